@@ -5,14 +5,14 @@ from typing import Literal, FrozenSet
 from app.domain.auth.role import Role
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Actor:
     id: UUID
     type: Literal["user"]          # system comes later
     permissions: FrozenSet[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenActor:
     id: UUID
     roles: Iterable[Role]
@@ -1,4 +1,6 @@
+from collections.abc import Iterable
 from enum import Enum
+from itertools import combinations
 
 from app.domain.auth.role import Role
 
@@ -32,6 +34,7 @@ class Permission(str, Enum):
     ADMIN_READ_CREDIT = "admin:read:credit",
     READ_SESSION = "user:read:session"
     COACH_READ_SESSION = "coach:read:session"
+    ADMIN_READ_METRICS = "admin:read:metrics"
 
 
 ROLE_PERMISSIONS: dict[Role, set[Permission]] = {
@@ -60,7 +63,8 @@ ROLE_PERMISSIONS: dict[Role, set[Permission]] = {
         Permission.REENEABLE_USER,
         Permission.ADMIN_READ_ATTENDANCE,
         Permission.ADMIN_READ_PAYMENT,
-        Permission.ADMIN_READ_CREDIT
+        Permission.ADMIN_READ_CREDIT,
+        Permission.ADMIN_READ_METRICS
     },
     Role.COACH: {
         Permission.READ_SELF,
@@ -76,3 +80,24 @@ ROLE_PERMISSIONS: dict[Role, set[Permission]] = {
         Permission.COACH_READ_SESSION
     }
 }
+
+
+def _role_combinations() -> list[frozenset[Role]]:
+    roles = list(Role)
+    return [
+        frozenset(combo)
+        for size in range(len(roles) + 1)
+        for combo in combinations(roles, size)
+    ]
+
+
+# Every possible role set maps to one shared frozenset, so tokens with
+# the same roles reuse the same permission object.
+ROLE_SET_PERMISSIONS: dict[frozenset[Role], frozenset[Permission]] = {
+    roles: frozenset().union(*(ROLE_PERMISSIONS[r] for r in roles))
+    for roles in _role_combinations()
+}
+
+
+def permissions_for(roles: Iterable[Role]) -> frozenset[Permission]:
+    return ROLE_SET_PERMISSIONS[frozenset(roles)]
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RefreshTokenEntity:
     user_id: UUID
     token_hash: str
@@ -22,7 +22,7 @@ class RefreshTokenEntity:
         return not self.is_revoked() and not self.is_expired(now=now)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewRefreshTokenEntity:
     user_id: UUID
     token_hash: str
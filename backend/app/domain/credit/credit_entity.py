@@ -4,7 +4,7 @@ from uuid import UUID
 from app.domain.credit.credit_cause import CreditCause
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreditEntity():
     id: UUID
     user_id: UUID
@@ -16,9 +16,17 @@ class CreditEntity():
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewCreditEntity():
     user_id: UUID
     amount_cents: int
     currency: str
     cause: CreditCause
+
+
+@dataclass(frozen=True, slots=True)
+class CreditBalanceDriftEntity():
+    user_id: UUID
+    currency: str
+    balance_cents: int
+    ledger_cents: int
@@ -1,9 +1,9 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PaymentEntity:
     id: UUID
     session_id: UUID
@@ -17,7 +17,7 @@ class PaymentEntity:
     created_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewPaymentEntity:
     session_id: UUID
     user_id: UUID
@@ -27,3 +27,14 @@ class NewPaymentEntity:
     provider_fee_cents: int
     net_amount_cents: int
     currency: str
+
+
+@dataclass(frozen=True, slots=True)
+class RevenueEntity:
+    coach_id: UUID | None
+    month: date | None
+    currency: str
+    payment_count: int
+    gross_amount_cents: int
+    provider_fee_cents: int
+    net_amount_cents: int
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PaymentIntentEntity:
     id: UUID
     user_id: UUID
@@ -15,12 +15,13 @@ class PaymentIntentEntity:
     currency: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewPaymentIntentEntity:
     user_id: UUID
     session_id: UUID
     provider: str
     provider_intent_id: str | None
+    provider_checkout_id: str | None
     status: str
     credit_applied_cents: int
     amount_cents: int
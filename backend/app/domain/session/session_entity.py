@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from app.domain.user.user_profile_entity import UserProfileEntity
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionEntity:
     id: UUID
     coach_id: UUID
@@ -21,7 +21,7 @@ class SessionEntity:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewSessionEntity:
     coach_id: UUID
     title: str
@@ -29,9 +29,10 @@ class NewSessionEntity:
     ends_at: datetime
     price_cents: int
     currency: str
+    capacity: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionWithCoachEntity:
     id: UUID
     coach: UserProfileEntity
@@ -46,7 +47,7 @@ class SessionWithCoachEntity:
     updated_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionCompleteEntity:
     id: UUID
     coach: UserProfileEntity
@@ -60,3 +61,15 @@ class SessionCompleteEntity:
     created_at: datetime
     updated_at: datetime
     participants: list[UserProfileEntity]
+
+
+@dataclass(frozen=True, slots=True)
+class RegistrationPreflightEntity:
+    user_disabled: bool
+    session_owner: bool
+    session_cancelled: bool
+    active_participation: bool
+    session_full: bool
+    registration_open: bool
+    session: SessionEntity | None
+    credit_cents: int | None
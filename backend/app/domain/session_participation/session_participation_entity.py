@@ -3,7 +3,7 @@ from datetime import datetime
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionParticipationEntity():
     id: UUID
     session_id: UUID
@@ -14,7 +14,20 @@ class SessionParticipationEntity():
     expires_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewSessionParticipationEntity():
     session_id: UUID
     user_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class ReleasedParticipationEntity():
+    session_id: UUID
+    user_id: UUID
+
+
+@dataclass(frozen=True, slots=True)
+class ParticipationSweepEntity():
+    released: int
+    intents_cancelled: int
+    checkout_ids: tuple[str, ...]
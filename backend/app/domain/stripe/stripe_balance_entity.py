@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class StripeBalanceEntity:
+    gross_amount_cents: int
+    provider_fee_cents: int
+    net_amount_cents: int
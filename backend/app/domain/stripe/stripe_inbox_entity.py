@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class StripeInboxEventEntity:
+    event_id: str
+    event_type: str
+    payload: str
+    attempts: int
+
+
+@dataclass(frozen=True, slots=True)
+class StripeInboxStatsEntity:
+    pending: int
+    due: int
+    dead: int
+    oldest_pending_seconds: float
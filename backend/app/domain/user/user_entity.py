@@ -5,7 +5,7 @@ from datetime import datetime
 from app.domain.auth.role import Role
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserEntity:
     id: UUID
     email: str
@@ -15,14 +15,14 @@ class UserEntity:
     disabled_reason: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewUserEntity:
     email: str
     password_hash: str
     role: Role
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdminUserRead:
     id: UUID
     email: str
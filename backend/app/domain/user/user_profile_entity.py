@@ -2,20 +2,20 @@ from dataclasses import dataclass
 from uuid import UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UserProfileEntity:
     user_id: UUID
     first_name: str
     last_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NewUserProfileEntity:
     first_name: str
     last_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AdminUserAttendanceRead:
     user_id: UUID
     first_name: str
@@ -1,3 +1,5 @@
+from datetime import datetime
+from uuid import UUID
 from pydantic import BaseModel
 
 
@@ -7,8 +9,32 @@ class GetCreditDTO(BaseModel):
     cause: str
 
 
+class ExportCreditDTO(BaseModel):
+    id: UUID
+    user_id: UUID
+    payment_id: UUID | None
+    amount_cents: int
+    currency: str
+    balance_after_cents: int
+    cause: str
+    created_at: datetime
+
+
 class PaginatedCreditOutputDTO(BaseModel):
     items: list[GetCreditDTO]
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
+
+
+class CreditBalanceDriftDTO(BaseModel):
+    user_id: UUID
+    currency: str
+    balance_cents: int
+    ledger_cents: int
+
+
+class CreditReconciliationOutputDTO(BaseModel):
+    in_sync: bool
+    drift: list[CreditBalanceDriftDTO]
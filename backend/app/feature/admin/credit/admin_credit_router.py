@@ -1,11 +1,16 @@
 from datetime import datetime
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
 from app.domain.auth.actor_entity import Actor
 from app.feature.admin.credit.admin_credit_dependencies import (
     get_admin_credit_service
 )
-from app.feature.admin.credit.admin_credit_dto import PaginatedCreditOutputDTO
+from app.feature.admin.credit.admin_credit_dto import (
+    CreditReconciliationOutputDTO,
+    ExportCreditDTO,
+    PaginatedCreditOutputDTO
+)
 from app.feature.admin.credit.admin_credit_service import AdminCreditService
 from app.feature.admin.credit.uow.admin_credit_uow_port import (
     AdminCreditUoWPort
@@ -14,6 +19,8 @@ from app.infrastructure.persistence.sqlalchemy.provider import (
     get_admin_credit_uow
 )
 from app.infrastructure.security.provider import get_current_actor
+from app.shared.utils.cursor import decode_cursor
+from app.shared.utils.export import ExportFormat, export_response
 
 router = APIRouter(
     prefix="/admin/credit",
@@ -28,26 +35,76 @@ router = APIRouter(
 async def get_all_credit(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     uow: AdminCreditUoWPort = Depends(get_admin_credit_uow),
     actor: Actor = Depends(get_current_actor),
     service: AdminCreditService = Depends(get_admin_credit_service)
 ) -> PaginatedCreditOutputDTO:
-    items, has_more = await service.get_all_credits(
+    items, has_more, next_cursor = await service.get_all_credits(
         limit=limit,
         offset=offset,
         to=to,
         _from=_from,
         uow=uow,
-        actor=actor
+        actor=actor,
+        cursor=decode_cursor(cursor)
     )
 
     return PaginatedCreditOutputDTO(
         items=items,
         limit=limit,
         offset=offset,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
+    )
+
+
+@router.get(
+    path="/reconciliation",
+    status_code=200
+)
+async def reconcile_credit_balances(
+    uow: AdminCreditUoWPort = Depends(get_admin_credit_uow),
+    actor: Actor = Depends(get_current_actor),
+    service: AdminCreditService = Depends(get_admin_credit_service)
+) -> CreditReconciliationOutputDTO:
+    drift = await service.get_balance_drift(uow=uow, actor=actor)
+
+    return CreditReconciliationOutputDTO(
+        in_sync=not drift,
+        drift=drift
+    )
+
+
+@router.get(
+    path="/export",
+    status_code=200,
+    response_class=StreamingResponse
+)
+async def export_credits(
+    format: ExportFormat = Query("csv"),
+    _from: datetime | None = Query(None),
+    to: datetime | None = Query(None),
+    accept_encoding: str | None = Header(None),
+    uow: AdminCreditUoWPort = Depends(get_admin_credit_uow),
+    actor: Actor = Depends(get_current_actor),
+    service: AdminCreditService = Depends(get_admin_credit_service)
+) -> StreamingResponse:
+    rows = await service.export_credits(
+        _from=_from,
+        to=to,
+        uow=uow,
+        actor=actor
+    )
+
+    return export_response(
+        rows,
+        ExportCreditDTO,
+        format,
+        filename="credit-ledger",
+        accept_encoding=accept_encoding
     )
 
 
@@ -59,25 +116,28 @@ async def get_user_credits(
     user_id: UUID,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     uow: AdminCreditUoWPort = Depends(get_admin_credit_uow),
     actor: Actor = Depends(get_current_actor),
     service: AdminCreditService = Depends(get_admin_credit_service)
 ) -> PaginatedCreditOutputDTO:
-    items, has_more = await service.get_user_credits(
+    items, has_more, next_cursor = await service.get_user_credits(
         limit=limit,
         offset=offset,
         to=to,
         _from=_from,
         uow=uow,
         actor=actor,
-        user_id=user_id
+        user_id=user_id,
+        cursor=decode_cursor(cursor)
     )
 
     return PaginatedCreditOutputDTO(
         items=items,
         limit=limit,
         offset=offset,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
     )
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import AsyncIterator
 from uuid import UUID
 from app.domain.auth.actor_entity import Actor
 from app.domain.auth.auth_exceptions import (
@@ -7,10 +8,15 @@ from app.domain.auth.auth_exceptions import (
 )
 from app.domain.auth.permission import Permission
 from app.domain.auth.permission_rules import ensure_has_permission
-from app.feature.admin.credit.admin_credit_dto import GetCreditDTO
+from app.feature.admin.credit.admin_credit_dto import (
+    CreditBalanceDriftDTO,
+    ExportCreditDTO,
+    GetCreditDTO
+)
 from app.feature.admin.credit.uow.admin_credit_uow_port import (
     AdminCreditUoWPort
 )
+from app.shared.utils.cursor import Cursor, next_cursor
 
 
 class AdminCreditService():
@@ -22,7 +28,8 @@ class AdminCreditService():
         to: datetime | None,
         uow: AdminCreditUoWPort,
         actor: Actor,
-    ) -> tuple[list[GetCreditDTO], bool]:
+        cursor: Cursor | None = None
+    ) -> tuple[list[GetCreditDTO], bool, str | None]:
         ensure_has_permission(actor, Permission.ADMIN_READ_CREDIT)
 
         if await uow.auth_read_repo.is_user_disabled(
@@ -36,6 +43,7 @@ class AdminCreditService():
                 offset=offset,
                 to=to,
                 _from=_from,
+                cursor=cursor
             )
         )
 
@@ -45,7 +53,7 @@ class AdminCreditService():
                 balance_after_cents=credit.balance_after_cents,
                 cause=credit.cause,
             ) for credit in credits
-        ], has_more
+        ], has_more, next_cursor(credits, has_more)
 
     async def get_user_credits(
         self,
@@ -55,8 +63,9 @@ class AdminCreditService():
         to: datetime | None,
         uow: AdminCreditUoWPort,
         actor: Actor,
-        user_id: UUID
-    ) -> tuple[list[GetCreditDTO], bool]:
+        user_id: UUID,
+        cursor: Cursor | None = None
+    ) -> tuple[list[GetCreditDTO], bool, str | None]:
         ensure_has_permission(actor, Permission.ADMIN_READ_CREDIT)
 
         if await uow.auth_read_repo.is_user_disabled(
@@ -73,7 +82,8 @@ class AdminCreditService():
                 offset=offset,
                 to=to,
                 _from=_from,
-                user_id=user_id
+                user_id=user_id,
+                cursor=cursor
             )
         )
 
@@ -83,4 +93,58 @@ class AdminCreditService():
                 balance_after_cents=credit.balance_after_cents,
                 cause=credit.cause,
             ) for credit in credits
-        ], has_more
+        ], has_more, next_cursor(credits, has_more)
+
+    async def get_balance_drift(
+        self,
+        uow: AdminCreditUoWPort,
+        actor: Actor
+    ) -> list[CreditBalanceDriftDTO]:
+        ensure_has_permission(actor, Permission.ADMIN_READ_CREDIT)
+
+        if await uow.auth_read_repo.is_user_disabled(
+            actor.id
+        ):
+            raise AuthUserIsDisabledError()
+
+        drift = await uow.credit_read_repo.get_balance_drift()
+
+        return [
+            CreditBalanceDriftDTO(
+                user_id=row.user_id,
+                currency=row.currency,
+                balance_cents=row.balance_cents,
+                ledger_cents=row.ledger_cents
+            ) for row in drift
+        ]
+
+    async def export_credits(
+        self,
+        _from: datetime | None,
+        to: datetime | None,
+        uow: AdminCreditUoWPort,
+        actor: Actor
+    ) -> AsyncIterator[ExportCreditDTO]:
+        ensure_has_permission(actor, Permission.ADMIN_READ_CREDIT)
+
+        if await uow.auth_read_repo.is_user_disabled(
+            actor.id
+        ):
+            raise AuthUserIsDisabledError()
+
+        # Checks run before the response starts; rows are read lazily.
+        return (
+            ExportCreditDTO(
+                id=credit.id,
+                user_id=credit.user_id,
+                payment_id=credit.payment_id,
+                amount_cents=credit.amount_cents,
+                currency=credit.currency,
+                balance_after_cents=credit.balance_after_cents,
+                cause=credit.cause,
+                created_at=credit.created_at
+            ) async for credit in uow.credit_read_repo.stream_credits(
+                _from=_from,
+                to=to
+            )
+        )
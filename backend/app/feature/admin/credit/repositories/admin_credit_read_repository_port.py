@@ -1,8 +1,12 @@
 from datetime import datetime
-from typing import Protocol
+from typing import AsyncIterator, Protocol
 from uuid import UUID
 
-from app.domain.credit.credit_entity import CreditEntity
+from app.domain.credit.credit_entity import (
+    CreditBalanceDriftEntity,
+    CreditEntity
+)
+from app.shared.utils.cursor import Cursor
 
 
 class AdminCreditLedgerReadRepoPort(Protocol):
@@ -12,7 +16,8 @@ class AdminCreditLedgerReadRepoPort(Protocol):
         offset: int,
         _from: datetime | None,
         to: datetime | None,
-        user_id: UUID
+        user_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[CreditEntity], bool]:
         ...
 
@@ -22,5 +27,16 @@ class AdminCreditLedgerReadRepoPort(Protocol):
         offset: int,
         _from: datetime | None,
         to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[CreditEntity], bool]:
         ...
+
+    def stream_credits(
+        self,
+        _from: datetime | None,
+        to: datetime | None
+    ) -> AsyncIterator[CreditEntity]:
+        ...
+
+    async def get_balance_drift(self) -> list[CreditBalanceDriftEntity]:
+        ...
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Literal
 from pydantic import BaseModel
 from uuid import UUID
 
@@ -21,6 +22,7 @@ class PaginatedPaymentOutputDTO(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class GetCoachPaymentOutputDTO(BaseModel):
@@ -41,3 +43,22 @@ class PaginatedCoachPaymentOutputDTO(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
+
+
+RevenueGrouping = Literal["month", "coach", "coach_month", "currency"]
+
+
+class RevenueDTO(BaseModel):
+    coach_id: UUID | None
+    month: date | None
+    currency: str
+    payment_count: int
+    gross_amount_cents: int
+    provider_fee_cents: int
+    net_amount_cents: int
+
+
+class RevenueReportOutputDTO(BaseModel):
+    group_by: RevenueGrouping
+    items: list[RevenueDTO]
@@ -1,15 +1,19 @@
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Header, Query
 from fastapi import Depends
+from fastapi.responses import StreamingResponse
 
 from app.domain.auth.actor_entity import Actor
 from app.feature.admin.payment.admin_payment_dependencies import (
     get_admin_payment_service
 )
 from app.feature.admin.payment.admin_payment_dto import (
+    GetPaymentOutputDTO,
     PaginatedCoachPaymentOutputDTO,
-    PaginatedPaymentOutputDTO
+    PaginatedPaymentOutputDTO,
+    RevenueGrouping,
+    RevenueReportOutputDTO
 )
 from app.feature.admin.payment.admin_payment_service import AdminPaymentService
 from app.feature.admin.payment.uow.admin_payment_uow_port import (
@@ -19,6 +23,9 @@ from app.infrastructure.persistence.sqlalchemy.provider import (
     get_admin_payment_uow
 )
 from app.infrastructure.security.provider import get_current_actor
+from app.shared.utils.cursor import decode_cursor
+from app.shared.utils.export import ExportFormat, export_response
+from app.shared.utils.json_response import FastJSONResponse, page_response
 
 router = APIRouter(
     prefix="/admin/payment",
@@ -28,93 +35,145 @@ router = APIRouter(
 
 @router.get(
     path="/",
-    status_code=200
+    status_code=200,
+    response_model=PaginatedPaymentOutputDTO
 )
 async def get_all_payments(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     uow: AdminPaymentUoWPort = Depends(get_admin_payment_uow),
     actor: Actor = Depends(get_current_actor),
     service: AdminPaymentService = Depends(get_admin_payment_service)
-) -> PaginatedPaymentOutputDTO:
-    items, has_more = await service.get_payments(
+) -> FastJSONResponse:
+    items, has_more, next_cursor = await service.get_payments(
         limit=limit,
         offset=offset,
+        _from=_from,
+        to=to,
+        uow=uow,
+        actor=actor,
+        cursor=decode_cursor(cursor)
+    )
+
+    return page_response(items, limit, offset, has_more, next_cursor)
+
+
+@router.get(
+    path="/export",
+    status_code=200,
+    response_class=StreamingResponse
+)
+async def export_payments(
+    format: ExportFormat = Query("csv"),
+    _from: datetime | None = Query(None),
+    to: datetime | None = Query(None),
+    accept_encoding: str | None = Header(None),
+    uow: AdminPaymentUoWPort = Depends(get_admin_payment_uow),
+    actor: Actor = Depends(get_current_actor),
+    service: AdminPaymentService = Depends(get_admin_payment_service)
+) -> StreamingResponse:
+    rows = await service.export_payments(
         _from=_from,
         to=to,
         uow=uow,
         actor=actor
     )
 
-    return PaginatedPaymentOutputDTO(
-        items=items,
-        limit=limit,
-        offset=offset,
-        has_more=has_more
+    return export_response(
+        rows,
+        GetPaymentOutputDTO,
+        format,
+        filename="payments",
+        accept_encoding=accept_encoding
     )
 
 
 @router.get(
-    path="/users/{user_id}",
+    path="/revenue",
     status_code=200
 )
+async def get_revenue(
+    group_by: RevenueGrouping = Query("month"),
+    _from: date | None = Query(None),
+    to: date | None = Query(None),
+    coach_id: UUID | None = Query(None),
+    uow: AdminPaymentUoWPort = Depends(get_admin_payment_uow),
+    actor: Actor = Depends(get_current_actor),
+    service: AdminPaymentService = Depends(get_admin_payment_service)
+) -> RevenueReportOutputDTO:
+    items = await service.get_revenue(
+        group_by=group_by,
+        from_month=_from,
+        to_month=to,
+        coach_id=coach_id,
+        uow=uow,
+        actor=actor
+    )
+
+    return RevenueReportOutputDTO(
+        group_by=group_by,
+        items=items
+    )
+
+
+@router.get(
+    path="/users/{user_id}",
+    status_code=200,
+    response_model=PaginatedPaymentOutputDTO
+)
 async def get_user_payment(
     user_id: UUID,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     uow: AdminPaymentUoWPort = Depends(get_admin_payment_uow),
     actor: Actor = Depends(get_current_actor),
     service: AdminPaymentService = Depends(get_admin_payment_service)
-) -> PaginatedPaymentOutputDTO:
-    items, has_more = await service.get_user_payments(
+) -> FastJSONResponse:
+    items, has_more, next_cursor = await service.get_user_payments(
         limit=limit,
         offset=offset,
         _from=_from,
         to=to,
         uow=uow,
         actor=actor,
-        user_id=user_id
+        user_id=user_id,
+        cursor=decode_cursor(cursor)
     )
 
-    return PaginatedPaymentOutputDTO(
-        items=items,
-        limit=limit,
-        offset=offset,
-        has_more=has_more
-    )
+    return page_response(items, limit, offset, has_more, next_cursor)
 
 
 @router.get(
     path="/coach/{coach_id}",
-    status_code=200
+    status_code=200,
+    response_model=PaginatedCoachPaymentOutputDTO
 )
 async def get_coach_payment(
     coach_id: UUID,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     uow: AdminPaymentUoWPort = Depends(get_admin_payment_uow),
     actor: Actor = Depends(get_current_actor),
     service: AdminPaymentService = Depends(get_admin_payment_service)
-) -> PaginatedCoachPaymentOutputDTO:
-    items, has_more = await service.get_coach_payments(
+) -> FastJSONResponse:
+    items, has_more, next_cursor = await service.get_coach_payments(
         limit=limit,
         offset=offset,
         _from=_from,
         to=to,
         uow=uow,
         actor=actor,
-        coach_id=coach_id
+        coach_id=coach_id,
+        cursor=decode_cursor(cursor)
     )
 
-    return PaginatedCoachPaymentOutputDTO(
-        items=items,
-        limit=limit,
-        offset=offset,
-        has_more=has_more
-    )
+    return page_response(items, limit, offset, has_more, next_cursor)
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Any, AsyncIterator
 from uuid import UUID
 from app.domain.auth.actor_entity import Actor
 from app.domain.auth.auth_exceptions import (
@@ -8,13 +9,16 @@ from app.domain.auth.auth_exceptions import (
 )
 from app.domain.auth.permission import Permission
 from app.domain.auth.permission_rules import ensure_has_permission
+from app.domain.payment.payment_entity import PaymentEntity
 from app.feature.admin.payment.admin_payment_dto import (
-    GetCoachPaymentOutputDTO,
-    GetPaymentOutputDTO
+    GetPaymentOutputDTO,
+    RevenueDTO,
+    RevenueGrouping
 )
 from app.feature.admin.payment.uow.admin_payment_uow_port import (
     AdminPaymentUoWPort
 )
+from app.shared.utils.cursor import Cursor, next_cursor
 
 
 class AdminPaymentService():
@@ -26,7 +30,8 @@ class AdminPaymentService():
         to: datetime | None,
         uow: AdminPaymentUoWPort,
         actor: Actor,
-    ) -> tuple[list[GetPaymentOutputDTO], bool]:
+        cursor: Cursor | None = None
+    ) -> tuple[list[dict[str, Any]], bool, str | None]:
         ensure_has_permission(actor, Permission.ADMIN_READ_PAYMENT)
 
         if await uow.auth_read_repo.is_user_disabled(actor.id):
@@ -37,24 +42,14 @@ class AdminPaymentService():
                 offset=offset,
                 limit=limit,
                 _from=_from,
-                to=to
+                to=to,
+                cursor=cursor
             )
         )
 
         return [
-            GetPaymentOutputDTO(
-                id=payment.id,
-                user_id=payment.user_id,
-                session_id=payment.session_id,
-                provider=payment.provider,
-                provider_payment_id=payment.provider_payment_id,
-                gross_amount_cents=payment.gross_amount_cents,
-                provider_fee_cents=payment.provider_fee_cents,
-                net_amount_cents=payment.net_amount_cents,
-                currency=payment.currency,
-                created_at=payment.created_at
-            ) for payment in payments
-        ], has_more
+            _payment_row(payment) for payment in payments
+        ], has_more, next_cursor(payments, has_more)
 
     async def get_user_payments(
         self,
@@ -64,8 +59,9 @@ class AdminPaymentService():
         to: datetime | None,
         uow: AdminPaymentUoWPort,
         actor: Actor,
-        user_id: UUID
-    ) -> tuple[list[GetPaymentOutputDTO], bool]:
+        user_id: UUID,
+        cursor: Cursor | None = None
+    ) -> tuple[list[dict[str, Any]], bool, str | None]:
         ensure_has_permission(actor, Permission.ADMIN_READ_PAYMENT)
 
         if await uow.auth_read_repo.is_user_disabled(actor.id):
@@ -80,24 +76,14 @@ class AdminPaymentService():
                 limit=limit,
                 _from=_from,
                 to=to,
-                user_id=user_id
+                user_id=user_id,
+                cursor=cursor
             )
         )
 
         return [
-            GetPaymentOutputDTO(
-                id=payment.id,
-                user_id=payment.user_id,
-                session_id=payment.session_id,
-                provider=payment.provider,
-                provider_payment_id=payment.provider_payment_id,
-                gross_amount_cents=payment.gross_amount_cents,
-                provider_fee_cents=payment.provider_fee_cents,
-                net_amount_cents=payment.net_amount_cents,
-                currency=payment.currency,
-                created_at=payment.created_at
-            ) for payment in payments
-        ], has_more
+            _payment_row(payment) for payment in payments
+        ], has_more, next_cursor(payments, has_more)
 
     async def get_coach_payments(
         self,
@@ -107,8 +93,9 @@ class AdminPaymentService():
         to: datetime | None,
         uow: AdminPaymentUoWPort,
         actor: Actor,
-        coach_id: UUID
-    ) -> tuple[list[GetCoachPaymentOutputDTO], bool]:
+        coach_id: UUID,
+        cursor: Cursor | None = None
+    ) -> tuple[list[dict[str, Any]], bool, str | None]:
         ensure_has_permission(actor, Permission.ADMIN_READ_PAYMENT)
 
         if await uow.auth_read_repo.is_user_disabled(actor.id):
@@ -123,14 +110,33 @@ class AdminPaymentService():
                 limit=limit,
                 _from=_from,
                 to=to,
-                coach_id=coach_id
+                coach_id=coach_id,
+                cursor=cursor
             )
         )
 
         return [
-            GetCoachPaymentOutputDTO(
+            _payment_row(payment, user_key="coach_id")
+            for payment in payments
+        ], has_more, next_cursor(payments, has_more)
+
+    async def export_payments(
+        self,
+        _from: datetime | None,
+        to: datetime | None,
+        uow: AdminPaymentUoWPort,
+        actor: Actor
+    ) -> AsyncIterator[GetPaymentOutputDTO]:
+        ensure_has_permission(actor, Permission.ADMIN_READ_PAYMENT)
+
+        if await uow.auth_read_repo.is_user_disabled(actor.id):
+            raise AuthUserIsDisabledError()
+
+        # Checks run before the response starts; rows are read lazily.
+        return (
+            GetPaymentOutputDTO(
                 id=payment.id,
-                coach_id=payment.user_id,
+                user_id=payment.user_id,
                 session_id=payment.session_id,
                 provider=payment.provider,
                 provider_payment_id=payment.provider_payment_id,
@@ -139,5 +145,67 @@ class AdminPaymentService():
                 net_amount_cents=payment.net_amount_cents,
                 currency=payment.currency,
                 created_at=payment.created_at
-            ) for payment in payments
-        ], has_more
+            ) async for payment in uow.payment_read_repo.stream_payments(
+                _from=_from,
+                to=to
+            )
+        )
+
+    async def get_revenue(
+        self,
+        group_by: RevenueGrouping,
+        from_month: date | None,
+        to_month: date | None,
+        coach_id: UUID | None,
+        uow: AdminPaymentUoWPort,
+        actor: Actor
+    ) -> list[RevenueDTO]:
+        ensure_has_permission(actor, Permission.ADMIN_READ_PAYMENT)
+
+        if await uow.auth_read_repo.is_user_disabled(actor.id):
+            raise AuthUserIsDisabledError()
+
+        if coach_id is not None and not (
+            await uow.auth_read_repo.exists_coach(coach_id)
+        ):
+            raise CoachNotFoundError()
+
+        revenue = await uow.payment_read_repo.get_revenue(
+            from_month=from_month,
+            to_month=to_month,
+            coach_id=coach_id,
+            by_coach=group_by in ("coach", "coach_month"),
+            by_month=group_by in ("month", "coach_month")
+        )
+
+        return [
+            RevenueDTO(
+                coach_id=row.coach_id,
+                month=row.month,
+                currency=row.currency,
+                payment_count=row.payment_count,
+                gross_amount_cents=row.gross_amount_cents,
+                provider_fee_cents=row.provider_fee_cents,
+                net_amount_cents=row.net_amount_cents
+            ) for row in revenue
+        ]
+
+
+def _payment_row(
+    payment: PaymentEntity,
+    user_key: str = "user_id"
+) -> dict[str, Any]:
+    # Trusted row shaped as GetPaymentOutputDTO (GetCoachPaymentOutputDTO
+    # with user_key="coach_id"), encoded by page_response.
+    return {
+        "id": payment.id,
+        user_key: payment.user_id,
+        "session_id": payment.session_id,
+        "provider": payment.provider,
+        "provider_payment_id": payment.provider_payment_id,
+        "gross_amount_cents": payment.gross_amount_cents,
+        "provider_fee_cents": payment.provider_fee_cents,
+        "net_amount_cents": payment.net_amount_cents,
+        "currency": payment.currency,
+        "created_at": payment.created_at,
+    }
@@ -1,8 +1,12 @@
-from datetime import datetime
-from typing import Protocol
+from datetime import date, datetime
+from typing import AsyncIterator, Protocol
 from uuid import UUID
 
-from app.domain.payment.payment_entity import PaymentEntity
+from app.domain.payment.payment_entity import (
+    PaymentEntity,
+    RevenueEntity
+)
+from app.shared.utils.cursor import Cursor
 
 
 class AdminPaymentReadRepoPort(Protocol):
@@ -12,6 +16,7 @@ class AdminPaymentReadRepoPort(Protocol):
         limit: int,
         _from: datetime | None,
         to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[PaymentEntity], bool]:
         ...
 
@@ -21,7 +26,8 @@ class AdminPaymentReadRepoPort(Protocol):
         limit: int,
         _from: datetime | None,
         to: datetime | None,
-        user_id: UUID
+        user_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[PaymentEntity], bool]:
         ...
 
@@ -31,6 +37,24 @@ class AdminPaymentReadRepoPort(Protocol):
         limit: int,
         _from: datetime | None,
         to: datetime | None,
-        coach_id: UUID
+        coach_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[PaymentEntity], bool]:
         ...
+
+    def stream_payments(
+        self,
+        _from: datetime | None,
+        to: datetime | None
+    ) -> AsyncIterator[PaymentEntity]:
+        ...
+
+    async def get_revenue(
+        self,
+        from_month: date | None,
+        to_month: date | None,
+        coach_id: UUID | None,
+        by_coach: bool,
+        by_month: bool
+    ) -> list[RevenueEntity]:
+        ...
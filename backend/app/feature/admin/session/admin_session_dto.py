@@ -35,6 +35,7 @@ class PaginatedAdminSessionOutputDTO(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class UserProfileOutputDTO(BaseModel):
@@ -25,6 +25,7 @@ from app.infrastructure.persistence.sqlalchemy.provider import (
     get_admin_session_uow
 )
 from app.infrastructure.security.provider import get_current_actor
+from app.shared.utils.cursor import decode_cursor
 
 router = APIRouter(
     prefix='/admin/sessions',
@@ -39,26 +40,29 @@ router = APIRouter(
 async def admin_get_all_session(
     limit: int = Query(0, ge=0, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     uow: AdminSessionUoWPort = Depends(get_admin_session_uow),
     actor: Actor = Depends(get_current_actor),
     service: AdminSessionService = Depends(get_admin_session_service)
 ) -> PaginatedAdminSessionOutputDTO:
-    items, has_more = await service.admin_list_all_sessions(
+    items, has_more, next_cursor = await service.admin_list_all_sessions(
         uow=uow,
         actor=actor,
         limit=limit,
         offset=offset,
         _from=_from,
-        to=to
+        to=to,
+        cursor=decode_cursor(cursor)
     )
 
     return PaginatedAdminSessionOutputDTO(
         items=items,
         limit=limit,
         offset=offset,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
     )
 
 
@@ -87,27 +91,30 @@ async def admin_get_sessions_by_coach(
     coach_id: UUID,
     limit: int = Query(0, ge=0, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     actor: Actor = Depends(get_current_actor),
     uow: AdminSessionUoWPort = Depends(get_admin_session_uow),
     service: AdminSessionService = Depends(get_admin_session_service),
 ):
-    items, has_more = await service.admin_list_sessions_by_coach(
+    items, has_more, next_cursor = await service.admin_list_sessions_by_coach(
         uow=uow,
         actor=actor,
         coach_id=coach_id,
         limit=limit,
         offset=offset,
         _from=_from,
-        to=to
+        to=to,
+        cursor=decode_cursor(cursor)
     )
 
     return PaginatedAdminSessionOutputDTO(
         items=items,
         limit=limit,
         offset=offset,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
     )
 
 
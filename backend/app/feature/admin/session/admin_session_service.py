@@ -29,6 +29,7 @@ from app.domain.auth.permission import Permission
 from app.domain.auth.permission_rules import (
     ensure_has_permission
 )
+from app.shared.utils.cursor import Cursor, next_cursor
 
 
 class AdminSessionService:
@@ -39,8 +40,9 @@ class AdminSessionService:
         limit: int,
         offset: int,
         _from: datetime | None,
-        to: datetime | None
-    ) -> tuple[list[AdminSessionOutputDTO], bool]:
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[AdminSessionOutputDTO], bool, str | None]:
         ensure_has_permission(actor, Permission.ADMIN_READ_SESSION)
 
         if await uow.auth_read_repo.is_user_disabled(actor.id):
@@ -51,6 +53,7 @@ class AdminSessionService:
             offset=offset,
             _from=_from,
             to=to,
+            cursor=cursor
         )
 
         return [
@@ -77,7 +80,7 @@ class AdminSessionService:
                     ) for participant in s.participants
                 ]
             ) for s in sessions
-        ], has_more
+        ], has_more, next_cursor(sessions, has_more)
 
     async def admin_list_sessions_by_coach(
         self,
@@ -87,8 +90,9 @@ class AdminSessionService:
         limit: int,
         offset: int,
         _from: datetime | None,
-        to: datetime | None
-    ) -> tuple[list[AdminSessionOutputDTO], bool]:
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[AdminSessionOutputDTO], bool, str | None]:
         ensure_has_permission(actor, Permission.ADMIN_READ_SESSION)
 
         if await uow.auth_read_repo.is_user_disabled(actor.id):
@@ -102,7 +106,8 @@ class AdminSessionService:
             limit,
             offset,
             _from,
-            to
+            to,
+            cursor=cursor
         )
 
         return [
@@ -130,7 +135,7 @@ class AdminSessionService:
                 ],
             )
             for s in sessions
-        ], has_more
+        ], has_more, next_cursor(sessions, has_more)
 
     async def admin_cancel_session(
             self,
@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from app.domain.session.session_entity import SessionCompleteEntity
+from app.shared.utils.cursor import Cursor
 
 
 class AdminSessionReadRepoPort(Protocol):
@@ -12,7 +13,8 @@ class AdminSessionReadRepoPort(Protocol):
         limit: int,
         offset: int,
         _from: datetime | None,
-        to: datetime | None
+        to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[SessionCompleteEntity], bool]:
         ...
 
@@ -21,7 +23,8 @@ class AdminSessionReadRepoPort(Protocol):
         limit: int,
         offset: int,
         _from: datetime | None,
-        to: datetime | None
+        to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[SessionCompleteEntity], bool]:
         ...
 
@@ -26,6 +26,7 @@ class PaginatedUsersDTO(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class RoleDTO(BaseModel):
@@ -21,6 +21,7 @@ from app.infrastructure.persistence.sqlalchemy.provider import (
     get_admin_system_user_uow,
     get_admin_user_uow
 )
+from app.shared.utils.cursor import decode_cursor
 
 
 router = APIRouter(
@@ -37,6 +38,7 @@ async def admin_get_users(
     uow: AdminUserUoWPort = Depends(get_admin_user_uow),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     actor: Actor = Depends(get_current_actor),
     service: AdminUserService = Depends(get_admin_user_service)
 ) -> PaginatedUsersDTO:
@@ -45,7 +47,8 @@ async def admin_get_users(
         uow=uow,
         actor=actor,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=decode_cursor(cursor)
     )
 
 
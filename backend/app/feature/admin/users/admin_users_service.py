@@ -21,6 +21,7 @@ from app.feature.admin.users.uow.admin_user_system_uow_port import (
 )
 from app.feature.admin.users.uow.admin_user_uow_port import AdminUserUoWPort
 from app.shared.exceptions.commons import NotFoundError
+from app.shared.utils.cursor import Cursor, next_cursor
 
 
 class AdminUserService:
@@ -31,6 +32,7 @@ class AdminUserService:
         *,
         limit: int = 50,
         offset: int = 0,
+        cursor: Cursor | None = None,
     ) -> PaginatedUsersDTO:
         ensure_has_permission(actor, Permission.ADMIN_READ_USERS)
 
@@ -39,7 +41,8 @@ class AdminUserService:
 
         users, has_more = await uow.admin_user_read_repo.get_all_users(
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
 
         items = [
@@ -58,6 +61,7 @@ class AdminUserService:
             limit=limit,
             offset=offset,
             has_more=has_more,
+            next_cursor=next_cursor(users, has_more),
         )
 
     async def get_user(
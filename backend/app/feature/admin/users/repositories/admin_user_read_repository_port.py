@@ -2,13 +2,15 @@ from typing import Protocol
 from uuid import UUID
 
 from app.domain.user.user_entity import AdminUserRead
+from app.shared.utils.cursor import Cursor
 
 
 class AdminUserReadRepoPort(Protocol):
     async def get_all_users(
         self,
         offset: int,
-        limit: int
+        limit: int,
+        cursor: Cursor | None = None
     ) -> tuple[list[AdminUserRead], bool]:
         ...
 
@@ -112,7 +112,7 @@ class AuthService:
         if user.disabled_at is not None:
             raise UserDisabledError()
 
-        if not password_hasher.verify(password, user.password_hash):
+        if not await password_hasher.verify(password, user.password_hash):
             raise InvalidPasswordError()
 
         token = None
@@ -240,9 +240,11 @@ class AuthService:
         if await uow.auth_read_repo.exist_email(email):
             raise EmailAlreadyExistError()
 
+        password_hash = await password_hasher.hash(password)
+
         new_user = NewUserEntity(
             email=email,
-            password_hash=password_hasher.hash(password),
+            password_hash=password_hash,
             role=Role.USER
         )
 
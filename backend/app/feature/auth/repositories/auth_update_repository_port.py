@@ -13,3 +13,10 @@ class AuthUpdateRepoPort(Protocol):
         new_token: NewRefreshTokenEntity
     ) -> None:
         ...
+
+    async def purge_refresh_tokens(
+        self,
+        grace_seconds: int,
+        limit: int
+    ) -> int:
+        ...
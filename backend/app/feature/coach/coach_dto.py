@@ -34,3 +34,4 @@ class PaginatedSessionsOutputDTO(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
 import stripe
 
 from app.feature.coach.coach_dependencies import get_coach_service
@@ -18,6 +18,13 @@ from app.infrastructure.settings.provider import (
     get_stripe_client
 )
 from app.infrastructure.persistence.sqlalchemy.provider import get_coach_uow
+from app.shared.utils.cursor import decode_cursor
+from app.shared.utils.etag import (
+    etag_matches,
+    make_etag,
+    not_modified,
+    set_etag
+)
 
 router = APIRouter(
     prefix="/coach",
@@ -66,44 +73,84 @@ async def coach_payout(
 
 @router.get(
     path='/sessions/',
-    status_code=200
+    status_code=200,
+    response_model=PaginatedSessionsOutputDTO
 )
 async def coach_get_own_sessions(
+    response: Response,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
+    if_none_match: str | None = Header(None),
     uow: CoachUoWPort = Depends(get_coach_uow),
     actor: Actor = Depends(get_current_actor),
     service: CoachService = Depends(get_coach_service)
-) -> PaginatedSessionsOutputDTO:
-    items, has_more = await service.get_own_sessions(
+) -> PaginatedSessionsOutputDTO | Response:
+    etag = make_etag(
+        "coach_sessions",
+        actor.id,
+        limit,
+        offset,
+        cursor,
+        _from,
+        to,
+        await service.get_own_sessions_version(actor=actor, uow=uow)
+    )
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, private=True)
+
+    set_etag(response, etag, private=True)
+
+    items, has_more, next_cursor = await service.get_own_sessions(
         actor=actor,
         uow=uow,
         limit=limit,
         offset=offset,
         _from=_from,
-        to=to
+        to=to,
+        cursor=decode_cursor(cursor)
     )
 
     return PaginatedSessionsOutputDTO(
         items=items,
         limit=limit,
         offset=offset,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
     )
 
 
 @router.get(
     path='/sessions/{session_id}',
-    status_code=200
+    status_code=200,
+    response_model=GetSessionOutputDto
 )
 async def coach_get_session_by_id(
     session_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
     uow: CoachUoWPort = Depends(get_coach_uow),
     actor: Actor = Depends(get_current_actor),
     service: CoachService = Depends(get_coach_service)
-) -> GetSessionOutputDto:
+) -> GetSessionOutputDto | Response:
+    etag = make_etag(
+        "coach_session",
+        actor.id,
+        await service.get_session_version(
+            session_id=session_id,
+            uow=uow,
+            actor=actor
+        )
+    )
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, private=True)
+
+    set_etag(response, etag, private=True)
+
     return await service.get_session_by_id(
         session_id=session_id,
         uow=uow,
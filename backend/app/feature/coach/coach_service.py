@@ -28,6 +28,7 @@ from app.feature.coach.uow.coach_uow_port import CoachUoWPort
 from app.domain.auth.permission_rules import (
     ensure_has_permission
 )
+from app.shared.utils.cursor import Cursor, next_cursor
 
 
 class CoachService():
@@ -169,6 +170,20 @@ class CoachService():
             new_payment=payment
         )
 
+    async def get_own_sessions_version(
+        self,
+        actor: Actor,
+        uow: CoachUoWPort
+    ) -> str:
+        ensure_has_permission(actor, Permission.COACH_READ_SESSION)
+
+        if await uow.auth_read_repo.is_user_disabled(actor.id):
+            raise AuthUserIsDisabledError()
+
+        return await uow.session_read_repo.get_coach_sessions_version(
+            actor.id
+        )
+
     async def get_own_sessions(
         self,
         actor: Actor,
@@ -177,7 +192,8 @@ class CoachService():
         offset: int,
         _from: datetime | None,
         to: datetime | None,
-    ) -> tuple[list[GetSessionOutputDto], bool]:
+        cursor: Cursor | None = None
+    ) -> tuple[list[GetSessionOutputDto], bool, str | None]:
         ensure_has_permission(actor, Permission.COACH_READ_SESSION)
 
         if await uow.auth_read_repo.is_user_disabled(actor.id):
@@ -189,7 +205,8 @@ class CoachService():
                 limit=limit,
                 offset=offset,
                 _from=_from,
-                to=to
+                to=to,
+                cursor=cursor
             )
         )
 
@@ -213,7 +230,33 @@ class CoachService():
                     )for participant in session.participants
                 ]
             ) for session in sessions
-        ], has_more
+        ], has_more, next_cursor(sessions, has_more)
+
+    async def get_session_version(
+        self,
+        session_id: UUID,
+        uow: CoachUoWPort,
+        actor: Actor
+    ) -> str:
+        ensure_has_permission(actor, Permission.COACH_READ_SESSION)
+
+        if not await uow.session_read_repo.exist_session(
+            session_id=session_id
+        ):
+            raise SessionNotFoundError()
+
+        if not await uow.session_read_repo.is_session_owner(
+            session_id=session_id,
+            user_id=actor.id
+        ):
+            raise NotOwnerOfSessionError()
+
+        version = await uow.session_read_repo.get_session_version(session_id)
+
+        if version is None:
+            raise SessionNotFoundError()
+
+        return version
 
     async def get_session_by_id(
         self,
@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from app.domain.session.session_entity import SessionCompleteEntity
+from app.shared.utils.cursor import Cursor
 
 
 class SessionReadRepoPort(Protocol):
@@ -43,6 +44,19 @@ class SessionReadRepoPort(Protocol):
         limit: int,
         offset: int,
         _from: datetime | None,
-        to: datetime | None
+        to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[SessionCompleteEntity], bool]:
         ...
+
+    async def get_session_version(
+        self,
+        session_id: UUID
+    ) -> str | None:
+        ...
+
+    async def get_coach_sessions_version(
+        self,
+        coach_id: UUID
+    ) -> str:
+        ...
@@ -12,3 +12,4 @@ class PaginatedCreditOutputDTO(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
@@ -7,6 +7,7 @@ from app.feature.credit.credit_service import CreditService
 from app.feature.credit.uow.credit_uow_port import CreditUoWPort
 from app.infrastructure.persistence.sqlalchemy.provider import get_credit_uow
 from app.infrastructure.security.provider import get_current_actor
+from app.shared.utils.cursor import decode_cursor
 
 router = APIRouter(
     prefix="/credit",
@@ -21,24 +22,27 @@ router = APIRouter(
 async def get_credit(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     uow: CreditUoWPort = Depends(get_credit_uow),
     actor: Actor = Depends(get_current_actor),
     service: CreditService = Depends(get_credit_service)
 ) -> PaginatedCreditOutputDTO:
-    items, has_more = await service.get_all_credits(
+    items, has_more, next_cursor = await service.get_all_credits(
         limit=limit,
         offset=offset,
         to=to,
         _from=_from,
         uow=uow,
-        actor=actor
+        actor=actor,
+        cursor=decode_cursor(cursor)
     )
 
     return PaginatedCreditOutputDTO(
         items=items,
         limit=limit,
         offset=offset,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
     )
@@ -5,6 +5,7 @@ from app.domain.auth.permission import Permission
 from app.domain.auth.permission_rules import ensure_has_permission
 from app.feature.credit.credit_dto import GetCreditDTO
 from app.feature.credit.uow.credit_uow_port import CreditUoWPort
+from app.shared.utils.cursor import Cursor, next_cursor
 
 
 class CreditService():
@@ -16,7 +17,8 @@ class CreditService():
         to: datetime | None,
         uow: CreditUoWPort,
         actor: Actor,
-    ) -> tuple[list[GetCreditDTO], bool]:
+        cursor: Cursor | None = None
+    ) -> tuple[list[GetCreditDTO], bool, str | None]:
         ensure_has_permission(actor, Permission.READ_CREDIT)
 
         if await uow.auth_read_repo.is_user_disabled(actor.id):
@@ -28,7 +30,8 @@ class CreditService():
                 offset=offset,
                 to=to,
                 _from=_from,
-                user_id=actor.id
+                user_id=actor.id,
+                cursor=cursor
             )
         )
 
@@ -38,4 +41,4 @@ class CreditService():
                 balance_after_cents=credit.balance_after_cents,
                 cause=credit.cause,
             ) for credit in credits
-        ], has_more
+        ], has_more, next_cursor(credits, has_more)
@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from app.domain.credit.credit_entity import CreditEntity
+from app.shared.utils.cursor import Cursor
 
 
 class CreditLedgerReadRepoPort(Protocol):
@@ -12,6 +13,7 @@ class CreditLedgerReadRepoPort(Protocol):
         offset: int,
         _from: datetime | None,
         to: datetime | None,
-        user_id: UUID
+        user_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[CreditEntity], bool]:
         ...
@@ -1,6 +1,6 @@
 from datetime import datetime
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query
 from fastapi.responses import Response
 
 from app.domain.auth.actor_entity import Actor
@@ -26,6 +26,14 @@ from app.infrastructure.security.provider import (
     get_password_hasher
 )
 from app.shared.security.password_hasher_port import PasswordHasherPort
+from app.shared.utils.cursor import decode_cursor
+from app.shared.utils.etag import (
+    etag_matches,
+    make_etag,
+    not_modified,
+    set_etag
+)
+from app.shared.utils.json_response import page_response
 
 
 router = APIRouter(
@@ -144,43 +152,76 @@ async def delete_me(
 
 
 @router.get(
-    path="/sessions/"
+    path="/sessions/",
+    response_model=PaginatedSessionsOutputDTO
 )
 async def get_own_sessions(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
+    if_none_match: str | None = Header(None),
     actor: Actor = Depends(get_current_actor),
     uow: MeUoWPort = Depends(get_me_uow),
     service: MeService = Depends(get_me_service)
-) -> PaginatedSessionsOutputDTO:
-    items, has_more = await service.get_own_sessions(
+) -> Response:
+    etag = make_etag(
+        "me_sessions",
+        actor.id,
+        limit,
+        offset,
+        cursor,
+        _from,
+        to,
+        await service.get_own_sessions_version(actor=actor, uow=uow)
+    )
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, private=True)
+
+    items, has_more, next_cursor = await service.get_own_sessions(
         offset=offset,
         limit=limit,
         _from=_from,
         to=to,
         uow=uow,
-        actor=actor
+        actor=actor,
+        cursor=decode_cursor(cursor)
     )
+    page = page_response(items, limit, offset, has_more, next_cursor)
 
-    return PaginatedSessionsOutputDTO(
-        items=items,
-        limit=limit,
-        offset=offset,
-        has_more=has_more
-    )
+    set_etag(page, etag, private=True)
+
+    return page
 
 
 @router.get(
-    path="/sessions/{session_id}/"
+    path="/sessions/{session_id}/",
+    response_model=GetSessionOutputDto
 )
 async def get_session(
     session_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
     actor: Actor = Depends(get_current_actor),
     uow: MeSystemUoWPort = Depends(get_me_system_uow),
     service: MeService = Depends(get_me_service)
-) -> GetSessionOutputDto:
+) -> GetSessionOutputDto | Response:
+    etag = make_etag(
+        "me_session",
+        actor.id,
+        await service.get_session_version(
+            session_id=session_id,
+            uow=uow,
+            actor=actor
+        )
+    )
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, private=True)
+
+    set_etag(response, etag, private=True)
 
     return await service.get_session_by_id(
         session_id=session_id,
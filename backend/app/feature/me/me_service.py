@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 from app.domain.auth.actor_entity import Actor
 from app.domain.auth.auth_exceptions import (
@@ -29,6 +30,7 @@ from app.feature.me.me_dto import (
 from app.feature.me.uow.me_system_uow_port import MeSystemUoWPort
 from app.feature.me.uow.me_uow_port import MeUoWPort
 from app.shared.security.password_hasher_port import PasswordHasherPort
+from app.shared.utils.cursor import Cursor, next_cursor
 
 
 class MeService:
@@ -93,13 +95,13 @@ class MeService:
 
         user = await uow.auth_read_repo.get_user_by_id(actor.id)
 
-        if not password_hasher.verify(old_password, user.password_hash):
+        if not await password_hasher.verify(old_password, user.password_hash):
             raise PasswordMissmatchError()
 
-        if password_hasher.verify(new_password, user.password_hash):
+        if await password_hasher.verify(new_password, user.password_hash):
             raise PasswordReuseError()
 
-        new_password_hash = password_hasher.hash(new_password)
+        new_password_hash = await password_hasher.hash(new_password)
 
         await uow.me_update_repo.update_password_by_id(
             user_id=actor.id,
@@ -168,6 +170,20 @@ class MeService:
             user_id=actor.id
         )
 
+    async def get_own_sessions_version(
+        self,
+        actor: Actor,
+        uow: MeUoWPort
+    ) -> str:
+        ensure_has_permission(actor, Permission.READ_SESSION)
+
+        if await uow.auth_read_repo.is_user_disabled(actor.id):
+            raise AuthUserIsDisabledError()
+
+        return await uow.session_read_repo.get_participant_sessions_version(
+            actor.id
+        )
+
     async def get_own_sessions(
         self,
         actor: Actor,
@@ -176,7 +192,8 @@ class MeService:
         offset: int,
         _from: datetime | None,
         to: datetime | None,
-    ) -> tuple[list[GetSessionOutputDto], bool]:
+        cursor: Cursor | None = None
+    ) -> tuple[list[dict[str, Any]], bool, str | None]:
         ensure_has_permission(actor, Permission.READ_SESSION)
 
         if await uow.auth_read_repo.is_user_disabled(actor.id):
@@ -188,31 +205,57 @@ class MeService:
                 limit=limit,
                 offset=offset,
                 _from=_from,
-                to=to
+                to=to,
+                cursor=cursor
             )
         )
 
+        # Trusted rows shaped as GetSessionOutputDto, encoded by
+        # page_response.
         return [
-            GetSessionOutputDto(
-                id=session.id,
-                coach=CoachDto(
-                    first_name=session.coach.first_name,
-                    last_name=session.coach.last_name
-                ),
-                title=session.title,
-                starts_at=session.starts_at,
-                ends_at=session.ends_at,
-                price_cents=session.price_cents,
-                currency=session.currency,
-                status=session.status,
-                participants=[
-                   ParticipationOutputDTO(
-                        first_name=participant.first_name,
-                        last_name=participant.last_name
-                    )for participant in session.participants
-                ]
-            ) for session in sessions
-        ], has_more
+            {
+                "id": session.id,
+                "coach": {
+                    "first_name": session.coach.first_name,
+                    "last_name": session.coach.last_name,
+                },
+                "title": session.title,
+                "starts_at": session.starts_at,
+                "ends_at": session.ends_at,
+                "price_cents": session.price_cents,
+                "currency": session.currency,
+                "status": session.status,
+                "participants": [
+                    {
+                        "first_name": participant.first_name,
+                        "last_name": participant.last_name,
+                    } for participant in session.participants
+                ],
+            } for session in sessions
+        ], has_more, next_cursor(sessions, has_more)
+
+    async def get_session_version(
+        self,
+        session_id: UUID,
+        uow: MeSystemUoWPort,
+        actor: Actor
+    ) -> str:
+        ensure_has_permission(actor, Permission.READ_SESSION)
+
+        if not (
+            await uow.session_participation_read_repo.has_active_participation(
+                session_id=session_id,
+                user_id=actor.id
+            )
+        ):
+            raise SessionNotFoundError()
+
+        version = await uow.session_read_repo.get_session_version(session_id)
+
+        if version is None:
+            raise SessionNotFoundError()
+
+        return version
 
     async def get_session_by_id(
         self,
@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from app.domain.session.session_entity import SessionCompleteEntity
+from app.shared.utils.cursor import Cursor
 
 
 class SessionReadRepoPort(Protocol):
@@ -12,7 +13,8 @@ class SessionReadRepoPort(Protocol):
         limit: int,
         offset: int,
         _from: datetime | None,
-        to: datetime | None
+        to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[SessionCompleteEntity], bool]:
         ...
 
@@ -21,3 +23,15 @@ class SessionReadRepoPort(Protocol):
         session_id: UUID
     ) -> SessionCompleteEntity:
         ...
+
+    async def get_session_version(
+        self,
+        session_id: UUID
+    ) -> str | None:
+        ...
+
+    async def get_participant_sessions_version(
+        self,
+        user_id: UUID
+    ) -> str:
+        ...
@@ -19,3 +19,4 @@ class PaginatedPaymentOutputDTO(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
@@ -9,6 +9,7 @@ from app.feature.payment.payment_service import PaymentService
 from app.feature.payment.uow.payment_uow_port import PaymentUoWPort
 from app.infrastructure.persistence.sqlalchemy.provider import get_payment_uow
 from app.infrastructure.security.provider import get_current_actor
+from app.shared.utils.cursor import decode_cursor
 
 router = APIRouter(
     prefix="/payment",
@@ -23,24 +24,27 @@ router = APIRouter(
 async def get_own_payment(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     uow: PaymentUoWPort = Depends(get_payment_uow),
     actor: Actor = Depends(get_current_actor),
     service: PaymentService = Depends(get_payment_service)
 ) -> PaginatedPaymentOutputDTO:
-    items, has_more = await service.get_payments(
+    items, has_more, next_cursor = await service.get_payments(
         limit=limit,
         offset=offset,
         _from=_from,
         to=to,
         uow=uow,
-        actor=actor
+        actor=actor,
+        cursor=decode_cursor(cursor)
     )
 
     return PaginatedPaymentOutputDTO(
         items=items,
         limit=limit,
         offset=offset,
-        has_more=has_more
+        has_more=has_more,
+        next_cursor=next_cursor
     )
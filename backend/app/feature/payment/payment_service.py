@@ -5,6 +5,7 @@ from app.domain.auth.permission import Permission
 from app.feature.payment.payment_dto import GetPaymentOutputDTO
 from app.feature.payment.uow.payment_uow_port import PaymentUoWPort
 from app.domain.auth.permission_rules import ensure_has_permission
+from app.shared.utils.cursor import Cursor, next_cursor
 
 
 class PaymentService():
@@ -16,7 +17,8 @@ class PaymentService():
         to: datetime | None,
         uow: PaymentUoWPort,
         actor: Actor,
-    ) -> tuple[list[GetPaymentOutputDTO], bool]:
+        cursor: Cursor | None = None
+    ) -> tuple[list[GetPaymentOutputDTO], bool, str | None]:
         ensure_has_permission(actor, Permission.READ_PAYMENT)
 
         if await uow.auth_read_repo.is_user_disabled(actor.id):
@@ -28,7 +30,8 @@ class PaymentService():
                 limit=limit,
                 _from=_from,
                 to=to,
-                user_id=actor.id
+                user_id=actor.id,
+                cursor=cursor
             )
         )
 
@@ -43,4 +46,4 @@ class PaymentService():
                 currency=payment.currency,
                 created_at=payment.created_at
             ) for payment in payments
-        ], has_more
+        ], has_more, next_cursor(payments, has_more)
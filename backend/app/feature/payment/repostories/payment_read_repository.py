@@ -3,6 +3,7 @@ from typing import Protocol
 from uuid import UUID
 
 from app.domain.payment.payment_entity import PaymentEntity
+from app.shared.utils.cursor import Cursor
 
 
 class PaymentReadRepoPort(Protocol):
@@ -12,6 +13,7 @@ class PaymentReadRepoPort(Protocol):
         limit: int,
         _from: datetime | None,
         to: datetime | None,
-        user_id: UUID
+        user_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[PaymentEntity], bool]:
         ...
@@ -3,9 +3,11 @@ from typing import Protocol
 from uuid import UUID
 
 from app.domain.session.session_entity import (
+    RegistrationPreflightEntity,
     SessionEntity,
     SessionWithCoachEntity
 )
+from app.shared.utils.cursor import Cursor
 
 
 class SessionReadRepoPort(Protocol):
@@ -20,25 +22,11 @@ class SessionReadRepoPort(Protocol):
         offset: int,
         limit: int,
         _from: datetime | None,
-        to: datetime | None
+        to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[SessionWithCoachEntity], bool]:
         ...
 
-    async def is_session_overlapping(
-        self,
-        starts_at: datetime,
-        ends_at: datetime
-    ) -> bool:
-        ...
-
-    async def is_session_overlapping_except(
-        self,
-        starts_at: datetime,
-        ends_at: datetime,
-        except_session_id: UUID
-    ) -> bool:
-        ...
-
     async def exist_session(
         self,
         session_id: UUID
@@ -70,12 +58,25 @@ class SessionReadRepoPort(Protocol):
     ) -> SessionEntity:
         ...
 
+    async def get_registration_preflight(
+        self,
+        session_id: UUID,
+        user_id: UUID
+    ) -> RegistrationPreflightEntity:
+        ...
+
     async def public_exists_session(
         self,
         session_id: UUID
     ) -> bool:
         ...
 
+    async def get_session_version(
+        self,
+        session_id: UUID
+    ) -> str | None:
+        ...
+
     async def get_session_participants(
         self,
         session_id: UUID
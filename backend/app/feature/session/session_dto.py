@@ -6,6 +6,10 @@ from pydantic.fields import Field
 from app.shared.rules.currency_rules import (
     CURRENCY_LENGTH
 )
+from app.shared.rules.session_capacity_rules import (
+    DEFAULT_SESSION_CAPACITY,
+    MIN_SESSION_CAPACITY
+)
 from app.shared.rules.session_title_rules import (
     MAX_TITLE_LENGTH,
     MIN_TITLE_LENGTH
@@ -49,6 +53,7 @@ class PaginatedSessionsOutputDTO(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    next_cursor: str | None = None
 
 
 class SessionCreationInputDTO(BaseModel):
@@ -65,6 +70,10 @@ class SessionCreationInputDTO(BaseModel):
         min_length=CURRENCY_LENGTH,
         max_length=CURRENCY_LENGTH
     )
+    capacity: int = Field(
+        DEFAULT_SESSION_CAPACITY,
+        ge=MIN_SESSION_CAPACITY
+    )
 
     @field_validator("price_cents")
     @staticmethod
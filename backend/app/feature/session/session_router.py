@@ -1,5 +1,5 @@
 from datetime import datetime
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Query, Response, status
 from uuid import UUID
 from app.feature.session.session_dto import (
     AttendanceInputDTO,
@@ -27,6 +27,14 @@ from app.infrastructure.settings.provider import (
     get_front_end_link,
     get_session_participation_ttl
 )
+from app.shared.utils.cursor import decode_cursor
+from app.shared.utils.etag import (
+    etag_matches,
+    make_etag,
+    not_modified,
+    set_etag
+)
+from app.shared.utils.json_response import FastJSONResponse, page_response
 
 router = APIRouter(
     prefix="/sessions",
@@ -36,13 +44,26 @@ router = APIRouter(
 
 @router.get(
     "/{session_id}",
-    status_code=200
+    status_code=200,
+    response_model=GetOutputDto
 )
 async def get_session(
     session_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
     uow: SessionPulbicUoWPort = Depends(get_session_public_uow),
     service: SessionService = Depends(get_session_service)
-) -> GetOutputDto:
+) -> GetOutputDto | Response:
+    etag = make_etag(
+        "session",
+        await service.get_session_version(uow=uow, session_id=session_id)
+    )
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    set_etag(response, etag)
+
     return await service.get_session(
         uow=uow,
         session_id=session_id
@@ -55,9 +76,21 @@ async def get_session(
 )
 async def get_session_participants(
     session_id: UUID,
+    response: Response,
+    if_none_match: str | None = Header(None),
     uow: SessionPulbicUoWPort = Depends(get_session_public_uow),
     service: SessionService = Depends(get_session_service)
-) -> list[ParticipantDTO]:
+) -> list[ParticipantDTO] | Response:
+    etag = make_etag(
+        "session_participants",
+        await service.get_session_version(uow=uow, session_id=session_id)
+    )
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    set_etag(response, etag)
+
     return await service.get_session_participants(
         uow=uow,
         session_id=session_id
@@ -90,25 +123,22 @@ async def create_session(
 async def get_all_sessions(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
     _from: datetime | None = Query(None),
     to: datetime | None = Query(None),
     uow: SessionPulbicUoWPort = Depends(get_session_public_uow),
     service: SessionService = Depends(get_session_service)
-) -> PaginatedSessionsOutputDTO:
-    items, has_more = await service.get_all_sessions(
+) -> FastJSONResponse:
+    items, has_more, next_cursor = await service.get_all_sessions(
         offset=offset,
         limit=limit,
         _from=_from,
         to=to,
         uow=uow,
+        cursor=decode_cursor(cursor)
     )
 
-    return PaginatedSessionsOutputDTO(
-        items=items,
-        limit=limit,
-        offset=offset,
-        has_more=has_more
-    )
+    return page_response(items, limit, offset, has_more, next_cursor)
 
 
 @router.put(
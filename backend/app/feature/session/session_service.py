@@ -1,3 +1,4 @@
+from typing import Any
 from uuid import UUID
 from datetime import datetime, timedelta
 import stripe
@@ -27,7 +28,6 @@ from app.domain.session.session_exception import (
     SessionClosedForRegistration,
     SessionIsFullError,
     SessionNotFoundError,
-    SessionOverlappingError,
     SessionStartedError
 )
 from app.feature.session.session_dto import (
@@ -58,6 +58,7 @@ from app.domain.auth.auth_exceptions import (
     AuthUserIsDisabledError
 )
 from app.shared.utils.time import utcnow
+from app.shared.utils.cursor import Cursor, next_cursor
 
 
 class SessionService:
@@ -86,6 +87,18 @@ class SessionService:
             status=session.status
         )
 
+    async def get_session_version(
+            self,
+            uow: SessionPulbicUoWPort,
+            session_id: UUID
+    ) -> str:
+        version = await uow.session_read_repo.get_session_version(session_id)
+
+        if version is None:
+            raise SessionNotFoundError()
+
+        return version
+
     async def get_session_participants(
             self,
             uow: SessionPulbicUoWPort,
@@ -129,19 +142,14 @@ class SessionService:
         ):
             raise InvalidCoachAccountError()
 
-        if await uow.session_read_repo.is_session_overlapping(
-            starts_at=input.starts_at,
-            ends_at=input.ends_at
-        ):
-            raise SessionOverlappingError()
-
         new_session = NewSessionEntity(
             coach_id=actor.id,
             title=title,
             starts_at=input.starts_at,
             ends_at=input.ends_at,
             price_cents=input.price_cents,
-            currency=currency
+            currency=currency,
+            capacity=input.capacity
         )
 
         await uow.session_creation_repo.create_session(new_session)
@@ -152,33 +160,36 @@ class SessionService:
         limit: int,
         _from: datetime | None,
         to: datetime | None,
-        uow: SessionPulbicUoWPort
-    ) -> tuple[list[GetOutputDto], bool]:
+        uow: SessionPulbicUoWPort,
+        cursor: Cursor | None = None
+    ) -> tuple[list[dict[str, Any]], bool, str | None]:
         sessions, has_more = (
             await uow.session_read_repo.get_all_sessions(
                 offset=offset,
                 limit=limit,
                 _from=_from,
                 to=to,
+                cursor=cursor
             )
         )
 
+        # Trusted rows shaped as GetOutputDto, encoded by page_response.
         return [
-            GetOutputDto(
-                id=session.id,
-                coach=CoachPublicDto(
-                    id=session.coach.user_id,
-                    first_name=session.coach.first_name,
-                    last_name=session.coach.last_name
-                ),
-                title=session.title,
-                starts_at=session.starts_at,
-                ends_at=session.ends_at,
-                price_cents=session.price_cents,
-                currency=session.currency,
-                status=session.status
-            ) for session in sessions
-        ], has_more
+            {
+                "id": session.id,
+                "coach": {
+                    "id": session.coach.user_id,
+                    "first_name": session.coach.first_name,
+                    "last_name": session.coach.last_name,
+                },
+                "title": session.title,
+                "starts_at": session.starts_at,
+                "ends_at": session.ends_at,
+                "price_cents": session.price_cents,
+                "currency": session.currency,
+                "status": session.status,
+            } for session in sessions
+        ], has_more, next_cursor(sessions, has_more)
 
     async def cancel_session(
         self,
@@ -332,13 +343,6 @@ class SessionService:
         ):
             raise NotOwnerOfSessionError()
 
-        if await uow.session_read_repo.is_session_overlapping_except(
-            starts_at=input.starts_at,
-            ends_at=input.ends_at,
-            except_session_id=session_id
-        ):
-            raise SessionOverlappingError()
-
         await uow.session_update_repo.update_session(
             session_id=session_id,
             title=title,
@@ -388,47 +392,34 @@ class SessionService:
     ) -> tuple[bool, str | None]:
         ensure_has_permission(actor, Permission.SESSION_REGISTRATION)
 
-        if await uow.auth_read_repo.is_user_disabled(actor.id):
-            raise AuthUserIsDisabledError()
-
-        if await uow.session_read_repo.is_session_owner(
+        preflight = await uow.session_read_repo.get_registration_preflight(
             session_id,
             actor.id
-        ):
+        )
+
+        if preflight.user_disabled:
+            raise AuthUserIsDisabledError()
+
+        if preflight.session_owner:
             raise OwnerCantRegisterToOwnSessionError()
 
-        if not await uow.session_read_repo.exist_session(session_id):
+        if preflight.session is None:
             raise SessionNotFoundError()
 
-        if await uow.session_read_repo.is_session_cancelled(session_id):
+        if preflight.session_cancelled:
             raise SessionCancelledError()
 
-        if await uow.session_participation_read_repo.has_active_participation(
-            session_id,
-            actor.id
-        ):
+        if preflight.active_participation:
             raise AlreadyActiveParticipationError()
 
-        if await uow.session_participation_read_repo.is_session_full(
-            session_id
-        ):
+        if preflight.session_full:
             raise SessionIsFullError()
 
-        if not await uow.session_participation_read_repo.is_registration_open(
-            session_id
-        ):
+        if not preflight.registration_open:
             raise SessionClosedForRegistration()
 
-        session = await uow.session_read_repo.system_get_session_by_id(
-            session_id
-        )
-
-        credit = (
-            await uow.credit_ledger_read_repo.fetch_credit_by_user_id(
-                user_id=actor.id,
-                currency=session.currency
-            )
-        )
+        session = preflight.session
+        credit = preflight.credit_cents or 0
 
         credit_applied = min(credit, session.price_cents)
 
@@ -494,6 +485,7 @@ class SessionService:
                     session_id=session.id,
                     provider=PaymentProvider.STRIPE,
                     provider_intent_id=None,
+                    provider_checkout_id=stripe_session.id,
                     status=str(stripe_session.status),
                     credit_applied_cents=credit_applied,
                     amount_cents=final_amount,
@@ -16,6 +16,9 @@ from .credit_ledger_cretion_repository_port import (
 from .coach_stripe_account_update_repository_port import (
     CoachStripeAccountUpdateRepoPort
 )
+from .stripe_event_inbox_repository_port import (
+    StripeEventInboxRepoPort
+)
 
 __all__ = [
     "PaymentIntentUpdateRepoPort",
@@ -23,5 +26,6 @@ __all__ = [
     "PaymentCreationRepoPort",
     "SessionParticipationUpdateRepoPort",
     "CreditLedgerCreationRepoPort",
-    "CoachStripeAccountUpdateRepoPort"
+    "CoachStripeAccountUpdateRepoPort",
+    "StripeEventInboxRepoPort"
 ]
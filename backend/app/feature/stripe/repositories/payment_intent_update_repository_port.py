@@ -2,6 +2,9 @@ from typing import Protocol
 from uuid import UUID
 
 from app.domain.payment_intent.payment_intent_providers import PaymentProvider
+from app.domain.session_participation.session_participation_entity import (
+    ReleasedParticipationEntity
+)
 
 
 class PaymentIntentUpdateRepoPort(Protocol):
@@ -20,3 +23,9 @@ class PaymentIntentUpdateRepoPort(Protocol):
         provider_intent_id: str
     ) -> None:
         ...
+
+    async def cancel_for_participations(
+        self,
+        participations: list[ReleasedParticipationEntity]
+    ) -> list[str | None]:
+        ...
@@ -1,5 +1,8 @@
 from typing import Protocol
 from uuid import UUID
+from app.domain.session_participation.session_participation_entity import (
+    ReleasedParticipationEntity
+)
 
 
 class SessionParticipationUpdateRepoPort(Protocol):
@@ -16,3 +19,9 @@ class SessionParticipationUpdateRepoPort(Protocol):
         user_id: UUID
     ) -> None:
         ...
+
+    async def release_expired(
+        self,
+        limit: int
+    ) -> list[ReleasedParticipationEntity]:
+        ...
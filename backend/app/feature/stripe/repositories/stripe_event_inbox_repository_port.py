@@ -0,0 +1,39 @@
+from typing import Protocol
+from app.domain.stripe.stripe_inbox_entity import (
+    StripeInboxEventEntity,
+    StripeInboxStatsEntity
+)
+
+
+class StripeEventInboxRepoPort(Protocol):
+    async def enqueue(
+        self,
+        event_id: str,
+        event_type: str,
+        payload: str
+    ) -> bool:
+        ...
+
+    async def claim_next(
+        self,
+        lease_seconds: float
+    ) -> StripeInboxEventEntity | None:
+        ...
+
+    async def lock(self, event_id: str) -> bool:
+        ...
+
+    async def complete(self, event_id: str) -> None:
+        ...
+
+    async def fail(
+        self,
+        event_id: str,
+        error: str,
+        retry_in_seconds: float,
+        max_attempts: int
+    ) -> bool:
+        ...
+
+    async def stats(self) -> StripeInboxStatsEntity:
+        ...
@@ -5,10 +5,7 @@ from app.feature.stripe.stripe_dependencies import get_stripe_service
 from app.feature.stripe.stripe_service import StripeService
 from app.feature.stripe.uow.stripe_uow_port import StripeUoWPort
 from app.infrastructure.persistence.sqlalchemy.provider import get_stripe_uow
-from app.infrastructure.settings.provider import (
-    get_stripe_client,
-    get_web_hook_secret
-)
+from app.infrastructure.settings.provider import get_web_hook_secret
 
 router = APIRouter(
     prefix="/stripe",
@@ -25,7 +22,6 @@ async def stripe_webhook(
     uow: StripeUoWPort = Depends(get_stripe_uow),
     stripe_signature: str = Header(None, alias="Stripe-Signature"),
     webhook_secret: str = Depends(get_web_hook_secret),
-    stripe_client: stripe.StripeClient = Depends(get_stripe_client),
     service: StripeService = Depends(get_stripe_service)
 ):
     if not stripe_signature:
@@ -44,10 +40,11 @@ async def stripe_webhook(
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid payload")
 
-    await service.handle_stripe_event(
+    # Processed in the background; redeliveries are acknowledged again.
+    await service.enqueue_stripe_event(
         uow,
         event,
-        stripe_client
+        payload.decode("utf-8")
     )
 
     return {"status": "ok"}
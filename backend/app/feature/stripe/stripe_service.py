@@ -1,3 +1,5 @@
+import asyncio
+import json
 from uuid import UUID
 from app.domain.credit.credit_cause import CreditCause
 from app.domain.credit.credit_entity import NewCreditEntity
@@ -9,6 +11,11 @@ from app.domain.stripe.stripe_exception import (
 )
 import stripe
 from app.domain.payment.payment_entity import NewPaymentEntity
+from app.domain.stripe.stripe_balance_entity import StripeBalanceEntity
+from app.domain.session_participation.session_participation_entity import (
+    ParticipationSweepEntity
+)
+from app.domain.stripe.stripe_inbox_entity import StripeInboxEventEntity
 from app.feature.stripe.uow.stripe_uow_port import StripeUoWPort
 from app.domain.payment_intent.payment_intent_providers import (
     PaymentProvider
@@ -16,11 +23,119 @@ from app.domain.payment_intent.payment_intent_providers import (
 
 
 class StripeService:
+    async def enqueue_stripe_event(
+        self,
+        uow: StripeUoWPort,
+        event: stripe.Event,
+        payload: str
+    ) -> bool:
+        return await uow.stripe_event_inbox_repo.enqueue(
+            event_id=event.id,
+            event_type=event.type,
+            payload=payload
+        )
+
+    def parse_inbox_event(
+        self,
+        inbox_event: StripeInboxEventEntity
+    ) -> stripe.Event:
+        return stripe.Event.construct_from(
+            json.loads(inbox_event.payload),
+            stripe.api_key
+        )
+
+    async def release_expired_participations(
+        self,
+        uow: StripeUoWPort,
+        batch_size: int
+    ) -> ParticipationSweepEntity:
+        released = await uow.session_participation_update_repo.release_expired(
+            batch_size
+        )
+
+        if not released:
+            return ParticipationSweepEntity(
+                released=0,
+                intents_cancelled=0,
+                checkout_ids=()
+            )
+
+        # Checkouts are expired on Stripe by the caller once committed.
+        checkout_ids = await (
+            uow.payment_intent_update_repo.cancel_for_participations(released)
+        )
+
+        return ParticipationSweepEntity(
+            released=len(released),
+            intents_cancelled=len(checkout_ids),
+            checkout_ids=tuple(
+                checkout_id
+                for checkout_id in checkout_ids
+                if checkout_id is not None
+            )
+        )
+
+    async def expire_checkout(
+        self,
+        stripe_client: stripe.StripeClient,
+        checkout_id: str
+    ) -> None:
+        # The Stripe client is synchronous.
+        await asyncio.to_thread(
+            stripe_client.checkout.sessions.expire,
+            checkout_id
+        )
+
+    async def fetch_balance(
+        self,
+        event: stripe.Event,
+        stripe_client: stripe.StripeClient
+    ) -> StripeBalanceEntity | None:
+        # Called before any transaction is opened: the inbox worker must
+        # not hold a row lock while waiting on Stripe.
+        if event.type != "payment_intent.succeeded":
+            return None
+
+        intent = event.data.object
+        if not isinstance(intent, stripe.PaymentIntent):
+            raise IntentIsInvalidError()
+
+        # The Stripe client is synchronous.
+        stripe_payment_intent = await asyncio.to_thread(
+            stripe_client.payment_intents.retrieve,
+            intent["id"],
+            params={
+                "expand": ["latest_charge.balance_transaction"]
+            }
+        )
+        charges = stripe_payment_intent.latest_charge
+        if charges is None or isinstance(charges, str):
+            raise ChargeNotReadyError()
+
+        balance_tx = charges.balance_transaction
+        if balance_tx is None or isinstance(balance_tx, str):
+            raise BalanceNotExpendedError()
+
+        return StripeBalanceEntity(
+            gross_amount_cents=balance_tx.amount,
+            provider_fee_cents=balance_tx.fee,
+            net_amount_cents=balance_tx.net
+        )
+
     async def handle_stripe_event(
         self,
         uow: StripeUoWPort,
         event: stripe.Event,
         stripe_client: stripe.StripeClient
+    ) -> None:
+        balance = await self.fetch_balance(event, stripe_client)
+        await self.apply_stripe_event(uow, event, balance)
+
+    async def apply_stripe_event(
+        self,
+        uow: StripeUoWPort,
+        event: stripe.Event,
+        balance: StripeBalanceEntity | None
     ) -> None:
         match event.type:
             case "payment_intent.succeeded":
@@ -56,24 +171,9 @@ class StripeService:
                         provider_intent_id=provider_payment_id,
                     )
 
-                stripe_payment_intent = stripe_client.payment_intents.retrieve(
-                    provider_payment_id,
-                    params={
-                        "expand": ["latest_charge.balance_transaction"]
-                    }
-                )
-                charges = stripe_payment_intent.latest_charge
-                if charges is None or isinstance(charges, str):
-                    raise ChargeNotReadyError()
-
-                balance_tx = charges.balance_transaction
-                if balance_tx is None or isinstance(balance_tx, str):
+                if balance is None:
                     raise BalanceNotExpendedError()
 
-                gross_amount = balance_tx.amount
-                provider_fee = balance_tx.fee
-                net_amount = balance_tx.net
-
                 await uow.payment_intent_update_repo.mark_payment_intent(
                     provider_payment_id=provider_payment_id,
                     provider_status=intent["status"]
@@ -84,9 +184,9 @@ class StripeService:
                     user_id=payment_intent.user_id,
                     provider=PaymentProvider.STRIPE.value,
                     provider_payment_id=provider_payment_id,
-                    gross_amount_cents=gross_amount,
-                    provider_fee_cents=provider_fee,
-                    net_amount_cents=net_amount,
+                    gross_amount_cents=balance.gross_amount_cents,
+                    provider_fee_cents=balance.provider_fee_cents,
+                    net_amount_cents=balance.net_amount_cents,
                     currency=payment_intent.currency,
                 )
 
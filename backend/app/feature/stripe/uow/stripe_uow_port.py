@@ -4,7 +4,8 @@ from app.feature.stripe.repositories import (
     SessionParticipationUpdateRepoPort,
     PaymentCreationRepoPort,
     CreditLedgerCreationRepoPort,
-    CoachStripeAccountUpdateRepoPort
+    CoachStripeAccountUpdateRepoPort,
+    StripeEventInboxRepoPort
 )
 
 
@@ -15,3 +16,4 @@ class StripeUoWPort():
     payment_creation_repo: PaymentCreationRepoPort
     credit_ledger_creation_repo: CreditLedgerCreationRepoPort
     coach_stripe_account_update_repo: CoachStripeAccountUpdateRepoPort
+    stripe_event_inbox_repo: StripeEventInboxRepoPort
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable
+from app.shared.cache.cache_backend_port import CacheBackendPort
+
+
+class LruCacheBackend(CacheBackendPort):
+    """In-process LRU cache with per-entry expiry.
+
+    Counters written by ``incr`` never expire and are not evicted, like
+    the memcached counters they stand in for.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2048,
+        clock: Callable[[], float] = monotonic
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[bytes, float]] = (
+            OrderedDict()
+        )
+        self._counters: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry[1] <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0 or self._max_entries <= 0:
+            return
+
+        self._entries[key] = (value, self._clock() + ttl_seconds)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def incr(self, key: str, delta: int = 1) -> int:
+        self._counters[key] = self._counters.get(key, 0) + delta
+        return self._counters[key]
+
+    async def close(self) -> None:
+        self._entries.clear()
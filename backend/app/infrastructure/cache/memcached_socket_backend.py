@@ -0,0 +1,161 @@
+import asyncio
+import math
+from app.shared.cache.cache_backend_port import (
+    CacheBackendPort,
+    CacheUnavailableError
+)
+
+_Connection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+_CONNECTION_ERRORS = (
+    OSError,
+    EOFError,
+    TimeoutError,
+    ValueError,
+    asyncio.LimitOverrunError,
+)
+
+
+class MemcachedSocketBackend(CacheBackendPort):
+    """Memcached client over a local Unix socket.
+
+    Speaks the memcached text protocol (``get``, ``set``, ``incr``,
+    ``add``) so a cache shared by every worker process on the host needs
+    no extra client library. Values are stored as the bytes they are
+    given: serializing them, as JSON, is up to the caller, so nothing
+    read back from the socket is ever executed.
+
+    Up to ``pool_size`` connections are opened lazily and reused. A
+    command that fails or exceeds ``timeout_seconds`` drops its connection
+    and raises ``CacheUnavailableError``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        pool_size: int = 8,
+        timeout_seconds: float = 0.05
+    ) -> None:
+        self._path = path
+        self._timeout_seconds = timeout_seconds
+        self._idle: list[_Connection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def get(self, key: str) -> bytes | None:
+        _, data = await self._command(f"get {key}\r\n".encode(), True)
+
+        return data
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        if ttl_seconds <= 0:
+            return
+
+        command = (
+            f"set {key} 0 {max(1, math.ceil(ttl_seconds))} {len(value)}\r\n"
+        ).encode() + value + b"\r\n"
+
+        header, _ = await self._command(command)
+        self._expect(header, b"STORED")
+
+    async def incr(self, key: str, delta: int = 1) -> int:
+        while True:
+            header, _ = await self._command(
+                f"incr {key} {delta}\r\n".encode()
+            )
+
+            if header != b"NOT_FOUND":
+                return self._parse_int(header)
+
+            # First increment: create the counter, unless a concurrent
+            # client just did.
+            value = str(delta)
+            header, _ = await self._command(
+                f"add {key} 0 0 {len(value)}\r\n{value}\r\n".encode()
+            )
+
+            if header == b"STORED":
+                return delta
+
+            self._expect(header, b"NOT_STORED")
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    async def _command(
+        self,
+        command: bytes,
+        retrieval: bool = False
+    ) -> tuple[bytes, bytes | None]:
+        async with self._slots:
+            connection = None
+
+            try:
+                async with asyncio.timeout(self._timeout_seconds):
+                    connection = await self._acquire()
+                    result = await self._roundtrip(
+                        connection,
+                        command,
+                        retrieval
+                    )
+            except CacheUnavailableError:
+                self._discard(connection)
+                raise
+            except _CONNECTION_ERRORS as exc:
+                self._discard(connection)
+                raise CacheUnavailableError(repr(exc)) from exc
+
+            self._idle.append(connection)
+            return result
+
+    async def _acquire(self) -> _Connection:
+        if self._idle:
+            return self._idle.pop()
+
+        return await asyncio.open_unix_connection(self._path)
+
+    async def _roundtrip(
+        self,
+        connection: _Connection,
+        command: bytes,
+        retrieval: bool
+    ) -> tuple[bytes, bytes | None]:
+        reader, writer = connection
+        writer.write(command)
+        await writer.drain()
+
+        header = (await reader.readuntil(b"\r\n"))[:-2]
+
+        if not retrieval or header == b"END":
+            return header, None
+
+        # VALUE <key> <flags> <bytes>
+        parts = header.split()
+
+        if len(parts) != 4 or parts[0] != b"VALUE":
+            raise ValueError(f"unexpected reply {header!r}")
+
+        data = await reader.readexactly(int(parts[3]) + 2)
+        end = await reader.readuntil(b"\r\n")
+        self._expect(end[:-2], b"END")
+
+        return header, data[:-2]
+
+    @staticmethod
+    def _discard(connection: _Connection | None) -> None:
+        # A connection left mid-reply cannot be reused.
+        if connection is not None:
+            connection[1].close()
+
+    @staticmethod
+    def _parse_int(header: bytes) -> int:
+        if not header.isdigit():
+            raise CacheUnavailableError(f"unexpected reply {header!r}")
+
+        return int(header)
+
+    @staticmethod
+    def _expect(header: bytes, expected: bytes) -> None:
+        if header != expected:
+            raise CacheUnavailableError(f"unexpected reply {header!r}")
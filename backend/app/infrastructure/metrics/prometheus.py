@@ -0,0 +1,183 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace('"', '\\"')
+    )
+
+
+def _labels(names: LabelValues, values: LabelValues) -> str:
+    if not names:
+        return ""
+
+    return "{" + ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values)
+    ) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+@dataclass(slots=True)
+class _HistogramSeries:
+    # One count per bucket plus the +Inf overflow, not cumulative.
+    counts: list[int]
+    sum: float = 0.0
+    count: int = 0
+
+
+@dataclass
+class Histogram:
+    """Labelled histogram with fixed upper bounds.
+
+    Observations cost a binary search and three increments; cumulative
+    bucket counts are only computed when rendering.
+    """
+    name: str
+    help: str
+    label_names: LabelValues
+    buckets: tuple[float, ...]
+    _series: dict[LabelValues, _HistogramSeries] = field(
+        default_factory=dict
+    )
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        series = self._series.get(labels)
+
+        if series is None:
+            series = self._series[labels] = _HistogramSeries(
+                [0] * (len(self.buckets) + 1)
+            )
+
+        series.counts[bisect_left(self.buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+
+    def clear(self) -> None:
+        self._series.clear()
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} histogram",
+        ]
+        names = (*self.label_names, "le")
+
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+
+            for bound, count in zip(
+                (*self.buckets, float("inf")),
+                series.counts
+            ):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket"
+                    f"{_labels(names, (*labels, _number(bound)))} "
+                    f"{cumulative}"
+                )
+
+            suffix = _labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{suffix} {_number(series.sum)}")
+            lines.append(f"{self.name}_count{suffix} {series.count}")
+
+        return lines
+
+
+@dataclass
+class Gauge:
+    """Labelled gauge, set to an absolute value."""
+    name: str
+    help: str
+    label_names: LabelValues
+    _values: dict[LabelValues, float] = field(default_factory=dict)
+
+    def set(self, labels: LabelValues, value: float) -> None:
+        self._values[labels] = value
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} gauge",
+        ]
+
+        for labels, value in sorted(self._values.items()):
+            lines.append(
+                f"{self.name}{_labels(self.label_names, labels)} "
+                f"{_number(value)}"
+            )
+
+        return lines
+
+
+M = TypeVar("M", Histogram, Gauge)
+
+
+class MetricsRegistry:
+    """Process wide metrics rendered in the Prometheus text format.
+
+    Metrics are declared once, at import time, by the module recording
+    them. Everything runs on the event loop thread (cursor hooks run in
+    SQLAlchemy's greenlets, on that same thread), so no lock is taken.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Histogram | Gauge] = {}
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        label_names: LabelValues,
+        buckets: tuple[float, ...]
+    ) -> Histogram:
+        return self._register(
+            Histogram(
+                name,
+                help,
+                label_names,
+                tuple(sorted(float(bound) for bound in buckets))
+            )
+        )
+
+    def gauge(self, name: str, help: str, label_names: LabelValues) -> Gauge:
+        return self._register(Gauge(name, help, label_names))
+
+    def _register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"metric {metric.name!r} is already registered")
+
+        self._metrics[metric.name] = metric
+
+        return metric
+
+    def clear(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def render(self) -> str:
+        lines = []
+
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry()
@@ -0,0 +1,104 @@
+from contextvars import ContextVar
+from time import perf_counter
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.infrastructure.metrics.prometheus import METRICS
+
+UNMATCHED_ROUTE = "unmatched"
+
+HTTP_REQUEST_DURATION = METRICS.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status.",
+    ("method", "route", "status"),
+    (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+)
+
+HTTP_REQUEST_DB_ROUND_TRIPS = METRICS.histogram(
+    "http_request_db_round_trips",
+    "Database statements executed per HTTP request, both engines.",
+    ("method", "route"),
+    (0, 1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 64)
+)
+
+
+class _RoundTrips:
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+
+# Set per request by the middleware; the holder is shared with the
+# request's child contexts and SQLAlchemy's greenlets.
+_round_trips: ContextVar[_RoundTrips | None] = ContextVar(
+    "db_round_trips",
+    default=None
+)
+
+
+def count_round_trip() -> None:
+    """Count one statement against the current request, if any."""
+    round_trips = _round_trips.get()
+
+    if round_trips is not None:
+        round_trips.count += 1
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the matched route, ``/sessions/{session_id}``
+    rather than the path, to keep label cardinality bounded."""
+    route = scope.get("route")
+
+    return getattr(route, "path_format", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Record the latency, status and database round trips of every
+    HTTP request.
+
+    The route is only known once routing ran, so labels are resolved
+    after the downstream app returns. A request failing before its
+    response starts is recorded as a 500.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        round_trips = _RoundTrips()
+        token = _round_trips.set(round_trips)
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        start = perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            _round_trips.reset(token)
+            method, route = scope["method"], route_template(scope)
+
+            HTTP_REQUEST_DURATION.observe(
+                (method, route, str(status)),
+                elapsed
+            )
+            HTTP_REQUEST_DB_ROUND_TRIPS.observe(
+                (method, route),
+                round_trips.count
+            )
@@ -0,0 +1,444 @@
+"""In-memory counterparts of the ``app_fcn`` functions shared by several
+repositories: actor checks, session projections, seat accounting, the
+credit ledger and keyset pages.
+
+Row level security is not mirrored: the actor only gates the calls
+the SQL functions guard with ``is_admin``, ``is_coach`` or a self
+check, and every row is visible.
+"""
+from bisect import bisect_left
+from dataclasses import replace
+from datetime import datetime
+from typing import Iterable, Sequence, TypeVar
+from uuid import UUID, uuid4
+from app.domain.auth.auth_exceptions import PermissionDeniedError
+from app.domain.auth.role import Role
+from app.domain.credit.credit_cause import CreditCause
+from app.domain.credit.credit_entity import CreditEntity
+from app.domain.credit.credit_exception import (
+    CreditNegativeError,
+    InvalidCreditAmount
+)
+from app.domain.session.session_entity import (
+    SessionCompleteEntity,
+    SessionEntity,
+    SessionWithCoachEntity
+)
+from app.domain.session.session_exception import (
+    SessionNotFoundError,
+    SessionStartedError
+)
+from app.domain.session.session_status import SessionStatus
+from app.domain.session_participation.session_participation_entity import (
+    SessionParticipationEntity
+)
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.infrastructure.persistence.in_memory.storage import (
+    InMemoryStorage,
+    SessionRow
+)
+from app.shared.utils.cursor import Cursor
+from app.shared.utils.time import utcnow
+
+T = TypeVar("T")
+
+
+def ensure_role(
+    storage: InMemoryStorage,
+    actor_id: UUID | None,
+    *roles: Role
+) -> None:
+    if not any(storage.has_role(actor_id, role) for role in roles):
+        raise PermissionDeniedError()
+
+
+def ensure_self(actor_id: UUID | None, user_id: UUID) -> None:
+    if actor_id != user_id:
+        raise PermissionDeniedError()
+
+
+def get_session(storage: InMemoryStorage, session_id: UUID) -> SessionRow:
+    session = storage.sessions.get(session_id)
+
+    if session is None:
+        raise SessionNotFoundError()
+
+    return session
+
+
+def is_session_owner(
+    storage: InMemoryStorage,
+    session_id: UUID,
+    user_id: UUID
+) -> bool:
+    session = storage.sessions.get(session_id)
+
+    return (
+        session is not None
+        and session.coach_id == user_id
+        and session.status != SessionStatus.CANCELLED
+    )
+
+
+def overlaps(
+    storage: InMemoryStorage,
+    starts_at: datetime,
+    ends_at: datetime,
+    exclude: UUID | None = None
+) -> bool:
+    """Mirror of the ``excl_sessions_no_overlap`` constraint: any two
+    non-cancelled sessions, whatever their coach, conflict when their
+    ``[starts_at, ends_at)`` periods intersect.
+
+    Non-cancelled sessions never overlap each other, so walking back
+    from the last session starting before ``ends_at``, the first one
+    kept decides: none before it can end later.
+    """
+    index = storage.sessions_by_start
+    position = bisect_left(index, (ends_at,))
+
+    for i in range(position - 1, -1, -1):
+        session_id = index[i][1]
+        other = storage.sessions[session_id]
+
+        if (
+            session_id == exclude
+            or other.status == SessionStatus.CANCELLED
+        ):
+            continue
+
+        return starts_at < other.ends_at
+
+    return False
+
+
+def session_entity(session: SessionRow) -> SessionEntity:
+    return SessionEntity(
+        id=session.id,
+        coach_id=session.coach_id,
+        title=session.title,
+        starts_at=session.starts_at,
+        ends_at=session.ends_at,
+        status=session.status,
+        cancelled_at=session.cancelled_at,  # type: ignore[arg-type]
+        price_cents=session.price_cents,
+        currency=session.currency,
+        created_at=session.created_at,
+        updated_at=session.updated_at
+    )
+
+
+def session_with_coach(
+    storage: InMemoryStorage,
+    session: SessionRow
+) -> SessionWithCoachEntity:
+    return SessionWithCoachEntity(
+        id=session.id,
+        coach=storage.user_profiles[session.coach_id],
+        title=session.title,
+        starts_at=session.starts_at,
+        ends_at=session.ends_at,
+        status=session.status,
+        cancelled_at=session.cancelled_at,  # type: ignore[arg-type]
+        price_cents=session.price_cents,
+        currency=session.currency,
+        created_at=session.created_at,
+        updated_at=session.updated_at
+    )
+
+
+def participants(
+    storage: InMemoryStorage,
+    session_id: UUID
+) -> list[UserProfileEntity]:
+    """Profiles of every participation, cancelled ones included."""
+    return sorted(
+        (
+            storage.user_profiles[user_id]
+            for user_id in storage.participations.get(session_id, ())
+        ),
+        key=lambda p: (p.last_name, p.first_name, str(p.user_id))
+    )
+
+
+def session_complete(
+    storage: InMemoryStorage,
+    session: SessionRow
+) -> SessionCompleteEntity:
+    return SessionCompleteEntity(
+        id=session.id,
+        coach=storage.user_profiles[session.coach_id],
+        title=session.title,
+        starts_at=session.starts_at,
+        ends_at=session.ends_at,
+        status=session.status,
+        cancelled_at=session.cancelled_at,  # type: ignore[arg-type]
+        price_cents=session.price_cents,
+        currency=session.currency,
+        created_at=session.created_at,
+        updated_at=session.updated_at,
+        participants=participants(storage, session.id)
+    )
+
+
+def is_active_participation(
+    participation: SessionParticipationEntity | None,
+    session: SessionRow,
+    now: datetime
+) -> bool:
+    return (
+        participation is not None
+        and participation.cancelled_at is None
+        and (
+            session.price_cents == 0
+            or participation.paid_at is not None
+            or participation.expires_at > now
+        )
+    )
+
+
+def is_lapsed_participation(
+    participation: SessionParticipationEntity,
+    session: SessionRow,
+    now: datetime
+) -> bool:
+    """Unpaid seat whose checkout window is over."""
+    return (
+        participation.cancelled_at is None
+        and participation.paid_at is None
+        and session.price_cents > 0
+        and participation.expires_at <= now
+    )
+
+
+def is_session_full(
+    storage: InMemoryStorage,
+    session: SessionRow,
+    now: datetime
+) -> bool:
+    """No seat left, and none held by a lapsed unpaid participation."""
+    if session.capacity is None or session.seats_taken < session.capacity:
+        return False
+
+    return not any(
+        is_lapsed_participation(participation, session, now)
+        for participation in storage.participations.get(
+            session.id, {}
+        ).values()
+    )
+
+
+def is_registration_open(session: SessionRow, now: datetime) -> bool:
+    return now < session.starts_at and session.status != (
+        SessionStatus.CANCELLED
+    )
+
+
+def is_attendance_payload_valid(
+    storage: InMemoryStorage,
+    session: SessionRow,
+    attendance_list: dict[UUID, bool],
+    now: datetime
+) -> bool:
+    """Every listed user holds an active participation, paid when the
+    session is."""
+    by_user = storage.participations.get(session.id, {})
+
+    for user_id in attendance_list:
+        participation = by_user.get(user_id)
+
+        if not is_active_participation(participation, session, now):
+            return False
+
+        if (
+            session.price_cents > 0
+            and participation.paid_at is None  # type: ignore[union-attr]
+        ):
+            return False
+
+    return True
+
+
+def cancel_participation(
+    storage: InMemoryStorage,
+    participation: SessionParticipationEntity,
+    now: datetime
+) -> None:
+    session = storage.sessions[participation.session_id]
+
+    storage.participations[session.id][participation.user_id] = replace(
+        participation,
+        cancelled_at=now
+    )
+    session.seats_taken -= 1
+    session.participation_version += 1
+
+
+def rename_user(
+    storage: InMemoryStorage,
+    user_id: UUID,
+    first_name: str,
+    last_name: str
+) -> None:
+    """Update a profile, bumping the version of every session the user
+    participates in when the name changes."""
+    profile = storage.user_profiles.get(user_id)
+
+    if profile is None or (profile.first_name, profile.last_name) == (
+        first_name,
+        last_name
+    ):
+        return
+
+    storage.user_profiles[user_id] = replace(
+        profile,
+        first_name=first_name,
+        last_name=last_name
+    )
+    storage.profile_updated_at[user_id] = utcnow()
+
+    for session_id in storage.sessions_by_participant.get(user_id, ()):
+        storage.sessions[session_id].participation_version += 1
+
+
+def balance(storage: InMemoryStorage, user_id: UUID, currency: str) -> int:
+    return storage.credit_balances.get((user_id, currency), 0)
+
+
+def append_credit(
+    storage: InMemoryStorage,
+    user_id: UUID,
+    amount_cents: int,
+    currency: str,
+    cause: CreditCause,
+    payment_id: UUID | None = None
+) -> None:
+    if amount_cents == 0:
+        raise InvalidCreditAmount()
+
+    balance_after = balance(storage, user_id, currency) + amount_cents
+
+    if balance_after < 0:
+        raise CreditNegativeError()
+
+    storage.add_credit(CreditEntity(
+        id=uuid4(),
+        user_id=user_id,
+        payment_id=payment_id,  # type: ignore[arg-type]
+        amount_cents=amount_cents,
+        currency=currency,
+        balance_after_cents=balance_after,
+        cause=cause,
+        created_at=utcnow()
+    ))
+
+
+def cancel_session(storage: InMemoryStorage, session_id: UUID) -> None:
+    """Cancel a session, its active participations, and refund every
+    payment once as ``session_cancelled`` credit."""
+    now = utcnow()
+    session = get_session(storage, session_id)
+
+    if session.starts_at <= now:
+        raise SessionStartedError()
+
+    if session.status == SessionStatus.CANCELLED:
+        return
+
+    for participation in list(
+        storage.participations.get(session_id, {}).values()
+    ):
+        if participation.cancelled_at is None:
+            cancel_participation(storage, participation, now)
+
+    refunded = {
+        entry.payment_id
+        for entry in storage.credit_ledger
+        if entry.cause == CreditCause.SESSION_CANCELLED
+    }
+
+    for payment_id in storage.payments_by_session.get(session_id, ()):
+        if payment_id in refunded:
+            continue
+
+        payment = storage.payments[payment_id]
+        append_credit(
+            storage,
+            payment.user_id,
+            payment.net_amount_cents,
+            payment.currency,
+            CreditCause.SESSION_CANCELLED,
+            payment_id=payment.id
+        )
+
+    session.status = SessionStatus.CANCELLED
+    session.cancelled_at = now
+    session.updated_at = now
+
+
+def version(*parts: object) -> str:
+    """``concat_ws(':', ...)``: NULL parts are skipped, timestamps are
+    rendered as epoch seconds."""
+    return ":".join(
+        f"{part.timestamp():.6f}" if isinstance(part, datetime) else str(part)
+        for part in parts
+        if part is not None
+    )
+
+
+def in_range(
+    starts_at: datetime,
+    ends_at: datetime,
+    _from: datetime | None,
+    to: datetime | None
+) -> bool:
+    """Fully contained in ``[_from, to]``, like the session listings."""
+    return (
+        (_from is None or starts_at >= _from)
+        and (to is None or ends_at <= to)
+    )
+
+
+def created_between(
+    created_at: datetime,
+    _from: datetime | None,
+    to: datetime | None
+) -> bool:
+    return (
+        (_from is None or created_at >= _from)
+        and (to is None or created_at <= to)
+    )
+
+
+def keyset_page(
+    rows: Iterable[T],
+    offset: int,
+    limit: int,
+    cursor: Cursor | None
+) -> tuple[list[T], bool]:
+    """One page of rows ordered by ``(created_at, id)`` DESC.
+
+    A cursor takes precedence over the offset, like ``keyset_params``.
+
+    Returns:
+        tuple[list[T], bool]: The page and whether more rows follow.
+    """
+    ordered: Sequence = sorted(
+        rows,
+        key=lambda row: (row.created_at, row.id),  # type: ignore
+        reverse=True
+    )
+
+    if cursor is not None:
+        offset = 0
+        ordered = [
+            row for row in ordered
+            if (row.created_at, row.id) < (  # type: ignore
+                cursor.created_at,
+                cursor.id
+            )
+        ]
+
+    page = list(ordered[offset:offset + limit + 1])
+
+    return page[:limit], len(page) > limit
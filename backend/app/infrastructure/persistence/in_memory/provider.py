@@ -1,18 +1,168 @@
+from functools import lru_cache
 from fastapi import Depends
-from app.infrastructure.persistence.in_memory.storage import (
-    InMemoryAuthStorage
+from app.domain.auth.actor_entity import Actor
+from app.feature.admin.credit.uow.admin_credit_uow_port import (
+    AdminCreditUoWPort
 )
-from app.feature.auth.uow.login_uow import LoginUoWPort
-from app.infrastructure.persistence.in_memory.uow.auth import InMemoryLoginUoW
-from functools import lru_cache
+from app.feature.admin.payment.uow.admin_payment_uow_port import (
+    AdminPaymentUoWPort
+)
+from app.feature.admin.session.uow.admin_session_system_uow_port import (
+    AdminSessionSystemUoWPort
+)
+from app.feature.admin.session.uow.admin_session_uow_port import (
+    AdminSessionUoWPort
+)
+from app.feature.admin.users.uow.admin_user_system_uow_port import (
+    AdminUserSystemUoWPort
+)
+from app.feature.admin.users.uow.admin_user_uow_port import AdminUserUoWPort
+from app.feature.auth.uow.auth_uow_port import AuthUoWPort
+from app.feature.me.uow.me_system_uow_port import MeSystemUoWPort
+from app.feature.me.uow.me_uow_port import MeUoWPort
+from app.feature.coach.uow.coach_uow_port import CoachUoWPort
+from app.feature.credit.uow.credit_uow_port import CreditUoWPort
+from app.feature.payment.uow.payment_uow_port import PaymentUoWPort
+from app.feature.session.uow.session_public_uow_port import (
+    SessionPulbicUoWPort
+)
+from app.feature.session.uow.session_uow_port import SessionUoWPort
+from app.feature.stripe.uow.stripe_uow_port import StripeUoWPort
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.uow.admin import (
+    InMemoryAdminUserUoW,
+    InMemoryAdminUserSystemUoW,
+    InMemoryAdminSessionUoW,
+    InMemoryAdminSessionSystemUoW,
+    InMemoryAdminPaymentUoW,
+    InMemoryAdminCreditUoW
+)
+from app.infrastructure.persistence.in_memory.uow.me import (
+    InMemoryMeUoW,
+    InMemoryMeSystemUoW
+)
+from app.infrastructure.persistence.in_memory.uow.auth import InMemoryAuthUoW
+from app.infrastructure.persistence.in_memory.uow.coach.coach_uow import (
+    InMemoryCoachUoW
+)
+from app.infrastructure.persistence.in_memory.uow.credit.credit_uow import (
+    InMemoryCreditUoW
+)
+from app.infrastructure.persistence.in_memory.uow.payment.payment_uow import (
+    InMemoryPaymentUoW
+)
+from app.infrastructure.persistence.in_memory.uow.session import (
+    InMemorySessionPublicUoW,
+    InMemorySessionUoW
+)
+from app.infrastructure.persistence.in_memory.uow.stripe.stripe_uow import (
+    InMemoryStripeUoW
+)
+from app.infrastructure.security.provider import get_current_actor
 
 
 @lru_cache
-def get_in_memory_storage() -> InMemoryAuthStorage:
-    return InMemoryAuthStorage()
+def get_in_memory_storage() -> InMemoryStorage:
+    return InMemoryStorage()
+
+
+def get_in_memory_auth_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage)
+) -> AuthUoWPort:
+    return InMemoryAuthUoW(storage)
+
+
+def get_in_memory_me_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> MeUoWPort:
+    return InMemoryMeUoW(storage, actor.id)
+
+
+def get_in_memory_me_system_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> MeSystemUoWPort:
+    return InMemoryMeSystemUoW(storage, actor.id)
+
+
+def get_in_memory_session_public_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage)
+) -> SessionPulbicUoWPort:
+    return InMemorySessionPublicUoW(storage)
+
+
+def get_in_memory_session_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> SessionUoWPort:
+    return InMemorySessionUoW(storage, actor.id)
+
+
+def get_in_memory_credit_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> CreditUoWPort:
+    return InMemoryCreditUoW(storage, actor.id)
+
+
+def get_in_memory_payment_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> PaymentUoWPort:
+    return InMemoryPaymentUoW(storage, actor.id)
+
+
+def get_in_memory_stripe_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage)
+) -> StripeUoWPort:
+    return InMemoryStripeUoW(storage)
+
+
+def get_in_memory_coach_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> CoachUoWPort:
+    return InMemoryCoachUoW(storage, actor.id)
+
+
+def get_in_memory_admin_user_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> AdminUserUoWPort:
+    return InMemoryAdminUserUoW(storage, actor.id)
+
+
+def get_in_memory_admin_system_user_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> AdminUserSystemUoWPort:
+    return InMemoryAdminUserSystemUoW(storage, actor.id)
+
+
+def get_in_memory_admin_session_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> AdminSessionUoWPort:
+    return InMemoryAdminSessionUoW(storage, actor.id)
+
+
+def get_in_memory_admin_session_system_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> AdminSessionSystemUoWPort:
+    return InMemoryAdminSessionSystemUoW(storage, actor.id)
+
+
+def get_in_memory_admin_payment_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> AdminPaymentUoWPort:
+    return InMemoryAdminPaymentUoW(storage, actor.id)
 
 
-def get_in_memory_login_uow(
-        storage: InMemoryAuthStorage = Depends(get_in_memory_storage)
-) -> LoginUoWPort:
-    return InMemoryLoginUoW(storage)
+def get_in_memory_admin_credit_uow(
+    storage: InMemoryStorage = Depends(get_in_memory_storage),
+    actor: Actor = Depends(get_current_actor)
+) -> AdminCreditUoWPort:
+    return InMemoryAdminCreditUoW(storage, actor.id)
@@ -0,0 +1,94 @@
+from .me import (
+    InMemoryMeReadRepo,
+    InMemoryMeDeleteRepo,
+    InMemoryMeUpdateRepo
+)
+from .admin import (
+    InMemoryAdminUserReadRepo,
+    InMemoryAdminUserUpdateRepo,
+    InMemoryAdminUserCreationRepo,
+    InMemoryAdminUserDeletionRepo,
+    InMemoryAdminSessionReadRepo,
+    InMemoryAdminSessionUpdateRepo,
+    InMemoryAdminSessionAttendanceReadRepo,
+    InMemoryAdminPaymentReadRepo,
+    InMemoryAdminCreditLedgerReadRepo
+)
+from .auth import (
+    InMemoryAuthReadRepo,
+    InMemoryAuthUpdateRepo,
+    InMemoryAuthCreationRepo,
+)
+from .credit_ledger import (
+    InMemoryCreditLedgerReadRepo,
+    InMemoryCreditLedgerCreationRepo
+)
+from .payment import (
+    InMemoryPaymentReadRepo,
+    InMemoryPaymentCreationRepo
+)
+from .session import (
+    InMemorySessionReadRepo,
+    InMemorySessionCreationRepo,
+    InMemorySessionUpdateRepo
+)
+from .session_participation import (
+    InMemorySessionParticipationReadRepo,
+    InMemorySessionParticipationCreationRepo,
+    InMemorySessionParticipationUpdateRepo
+)
+from .session_attendance import (
+    InMemorySessionAttendanceReadRepo,
+    InMemorySessionAttendanceCreationRepo
+)
+from .payment_intent import (
+    InMemoryPaymentIntentCreationRepo,
+    InMemoryPaymentIntentReadRepo,
+    InMemoryPaymentIntentUpdateRepo
+)
+from .coach_stripe_account import (
+    InMemoryCoachStripeAccountCreationRepo,
+    InMemoryCoachStripeAccountReadRepo,
+    InMemoryCoachStripeAccountUpdateRepo
+)
+from .stripe_event_inbox import (
+    InMemoryStripeEventInboxRepo
+)
+
+
+__all__ = [
+    "InMemoryAuthReadRepo",
+    "InMemoryAuthUpdateRepo",
+    "InMemoryAuthCreationRepo",
+    "InMemoryMeReadRepo",
+    "InMemoryMeUpdateRepo",
+    "InMemoryMeDeleteRepo",
+    "InMemoryCreditLedgerReadRepo",
+    "InMemoryCreditLedgerCreationRepo",
+    "InMemoryPaymentReadRepo",
+    "InMemoryPaymentCreationRepo",
+    "InMemorySessionReadRepo",
+    "InMemorySessionUpdateRepo",
+    "InMemorySessionCreationRepo",
+    "InMemoryAdminUserReadRepo",
+    "InMemoryAdminUserUpdateRepo",
+    "InMemoryAdminUserCreationRepo",
+    "InMemoryAdminUserDeletionRepo",
+    "InMemorySessionParticipationReadRepo",
+    "InMemorySessionParticipationUpdateRepo",
+    "InMemorySessionParticipationCreationRepo",
+    "InMemorySessionAttendanceCreationRepo",
+    "InMemorySessionAttendanceReadRepo",
+    "InMemoryPaymentIntentReadRepo",
+    "InMemoryPaymentIntentCreationRepo",
+    "InMemoryPaymentIntentUpdateRepo",
+    "InMemoryCoachStripeAccountReadRepo",
+    "InMemoryCoachStripeAccountUpdateRepo",
+    "InMemoryCoachStripeAccountCreationRepo",
+    "InMemoryAdminSessionReadRepo",
+    "InMemoryAdminSessionUpdateRepo",
+    "InMemoryAdminSessionAttendanceReadRepo",
+    "InMemoryAdminPaymentReadRepo",
+    "InMemoryAdminCreditLedgerReadRepo",
+    "InMemoryStripeEventInboxRepo"
+]
@@ -0,0 +1,37 @@
+from .users.admin_user_read_repository import InMemoryAdminUserReadRepo
+from .users.admin_user_update_repository import (
+    InMemoryAdminUserUpdateRepo
+)
+from .users.admin_user_creatiton_repository import (
+    InMemoryAdminUserCreationRepo
+)
+from .users.admin_user_deletion_repository_port import (
+    InMemoryAdminUserDeletionRepo
+)
+from .session.admin_session_read_repository import (
+    InMemoryAdminSessionReadRepo
+)
+from .session.admin_session_update_repository import (
+    InMemoryAdminSessionUpdateRepo
+)
+from .session_attendance.admin_session_attendance_repository import (
+    InMemoryAdminSessionAttendanceReadRepo
+)
+from .payment.admin_payment_read_repository import (
+    InMemoryAdminPaymentReadRepo
+)
+from .credit.admin_credit_read_repository import (
+    InMemoryAdminCreditLedgerReadRepo
+)
+
+__all__ = [
+    "InMemoryAdminUserReadRepo",
+    "InMemoryAdminUserUpdateRepo",
+    "InMemoryAdminUserCreationRepo",
+    "InMemoryAdminUserDeletionRepo",
+    "InMemoryAdminSessionReadRepo",
+    "InMemoryAdminSessionUpdateRepo",
+    "InMemoryAdminSessionAttendanceReadRepo",
+    "InMemoryAdminPaymentReadRepo",
+    "InMemoryAdminCreditLedgerReadRepo"
+]
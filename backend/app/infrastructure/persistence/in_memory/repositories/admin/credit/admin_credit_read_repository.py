@@ -0,0 +1,122 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import AsyncIterator, Iterable
+from uuid import UUID
+from app.domain.credit.credit_entity import (
+    CreditBalanceDriftEntity,
+    CreditEntity
+)
+from app.feature.admin.credit.repositories import (
+    AdminCreditLedgerReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    created_between,
+    keyset_page
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.cursor import Cursor
+
+
+class InMemoryAdminCreditLedgerReadRepo(
+    AdminCreditLedgerReadRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def get_credit_by_user_id(
+        self,
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        user_id: UUID,
+        cursor: Cursor | None = None
+    ) -> tuple[list[CreditEntity], bool]:
+        return self._page(
+            self._storage.credit_ledger_by_user.get(user_id, ()),
+            limit,
+            offset,
+            _from,
+            to,
+            cursor
+        )
+
+    async def get_all_credits(
+        self,
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[CreditEntity], bool]:
+        return self._page(
+            self._storage.credit_ledger,
+            limit,
+            offset,
+            _from,
+            to,
+            cursor
+        )
+
+    async def stream_credits(
+        self,
+        _from: datetime | None,
+        to: datetime | None
+    ) -> AsyncIterator[CreditEntity]:
+        credits = sorted(
+            (
+                credit for credit in self._storage.credit_ledger
+                if created_between(credit.created_at, _from, to)
+            ),
+            key=lambda credit: (credit.created_at, credit.id)
+        )
+
+        for credit in credits:
+            yield credit
+
+    async def get_balance_drift(self) -> list[CreditBalanceDriftEntity]:
+        ledger: dict[tuple[UUID, str], int] = defaultdict(int)
+
+        for credit in self._storage.credit_ledger:
+            ledger[(credit.user_id, credit.currency)] += credit.amount_cents
+
+        balances = self._storage.credit_balances
+
+        return [
+            CreditBalanceDriftEntity(
+                user_id=user_id,
+                currency=currency,
+                balance_cents=balances.get((user_id, currency), 0),
+                ledger_cents=ledger.get((user_id, currency), 0)
+            )
+            for user_id, currency in sorted(
+                balances.keys() | ledger.keys(),
+                key=lambda key: (key[0].int, key[1])
+            )
+            if balances.get((user_id, currency), 0)
+            != ledger.get((user_id, currency), 0)
+        ]
+
+    def _page(
+        self,
+        credits: Iterable[CreditEntity],
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None
+    ) -> tuple[list[CreditEntity], bool]:
+        return keyset_page(
+            (
+                credit for credit in credits
+                if created_between(credit.created_at, _from, to)
+            ),
+            offset,
+            limit,
+            cursor
+        )
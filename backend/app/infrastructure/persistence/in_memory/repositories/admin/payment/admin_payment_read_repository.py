@@ -0,0 +1,185 @@
+from collections import defaultdict
+from datetime import date, datetime
+from typing import AsyncIterator, Iterable
+from uuid import UUID
+from app.domain.payment.payment_entity import (
+    PaymentEntity,
+    RevenueEntity
+)
+from app.feature.admin.payment.repositories import (
+    AdminPaymentReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    created_between,
+    keyset_page
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.cursor import Cursor
+
+
+def _listed(
+    created_at: datetime,
+    _from: datetime | None,
+    to: datetime | None
+) -> bool:
+    # Same bounds as the SQL listings, where ``to`` is compared as
+    # ``:to_ts <= created_at``.
+    return (
+        (_from is None or created_at >= _from)
+        and (to is None or to <= created_at)
+    )
+
+
+class InMemoryAdminPaymentReadRepo(AdminPaymentReadRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def get_all_payments(
+        self,
+        offset: int,
+        limit: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[PaymentEntity], bool]:
+        return self._page(
+            self._storage.payments.values(),
+            offset,
+            limit,
+            _from,
+            to,
+            cursor
+        )
+
+    async def get_user_payments(
+        self,
+        offset: int,
+        limit: int,
+        _from: datetime | None,
+        to: datetime | None,
+        user_id: UUID,
+        cursor: Cursor | None = None
+    ) -> tuple[list[PaymentEntity], bool]:
+        return self._page(
+            self._by_user(user_id),
+            offset,
+            limit,
+            _from,
+            to,
+            cursor
+        )
+
+    async def get_coach_payments(
+        self,
+        offset: int,
+        limit: int,
+        _from: datetime | None,
+        to: datetime | None,
+        coach_id: UUID,
+        cursor: Cursor | None = None
+    ) -> tuple[list[PaymentEntity], bool]:
+        # The SQL listing filters on ``user_id = :coach_id``.
+        return self._page(
+            self._by_user(coach_id),
+            offset,
+            limit,
+            _from,
+            to,
+            cursor
+        )
+
+    async def stream_payments(
+        self,
+        _from: datetime | None,
+        to: datetime | None
+    ) -> AsyncIterator[PaymentEntity]:
+        payments = sorted(
+            (
+                payment for payment in self._storage.payments.values()
+                if created_between(payment.created_at, _from, to)
+            ),
+            key=lambda payment: (payment.created_at, payment.id)
+        )
+
+        for payment in payments:
+            yield payment
+
+    async def get_revenue(
+        self,
+        from_month: date | None,
+        to_month: date | None,
+        coach_id: UUID | None,
+        by_coach: bool,
+        by_month: bool
+    ) -> list[RevenueEntity]:
+        storage = self._storage
+        first_month = from_month.replace(day=1) if from_month else None
+        buckets: dict[tuple, list[int]] = defaultdict(lambda: [0, 0, 0, 0])
+
+        for payment in storage.payments.values():
+            owner = storage.sessions[payment.session_id].coach_id
+            month = payment.created_at.date().replace(day=1)
+
+            if (
+                (first_month is not None and month < first_month)
+                or (to_month is not None and month > to_month)
+                or (coach_id is not None and owner != coach_id)
+            ):
+                continue
+
+            totals = buckets[(
+                owner if by_coach else None,
+                month if by_month else None,
+                payment.currency
+            )]
+            totals[0] += 1
+            totals[1] += payment.gross_amount_cents
+            totals[2] += payment.provider_fee_cents
+            totals[3] += payment.net_amount_cents
+
+        # ORDER BY month, coach_id, currency; NULLs sort last.
+        return [
+            RevenueEntity(owner, month, currency, *totals)
+            for (owner, month, currency), totals in sorted(
+                buckets.items(),
+                key=lambda item: (
+                    item[0][1] is None,
+                    item[0][1] or date.min,
+                    item[0][0] is None,
+                    item[0][0].int if item[0][0] else 0,
+                    item[0][2]
+                )
+            )
+        ]
+
+    def _by_user(self, user_id: UUID) -> list[PaymentEntity]:
+        payments = self._storage.payments
+
+        return [
+            payments[payment_id]
+            for payment_id in self._storage.payments_by_user.get(user_id, ())
+        ]
+
+    def _page(
+        self,
+        payments: Iterable[PaymentEntity],
+        offset: int,
+        limit: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None
+    ) -> tuple[list[PaymentEntity], bool]:
+        return keyset_page(
+            (
+                payment for payment in payments
+                if _listed(payment.created_at, _from, to)
+            ),
+            offset,
+            limit,
+            cursor
+        )
@@ -0,0 +1,123 @@
+from datetime import datetime
+from uuid import UUID
+from app.domain.session.session_entity import (
+    SessionCompleteEntity,
+)
+from app.domain.session.session_status import SessionStatus
+from app.feature.admin.session.repositories import (
+    AdminSessionReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    is_session_owner,
+    keyset_page,
+    participants,
+    session_complete
+)
+from app.infrastructure.persistence.in_memory.storage import (
+    InMemoryStorage,
+    SessionRow
+)
+from app.shared.utils.cursor import Cursor
+from app.shared.utils.time import utcnow
+
+
+class InMemoryAdminSessionReadRepo(AdminSessionReadRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def sessions_by_coach_id(
+        self,
+        coach_id: UUID,
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[SessionCompleteEntity], bool]:
+        storage = self._storage
+
+        return self._page(
+            (
+                storage.sessions[session_id]
+                for session_id in storage.sessions_by_coach.get(coach_id, ())
+            ),
+            limit,
+            offset,
+            cursor
+        )
+
+    async def get_all_sessions(
+        self,
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[SessionCompleteEntity], bool]:
+        return self._page(
+            self._storage.sessions.values(),
+            limit,
+            offset,
+            cursor
+        )
+
+    async def exist_session(
+        self,
+        session_id: UUID
+    ) -> bool:
+        return session_id in self._storage.sessions
+
+    async def is_session_owner(
+        self,
+        session_id: UUID,
+        user_id: UUID
+    ) -> bool:
+        return is_session_owner(self._storage, session_id, user_id)
+
+    async def is_session_cancelled(
+        self,
+        session_id: UUID
+    ) -> bool:
+        session = self._storage.sessions.get(session_id)
+
+        return (
+            session is not None
+            and session.status == SessionStatus.CANCELLED
+        )
+
+    async def is_session_started(
+        self,
+        session_id: UUID
+    ) -> bool:
+        session = self._storage.sessions.get(session_id)
+
+        return session is not None and session.starts_at <= utcnow()
+
+    async def get_session_participants(
+        self,
+        session_id: UUID
+    ) -> list[tuple[str, str]]:
+        return [
+            (profile.first_name, profile.last_name)
+            for profile in participants(self._storage, session_id)
+        ]
+
+    def _page(
+        self,
+        sessions,
+        limit: int,
+        offset: int,
+        cursor: Cursor | None
+    ) -> tuple[list[SessionCompleteEntity], bool]:
+        # Like the SQL listings, ``_from`` and ``to`` are not applied.
+        page: list[SessionRow]
+        page, has_more = keyset_page(sessions, offset, limit, cursor)
+
+        return [
+            session_complete(self._storage, session) for session in page
+        ], has_more
@@ -0,0 +1,30 @@
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.feature.admin.session.repositories import (
+    AdminSessionUpdateRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    cancel_session,
+    ensure_role
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+
+
+class InMemoryAdminSessionUpdateRepo(
+    AdminSessionUpdateRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def cancel_session(
+            self,
+            session_id: UUID
+    ) -> None:
+        ensure_role(self._storage, self._actor_id, Role.COACH, Role.ADMIN)
+
+        cancel_session(self._storage, session_id)
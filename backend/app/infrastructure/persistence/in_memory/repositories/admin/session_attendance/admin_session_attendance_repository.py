@@ -0,0 +1,45 @@
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.domain.user.user_profile_entity import AdminUserAttendanceRead
+from app.feature.admin.session.repositories import (
+    AdminSessionAttendanceReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import ensure_role
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+
+
+class InMemoryAdminSessionAttendanceReadRepo(
+    AdminSessionAttendanceReadRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def is_session_attended(
+        self,
+        session_id: UUID
+    ) -> bool:
+        return bool(self._storage.attendance.get(session_id))
+
+    async def get_session_attendance_list(
+        self,
+        session_id: UUID
+    ) -> list[AdminUserAttendanceRead]:
+        storage = self._storage
+        ensure_role(storage, self._actor_id, Role.ADMIN)
+
+        return [
+            AdminUserAttendanceRead(
+                user_id=user_id,
+                first_name=storage.user_profiles[user_id].first_name,
+                last_name=storage.user_profiles[user_id].last_name,
+                attended=attended
+            )
+            for user_id, attended in storage.attendance.get(
+                session_id, {}
+            ).items()
+        ]
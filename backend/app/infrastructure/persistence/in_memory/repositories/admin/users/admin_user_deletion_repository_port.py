@@ -0,0 +1,33 @@
+from dataclasses import replace
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.feature.admin.users.repositories import (
+    AdminUserDeletionRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import ensure_role
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+
+
+class InMemoryAdminUserDeletionRepo(AdminUserDeletionRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def revoke_role(
+        self,
+        user_id: UUID,
+        role: Role
+    ) -> None:
+        ensure_role(self._storage, self._actor_id, Role.ADMIN)
+
+        user = self._storage.users.get(user_id)
+
+        if user is not None:
+            self._storage.users[user_id] = replace(
+                user,
+                roles=user.roles - {Role(role)}
+            )
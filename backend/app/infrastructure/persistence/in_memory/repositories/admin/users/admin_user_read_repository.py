@@ -0,0 +1,52 @@
+from uuid import UUID
+from app.domain.user.user_entity import AdminUserRead
+from app.feature.admin.users.repositories import (
+    AdminUserReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import keyset_page
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.cursor import Cursor
+
+
+class InMemoryAdminUserReadRepo(AdminUserReadRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def get_all_users(
+        self,
+        offset: int,
+        limit: int,
+        cursor: Cursor | None = None
+    ) -> tuple[list[AdminUserRead], bool]:
+        return keyset_page(
+            map(self._admin_user, self._storage.users),
+            offset,
+            limit,
+            cursor
+        )
+
+    async def get_user_by_id(
+        self,
+        user_id: UUID
+    ) -> AdminUserRead | None:
+        if user_id not in self._storage.users:
+            return None
+
+        return self._admin_user(user_id)
+
+    def _admin_user(self, user_id: UUID) -> AdminUserRead:
+        user = self._storage.users[user_id]
+
+        return AdminUserRead(
+            id=user.id,
+            email=user.email,
+            disabled_at=user.disabled_at,
+            disabled_reason=user.disabled_reason,
+            created_at=self._storage.user_created_at[user.id],
+            roles=set(user.roles)
+        )
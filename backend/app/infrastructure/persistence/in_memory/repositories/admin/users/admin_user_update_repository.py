@@ -0,0 +1,50 @@
+from dataclasses import replace
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.feature.admin.users.repositories import (
+    AdminUserUpdateRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import ensure_role
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.time import utcnow
+
+
+class InMemoryAdminUserUpdateRepo(AdminUserUpdateRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def disable_user(
+        self,
+        user_id: UUID
+    ) -> None:
+        ensure_role(self._storage, self._actor_id, Role.ADMIN)
+
+        user = self._storage.users.get(user_id)
+
+        if user is not None and user.disabled_at is None:
+            self._storage.users[user_id] = replace(
+                user,
+                disabled_at=utcnow(),
+                disabled_reason="admin"
+            )
+
+    async def reenable_user(
+        self,
+        user_id: UUID
+    ) -> None:
+        ensure_role(self._storage, self._actor_id, Role.ADMIN)
+
+        user = self._storage.users.get(user_id)
+
+        # Self deleted accounts stay disabled.
+        if user is not None and user.disabled_reason == "admin":
+            self._storage.users[user_id] = replace(
+                user,
+                disabled_at=None,
+                disabled_reason=None
+            )
@@ -1,9 +1,9 @@
-from .auth_creation_repository import InMemoryAuthCreationRepository
-from .auth_read_repository import InMemoryAuthReadRepository
-from .auth_update_repository import InMemoryAuthUpdateRepository
+from .auth_creation_repository import InMemoryAuthCreationRepo
+from .auth_read_repository import InMemoryAuthReadRepo
+from .auth_update_repository import InMemoryAuthUpdateRepo
 
 __all__ = [
-    "InMemoryAuthCreationRepository",
-    "InMemoryAuthReadRepository",
-    "InMemoryAuthUpdateRepository",
+    "InMemoryAuthCreationRepo",
+    "InMemoryAuthReadRepo",
+    "InMemoryAuthUpdateRepo",
 ]
@@ -1,11 +1,47 @@
-from app.infrastructure.persistence.in_memory.storage import (
-    InMemoryAuthStorage
+from uuid import UUID, uuid4
+from app.domain.user.user_entity import NewUserEntity, UserEntity
+from app.domain.user.user_profile_entity import (
+    NewUserProfileEntity,
+    UserProfileEntity
 )
+from app.feature.auth.auth_exception import RegistrationFailed
 from app.feature.auth.repositories.auth_creation_respository_port import (
-    AuthCreationRepositoryPort
+    AuthCreationRepoPort
 )
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
 
 
-class InMemoryAuthCreationRepository(AuthCreationRepositoryPort):
-    def __init__(self, storage: InMemoryAuthStorage) -> None:
+class InMemoryAuthCreationRepo(AuthCreationRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
         self._storage = storage
+        self._actor_id = actor_id
+
+    async def register(
+            self,
+            user: NewUserEntity,
+            user_profile: NewUserProfileEntity
+    ) -> None:
+        if user.email in self._storage.users_by_email:
+            raise RegistrationFailed()
+
+        id = uuid4()
+
+        self._storage.add_user(
+            UserEntity(
+                id=id,
+                email=user.email,
+                password_hash=user.password_hash,
+                roles={user.role},
+                disabled_at=None,
+                disabled_reason=None
+            ),
+            UserProfileEntity(
+                user_id=id,
+                first_name=user_profile.first_name,
+                last_name=user_profile.last_name
+            )
+        )
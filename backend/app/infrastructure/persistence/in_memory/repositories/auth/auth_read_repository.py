@@ -1,26 +1,63 @@
+from uuid import UUID
 from app.domain.auth.refresh_token_entity import RefreshTokenEntity
-from app.infrastructure.persistence.in_memory.storage import (
-    InMemoryAuthStorage
-)
+from app.domain.auth.role import Role
+from app.domain.user.user_entity import UserEntity
 from app.feature.auth.repositories.auth_read_repository_port import (
-    AuthReadRepositoryPort
+    AuthReadRepoPort
 )
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
 
 
-class InMemoryAuthReadRepository(AuthReadRepositoryPort):
-    def __init__(self, storage: InMemoryAuthStorage) -> None:
+class InMemoryAuthReadRepo(AuthReadRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
         self._storage = storage
+        self._actor_id = actor_id
 
     async def exist_email(self, email: str) -> bool:
         return email in self._storage.users_by_email
 
-    async def get_user_by_email(self, email: str):
-        user_id = self._storage.users_by_email[email]
-        return self._storage.users[user_id]
+    async def get_user_by_email(self, email: str) -> UserEntity | None:
+        user_id = self._storage.users_by_email.get(email)
+
+        return None if user_id is None else self._storage.users[user_id]
+
+    async def get_refresh_token(
+        self,
+        token_hash: str
+    ) -> RefreshTokenEntity | None:
+        token = self._storage.refresh_tokens.get(token_hash)
+
+        if token is None or token.is_revoked():
+            return None
 
-    async def system_get_user_by_email(self, email: str):
-        user_id = self._storage.users_by_email[email]
+        return token
+
+    async def get_user_by_id(
+        self,
+        user_id: UUID
+    ) -> UserEntity:
         return self._storage.users[user_id]
 
-    async def get_refresh_token(self, token_hash: str) -> RefreshTokenEntity:
-        return self._storage.refresh_tokens[token_hash]
+    async def is_user_disabled(
+        self,
+        user_id: UUID
+    ) -> bool:
+        user = self._storage.users.get(user_id)
+
+        return user is not None and user.disabled_at is not None
+
+    async def exists_coach(
+        self,
+        coach_id: UUID
+    ) -> bool:
+        return self._storage.has_role(coach_id, Role.COACH)
+
+    async def exists_user(
+        self,
+        user_id: UUID
+    ) -> bool:
+        return user_id in self._storage.users
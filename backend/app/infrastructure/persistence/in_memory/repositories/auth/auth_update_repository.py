@@ -1,30 +1,34 @@
+from dataclasses import replace
+from datetime import timedelta
+from uuid import UUID
 from app.domain.auth.refresh_token_entity import (
     NewRefreshTokenEntity,
     RefreshTokenEntity
 )
-from app.infrastructure.persistence.in_memory.storage import (
-    InMemoryAuthStorage
-)
 from app.feature.auth.repositories.auth_update_repository_port import (
-    AuthUpdateRepositoryPort
+    AuthUpdateRepoPort
 )
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
 from app.shared.utils.time import utcnow
 
 
-class InMemoryAuthUpdateRepository(AuthUpdateRepositoryPort):
-    def __init__(self, storage: InMemoryAuthStorage) -> None:
+class InMemoryAuthUpdateRepo(AuthUpdateRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
         self._storage = storage
+        self._actor_id = actor_id
 
     async def revoke_refresh_token(self, token_hash: str) -> None:
         token = self._storage.refresh_tokens.get(token_hash)
-        if not token:
+
+        if token is None or token.is_revoked():
             return
 
-        self._storage.refresh_tokens[token_hash] = RefreshTokenEntity(
-            user_id=token.user_id,
-            token_hash=token.token_hash,
-            created_at=token.created_at,
-            expires_at=token.expires_at,
+        self._storage.refresh_tokens[token_hash] = replace(
+            token,
             revoked_at=utcnow()
         )
 
@@ -33,26 +37,49 @@ class InMemoryAuthUpdateRepository(AuthUpdateRepositoryPort):
         current_token_hash: str | None,
         new_token: NewRefreshTokenEntity
     ) -> None:
-        if current_token_hash:
-            for t in self._storage.refresh_tokens.values():
-                if t.token_hash == current_token_hash:
-                    self._storage.refresh_tokens[t.token_hash] = (
-                        RefreshTokenEntity(
-                            user_id=t.user_id,
-                            token_hash=t.token_hash,
-                            created_at=t.created_at,
-                            expires_at=t.expires_at,
-                            revoked_at=utcnow(),
-                        )
-                    )
-                    break
-
-        self._storage.refresh_tokens[new_token.token_hash] = (
-            RefreshTokenEntity(
-                user_id=new_token.user_id,
-                token_hash=new_token.token_hash,
-                created_at=utcnow(),
-                expires_at=new_token.expires_at,
-                revoked_at=None
-            )
+        now = utcnow()
+        tokens = self._storage.refresh_tokens
+        current = tokens.get(current_token_hash or "")
+
+        if (
+            current is not None
+            and current.user_id == new_token.user_id
+            and not current.is_revoked()
+        ):
+            tokens[current.token_hash] = replace(current, revoked_at=now)
+
+        tokens[new_token.token_hash] = RefreshTokenEntity(
+            user_id=new_token.user_id,
+            token_hash=new_token.token_hash,
+            created_at=now,
+            expires_at=new_token.expires_at,
+            revoked_at=None
         )
+
+    async def revoke_all_refresh_token(self, user_id: UUID) -> None:
+        now = utcnow()
+        tokens = self._storage.refresh_tokens
+
+        for token_hash, token in tokens.items():
+            if token.user_id == user_id and not token.is_revoked():
+                tokens[token_hash] = replace(token, revoked_at=now)
+
+    async def purge_refresh_tokens(
+        self,
+        grace_seconds: int,
+        limit: int
+    ) -> int:
+        cutoff = utcnow() - timedelta(seconds=grace_seconds)
+        tokens = self._storage.refresh_tokens
+        dead = sorted(
+            (
+                (token.revoked_at or token.expires_at, token_hash)
+                for token_hash, token in tokens.items()
+                if (token.revoked_at or token.expires_at) < cutoff
+            )
+        )[:limit]
+
+        for _, token_hash in dead:
+            del tokens[token_hash]
+
+        return len(dead)
@@ -0,0 +1,15 @@
+from .coach_stripe_account_read_repository import (
+    InMemoryCoachStripeAccountReadRepo
+)
+from .coach_stripe_account_creation_repository import (
+    InMemoryCoachStripeAccountCreationRepo
+)
+from .coach_stripe_account_update_repository import (
+    InMemoryCoachStripeAccountUpdateRepo
+)
+
+__all__ = [
+    "InMemoryCoachStripeAccountReadRepo",
+    "InMemoryCoachStripeAccountCreationRepo",
+    "InMemoryCoachStripeAccountUpdateRepo"
+]
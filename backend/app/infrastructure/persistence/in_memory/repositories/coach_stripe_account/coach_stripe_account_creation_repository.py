@@ -0,0 +1,42 @@
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.feature.coach.repositories import (
+    CoachStripeAccountCreationRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import ensure_role
+from app.infrastructure.persistence.in_memory.storage import (
+    CoachStripeAccountRow,
+    InMemoryStorage
+)
+
+
+class InMemoryCoachStripeAccountCreationRepo(
+    CoachStripeAccountCreationRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def create_account(
+        self,
+        stripe_acount_id: str
+    ) -> None:
+        storage = self._storage
+        ensure_role(storage, self._actor_id, Role.COACH)
+
+        coach_id: UUID = self._actor_id  # type: ignore[assignment]
+
+        if coach_id in storage.coach_stripe_accounts:
+            return
+
+        storage.coach_stripe_accounts[coach_id] = CoachStripeAccountRow(
+            coach_id=coach_id,
+            stripe_account_id=stripe_acount_id
+        )
+        storage.coach_stripe_accounts_by_account_id[stripe_acount_id] = (
+            coach_id
+        )
@@ -0,0 +1,48 @@
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.feature.coach.repositories import (
+    CoachStripeAccountReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import ensure_role
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+
+
+class InMemoryCoachStripeAccountReadRepo(
+    CoachStripeAccountReadRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def account_exists(
+        self,
+        coach_id: UUID
+    ) -> bool:
+        return coach_id in self._storage.coach_stripe_accounts
+
+    async def get_account_id(
+        self,
+        coach_id: UUID
+    ) -> str | None:
+        ensure_role(self._storage, self._actor_id, Role.COACH)
+
+        account = self._storage.coach_stripe_accounts.get(coach_id)
+
+        return None if account is None else account.stripe_account_id
+
+    async def is_coach_account_valid(
+        self,
+        coach_id: UUID
+    ) -> bool:
+        account = self._storage.coach_stripe_accounts.get(coach_id)
+
+        return (
+            account is not None
+            and account.details_submitted
+            and account.charges_enabled
+            and account.payouts_enabled
+        )
@@ -0,0 +1,36 @@
+from uuid import UUID
+from app.feature.stripe.repositories import (
+    CoachStripeAccountUpdateRepoPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+
+
+class InMemoryCoachStripeAccountUpdateRepo(
+    CoachStripeAccountUpdateRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def update_by_account_id(
+        self,
+        account_id: str,
+        details_submitted: bool,
+        charges_enabled: bool,
+        payouts_enabled: bool
+    ) -> None:
+        coach_id = self._storage.coach_stripe_accounts_by_account_id.get(
+            account_id
+        )
+
+        if coach_id is None:
+            return
+
+        account = self._storage.coach_stripe_accounts[coach_id]
+        account.details_submitted = details_submitted
+        account.charges_enabled = charges_enabled
+        account.payouts_enabled = payouts_enabled
@@ -0,0 +1,11 @@
+from .credit_ledger_read_repository import (
+    InMemoryCreditLedgerReadRepo
+)
+from .credit_ledger_creation_repository import (
+    InMemoryCreditLedgerCreationRepo
+)
+
+__all__ = [
+    "InMemoryCreditLedgerReadRepo",
+    "InMemoryCreditLedgerCreationRepo"
+]
@@ -0,0 +1,50 @@
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.domain.credit.credit_entity import NewCreditEntity
+from app.feature.session.repositories import (
+    CreditLedgerCreationRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    append_credit,
+    ensure_role
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+
+
+class InMemoryCreditLedgerCreationRepo(
+    CreditLedgerCreationRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def create_credit_entry(
+        self,
+        entry: NewCreditEntity
+    ) -> None:
+        if self._actor_id != entry.user_id:
+            ensure_role(self._storage, self._actor_id, Role.ADMIN)
+
+        append_credit(
+            self._storage,
+            entry.user_id,
+            entry.amount_cents,
+            entry.currency,
+            entry.cause
+        )
+
+    async def append_credit_ledger(
+        self,
+        credit: NewCreditEntity
+    ) -> None:
+        append_credit(
+            self._storage,
+            credit.user_id,
+            credit.amount_cents,
+            credit.currency,
+            credit.cause
+        )
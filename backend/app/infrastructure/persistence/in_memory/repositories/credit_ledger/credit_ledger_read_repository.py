@@ -0,0 +1,57 @@
+from datetime import datetime
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.domain.credit.credit_entity import CreditEntity
+from app.feature.credit.respositories import (
+    CreditLedgerReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    balance,
+    created_between,
+    ensure_role,
+    keyset_page
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.cursor import Cursor
+
+
+class InMemoryCreditLedgerReadRepo(CreditLedgerReadRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def get_credit_by_user_id(
+        self,
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        user_id: UUID,
+        cursor: Cursor | None = None
+    ) -> tuple[list[CreditEntity], bool]:
+        return keyset_page(
+            (
+                entry
+                for entry in self._storage.credit_ledger_by_user.get(
+                    user_id, ()
+                )
+                if created_between(entry.created_at, _from, to)
+            ),
+            offset,
+            limit,
+            cursor
+        )
+
+    async def fetch_credit_by_user_id(
+        self,
+        user_id: UUID,
+        currency: str
+    ) -> int:
+        if self._actor_id != user_id:
+            ensure_role(self._storage, self._actor_id, Role.ADMIN)
+
+        return balance(self._storage, user_id, currency)
@@ -0,0 +1,10 @@
+from .me_read_repository import InMemoryMeReadRepo
+from .me_delete_repository import InMemoryMeDeleteRepo
+from .me_update_repository import InMemoryMeUpdateRepo
+
+
+__all__ = [
+    "InMemoryMeUpdateRepo",
+    "InMemoryMeReadRepo",
+    "InMemoryMeDeleteRepo"
+]
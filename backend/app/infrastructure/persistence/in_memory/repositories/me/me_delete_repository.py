@@ -0,0 +1,45 @@
+from dataclasses import replace
+from uuid import UUID
+from app.feature.me.repositories.me_delete_repository_port import (
+    MeDeleteRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    ensure_self,
+    rename_user
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.time import utcnow
+
+
+class InMemoryMeDeleteRepo(MeDeleteRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def soft_delete_user(
+            self,
+            user_id: UUID,
+    ) -> None:
+        storage = self._storage
+        ensure_self(self._actor_id, user_id)
+
+        user = storage.users.get(user_id)
+
+        if user is not None and user.disabled_at is None:
+            email = f"deleted+{user_id}@deleted.invalid"
+
+            del storage.users_by_email[user.email]
+            storage.users_by_email[email] = user_id
+            storage.users[user_id] = replace(
+                user,
+                email=email,
+                password_hash="!!deleted!!",
+                disabled_at=utcnow(),
+                disabled_reason="self"
+            )
+
+        rename_user(storage, user_id, "deleted", "deleted")
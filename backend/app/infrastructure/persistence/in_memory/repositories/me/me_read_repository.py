@@ -0,0 +1,23 @@
+from uuid import UUID
+from app.domain.user.user_entity import UserEntity
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.feature.me.repositories.me_read_repository_port import (
+    MeReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+
+
+class InMemoryMeReadRepo(MeReadRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def get(self, user_id: UUID) -> UserEntity:
+        return self._storage.users[user_id]
+
+    async def get_profile_by_id(self, user_id: UUID) -> UserProfileEntity:
+        return self._storage.user_profiles[user_id]
@@ -0,0 +1,65 @@
+from dataclasses import replace
+from uuid import UUID
+from app.domain.auth.auth_exceptions import (
+    EmailAlreadyExistError,
+    PasswordIsBlankError
+)
+from app.feature.me.repositories.me_update_repository_port import (
+    MeUpdateRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    ensure_self,
+    rename_user
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+
+
+class InMemoryMeUpdateRepo(MeUpdateRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def update_email_by_user_id(self, email: str, user_id: UUID):
+        storage = self._storage
+        ensure_self(self._actor_id, user_id)
+
+        email = email.strip().lower() if email else ""
+        owner = storage.users_by_email.get(email)
+
+        if not email or owner not in (None, user_id):
+            raise EmailAlreadyExistError()
+
+        user = storage.users.get(user_id)
+
+        if user is None:
+            return
+
+        del storage.users_by_email[user.email]
+        storage.users_by_email[email] = user_id
+        storage.users[user_id] = replace(user, email=email)
+
+    async def update_password_by_id(self, user_id: UUID, password_hash: str):
+        ensure_self(self._actor_id, user_id)
+
+        if not password_hash:
+            raise PasswordIsBlankError()
+
+        user = self._storage.users.get(user_id)
+
+        if user is not None:
+            self._storage.users[user_id] = replace(
+                user,
+                password_hash=password_hash
+            )
+
+    async def update_profile_by_id(
+        self,
+        user_id: UUID,
+        first_name: str,
+        last_name: str
+    ):
+        rename_user(self._storage, user_id, first_name, last_name)
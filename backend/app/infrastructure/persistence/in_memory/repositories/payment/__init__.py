@@ -0,0 +1,11 @@
+from .payment_read_repository import (
+    InMemoryPaymentReadRepo
+)
+from .payment_creation_repository import (
+    InMemoryPaymentCreationRepo
+)
+
+__all__ = [
+    "InMemoryPaymentReadRepo",
+    "InMemoryPaymentCreationRepo"
+]
@@ -0,0 +1,40 @@
+from uuid import UUID, uuid4
+from app.domain.payment.payment_entity import NewPaymentEntity, PaymentEntity
+from app.feature.stripe.repositories import (
+    PaymentCreationRepoPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.time import utcnow
+
+
+class InMemoryPaymentCreationRepo(PaymentCreationRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def create_payment(
+        self,
+        new_payment: NewPaymentEntity
+    ) -> None:
+        # ON CONFLICT (provider_payment_id) DO NOTHING
+        if new_payment.provider_payment_id in (
+            self._storage.payments_by_provider_id
+        ):
+            return
+
+        self._storage.add_payment(PaymentEntity(
+            id=uuid4(),
+            session_id=new_payment.session_id,
+            user_id=new_payment.user_id,
+            provider=new_payment.provider,
+            provider_payment_id=new_payment.provider_payment_id,
+            gross_amount_cents=new_payment.gross_amount_cents,
+            provider_fee_cents=new_payment.provider_fee_cents,
+            net_amount_cents=new_payment.net_amount_cents,
+            currency=new_payment.currency,
+            created_at=utcnow()
+        ))
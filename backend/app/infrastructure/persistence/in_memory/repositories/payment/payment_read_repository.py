@@ -0,0 +1,74 @@
+from datetime import datetime
+from uuid import UUID
+from app.domain.payment.payment_entity import PaymentEntity
+from app.feature.payment.repostories.payment_read_repository import (
+    PaymentReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    created_between,
+    get_session,
+    keyset_page
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.cursor import Cursor
+
+
+class InMemoryPaymentReadRepo(PaymentReadRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def get_payment_by_user_id(
+        self,
+        offset: int,
+        limit: int,
+        _from: datetime | None,
+        to: datetime | None,
+        user_id: UUID,
+        cursor: Cursor | None = None
+    ) -> tuple[list[PaymentEntity], bool]:
+        payments = self._storage.payments
+
+        return keyset_page(
+            (
+                payments[payment_id]
+                for payment_id in self._storage.payments_by_user.get(
+                    user_id, ()
+                )
+                if created_between(payments[payment_id].created_at, _from, to)
+            ),
+            offset,
+            limit,
+            cursor
+        )
+
+    async def is_alread_paid(
+        self,
+        session_id: UUID,
+        user_id: UUID
+    ) -> bool:
+        payments = self._storage.payments
+
+        return any(
+            payments[payment_id].user_id == user_id
+            for payment_id in self._storage.payments_by_session.get(
+                session_id, ()
+            )
+        )
+
+    async def get_payment_for_session(
+        self,
+        session_id: UUID
+    ) -> tuple[int, str]:
+        session = get_session(self._storage, session_id)
+
+        return sum(
+            self._storage.payments[payment_id].net_amount_cents
+            for payment_id in self._storage.payments_by_session.get(
+                session_id, ()
+            )
+        ), session.currency
@@ -0,0 +1,15 @@
+from .payment_intent_read_repository import (
+    InMemoryPaymentIntentReadRepo
+)
+from .payment_intent_creation_repository import (
+    InMemoryPaymentIntentCreationRepo
+)
+from .payment_intent_update_repository import (
+    InMemoryPaymentIntentUpdateRepo
+)
+
+__all__ = [
+    "InMemoryPaymentIntentReadRepo",
+    "InMemoryPaymentIntentCreationRepo",
+    "InMemoryPaymentIntentUpdateRepo"
+]
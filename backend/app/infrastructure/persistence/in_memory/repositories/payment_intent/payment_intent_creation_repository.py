@@ -0,0 +1,66 @@
+from uuid import UUID, uuid4
+from app.domain.payment_intent.payment_intent_entity import (
+    NewPaymentIntentEntity
+)
+from app.domain.payment_intent.payment_intent_exceptions import (
+    PaymentIntentAlreadyExist
+)
+from app.domain.payment_intent.payment_intent_providers import PaymentProvider
+from app.domain.session.session_exception import SessionNotFoundError
+from app.feature.session.repositories import (
+    PaymentIntentCreationRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import ensure_self
+from app.infrastructure.persistence.in_memory.storage import (
+    InMemoryStorage,
+    PaymentIntentRow,
+    intent_key
+)
+
+_CLOSED = ("canceled", "failed")
+
+
+class InMemoryPaymentIntentCreationRepo(
+    PaymentIntentCreationRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def create_payment_intent(
+        self,
+        payment_intent: NewPaymentIntentEntity
+    ) -> None:
+        storage = self._storage
+        ensure_self(self._actor_id, payment_intent.user_id)
+
+        if payment_intent.session_id not in storage.sessions:
+            raise SessionNotFoundError()
+
+        existing = storage.payment_intents.get(intent_key(
+            payment_intent.user_id,
+            payment_intent.session_id,
+            payment_intent.provider
+        ))
+
+        if existing is not None and existing.status in _CLOSED:
+            raise PaymentIntentAlreadyExist()
+
+        intent = PaymentIntentRow(
+            id=existing.id if existing is not None else uuid4(),
+            user_id=payment_intent.user_id,
+            session_id=payment_intent.session_id,
+            provider=PaymentProvider(payment_intent.provider).value,
+            provider_intent_id=payment_intent.provider_intent_id,
+            provider_checkout_id=payment_intent.provider_checkout_id,
+            status=payment_intent.status,
+            credit_applied_cents=payment_intent.credit_applied_cents,
+            amount_cents=payment_intent.amount_cents,
+            currency=payment_intent.currency
+        )
+
+        storage.add_payment_intent(intent)
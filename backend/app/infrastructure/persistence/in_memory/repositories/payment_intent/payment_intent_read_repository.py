@@ -0,0 +1,56 @@
+from uuid import UUID
+from app.domain.payment_intent.payment_intent_entity import (
+    PaymentIntentEntity
+)
+from app.domain.payment_intent.payment_intent_providers import PaymentProvider
+from app.feature.stripe.repositories import (
+    PaymentIntentReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.storage import (
+    InMemoryStorage,
+    intent_key
+)
+
+
+class InMemoryPaymentIntentReadRepo(
+    PaymentIntentReadRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def intent_exists(
+        self,
+        user_id: UUID,
+        session_id: UUID,
+        provider: PaymentProvider
+    ) -> bool:
+        return intent_key(user_id, session_id, provider) in (
+            self._storage.payment_intents
+        )
+
+    async def get_by_identity(
+        self,
+        user_id: UUID,
+        session_id: UUID,
+        provider: PaymentProvider
+    ) -> PaymentIntentEntity:
+        intent = self._storage.payment_intents[
+            intent_key(user_id, session_id, provider)
+        ]
+
+        return PaymentIntentEntity(
+            id=intent.id,
+            user_id=intent.user_id,
+            session_id=intent.session_id,
+            provider=intent.provider,
+            provider_intent_id=intent.provider_intent_id,  # type: ignore
+            status=intent.status,
+            credit_applied_cents=intent.credit_applied_cents,
+            amount_cents=intent.amount_cents,
+            currency=intent.currency
+        )
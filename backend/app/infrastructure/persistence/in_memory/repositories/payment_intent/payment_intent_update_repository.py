@@ -0,0 +1,77 @@
+from uuid import UUID
+from app.domain.payment_intent.payment_intent_providers import PaymentProvider
+from app.domain.session_participation.session_participation_entity import (
+    ReleasedParticipationEntity
+)
+from app.feature.stripe.repositories import (
+    PaymentIntentUpdateRepoPort
+)
+from app.infrastructure.persistence.in_memory.storage import (
+    InMemoryStorage,
+    intent_key
+)
+
+_SETTLED = ("succeeded", "failed", "canceled", "processing")
+
+
+class InMemoryPaymentIntentUpdateRepo(
+    PaymentIntentUpdateRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def mark_payment_intent(
+        self,
+        provider_payment_id: str,
+        provider_status: str,
+    ) -> None:
+        key = self._storage.payment_intents_by_provider_id.get(
+            provider_payment_id
+        )
+
+        if key is not None:
+            self._storage.payment_intents[key].status = provider_status
+
+    async def set_provider_id(
+        self,
+        user_id: UUID,
+        session_id: UUID,
+        provider: PaymentProvider,
+        provider_intent_id: str
+    ) -> None:
+        key = intent_key(user_id, session_id, provider)
+        intent = self._storage.payment_intents.get(key)
+
+        if intent is None:
+            return
+
+        intent.provider_intent_id = provider_intent_id
+        self._storage.payment_intents_by_provider_id[provider_intent_id] = (
+            key
+        )
+
+    async def cancel_for_participations(
+        self,
+        participations: list[ReleasedParticipationEntity]
+    ) -> list[str | None]:
+        intents = self._storage.payment_intents
+        checkout_ids = []
+
+        for participation in participations:
+            for provider in PaymentProvider:
+                intent = intents.get(intent_key(
+                    participation.user_id,
+                    participation.session_id,
+                    provider
+                ))
+
+                if intent is not None and intent.status not in _SETTLED:
+                    intent.status = "canceled"
+                    checkout_ids.append(intent.provider_checkout_id)
+
+        return checkout_ids
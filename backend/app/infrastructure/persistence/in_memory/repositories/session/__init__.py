@@ -0,0 +1,15 @@
+from .session_read_repository import (
+    InMemorySessionReadRepo
+)
+from .session_creation_repository import (
+    InMemorySessionCreationRepo
+)
+from .session_update_repository import (
+    InMemorySessionUpdateRepo
+)
+
+__all__ = [
+    "InMemorySessionReadRepo",
+    "InMemorySessionCreationRepo",
+    "InMemorySessionUpdateRepo"
+]
@@ -0,0 +1,55 @@
+from uuid import UUID, uuid4
+from app.domain.auth.role import Role
+from app.domain.session.session_entity import NewSessionEntity
+from app.domain.session.session_exception import SessionOverlappingError
+from app.feature.session.repositories.session_creation_repository_port import (
+    SessionCreationRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    ensure_role,
+    overlaps
+)
+from app.infrastructure.persistence.in_memory.storage import (
+    InMemoryStorage,
+    SessionRow
+)
+from app.shared.utils.time import utcnow
+
+
+class InMemorySessionCreationRepo(SessionCreationRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def create_session(
+        self,
+        session: NewSessionEntity
+    ) -> None:
+        storage = self._storage
+        ensure_role(storage, self._actor_id, Role.COACH, Role.ADMIN)
+
+        coach = storage.users.get(session.coach_id)
+
+        if coach is None or coach.disabled_at is not None:
+            return
+
+        if overlaps(storage, session.starts_at, session.ends_at):
+            raise SessionOverlappingError()
+
+        now = utcnow()
+        storage.add_session(SessionRow(
+            id=uuid4(),
+            coach_id=session.coach_id,
+            title=session.title,
+            starts_at=session.starts_at,
+            ends_at=session.ends_at,
+            price_cents=session.price_cents,
+            currency=session.currency,
+            capacity=session.capacity,
+            created_at=now,
+            updated_at=now
+        ))
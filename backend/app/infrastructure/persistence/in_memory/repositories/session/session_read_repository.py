@@ -0,0 +1,321 @@
+from datetime import datetime
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.domain.session.session_entity import (
+    RegistrationPreflightEntity,
+    SessionCompleteEntity,
+    SessionEntity,
+    SessionWithCoachEntity
+)
+from app.domain.session.session_status import SessionStatus
+from app.feature.session.repositories.session_read_repository_port import (
+    SessionReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    balance,
+    ensure_role,
+    get_session,
+    in_range,
+    is_active_participation,
+    is_registration_open,
+    is_session_full,
+    is_session_owner,
+    keyset_page,
+    participants,
+    session_complete,
+    session_entity,
+    session_with_coach,
+    version
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.cursor import Cursor
+from app.shared.utils.time import utcnow
+
+
+class InMemorySessionReadRepo(SessionReadRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def get_session_by_id(
+        self,
+        session_id: UUID
+    ) -> SessionWithCoachEntity:
+        return session_with_coach(
+            self._storage,
+            get_session(self._storage, session_id)
+        )
+
+    async def get_all_sessions(
+        self,
+        offset: int,
+        limit: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[SessionWithCoachEntity], bool]:
+        sessions, has_more = keyset_page(
+            (
+                session for session in self._storage.sessions.values()
+                if in_range(session.starts_at, session.ends_at, _from, to)
+            ),
+            offset,
+            limit,
+            cursor
+        )
+
+        return [
+            session_with_coach(self._storage, session)
+            for session in sessions
+        ], has_more
+
+    async def get_sessions_by_coach_id(
+        self,
+        coach_id: UUID
+    ) -> list[SessionEntity]:
+        return [
+            session_entity(self._storage.sessions[session_id])
+            for session_id in self._storage.sessions_by_coach.get(
+                coach_id, ()
+            )
+        ]
+
+    async def exist_session(
+        self,
+        session_id: UUID
+    ) -> bool:
+        return session_id in self._storage.sessions
+
+    async def public_exists_session(
+        self,
+        session_id: UUID
+    ) -> bool:
+        return session_id in self._storage.sessions
+
+    async def is_session_owner(
+        self,
+        session_id: UUID,
+        user_id: UUID
+    ) -> bool:
+        return is_session_owner(self._storage, session_id, user_id)
+
+    async def is_session_cancelled(
+        self,
+        session_id: UUID
+    ) -> bool:
+        session = self._storage.sessions.get(session_id)
+
+        return (
+            session is not None
+            and session.status == SessionStatus.CANCELLED
+        )
+
+    async def is_session_started(
+        self,
+        session_id: UUID
+    ) -> bool:
+        session = self._storage.sessions.get(session_id)
+
+        return session is not None and session.starts_at <= utcnow()
+
+    async def is_session_finished(
+        self,
+        session_id: UUID
+    ) -> bool:
+        session = self._storage.sessions.get(session_id)
+
+        return session is not None and session.ends_at <= utcnow()
+
+    async def system_get_session_by_id(
+        self,
+        session_id: UUID
+    ) -> SessionEntity:
+        return session_entity(get_session(self._storage, session_id))
+
+    async def get_registration_preflight(
+        self,
+        session_id: UUID,
+        user_id: UUID
+    ) -> RegistrationPreflightEntity:
+        if self._actor_id != user_id:
+            ensure_role(self._storage, self._actor_id, Role.ADMIN)
+
+        now = utcnow()
+        storage = self._storage
+        user = storage.users.get(user_id)
+        session = storage.sessions.get(session_id)
+        disabled = user is not None and user.disabled_at is not None
+
+        if session is None:
+            return RegistrationPreflightEntity(
+                user_disabled=disabled,
+                session_owner=False,
+                session_cancelled=False,
+                active_participation=False,
+                session_full=False,
+                registration_open=False,
+                session=None,
+                credit_cents=None
+            )
+
+        return RegistrationPreflightEntity(
+            user_disabled=disabled,
+            session_owner=session.coach_id == user_id,
+            session_cancelled=session.status == SessionStatus.CANCELLED,
+            active_participation=is_active_participation(
+                storage.participations.get(session_id, {}).get(user_id),
+                session,
+                now
+            ),
+            session_full=is_session_full(storage, session, now),
+            registration_open=is_registration_open(session, now),
+            session=session_entity(session),
+            credit_cents=balance(storage, user_id, session.currency)
+        )
+
+    async def get_session_participants(
+        self,
+        session_id: UUID
+    ) -> list[tuple[str, str]]:
+        return [
+            (profile.first_name, profile.last_name)
+            for profile in participants(self._storage, session_id)
+        ]
+
+    async def get_complete_session_by_id(
+        self,
+        session_id: UUID
+    ) -> SessionCompleteEntity:
+        return session_complete(
+            self._storage,
+            get_session(self._storage, session_id)
+        )
+
+    async def get_own_sessions(
+        self,
+        user_id: UUID,
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[SessionCompleteEntity], bool]:
+        storage = self._storage
+        own = []
+
+        for session_id in storage.sessions_by_participant.get(user_id, ()):
+            session = storage.sessions[session_id]
+            participation = storage.participations[session_id][user_id]
+
+            if (
+                participation.cancelled_at is None
+                and (
+                    participation.paid_at is not None
+                    or session.price_cents == 0
+                )
+                and in_range(session.starts_at, session.ends_at, _from, to)
+            ):
+                own.append(session)
+
+        sessions, has_more = keyset_page(own, offset, limit, cursor)
+
+        return [
+            session_complete(storage, session) for session in sessions
+        ], has_more
+
+    async def get_own_coach_sessions(
+        self,
+        user_id: UUID,
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[SessionCompleteEntity], bool]:
+        ensure_role(self._storage, self._actor_id, Role.COACH)
+
+        storage = self._storage
+        sessions, has_more = keyset_page(
+            (
+                storage.sessions[session_id]
+                for session_id in storage.sessions_by_coach.get(user_id, ())
+                if in_range(
+                    storage.sessions[session_id].starts_at,
+                    storage.sessions[session_id].ends_at,
+                    _from,
+                    to
+                )
+            ),
+            offset,
+            limit,
+            cursor
+        )
+
+        return [
+            session_complete(storage, session) for session in sessions
+        ], has_more
+
+    async def get_session_version(
+        self,
+        session_id: UUID
+    ) -> str | None:
+        session = self._storage.sessions.get(session_id)
+
+        if session is None:
+            return None
+
+        return version(
+            session.participation_version,
+            session.updated_at,
+            self._storage.profile_updated_at.get(session.coach_id)
+        )
+
+    async def get_coach_sessions_version(
+        self,
+        coach_id: UUID
+    ) -> str:
+        sessions = [
+            self._storage.sessions[session_id]
+            for session_id in self._storage.sessions_by_coach.get(
+                coach_id, ()
+            )
+        ]
+
+        return version(
+            len(sessions),
+            sum(s.participation_version for s in sessions) if sessions
+            else None,
+            max((s.updated_at for s in sessions), default=None),
+            self._storage.profile_updated_at.get(coach_id)
+        )
+
+    async def get_participant_sessions_version(
+        self,
+        user_id: UUID
+    ) -> str:
+        storage = self._storage
+        sessions = [
+            storage.sessions[session_id]
+            for session_id in storage.sessions_by_participant.get(
+                user_id, ()
+            )
+        ]
+
+        return version(
+            len(sessions),
+            sum(s.participation_version for s in sessions) if sessions
+            else None,
+            max((s.updated_at for s in sessions), default=None),
+            max(
+                (
+                    storage.profile_updated_at[s.coach_id]
+                    for s in sessions
+                    if s.coach_id in storage.profile_updated_at
+                ),
+                default=None
+            )
+        )
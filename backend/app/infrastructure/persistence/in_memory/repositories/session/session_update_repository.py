@@ -0,0 +1,54 @@
+from datetime import datetime
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.domain.session.session_exception import SessionOverlappingError
+from app.feature.session.repositories.session_update_repository_port import (
+    SessionUpdateRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    cancel_session,
+    ensure_role,
+    overlaps
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.time import utcnow
+
+
+class InMemorySessionUpdateRepo(SessionUpdateRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def update_session(
+        self,
+        session_id: UUID,
+        title: str,
+        starts_at: datetime,
+        ends_at: datetime
+    ) -> None:
+        storage = self._storage
+        ensure_role(storage, self._actor_id, Role.COACH, Role.ADMIN)
+
+        session = storage.sessions.get(session_id)
+
+        if session is None:
+            return
+
+        if overlaps(storage, starts_at, ends_at, exclude=session_id):
+            raise SessionOverlappingError()
+
+        session.title = title
+        storage.reschedule_session(session, starts_at, ends_at)
+        session.updated_at = utcnow()
+
+    async def cancel_session(
+        self,
+        session_id: UUID
+    ) -> None:
+        ensure_role(self._storage, self._actor_id, Role.COACH, Role.ADMIN)
+
+        cancel_session(self._storage, session_id)
@@ -0,0 +1,11 @@
+from .session_attendance_read_repository import (
+    InMemorySessionAttendanceReadRepo
+)
+from .session_attendance_creation_repository import (
+    InMemorySessionAttendanceCreationRepo
+)
+
+__all__ = [
+    "InMemorySessionAttendanceReadRepo",
+    "InMemorySessionAttendanceCreationRepo"
+]
@@ -0,0 +1,64 @@
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.domain.session.session_exception import (
+    InvalidAttendanceInputError,
+    SessionAttendanceNotOpenError,
+    SessionCancelledError,
+    SessionNotFoundError
+)
+from app.domain.session.session_status import SessionStatus
+from app.feature.session.repositories import (
+    SessionAttendanceCreationRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    ensure_role,
+    is_attendance_payload_valid
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.time import utcnow
+
+
+class InMemorySessionAttendanceCreationRepo(
+    SessionAttendanceCreationRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def create_attendance(
+        self,
+        session_id: UUID,
+        attendance_list: dict[UUID, bool]
+    ) -> None:
+        storage = self._storage
+        ensure_role(storage, self._actor_id, Role.COACH)
+
+        session = storage.sessions.get(session_id)
+
+        if session is None:
+            raise SessionNotFoundError()
+
+        if session.status == SessionStatus.CANCELLED:
+            raise SessionCancelledError()
+
+        now = utcnow()
+
+        if now < session.starts_at:
+            raise SessionAttendanceNotOpenError()
+
+        if storage.attendance.get(session_id):
+            return
+
+        if not attendance_list or not is_attendance_payload_valid(
+            storage,
+            session,
+            attendance_list,
+            now
+        ):
+            raise InvalidAttendanceInputError()
+
+        storage.attendance[session_id] = dict(attendance_list)
@@ -0,0 +1,89 @@
+from uuid import UUID
+from app.domain.auth.role import Role
+from app.domain.session.session_exception import InvalidAttendanceInputError
+from app.domain.session.session_status import SessionStatus
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.feature.session.repositories import (
+    SessionAttendanceReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    ensure_role,
+    is_attendance_payload_valid
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.time import utcnow
+
+
+class InMemorySessionAttendanceReadRepo(SessionAttendanceReadRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def is_session_attended(
+        self,
+        session_id: UUID
+    ) -> bool:
+        return bool(self._storage.attendance.get(session_id))
+
+    async def get_attendance(
+        self,
+        session_id: UUID
+    ) -> list[UserProfileEntity]:
+        storage = self._storage
+        ensure_role(storage, self._actor_id, Role.COACH)
+
+        session = storage.sessions.get(session_id)
+
+        if session is None or storage.attendance.get(session_id):
+            return []
+
+        return [
+            storage.user_profiles[user_id]
+            for user_id, participation in storage.participations.get(
+                session_id, {}
+            ).items()
+            if participation.cancelled_at is None
+            and (
+                participation.paid_at is not None
+                or session.price_cents == 0
+            )
+        ]
+
+    async def is_session_attendance_open(
+        self,
+        session_id: UUID
+    ) -> bool:
+        session = self._storage.sessions.get(session_id)
+
+        return (
+            session is not None
+            and session.status != SessionStatus.CANCELLED
+            and utcnow() >= session.starts_at
+        )
+
+    async def is_attendance_payload_valid(
+        self,
+        session_id: UUID,
+        attendance_list: dict[UUID, bool]
+    ) -> bool:
+        storage = self._storage
+        ensure_role(storage, self._actor_id, Role.COACH)
+
+        if storage.attendance.get(session_id):
+            return False
+
+        if not attendance_list:
+            raise InvalidAttendanceInputError()
+
+        session = storage.sessions.get(session_id)
+
+        return session is not None and is_attendance_payload_valid(
+            storage,
+            session,
+            attendance_list,
+            utcnow()
+        )
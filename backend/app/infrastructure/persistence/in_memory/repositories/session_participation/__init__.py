@@ -0,0 +1,15 @@
+from .session_participation_read_repository import (
+    InMemorySessionParticipationReadRepo
+)
+from .session_participation_creation_repository import (
+    InMemorySessionParticipationCreationRepo
+)
+from .session_participation_update_repository import (
+    InMemorySessionParticipationUpdateRepo
+)
+
+__all__ = [
+    "InMemorySessionParticipationReadRepo",
+    "InMemorySessionParticipationCreationRepo",
+    "InMemorySessionParticipationUpdateRepo"
+]
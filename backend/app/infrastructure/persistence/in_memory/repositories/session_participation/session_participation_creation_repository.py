@@ -0,0 +1,99 @@
+from dataclasses import replace
+from datetime import datetime
+from uuid import UUID, uuid4
+from app.domain.auth.auth_exceptions import PermissionDeniedError
+from app.domain.session.session_exception import (
+    AlreadyActiveParticipationError,
+    SessionCancelledError,
+    SessionIsFullError,
+    SessionNotFoundError
+)
+from app.domain.session.session_status import SessionStatus
+from app.domain.session_participation.session_participation_entity import (
+    NewSessionParticipationEntity,
+    SessionParticipationEntity
+)
+from app.feature.session.repositories import (
+    SessionParticipationCreationRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    cancel_participation,
+    is_active_participation,
+    is_lapsed_participation
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.time import utcnow
+
+
+class InMemorySessionParticipationCreationRepo(
+    SessionParticipationCreationRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def create_participation(
+        self,
+        participation: NewSessionParticipationEntity,
+        expires_at: datetime
+    ) -> None:
+        storage = self._storage
+
+        if self._actor_id != participation.user_id:
+            raise PermissionDeniedError()
+
+        session = storage.sessions.get(participation.session_id)
+
+        if session is None:
+            raise SessionNotFoundError()
+
+        if session.status == SessionStatus.CANCELLED:
+            raise SessionCancelledError()
+
+        now = utcnow()
+        by_user = storage.participations.get(session.id, {})
+        existing = by_user.get(participation.user_id)
+
+        if is_active_participation(existing, session, now):
+            raise AlreadyActiveParticipationError()
+
+        # ON CONFLICT (session_id, user_id): only the window moves.
+        if existing is not None:
+            by_user[participation.user_id] = replace(
+                existing,
+                expires_at=expires_at
+            )
+            session.participation_version += 1
+            return
+
+        if (
+            session.capacity is not None
+            and session.seats_taken >= session.capacity
+        ):
+            for lapsed in [
+                p for p in by_user.values()
+                if is_lapsed_participation(p, session, now)
+            ]:
+                cancel_participation(storage, lapsed, now)
+
+        if (
+            session.capacity is not None
+            and session.seats_taken >= session.capacity
+        ):
+            raise SessionIsFullError()
+
+        storage.add_participation(SessionParticipationEntity(
+            id=uuid4(),
+            session_id=session.id,
+            user_id=participation.user_id,
+            paid_at=None,  # type: ignore[arg-type]
+            registred_at=now,
+            cancelled_at=None,  # type: ignore[arg-type]
+            expires_at=expires_at
+        ))
+        session.seats_taken += 1
+        session.participation_version += 1
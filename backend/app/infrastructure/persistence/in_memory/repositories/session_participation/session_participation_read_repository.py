@@ -0,0 +1,65 @@
+from uuid import UUID
+from app.feature.session.repositories import (
+    SessionParticipationReadRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    is_active_participation,
+    is_registration_open,
+    is_session_full
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.time import utcnow
+
+
+class InMemorySessionParticipationReadRepo(
+    SessionParticipationReadRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def has_active_participation(
+        self,
+        session_id: UUID,
+        user_id: UUID
+    ) -> bool:
+        session = self._storage.sessions.get(session_id)
+
+        return session is not None and is_active_participation(
+            self._storage.participations.get(session_id, {}).get(user_id),
+            session,
+            utcnow()
+        )
+
+    async def is_session_full(
+        self,
+        session_id: UUID
+    ) -> bool:
+        session = self._storage.sessions.get(session_id)
+
+        return session is not None and is_session_full(
+            self._storage,
+            session,
+            utcnow()
+        )
+
+    async def is_registration_open(
+        self,
+        session_id: UUID
+    ) -> bool:
+        session = self._storage.sessions.get(session_id)
+
+        return session is not None and is_registration_open(
+            session,
+            utcnow()
+        )
+
+    async def get_user_registered_session_ids(
+        self,
+        user_id: UUID
+    ) -> list[UUID]:
+        return list(self._storage.sessions_by_participant.get(user_id, ()))
@@ -0,0 +1,127 @@
+from dataclasses import replace
+from uuid import UUID
+from app.domain.session.session_exception import (
+    NoActiveParticipationFoundError,
+    SessionNotFoundError
+)
+from app.domain.session_participation.session_participation_entity import (
+    ReleasedParticipationEntity
+)
+from app.feature.stripe.repositories import (
+    SessionParticipationUpdateRepoPort
+)
+from app.infrastructure.persistence.in_memory.functions import (
+    cancel_participation,
+    ensure_self,
+    is_active_participation,
+    is_lapsed_participation
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.shared.utils.time import utcnow
+
+
+class InMemorySessionParticipationUpdateRepo(
+    SessionParticipationUpdateRepoPort
+):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def user_paid(
+        self,
+        session_id: UUID,
+        user_id: UUID
+    ) -> None:
+        now = utcnow()
+        by_user = self._storage.participations.get(session_id, {})
+        participation = by_user.get(user_id)
+
+        if (
+            participation is None
+            or participation.cancelled_at is not None
+            or participation.paid_at is not None
+            or participation.expires_at < now
+        ):
+            return
+
+        by_user[user_id] = replace(participation, paid_at=now)
+        self._storage.sessions[session_id].participation_version += 1
+
+    async def cancel_unpaid(
+        self,
+        session_id: UUID,
+        user_id: UUID
+    ) -> None:
+        participation = self._storage.participations.get(
+            session_id, {}
+        ).get(user_id)
+
+        if (
+            participation is None
+            or participation.cancelled_at is not None
+            or participation.paid_at is not None
+        ):
+            return
+
+        cancel_participation(self._storage, participation, utcnow())
+
+    async def cancel_registration(
+        self,
+        user_id: UUID,
+        session_id: UUID
+    ) -> None:
+        ensure_self(self._actor_id, user_id)
+
+        session = self._storage.sessions.get(session_id)
+
+        if session is None:
+            raise SessionNotFoundError()
+
+        now = utcnow()
+        participation = self._storage.participations.get(
+            session_id, {}
+        ).get(user_id)
+
+        if not is_active_participation(participation, session, now):
+            raise NoActiveParticipationFoundError()
+
+        cancel_participation(
+            self._storage,
+            participation,  # type: ignore[arg-type]
+            now
+        )
+
+    async def release_expired(
+        self,
+        limit: int
+    ) -> list[ReleasedParticipationEntity]:
+        storage = self._storage
+        now = utcnow()
+        expired = sorted(
+            (
+                participation
+                for session_id, by_user in storage.participations.items()
+                if storage.sessions[session_id].starts_at > now
+                for participation in by_user.values()
+                if is_lapsed_participation(
+                    participation,
+                    storage.sessions[session_id],
+                    now
+                )
+            ),
+            key=lambda participation: participation.expires_at
+        )[:limit]
+
+        for participation in expired:
+            cancel_participation(storage, participation, now)
+
+        return [
+            ReleasedParticipationEntity(
+                session_id=participation.session_id,
+                user_id=participation.user_id
+            ) for participation in expired
+        ]
@@ -0,0 +1,5 @@
+from .stripe_event_inbox_repository import InMemoryStripeEventInboxRepo
+
+__all__ = [
+    "InMemoryStripeEventInboxRepo"
+]
@@ -0,0 +1,113 @@
+from datetime import timedelta
+from uuid import UUID
+from app.domain.stripe.stripe_inbox_entity import (
+    StripeInboxEventEntity,
+    StripeInboxStatsEntity
+)
+from app.feature.stripe.repositories import StripeEventInboxRepoPort
+from app.infrastructure.persistence.in_memory.storage import (
+    InMemoryStorage,
+    StripeInboxRow
+)
+from app.shared.utils.time import utcnow
+
+
+class InMemoryStripeEventInboxRepo(StripeEventInboxRepoPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+    async def enqueue(
+        self,
+        event_id: str,
+        event_type: str,
+        payload: str
+    ) -> bool:
+        inbox = self._storage.stripe_event_inbox
+
+        # ON CONFLICT (event_id) DO NOTHING
+        if event_id in inbox:
+            return False
+
+        now = utcnow()
+        inbox[event_id] = StripeInboxRow(
+            event_id=event_id,
+            event_type=event_type,
+            payload=payload,
+            received_at=now,
+            next_attempt_at=now
+        )
+
+        return True
+
+    async def claim_next(
+        self,
+        lease_seconds: float
+    ) -> StripeInboxEventEntity | None:
+        now = utcnow()
+        due = [
+            row for row in self._storage.stripe_event_inbox.values()
+            if row.status == "pending" and row.next_attempt_at <= now
+        ]
+
+        if not due:
+            return None
+
+        row = min(due, key=lambda row: row.next_attempt_at)
+        row.next_attempt_at = now + timedelta(seconds=lease_seconds)
+
+        return StripeInboxEventEntity(
+            event_id=row.event_id,
+            event_type=row.event_type,
+            payload=row.payload,
+            attempts=row.attempts
+        )
+
+    async def lock(self, event_id: str) -> bool:
+        row = self._storage.stripe_event_inbox.get(event_id)
+
+        return row is not None and row.status == "pending"
+
+    async def complete(self, event_id: str) -> None:
+        row = self._storage.stripe_event_inbox.get(event_id)
+
+        if row is not None:
+            row.status = "processed"
+            row.attempts += 1
+            row.last_error = None
+
+    async def fail(
+        self,
+        event_id: str,
+        error: str,
+        retry_in_seconds: float,
+        max_attempts: int
+    ) -> bool:
+        row = self._storage.stripe_event_inbox.get(event_id)
+
+        if row is None or row.status != "pending":
+            return False
+
+        row.attempts += 1
+        row.last_error = error
+        row.status = "dead" if row.attempts >= max_attempts else "pending"
+        row.next_attempt_at = utcnow() + timedelta(seconds=retry_in_seconds)
+
+        return row.status == "dead"
+
+    async def stats(self) -> StripeInboxStatsEntity:
+        now = utcnow()
+        rows = self._storage.stripe_event_inbox.values()
+        pending = [row for row in rows if row.status == "pending"]
+        oldest = min((row.received_at for row in pending), default=now)
+
+        return StripeInboxStatsEntity(
+            pending=len(pending),
+            due=sum(row.next_attempt_at <= now for row in pending),
+            dead=sum(row.status == "dead" for row in rows),
+            oldest_pending_seconds=(now - oldest).total_seconds()
+        )
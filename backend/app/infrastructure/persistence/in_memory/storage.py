@@ -1,10 +1,241 @@
+from bisect import insort
+from dataclasses import dataclass, field
+from datetime import datetime
 from uuid import UUID
-from app.domain.user.user_entity import UserEntity
 from app.domain.auth.refresh_token_entity import RefreshTokenEntity
+from app.domain.auth.role import Role
+from app.domain.credit.credit_entity import CreditEntity
+from app.domain.payment.payment_entity import PaymentEntity
+from app.domain.payment_intent.payment_intent_providers import PaymentProvider
+from app.domain.session.session_status import SessionStatus
+from app.domain.session_participation.session_participation_entity import (
+    SessionParticipationEntity
+)
+from app.domain.user.user_entity import UserEntity
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.shared.utils.time import utcnow
+
+
+IntentKey = tuple[UUID, UUID, str]
+
+
+def intent_key(user_id: UUID, session_id: UUID, provider: str) -> IntentKey:
+    """``(user_id, session_id, provider)`` unique key of a payment intent.
+
+    Providers are stored by value: members of ``str`` enums do not hash
+    like their value.
+    """
+    return user_id, session_id, PaymentProvider(provider).value
+
+
+@dataclass(slots=True)
+class SessionRow:
+    """Row of ``app.sessions``, including the columns kept off the
+    session entities (``capacity``, ``seats_taken`` and
+    ``participation_version``)."""
+    id: UUID
+    coach_id: UUID
+    title: str
+    starts_at: datetime
+    ends_at: datetime
+    price_cents: int
+    currency: str
+    capacity: int | None
+    created_at: datetime
+    updated_at: datetime
+    status: SessionStatus = SessionStatus.SCHEDULED
+    cancelled_at: datetime | None = None
+    seats_taken: int = 0
+    participation_version: int = 0
+
+
+@dataclass(slots=True)
+class PaymentIntentRow:
+    """Row of ``app.payment_intents``."""
+    id: UUID
+    user_id: UUID
+    session_id: UUID
+    provider: str
+    provider_intent_id: str | None
+    provider_checkout_id: str | None
+    status: str
+    credit_applied_cents: int
+    amount_cents: int
+    currency: str
+
+
+@dataclass(slots=True)
+class CoachStripeAccountRow:
+    """Row of ``app.coach_stripe_accounts``."""
+    coach_id: UUID
+    stripe_account_id: str
+    details_submitted: bool = False
+    charges_enabled: bool = False
+    payouts_enabled: bool = False
+
+
+@dataclass(slots=True)
+class StripeInboxRow:
+    """Row of ``app.stripe_webhook_events``."""
+    event_id: str
+    event_type: str
+    payload: str
+    received_at: datetime
+    next_attempt_at: datetime
+    status: str = "pending"
+    attempts: int = 0
+    last_error: str | None = None
+
+
+@dataclass
+class InMemoryStorage:
+    """Process local tables for the in-memory repositories.
+
+    Each table is a dict keyed like its primary key or unique
+    constraint, with secondary indexes for the lookups the SQL
+    repositories answer from an index. Repositories keep the indexes
+    in sync through the ``add_*`` methods; entities are frozen and
+    replaced on update, rows without an entity are updated in place.
+    """
+    users: dict[UUID, UserEntity] = field(default_factory=dict)
+    users_by_email: dict[str, UUID] = field(default_factory=dict)
+    user_created_at: dict[UUID, datetime] = field(default_factory=dict)
+    user_profiles: dict[UUID, UserProfileEntity] = field(
+        default_factory=dict
+    )
+    profile_updated_at: dict[UUID, datetime] = field(default_factory=dict)
+    refresh_tokens: dict[str, RefreshTokenEntity] = field(
+        default_factory=dict
+    )
+
+    sessions: dict[UUID, SessionRow] = field(default_factory=dict)
+    sessions_by_coach: dict[UUID, list[UUID]] = field(default_factory=dict)
+    # (starts_at, id) of every session, sorted, for the overlap check.
+    sessions_by_start: list[tuple[datetime, UUID]] = field(
+        default_factory=list
+    )
+
+    # session_id -> user_id -> participation, plus the reverse index.
+    participations: dict[UUID, dict[UUID, SessionParticipationEntity]] = (
+        field(default_factory=dict)
+    )
+    sessions_by_participant: dict[UUID, list[UUID]] = field(
+        default_factory=dict
+    )
+
+    # session_id -> user_id -> attended
+    attendance: dict[UUID, dict[UUID, bool]] = field(default_factory=dict)
+
+    credit_ledger: list[CreditEntity] = field(default_factory=list)
+    credit_ledger_by_user: dict[UUID, list[CreditEntity]] = field(
+        default_factory=dict
+    )
+    credit_balances: dict[tuple[UUID, str], int] = field(
+        default_factory=dict
+    )
+
+    payments: dict[UUID, PaymentEntity] = field(default_factory=dict)
+    payments_by_provider_id: dict[str, UUID] = field(default_factory=dict)
+    payments_by_session: dict[UUID, list[UUID]] = field(
+        default_factory=dict
+    )
+    payments_by_user: dict[UUID, list[UUID]] = field(default_factory=dict)
+
+    payment_intents: dict[IntentKey, PaymentIntentRow] = field(
+        default_factory=dict
+    )
+    payment_intents_by_provider_id: dict[str, IntentKey] = field(
+        default_factory=dict
+    )
+
+    coach_stripe_accounts: dict[UUID, CoachStripeAccountRow] = field(
+        default_factory=dict
+    )
+    coach_stripe_accounts_by_account_id: dict[str, UUID] = field(
+        default_factory=dict
+    )
+
+    stripe_event_inbox: dict[str, StripeInboxRow] = field(
+        default_factory=dict
+    )
+
+    def add_user(
+        self,
+        user: UserEntity,
+        profile: UserProfileEntity,
+        created_at: datetime | None = None
+    ) -> None:
+        created_at = created_at or utcnow()
+
+        self.users[user.id] = user
+        self.users_by_email[user.email] = user.id
+        self.user_created_at[user.id] = created_at
+        self.user_profiles[user.id] = profile
+        self.profile_updated_at[user.id] = created_at
+
+    def has_role(self, user_id: UUID | None, role: Role) -> bool:
+        user = self.users.get(user_id) if user_id is not None else None
+
+        return user is not None and role in user.roles
+
+    def add_session(self, session: SessionRow) -> None:
+        self.sessions[session.id] = session
+        self.sessions_by_coach.setdefault(session.coach_id, []).append(
+            session.id
+        )
+        insort(self.sessions_by_start, (session.starts_at, session.id))
+
+    def reschedule_session(
+        self,
+        session: SessionRow,
+        starts_at: datetime,
+        ends_at: datetime
+    ) -> None:
+        self.sessions_by_start.remove((session.starts_at, session.id))
+        session.starts_at = starts_at
+        session.ends_at = ends_at
+        insort(self.sessions_by_start, (starts_at, session.id))
+
+    def add_participation(
+        self,
+        participation: SessionParticipationEntity
+    ) -> None:
+        by_user = self.participations.setdefault(participation.session_id, {})
+
+        if participation.user_id not in by_user:
+            self.sessions_by_participant.setdefault(
+                participation.user_id, []
+            ).append(participation.session_id)
+
+        by_user[participation.user_id] = participation
+
+    def add_credit(self, entry: CreditEntity) -> None:
+        key = (entry.user_id, entry.currency)
+
+        self.credit_ledger.append(entry)
+        self.credit_ledger_by_user.setdefault(entry.user_id, []).append(
+            entry
+        )
+        self.credit_balances[key] = entry.balance_after_cents
+
+    def add_payment(self, payment: PaymentEntity) -> None:
+        self.payments[payment.id] = payment
+        self.payments_by_provider_id[payment.provider_payment_id] = (
+            payment.id
+        )
+        self.payments_by_session.setdefault(payment.session_id, []).append(
+            payment.id
+        )
+        self.payments_by_user.setdefault(payment.user_id, []).append(
+            payment.id
+        )
+
+    def add_payment_intent(self, intent: PaymentIntentRow) -> None:
+        key = intent_key(intent.user_id, intent.session_id, intent.provider)
 
+        self.payment_intents[key] = intent
 
-class InMemoryAuthStorage:
-    def __init__(self) -> None:
-        self.users: dict[UUID, UserEntity] = {}
-        self.users_by_email: dict[str, UUID] = {}
-        self.refresh_tokens: dict[str, RefreshTokenEntity] = {}
+        if intent.provider_intent_id is not None:
+            self.payment_intents_by_provider_id[
+                intent.provider_intent_id
+            ] = key
@@ -0,0 +1,16 @@
+from .users.admin_user_uow import InMemoryAdminUserUoW
+from .users.admin_user_system_uow import InMemoryAdminUserSystemUoW
+from .session.admin_session_uow import InMemoryAdminSessionUoW
+from .session.admin_session_system_uow import InMemoryAdminSessionSystemUoW
+from .payment.admin_payment_uow import InMemoryAdminPaymentUoW
+from .credit.admin_credit_uow import InMemoryAdminCreditUoW
+
+
+__all__ = [
+    "InMemoryAdminUserUoW",
+    "InMemoryAdminUserSystemUoW",
+    "InMemoryAdminSessionUoW",
+    "InMemoryAdminSessionSystemUoW",
+    "InMemoryAdminPaymentUoW",
+    "InMemoryAdminCreditUoW"
+]
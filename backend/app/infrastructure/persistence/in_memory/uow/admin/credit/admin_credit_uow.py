@@ -0,0 +1,24 @@
+from uuid import UUID
+from app.feature.admin.credit.uow.admin_credit_uow_port import (
+    AdminCreditUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryAdminCreditLedgerReadRepo,
+    InMemoryAuthReadRepo
+)
+
+
+class InMemoryAdminCreditUoW(AdminCreditUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.credit_read_repo = (
+            InMemoryAdminCreditLedgerReadRepo(storage, actor_id)
+        )
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
@@ -0,0 +1,24 @@
+from uuid import UUID
+from app.feature.admin.payment.uow.admin_payment_uow_port import (
+    AdminPaymentUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryAdminPaymentReadRepo,
+    InMemoryAuthReadRepo
+)
+
+
+class InMemoryAdminPaymentUoW(AdminPaymentUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.payment_read_repo = (
+            InMemoryAdminPaymentReadRepo(storage, actor_id)
+        )
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
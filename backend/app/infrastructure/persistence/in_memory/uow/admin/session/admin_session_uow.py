@@ -0,0 +1,29 @@
+from uuid import UUID
+from app.feature.admin.session.uow.admin_session_uow_port import (
+    AdminSessionUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryAdminSessionReadRepo,
+    InMemoryAdminSessionUpdateRepo,
+    InMemoryAuthReadRepo
+)
+
+
+class InMemoryAdminSessionUoW(AdminSessionUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.session_read_repo = (
+            InMemoryAdminSessionReadRepo(storage, actor_id)
+        )
+        self.session_update_repo = (
+            InMemoryAdminSessionUpdateRepo(storage, actor_id)
+        )
+
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
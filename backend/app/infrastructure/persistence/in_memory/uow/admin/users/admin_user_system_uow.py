@@ -0,0 +1,34 @@
+from uuid import UUID
+from app.feature.admin.users.uow.admin_user_system_uow_port import (
+    AdminUserSystemUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories.admin import (
+    InMemoryAdminUserUpdateRepo,
+    InMemoryAdminUserCreationRepo,
+    InMemoryAdminUserDeletionRepo
+)
+from app.infrastructure.persistence.in_memory.repositories.auth import (
+    InMemoryAuthReadRepo
+)
+
+
+class InMemoryAdminUserSystemUoW(AdminUserSystemUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.admin_user_update_repo = (
+            InMemoryAdminUserUpdateRepo(storage, actor_id)
+        )
+        self.admin_user_creation_repo = (
+            InMemoryAdminUserCreationRepo(storage, actor_id)
+        )
+        self.admin_user_deletion_repo = (
+            InMemoryAdminUserDeletionRepo(storage, actor_id)
+        )
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
@@ -0,0 +1,24 @@
+from uuid import UUID
+from app.feature.admin.users.uow.admin_user_uow_port import (
+    AdminUserUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryAdminUserReadRepo,
+    InMemoryAuthReadRepo
+)
+
+
+class InMemoryAdminUserUoW(AdminUserUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.admin_user_read_repo = (
+            InMemoryAdminUserReadRepo(storage, actor_id)
+        )
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
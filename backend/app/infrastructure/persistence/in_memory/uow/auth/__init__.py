@@ -1,6 +1,5 @@
-from .login_uow import InMemoryLoginUoW
-
+from .auth_uow import InMemoryAuthUoW
 
 __all__ = [
-    "InMemoryLoginUoW"
+    "InMemoryAuthUoW"
 ]
@@ -0,0 +1,22 @@
+from uuid import UUID
+from app.feature.auth.uow.auth_uow_port import AuthUoWPort
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories.auth import (
+    InMemoryAuthUpdateRepo,
+    InMemoryAuthReadRepo,
+    InMemoryAuthCreationRepo
+)
+
+
+class InMemoryAuthUoW(AuthUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.auth_update_repo = InMemoryAuthUpdateRepo(storage, actor_id)
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
+        self.auth_creation_repo = InMemoryAuthCreationRepo(storage, actor_id)
@@ -0,0 +1,42 @@
+from uuid import UUID
+from app.feature.coach.uow.coach_uow_port import (
+    CoachUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryCoachStripeAccountReadRepo,
+    InMemoryCoachStripeAccountCreationRepo,
+    InMemoryPaymentReadRepo,
+    InMemoryPaymentCreationRepo,
+    InMemorySessionReadRepo,
+    InMemoryAuthReadRepo
+)
+
+
+class InMemoryCoachUoW(CoachUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.coach_stripe_account_read_repo = (
+            InMemoryCoachStripeAccountReadRepo(storage, actor_id)
+        )
+        self.coach_stripe_account_creation_repo = (
+            InMemoryCoachStripeAccountCreationRepo(storage, actor_id)
+        )
+        self.payment_read_repo = (
+            InMemoryPaymentReadRepo(storage, actor_id)
+        )
+        self.payment_creation_repo = (
+            InMemoryPaymentCreationRepo(storage, actor_id)
+        )
+        self.session_read_repo = (
+            InMemorySessionReadRepo(storage, actor_id)
+        )
+        self.auth_read_repo = (
+            InMemoryAuthReadRepo(storage, actor_id)
+        )
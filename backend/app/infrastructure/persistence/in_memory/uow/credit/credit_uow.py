@@ -0,0 +1,21 @@
+from uuid import UUID
+from app.feature.credit.uow.credit_uow_port import (
+    CreditUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryCreditLedgerReadRepo,
+    InMemoryAuthReadRepo
+)
+
+
+class InMemoryCreditUoW(CreditUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+        self.credit_read_repo = InMemoryCreditLedgerReadRepo(storage, actor_id)
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
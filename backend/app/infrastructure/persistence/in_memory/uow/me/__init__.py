@@ -0,0 +1,8 @@
+from .me_system_uow import InMemoryMeSystemUoW
+from .me_uow import InMemoryMeUoW
+
+
+__all__ = [
+    "InMemoryMeUoW",
+    "InMemoryMeSystemUoW"
+]
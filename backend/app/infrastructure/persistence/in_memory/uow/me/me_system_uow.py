@@ -0,0 +1,32 @@
+from uuid import UUID
+from app.feature.me.uow.me_system_uow_port import (
+    MeSystemUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryMeDeleteRepo,
+    InMemoryMeUpdateRepo,
+    InMemoryAuthUpdateRepo,
+    InMemoryAuthReadRepo,
+    InMemorySessionReadRepo,
+    InMemorySessionParticipationReadRepo
+)
+
+
+class InMemoryMeSystemUoW(MeSystemUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.me_update_repo = InMemoryMeUpdateRepo(storage, actor_id)
+        self.me_delete_repo = InMemoryMeDeleteRepo(storage, actor_id)
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
+        self.auth_update_repo = InMemoryAuthUpdateRepo(storage, actor_id)
+        self.session_read_repo = InMemorySessionReadRepo(storage, actor_id)
+        self.session_participation_read_repo = (
+            InMemorySessionParticipationReadRepo(storage, actor_id)
+        )
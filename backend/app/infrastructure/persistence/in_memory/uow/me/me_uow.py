@@ -0,0 +1,24 @@
+from uuid import UUID
+from app.feature.me.uow.me_uow_port import MeUoWPort
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryMeReadRepo,
+    InMemoryMeUpdateRepo,
+    InMemoryAuthReadRepo,
+    InMemorySessionReadRepo
+)
+
+
+class InMemoryMeUoW(MeUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.me_read_repo = InMemoryMeReadRepo(storage, actor_id)
+        self.me_update_repo = InMemoryMeUpdateRepo(storage, actor_id)
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
+        self.session_read_repo = InMemorySessionReadRepo(storage, actor_id)
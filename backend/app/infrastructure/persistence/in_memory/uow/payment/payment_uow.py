@@ -0,0 +1,22 @@
+from uuid import UUID
+from app.feature.payment.uow.payment_uow_port import (
+    PaymentUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryPaymentReadRepo,
+    InMemoryAuthReadRepo
+)
+
+
+class InMemoryPaymentUoW(PaymentUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.payment_read_repo = InMemoryPaymentReadRepo(storage, actor_id)
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
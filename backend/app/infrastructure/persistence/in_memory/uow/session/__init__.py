@@ -0,0 +1,8 @@
+from .session_public_uow import InMemorySessionPublicUoW
+from .session_uow import InMemorySessionUoW
+
+
+__all__ = [
+    "InMemorySessionPublicUoW",
+    "InMemorySessionUoW"
+]
@@ -0,0 +1,21 @@
+from uuid import UUID
+from app.feature.session.uow.session_public_uow_port import (
+    SessionPulbicUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories.session import (
+    InMemorySessionReadRepo
+)
+
+
+class InMemorySessionPublicUoW(SessionPulbicUoWPort):
+
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.session_read_repo = InMemorySessionReadRepo(storage, actor_id)
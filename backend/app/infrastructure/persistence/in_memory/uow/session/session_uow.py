@@ -0,0 +1,64 @@
+from uuid import UUID
+from app.feature.session.uow.session_uow_port import (
+    SessionUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemorySessionParticipationReadRepo,
+    InMemorySessionParticipationCreationRepo,
+    InMemorySessionParticipationUpdateRepo,
+    InMemorySessionUpdateRepo,
+    InMemorySessionReadRepo,
+    InMemorySessionCreationRepo,
+    InMemoryAuthReadRepo,
+    InMemorySessionAttendanceReadRepo,
+    InMemorySessionAttendanceCreationRepo,
+    InMemoryPaymentIntentCreationRepo,
+    InMemoryCreditLedgerReadRepo,
+    InMemoryCreditLedgerCreationRepo,
+    InMemoryCoachStripeAccountReadRepo
+)
+
+
+class InMemorySessionUoW(SessionUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.session_creation_repo = (
+            InMemorySessionCreationRepo(storage, actor_id)
+        )
+        self.session_update_repo = InMemorySessionUpdateRepo(storage, actor_id)
+        self.session_read_repo = InMemorySessionReadRepo(storage, actor_id)
+        self.session_participation_read_repo = (
+            InMemorySessionParticipationReadRepo(storage, actor_id)
+        )
+        self.auth_read_repo = InMemoryAuthReadRepo(storage, actor_id)
+        self.session_participation_creation_repo = (
+            InMemorySessionParticipationCreationRepo(storage, actor_id)
+        )
+        self.session_attendance_read_repo = (
+            InMemorySessionAttendanceReadRepo(storage, actor_id)
+        )
+        self.session_attendance_creation_repo = (
+            InMemorySessionAttendanceCreationRepo(storage, actor_id)
+        )
+        self.payment_intent_creation_repo = (
+            InMemoryPaymentIntentCreationRepo(storage, actor_id)
+        )
+        self.credit_ledger_read_repo = (
+            InMemoryCreditLedgerReadRepo(storage, actor_id)
+        )
+        self.credit_ledger_creation_repo = (
+            InMemoryCreditLedgerCreationRepo(storage, actor_id)
+        )
+        self.session_participation_update_repo = (
+            InMemorySessionParticipationUpdateRepo(storage, actor_id)
+        )
+        self.coach_stripe_account_read_repo = (
+            InMemoryCoachStripeAccountReadRepo(storage, actor_id)
+        )
@@ -0,0 +1,46 @@
+from uuid import UUID
+from app.feature.stripe.uow.stripe_uow_port import (
+    StripeUoWPort
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryPaymentIntentReadRepo,
+    InMemoryPaymentIntentUpdateRepo,
+    InMemorySessionParticipationUpdateRepo,
+    InMemoryPaymentCreationRepo,
+    InMemoryCreditLedgerCreationRepo,
+    InMemoryCoachStripeAccountUpdateRepo,
+    InMemoryStripeEventInboxRepo
+)
+
+
+class InMemoryStripeUoW(StripeUoWPort):
+    def __init__(
+        self,
+        storage: InMemoryStorage,
+        actor_id: UUID | None = None
+    ) -> None:
+        self._storage = storage
+        self._actor_id = actor_id
+
+        self.payment_intent_read_repo = (
+            InMemoryPaymentIntentReadRepo(storage, actor_id)
+        )
+        self.payment_intent_update_repo = (
+            InMemoryPaymentIntentUpdateRepo(storage, actor_id)
+        )
+        self.session_participation_update_repo = (
+            InMemorySessionParticipationUpdateRepo(storage, actor_id)
+        )
+        self.payment_creation_repo = (
+            InMemoryPaymentCreationRepo(storage, actor_id)
+        )
+        self.credit_ledger_creation_repo = (
+            InMemoryCreditLedgerCreationRepo(storage, actor_id)
+        )
+        self.coach_stripe_account_update_repo = (
+            InMemoryCoachStripeAccountUpdateRepo(storage, actor_id)
+        )
+        self.stripe_event_inbox_repo = (
+            InMemoryStripeEventInboxRepo(storage, actor_id)
+        )
@@ -1,38 +1,87 @@
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from app.infrastructure.persistence.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    PoolConfig
+)
+from app.infrastructure.persistence.sqlalchemy.query_metrics import (
+    install_query_metrics
+)
+from app.infrastructure.persistence.sqlalchemy.rls import (
+    ActorBindingConnection,
+    install_actor_binding
+)
+from app.infrastructure.persistence.sqlalchemy.statements import (
+    StatementCacheConfig,
+    install_statement_cache_stats
+)
 
 
-def create_app_engine(dsn: str) -> AsyncEngine:
+def _create_engine(
+    name: str,
+    dsn: str,
+    pool: PoolConfig,
+    statements: StatementCacheConfig
+) -> AsyncEngine:
+    engine = create_async_engine(
+        dsn,
+        echo=False,
+        connect_args={
+            "connection_class": ActorBindingConnection,
+            "prepared_statement_cache_size": (
+                statements.prepared_statement_cache_size
+            ),
+        },
+        query_cache_size=statements.query_cache_size,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        pool_size=pool.pool_size,
+        max_overflow=pool.max_overflow,
+        pool_timeout=pool.timeout_seconds,
+        pool_recycle=pool.recycle_seconds,
+        pool_pre_ping=pool.pre_ping,
+    )
+    install_actor_binding(engine)
+    install_statement_cache_stats(engine)
+    install_query_metrics(engine, name)
+
+    return engine
+
+
+def create_app_engine(
+    dsn: str,
+    pool: PoolConfig,
+    statements: StatementCacheConfig = StatementCacheConfig()
+) -> AsyncEngine:
     """Create the application database engine.
 
     Uses the application role which is subject to RLS and business rules.
 
     Args:
-        settings (AppSettings): Application settings.
+        dsn (str): Async DSN for the app_user role.
+        pool (PoolConfig): Connection pool sizing for the app_user role.
+        statements (StatementCacheConfig): Statement cache sizing.
 
     Returns:
         AsyncEngine: SQLAlchemy async engine.
     """
-    return create_async_engine(
-        dsn,
-        echo=False,
-        pool_pre_ping=True,
-    )
+    return _create_engine("app_user", dsn, pool, statements)
 
 
-def create_system_engine(dsn: str) -> AsyncEngine:
+def create_system_engine(
+    dsn: str,
+    pool: PoolConfig,
+    statements: StatementCacheConfig = StatementCacheConfig()
+) -> AsyncEngine:
     """Create the system database engine.
 
     Uses the system role for internal operations that require elevated
     permissions but still respect RLS where applicable.
 
     Args:
-        settings (AppSettings): Application settings.
+        dsn (str): Async DSN for the app_system role.
+        pool (PoolConfig): Connection pool sizing for the app_system role.
+        statements (StatementCacheConfig): Statement cache sizing.
 
     Returns:
         AsyncEngine: SQLAlchemy async engine.
     """
-    return create_async_engine(
-        dsn,
-        echo=False,
-        pool_pre_ping=True,
-    )
+    return _create_engine("app_system", dsn, pool, statements)
@@ -0,0 +1,114 @@
+import asyncio
+import logging
+from typing import Mapping, Protocol
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+_CONNECTION_ERRORS = (
+    OSError,
+    asyncio.TimeoutError,
+    asyncpg.PostgresError,
+    asyncpg.InterfaceError,
+)
+
+
+class NotifiedCache(Protocol):
+    def invalidate(self, payload: str) -> None: ...
+    def suspend(self) -> None: ...
+    def resume(self) -> None: ...
+
+
+class CacheInvalidationListener:
+    """Invalidate caches from Postgres notifications.
+
+    Keeps a dedicated connection LISTENing on every channel of ``caches``
+    and hands each notification payload to the cache of its channel.
+    Reconnects when the connection drops; the caches are suspended while
+    it is down, because notifications sent meanwhile are lost.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        caches: Mapping[str, NotifiedCache],
+        retry_seconds: float = 5,
+        keepalive_seconds: float = 30
+    ) -> None:
+        self._dsn = dsn
+        self._caches = dict(caches)
+        self._retry_seconds = retry_seconds
+        self._keepalive_seconds = keepalive_seconds
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._suspend()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        self._caches[channel].invalidate(payload)
+
+    def _suspend(self) -> None:
+        for cache in self._caches.values():
+            cache.suspend()
+
+    async def _watch(
+        self,
+        connection: asyncpg.Connection,
+        closed: asyncio.Event
+    ) -> None:
+        # An idle LISTEN connection never notices a silently dropped
+        # network path, so it is pinged periodically.
+        while not closed.is_set():
+            try:
+                await asyncio.wait_for(
+                    closed.wait(),
+                    timeout=self._keepalive_seconds
+                )
+            except asyncio.TimeoutError:
+                await connection.execute("SELECT 1")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                connection = await asyncpg.connect(self._dsn)
+            except _CONNECTION_ERRORS as exc:
+                logger.warning("cache invalidation listener: %s", exc)
+                await asyncio.sleep(self._retry_seconds)
+                continue
+
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+
+            try:
+                for channel in self._caches:
+                    await connection.add_listener(channel, self._on_notify)
+
+                # Notifications sent while disconnected are lost.
+                for cache in self._caches.values():
+                    cache.resume()
+
+                await self._watch(connection, closed)
+                logger.warning("cache invalidation listener disconnected")
+            except _CONNECTION_ERRORS as exc:
+                logger.warning("cache invalidation listener: %s", exc)
+            finally:
+                self._suspend()
+
+                if not connection.is_closed():
+                    await connection.close()
+
+            await asyncio.sleep(self._retry_seconds)
@@ -0,0 +1,106 @@
+import logging
+import stripe
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.domain.session_participation.session_participation_entity import (
+    ParticipationSweepEntity
+)
+from app.feature.stripe.stripe_service import StripeService
+from app.infrastructure.persistence.sqlalchemy.periodic_worker import (
+    PeriodicBatchWorker
+)
+from app.infrastructure.persistence.sqlalchemy.uow.stripe.stripe_uow import (
+    SqlAlchemyStripeUoW
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ParticipationSweeper(PeriodicBatchWorker[ParticipationSweepEntity]):
+    """Release expired unpaid registrations in a background task.
+
+    Every ``interval_seconds`` a pass cancels registrations whose payment
+    window is over, ``batch_size`` rows per transaction claimed with
+    ``SKIP LOCKED``, until a short batch shows the backlog is drained or
+    ``max_batches`` is reached. Pending payment intents of the released
+    registrations are cancelled in the same transaction, and their Stripe
+    checkout sessions are expired once it has committed.
+    """
+    name = "participation sweeper"
+    counters = (
+        "released",
+        "intents_cancelled",
+        "checkouts_expired",
+        "checkout_errors",
+    )
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        service: StripeService,
+        stripe_client: stripe.StripeClient,
+        interval_seconds: float = 30,
+        batch_size: int = 200,
+        max_batches: int = 50
+    ) -> None:
+        super().__init__(
+            session_factory,
+            interval_seconds,
+            batch_size,
+            max_batches
+        )
+        self._service = service
+        self._stripe_client = stripe_client
+
+    async def _run_batch(
+        self,
+        session: AsyncSession
+    ) -> ParticipationSweepEntity:
+        return await self._service.release_expired_participations(
+            SqlAlchemyStripeUoW(session),
+            self._batch_size
+        )
+
+    async def _settle(
+        self,
+        batch: ParticipationSweepEntity,
+        counts: dict[str, int]
+    ) -> int:
+        counts["released"] += batch.released
+        counts["intents_cancelled"] += batch.intents_cancelled
+
+        for checkout_id in batch.checkout_ids:
+            if await self._expire_checkout(checkout_id):
+                counts["checkouts_expired"] += 1
+            else:
+                counts["checkout_errors"] += 1
+
+        return batch.released
+
+    def _report(self, last_pass: dict[str, float]) -> None:
+        if last_pass["released"]:
+            logger.info(
+                "released %d expired participations, cancelled %d "
+                "payment intents, expired %d checkouts in %.1f ms",
+                last_pass["released"],
+                last_pass["intents_cancelled"],
+                last_pass["checkouts_expired"],
+                last_pass["duration_ms"]
+            )
+
+    async def _expire_checkout(self, checkout_id: str) -> bool:
+        # The checkout may already be completed or expired by Stripe; the
+        # registration is released either way.
+        try:
+            await self._service.expire_checkout(
+                self._stripe_client,
+                checkout_id
+            )
+        except stripe.StripeError as exc:
+            logger.warning(
+                "could not expire checkout %s: %r",
+                checkout_id,
+                exc
+            )
+            return False
+
+        return True
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from time import perf_counter
+from typing import Generic, TypeVar
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PeriodicBatchWorker(ABC, Generic[T]):
+    """Drain a backlog in batches from a background task.
+
+    Every ``interval_seconds`` a pass runs ``_run_batch`` in a transaction
+    of its own, then ``_settle`` once it has committed, until a batch
+    claims fewer than ``batch_size`` rows or ``max_batches`` is reached.
+    A failed pass is logged and the next one runs on schedule.
+
+    Subclasses name the ``counters`` their batches add to; a pass
+    reports them with its batch count and duration, and ``status``
+    their totals since startup.
+    """
+    name = "periodic worker"
+    counters: tuple[str, ...] = ()
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval_seconds: float,
+        batch_size: int,
+        max_batches: int
+    ) -> None:
+        self._session_factory = session_factory
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+        self._task: asyncio.Task | None = None
+        self.passes = 0
+        self.totals = dict.fromkeys(self.counters, 0)
+        self.last_pass: dict[str, float] = {}
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    def status(self) -> dict[str, object]:
+        return {
+            "running": self._task is not None,
+            "passes": self.passes,
+            **self.totals,
+            "last_pass": self.last_pass,
+        }
+
+    async def run_once(self) -> dict[str, float]:
+        """Run one pass.
+
+        Returns:
+            dict[str, float]: Counters of the pass, its batches and
+            duration.
+        """
+        start = perf_counter()
+        counts = dict.fromkeys(self.counters, 0)
+        batches = 0
+
+        while batches < self._max_batches:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    batch = await self._run_batch(session)
+
+            batches += 1
+
+            if await self._settle(batch, counts) < self._batch_size:
+                break
+
+        self.passes += 1
+
+        for counter, count in counts.items():
+            self.totals[counter] += count
+
+        self.last_pass = {
+            "batches": batches,
+            **counts,
+            "duration_ms": round((perf_counter() - start) * 1000, 3),
+        }
+        self._report(self.last_pass)
+
+        return self.last_pass
+
+    @abstractmethod
+    async def _run_batch(self, session: AsyncSession) -> T:
+        """Claim and process one batch, inside its transaction."""
+
+    @abstractmethod
+    async def _settle(self, batch: T, counts: dict[str, int]) -> int:
+        """Add a committed batch to the pass counters and run its side
+        effects.
+
+        Returns:
+            int: Rows the batch claimed.
+        """
+
+    def _report(self, last_pass: dict[str, float]) -> None:
+        pass
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("%s failed", self.name)
+
+            await asyncio.sleep(self._interval_seconds)
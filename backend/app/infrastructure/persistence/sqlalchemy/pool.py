@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool sizing for one database role.
+
+    Attributes:
+        pool_size: Connections kept open in the pool.
+        max_overflow: Extra connections allowed above ``pool_size``.
+        timeout_seconds: Time to wait for a free connection before failing.
+        recycle_seconds: Maximum connection age, ``-1`` disables recycling.
+        pre_ping: Test connections for liveness on checkout.
+    """
+    pool_size: int
+    max_overflow: int
+    timeout_seconds: float
+    recycle_seconds: int
+    pre_ping: bool
+
+
+class PoolStats:
+    """Cumulative acquisition counters for a connection pool.
+
+    ``checkouts`` and the wait times cover successful checkouts only;
+    checkouts that gave up after the pool timeout are ``timeouts``.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+
+        if seconds > self.wait_seconds_max:
+            self.wait_seconds_max = seconds
+
+    def record_timeout(self) -> None:
+        self.timeouts += 1
+
+
+class InstrumentedPoolMixin:
+    """Record acquisition wait time and timeouts on a queue pool.
+
+    The counters survive ``recreate()`` (called by ``engine.dispose()``)
+    so they describe the lifetime of the engine, not of a single pool.
+    """
+    stats: PoolStats
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        # Only successful checkouts are timed: a timeout is counted on its
+        # own, and a failed or cancelled checkout is not a wait.
+        start = perf_counter()
+        try:
+            connection = super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            self.stats.record_timeout()
+            raise
+
+        self.stats.record_wait(perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()  # type: ignore[misc]
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedAsyncAdaptedQueuePool(
+    InstrumentedPoolMixin,
+    AsyncAdaptedQueuePool
+):
+    pass
+
+
+def pool_status(pool: Pool) -> dict[str, int | float]:
+    """Snapshot the live gauges and counters of a pool.
+
+    Args:
+        pool (Pool): Pool to inspect, usually ``engine.pool``.
+
+    Returns:
+        dict[str, int | float]: Pool gauges and acquisition counters.
+    """
+    status: dict[str, int | float] = {}
+
+    if isinstance(pool, QueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+        })
+
+    stats: PoolStats | None = getattr(pool, "stats", None)
+
+    if stats is not None:
+        status.update({
+            "checkouts": stats.checkouts,
+            "timeouts": stats.timeouts,
+            "wait_seconds_total": round(stats.wait_seconds_total, 6),
+            "wait_seconds_max": round(stats.wait_seconds_max, 6),
+            "wait_seconds_avg": round(
+                stats.wait_seconds_total / stats.checkouts, 6
+            ) if stats.checkouts else 0.0,
+        })
+
+    return status
+
+
+def engines_pool_status(
+    engines: dict[str, AsyncEngine]
+) -> dict[str, dict[str, int | float]]:
+    """Snapshot the pools of several named engines.
+
+    Args:
+        engines (dict[str, AsyncEngine]): Engines keyed by role name.
+
+    Returns:
+        dict[str, dict[str, int | float]]: Pool status keyed by role name.
+    """
+    return {
+        name: pool_status(engine.pool)
+        for name, engine in engines.items()
+    }
@@ -1,6 +1,5 @@
 from fastapi import Depends
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql.expression import text
 from app.domain.auth.actor_entity import Actor
 from app.feature.admin.credit.uow.admin_credit_uow_port import (
     AdminCreditUoWPort
@@ -27,6 +26,7 @@ from app.feature.payment.uow.payment_uow_port import PaymentUoWPort
 from app.feature.session.uow.session_public_uow_port import (
     SessionPulbicUoWPort
 )
+from app.infrastructure.persistence.sqlalchemy.rls import bind_current_user
 from app.infrastructure.persistence.sqlalchemy.uow.admin import (
     SqlAlchemyAdminUserUoW,
     SqlAlchemyAdminUserSystemUoW,
@@ -78,12 +78,7 @@ async def get_me_uow(
     session: AsyncSession = Depends(get_app_user_session),
     actor: Actor = Depends(get_current_actor)
 ) -> MeUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {"user_id": str(actor.id)},
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyMeUoW(session)
 
 
@@ -91,12 +86,7 @@ async def get_me_system_uow(
     session: AsyncSession = Depends(get_app_system_session),
     actor: Actor = Depends(get_current_actor)
 ) -> MeSystemUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {"user_id": str(actor.id)},
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyMeSystemUoW(session)
 
 
@@ -110,12 +100,7 @@ async def get_session_uow(
     actor: Actor = Depends(get_current_actor),
     session: AsyncSession = Depends(get_app_system_session)
 ) -> SessionUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {"user_id": str(actor.id)},
-    )
+    await bind_current_user(session, actor.id)
 
     return SqlAlchemySessionUoW(session)
 
@@ -124,14 +109,7 @@ async def get_credit_uow(
         session: AsyncSession = Depends(get_app_user_session),
         actor: Actor = Depends(get_current_actor)
 ) -> CreditUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {
-            "user_id": str(actor.id)
-        }
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyCreditUoW(session)
 
 
@@ -139,14 +117,7 @@ async def get_payment_uow(
         session: AsyncSession = Depends(get_app_user_session),
         actor: Actor = Depends(get_current_actor)
 ) -> PaymentUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {
-            "user_id": str(actor.id)
-        }
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyPaymenUoW(session)
 
 
@@ -160,14 +131,7 @@ async def get_coach_uow(
     session: AsyncSession = Depends(get_app_system_session),
     actor: Actor = Depends(get_current_actor)
 ) -> CoachUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {
-            "user_id": str(actor.id)
-        }
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyCoachUoW(session)
 
 
@@ -175,12 +139,7 @@ async def get_admin_user_uow(
         session: AsyncSession = Depends(get_app_user_session),
         actor: Actor = Depends(get_current_actor)
 ) -> AdminUserUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {"user_id": str(actor.id)},
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyAdminUserUoW(session)
 
 
@@ -188,12 +147,7 @@ async def get_admin_system_user_uow(
         session: AsyncSession = Depends(get_app_system_session),
         actor: Actor = Depends(get_current_actor)
 ) -> AdminUserSystemUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {"user_id": str(actor.id)},
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyAdminUserSystemUoW(session)
 
 
@@ -201,12 +155,7 @@ async def get_admin_session_uow(
     session: AsyncSession = Depends(get_app_user_session),
     actor: Actor = Depends(get_current_actor)
 ) -> AdminSessionUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {"user_id": str(actor.id)},
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyAdminSessionUoW(session)
 
 
@@ -214,12 +163,7 @@ async def get_admin_session_system_uow(
     session: AsyncSession = Depends(get_app_system_session),
     actor: Actor = Depends(get_current_actor)
 ) -> AdminSessionSystemUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {"user_id": str(actor.id)},
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyAdminSessionSystemUoW(session)
 
 
@@ -227,12 +171,7 @@ async def get_admin_payment_uow(
     session: AsyncSession = Depends(get_app_user_session),
     actor: Actor = Depends(get_current_actor)
 ) -> AdminPaymentUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {"user_id": str(actor.id)},
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyAdminPaymentUoW(session)
 
 
@@ -240,10 +179,5 @@ async def get_admin_credit_uow(
     session: AsyncSession = Depends(get_app_user_session),
     actor: Actor = Depends(get_current_actor)
 ) -> AdminCreditUoWPort:
-    await session.execute(
-        text(
-            "SELECT set_config('app.current_user_id', :user_id, true)"
-        ),
-        {"user_id": str(actor.id)},
-    )
+    await bind_current_user(session, actor.id)
     return SqlAlchemyAdminCreditUoW(session)
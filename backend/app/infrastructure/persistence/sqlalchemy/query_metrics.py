@@ -0,0 +1,98 @@
+import re
+from functools import lru_cache
+from hashlib import blake2b
+from time import perf_counter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.infrastructure.metrics.prometheus import METRICS
+from app.infrastructure.metrics.request_metrics import count_round_trip
+
+DB_QUERY_DURATION = METRICS.histogram(
+    "db_query_duration_seconds",
+    "Statement execution time by engine and statement fingerprint.",
+    ("engine", "fingerprint"),
+    (
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+        1.0, 2.5
+    )
+)
+
+DB_STATEMENT_INFO = METRICS.gauge(
+    "db_statement_info",
+    "Normalized SQL of each statement fingerprint.",
+    ("fingerprint", "statement")
+)
+
+# Labels only; the fingerprint covers the whole statement.
+STATEMENT_LABEL_LENGTH = 200
+
+_QUERY_START = "metrics_query_start"
+
+_COMMENTS = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_LITERALS = re.compile(
+    r"'(?:[^']|'')*'"
+    r"|\$\d+"
+    r"|%\(\w+\)s"
+    r"|\b\d+(?:\.\d+)?\b"
+)
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(statement: str) -> str:
+    """SQL with comments, literals and bind parameters removed, so
+    executions differing only by their values share a fingerprint."""
+    statement = _COMMENTS.sub(" ", statement)
+    statement = _LITERALS.sub("?", statement)
+    statement = _LISTS.sub("(?)", statement)
+
+    return _SPACES.sub(" ", statement).strip()
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """Stable 16 hex digit id of a statement, recorded once with its
+    normalized SQL in ``db_statement_info``.
+
+    Repository statements are shared objects with a fixed SQL string,
+    so the cache turns normalization into a lookup.
+    """
+    normalized = normalize(statement)
+    digest = blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+    DB_STATEMENT_INFO.set(
+        (digest, normalized[:STATEMENT_LABEL_LENGTH]),
+        1
+    )
+
+    return digest
+
+
+def install_query_metrics(engine: AsyncEngine, name: str) -> None:
+    """Time every statement an engine executes and count it as a round
+    trip of the current HTTP request.
+
+    Only cursor executions are seen: the BEGIN carrying the RLS actor
+    and the COMMIT are not counted.
+
+    Args:
+        engine (AsyncEngine): Engine to instrument.
+        name (str): ``engine`` label, the database role.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, context, executemany):
+        conn.info[_QUERY_START] = perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        start = conn.info.pop(_QUERY_START, None)
+
+        if start is None:
+            return
+
+        DB_QUERY_DURATION.observe(
+            (name, fingerprint(statement)),
+            perf_counter() - start
+        )
+        count_round_trip()
@@ -0,0 +1,61 @@
+import logging
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.infrastructure.persistence.sqlalchemy.periodic_worker import (
+    PeriodicBatchWorker
+)
+from app.infrastructure.persistence.sqlalchemy.uow.auth.auth_uow import (
+    SqlAlchemyAuthUoW
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshTokenCompactor(PeriodicBatchWorker[int]):
+    """Delete dead refresh tokens in a background task.
+
+    Every rotation revokes a token and inserts a new one, so without
+    compaction ``app.refresh_tokens`` grows with the login history. Every
+    ``interval_seconds`` a pass deletes tokens revoked or expired more than
+    ``grace_seconds`` ago, ``batch_size`` rows per transaction so locks
+    and WAL stay bounded, until a short batch shows the backlog is drained
+    or ``max_batches`` is reached.
+    """
+    name = "refresh token compaction"
+    counters = ("deleted",)
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval_seconds: float = 300,
+        grace_seconds: int = 86_400,
+        batch_size: int = 1000,
+        max_batches: int = 100
+    ) -> None:
+        super().__init__(
+            session_factory,
+            interval_seconds,
+            batch_size,
+            max_batches
+        )
+        self._grace_seconds = grace_seconds
+
+    async def _run_batch(self, session: AsyncSession) -> int:
+        return await SqlAlchemyAuthUoW(
+            session
+        ).auth_update_repo.purge_refresh_tokens(
+            grace_seconds=self._grace_seconds,
+            limit=self._batch_size
+        )
+
+    async def _settle(self, batch: int, counts: dict[str, int]) -> int:
+        counts["deleted"] += batch
+
+        return batch
+
+    def _report(self, last_pass: dict[str, float]) -> None:
+        if last_pass["deleted"]:
+            logger.info(
+                "deleted %d dead refresh tokens in %.1f ms",
+                last_pass["deleted"],
+                last_pass["duration_ms"]
+            )
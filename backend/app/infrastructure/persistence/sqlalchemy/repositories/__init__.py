@@ -51,6 +51,9 @@ from .coach_stripe_account import (
     SqlAlchemyCoachStripeAccountReadRepo,
     SqlAlchemyCoachStripeAccountUpdateRepo
 )
+from .stripe_event_inbox import (
+    SqlAlchemyStripeEventInboxRepo
+)
 
 
 __all__ = [
@@ -86,5 +89,6 @@ __all__ = [
     "SqlAlchemyAdminSessionUpdateRepo",
     "SqlAlchemyAdminSessionAttendanceReadRepo",
     "SqlAlchemyAdminPaymentReadRepo",
-    "SqlAlchemyAdminCreditLedgerReadRepo"
+    "SqlAlchemyAdminCreditLedgerReadRepo",
+    "SqlAlchemyStripeEventInboxRepo"
 ]
@@ -1,14 +1,141 @@
 from datetime import datetime
+from typing import AsyncIterator
 from uuid import UUID
 
-from sqlalchemy.sql.expression import text
-from app.domain.credit.credit_entity import CreditEntity
+from app.domain.credit.credit_entity import (
+    CreditBalanceDriftEntity,
+    CreditEntity
+)
 from app.feature.admin.credit.repositories import (
     AdminCreditLedgerReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.repositories.keyset import (
+    keyset_params,
+    keyset_statement
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    RowMapper
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+from app.shared.utils.cursor import Cursor
 from sqlalchemy.ext.asyncio.session import AsyncSession
 
 
+_GET_CREDIT_BY_USER_ID = keyset_statement(
+    "admin_credit_read.get_credit_by_user_id",
+    """
+        SELECT
+            id,
+            user_id,
+            payment_id,
+            amount_cents,
+            currency,
+            balance_after_cents,
+            cause,
+            created_at
+        FROM app.credit_ledger
+        WHERE
+            user_id = :user_id
+            AND (
+                CAST(:from_ts as timestamptz) IS NULL
+                OR created_at >= CAST(:from_ts AS timestamptz)
+            )
+            AND (
+                CAST(:to_ts as timestamptz) IS NULL
+                OR created_at <= CAST(:to_ts AS timestamptz)
+            )
+        AND {keyset}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+        OFFSET :offset
+    """
+)
+
+_GET_ALL_CREDITS = keyset_statement(
+    "admin_credit_read.get_all_credits",
+    """
+        SELECT
+            id,
+            user_id,
+            payment_id,
+            amount_cents,
+            currency,
+            balance_after_cents,
+            cause,
+            created_at
+        FROM app.credit_ledger
+        WHERE (
+                CAST(:from_ts as timestamptz) IS NULL
+                OR created_at >= CAST(:from_ts AS timestamptz)
+            )
+            AND (
+                CAST(:to_ts as timestamptz) IS NULL
+                OR created_at <= CAST(:to_ts AS timestamptz)
+            )
+        AND {keyset}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+        OFFSET :offset
+    """
+)
+
+_STREAM_CREDITS = statement(
+    "admin_credit_read.stream_credits",
+    """
+        SELECT
+            id,
+            user_id,
+            payment_id,
+            amount_cents,
+            currency,
+            balance_after_cents,
+            cause,
+            created_at
+        FROM app.credit_ledger
+        WHERE (
+                CAST(:from_ts as timestamptz) IS NULL
+                OR created_at >= CAST(:from_ts AS timestamptz)
+            )
+            AND (
+                CAST(:to_ts as timestamptz) IS NULL
+                OR created_at <= CAST(:to_ts AS timestamptz)
+            )
+        ORDER BY created_at, id
+    """
+)
+
+# Rows fetched per round trip by the server-side export cursor.
+_STREAM_BATCH_ROWS = 1000
+
+_GET_BALANCE_DRIFT = statement(
+    "admin_credit_read.get_balance_drift",
+    """
+        SELECT
+            COALESCE(b.user_id, l.user_id) AS user_id,
+            COALESCE(b.currency, l.currency) AS currency,
+            COALESCE(b.balance_cents, 0) AS balance_cents,
+            COALESCE(l.ledger_cents, 0) AS ledger_cents
+        FROM app.credit_balances b
+        FULL JOIN (
+            SELECT
+                user_id,
+                currency,
+                SUM(amount_cents)::int AS ledger_cents
+            FROM app.credit_ledger
+            GROUP BY user_id, currency
+        ) l
+            ON l.user_id = b.user_id
+            AND l.currency = b.currency
+        WHERE COALESCE(b.balance_cents, 0) <> COALESCE(l.ledger_cents, 0)
+        ORDER BY user_id, currency
+    """
+)
+
+_CREDIT = RowMapper(CreditEntity)
+
+_BALANCE_DRIFT = RowMapper(CreditBalanceDriftEntity)
+
+
 class SqlAlchemyAdminCreditLedgerReadRepo(
     AdminCreditLedgerReadRepoPort
 ):
@@ -21,62 +148,23 @@ class SqlAlchemyAdminCreditLedgerReadRepo(
         offset: int,
         _from: datetime | None,
         to: datetime | None,
-        user_id: UUID
+        user_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[CreditEntity], bool]:
         res = await self._session.execute(
-            text(
-                """
-                SELECT
-                    id,
-                    user_id,
-                    payment_id,
-                    amount_cents,
-                    currency,
-                    balance_after_cents,
-                    cause,
-                    created_at
-                FROM app.credit_ledger
-                WHERE
-                    user_id = :user_id
-                    AND (
-                        CAST(:from_ts as timestamptz) IS NULL
-                        OR created_at >= CAST(:from_ts AS timestamptz)
-                    )
-                    AND (
-                        CAST(:to_ts as timestamptz) IS NULL
-                        OR created_at <= CAST(:to_ts AS timestamptz)
-                    )
-                ORDER BY created_at DESC
-                LIMIT :limit
-                OFFSET :offset
-                """
-            ),
+            _GET_CREDIT_BY_USER_ID.select(cursor),
             {
                 "user_id": user_id,
                 "from_ts": _from,
                 "to_ts": to,
-                "offset": offset,
+                **keyset_params(cursor, offset),
                 "limit": limit + 1
             }
         )
 
-        rows = res.mappings().all()
+        credits = _CREDIT.all(res)
 
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-
-        return [
-            CreditEntity(
-                id=row["id"],
-                user_id=row['user_id'],
-                payment_id=row['payment_id'],
-                amount_cents=row["amount_cents"],
-                currency=row["currency"],
-                balance_after_cents=row["balance_after_cents"],
-                cause=row["cause"],
-                created_at=row["created_at"]
-            ) for row in rows
-        ], has_more
+        return credits[:limit], len(credits) > limit
 
     async def get_all_credits(
         self,
@@ -84,55 +172,37 @@ class SqlAlchemyAdminCreditLedgerReadRepo(
         offset: int,
         _from: datetime | None,
         to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[CreditEntity], bool]:
         res = await self._session.execute(
-            text(
-                """
-                SELECT
-                    id,
-                    user_id,
-                    payment_id,
-                    amount_cents,
-                    currency,
-                    balance_after_cents,
-                    cause,
-                    created_at
-                FROM app.credit_ledger
-                WHERE (
-                        CAST(:from_ts as timestamptz) IS NULL
-                        OR created_at >= CAST(:from_ts AS timestamptz)
-                    )
-                    AND (
-                        CAST(:to_ts as timestamptz) IS NULL
-                        OR created_at <= CAST(:to_ts AS timestamptz)
-                    )
-                ORDER BY created_at DESC
-                LIMIT :limit
-                OFFSET :offset
-                """
-            ),
+            _GET_ALL_CREDITS.select(cursor),
             {
                 "from_ts": _from,
                 "to_ts": to,
-                "offset": offset,
+                **keyset_params(cursor, offset),
                 "limit": limit + 1
             }
         )
 
-        rows = res.mappings().all()
-
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-
-        return [
-            CreditEntity(
-                id=row["id"],
-                user_id=row['user_id'],
-                payment_id=row['payment_id'],
-                amount_cents=row["amount_cents"],
-                currency=row["currency"],
-                balance_after_cents=row["balance_after_cents"],
-                cause=row["cause"],
-                created_at=row["created_at"]
-            ) for row in rows
-        ], has_more
+        credits = _CREDIT.all(res)
+
+        return credits[:limit], len(credits) > limit
+
+    async def stream_credits(
+        self,
+        _from: datetime | None,
+        to: datetime | None
+    ) -> AsyncIterator[CreditEntity]:
+        res = await self._session.stream(
+            _STREAM_CREDITS,
+            {"from_ts": _from, "to_ts": to},
+            execution_options={"yield_per": _STREAM_BATCH_ROWS}
+        )
+
+        async for credit in _CREDIT.stream(res):
+            yield credit
+
+    async def get_balance_drift(self) -> list[CreditBalanceDriftEntity]:
+        res = await self._session.execute(_GET_BALANCE_DRIFT)
+
+        return _BALANCE_DRIFT.all(res)
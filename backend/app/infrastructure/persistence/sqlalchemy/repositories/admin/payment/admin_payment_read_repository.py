@@ -1,12 +1,186 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import AsyncIterator
 from uuid import UUID
 
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from app.domain.payment.payment_entity import PaymentEntity
+from app.domain.payment.payment_entity import (
+    PaymentEntity,
+    RevenueEntity
+)
 from app.feature.admin.payment.repositories import (
     AdminPaymentReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.repositories.keyset import (
+    keyset_params,
+    keyset_statement
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    RowMapper
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+from app.shared.utils.cursor import Cursor
+
+
+_GET_ALL_PAYMENTS = keyset_statement(
+    "admin_payment_read.get_all_payments",
+    """
+        SELECT
+            id,
+            session_id,
+            user_id,
+            provider,
+            provider_payment_id,
+            gross_amount_cents,
+            provider_fee_cents,
+            net_amount_cents,
+            currency,
+            created_at
+        FROM app.payments
+        WHERE (
+            CAST(:from_ts AS TIMESTAMPTZ) IS NULL
+            OR created_at >= CAST(:from_ts AS TIMESTAMPTZ)
+            )
+        AND (
+            CAST(:to_ts AS TIMESTAMPTZ) IS NULL
+            OR CAST(:to_ts AS TIMESTAMPTZ) <= created_at
+        )
+        AND {keyset}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+        OFFSET :offset
+    """
+)
+
+_GET_USER_PAYMENTS = keyset_statement(
+    "admin_payment_read.get_user_payments",
+    """
+        SELECT
+            id,
+            session_id,
+            user_id,
+            provider,
+            provider_payment_id,
+            gross_amount_cents,
+            provider_fee_cents,
+            net_amount_cents,
+            currency,
+            created_at
+        FROM app.payments
+        WHERE user_id = :user_id
+        AND (
+            CAST(:from_ts AS TIMESTAMPTZ) IS NULL
+            OR created_at >= CAST(:from_ts AS TIMESTAMPTZ)
+            )
+        AND (
+            CAST(:to_ts AS TIMESTAMPTZ) IS NULL
+            OR CAST(:to_ts AS TIMESTAMPTZ) <= created_at
+        )
+        AND {keyset}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+        OFFSET :offset
+    """
+)
+
+_GET_COACH_PAYMENTS = keyset_statement(
+    "admin_payment_read.get_coach_payments",
+    """
+        SELECT
+            id,
+            session_id,
+            user_id,
+            provider,
+            provider_payment_id,
+            gross_amount_cents,
+            provider_fee_cents,
+            net_amount_cents,
+            currency,
+            created_at
+        FROM app.payments
+        WHERE user_id = :coach_id
+        AND (
+            CAST(:from_ts AS TIMESTAMPTZ) IS NULL
+            OR created_at >= CAST(:from_ts AS TIMESTAMPTZ)
+            )
+        AND (
+            CAST(:to_ts AS TIMESTAMPTZ) IS NULL
+            OR CAST(:to_ts AS TIMESTAMPTZ) <= created_at
+        )
+        AND {keyset}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+        OFFSET :offset
+    """
+)
+
+_STREAM_PAYMENTS = statement(
+    "admin_payment_read.stream_payments",
+    """
+        SELECT
+            id,
+            session_id,
+            user_id,
+            provider,
+            provider_payment_id,
+            gross_amount_cents,
+            provider_fee_cents,
+            net_amount_cents,
+            currency,
+            created_at
+        FROM app.payments
+        WHERE (
+            CAST(:from_ts AS TIMESTAMPTZ) IS NULL
+            OR created_at >= CAST(:from_ts AS TIMESTAMPTZ)
+        )
+        AND (
+            CAST(:to_ts AS TIMESTAMPTZ) IS NULL
+            OR created_at <= CAST(:to_ts AS TIMESTAMPTZ)
+        )
+        ORDER BY created_at, id
+    """
+)
+
+# Rows fetched per round trip by the server-side export cursor.
+_STREAM_BATCH_ROWS = 1000
+
+# Reads the rollup maintained by trg_payment_apply_revenue, never
+# app.payments; dropped dimensions come back as NULL.
+_GET_REVENUE = statement(
+    "admin_payment_read.get_revenue",
+    """
+        SELECT
+            CASE WHEN CAST(:by_coach AS boolean) THEN coach_id END
+                AS coach_id,
+            CASE WHEN CAST(:by_month AS boolean) THEN month END
+                AS month,
+            currency,
+            SUM(payment_count)::bigint AS payment_count,
+            SUM(gross_amount_cents)::bigint AS gross_amount_cents,
+            SUM(provider_fee_cents)::bigint AS provider_fee_cents,
+            SUM(net_amount_cents)::bigint AS net_amount_cents
+        FROM app.payment_revenue_monthly
+        WHERE (
+            CAST(:from_month AS date) IS NULL
+            OR month >= date_trunc(
+                'month', CAST(:from_month AS date)
+            )::date
+        )
+        AND (
+            CAST(:to_month AS date) IS NULL
+            OR month <= CAST(:to_month AS date)
+        )
+        AND (
+            CAST(:coach_id AS uuid) IS NULL
+            OR coach_id = CAST(:coach_id AS uuid)
+        )
+        GROUP BY 1, 2, currency
+        ORDER BY 2, 1, currency
+    """
+)
+
+_PAYMENT = RowMapper(PaymentEntity)
+
+_REVENUE = RowMapper(RevenueEntity)
 
 
 class SqlAlchemyAdminPaymentReadRepo(AdminPaymentReadRepoPort):
@@ -19,58 +193,20 @@ class SqlAlchemyAdminPaymentReadRepo(AdminPaymentReadRepoPort):
         limit: int,
         _from: datetime | None,
         to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[PaymentEntity], bool]:
-        stmt = text("""
-            SELECT
-                id,
-                session_id,
-                user_id,
-                provider,
-                provider_payment_id,
-                gross_amount_cents,
-                provider_fee_cents,
-                net_amount_cents,
-                currency,
-                created_at
-            FROM app.payments
-            WHERE (
-                CAST(:from_ts AS TIMESTAMPTZ) IS NULL
-                OR created_at >= CAST(:from_ts AS TIMESTAMPTZ)
-                )
-            AND (
-                CAST(:to_ts AS TIMESTAMPTZ) IS NULL
-                OR CAST(:to_ts AS TIMESTAMPTZ) <= created_at
-            )
-            LIMIT :limit
-            OFFSET :offset
-        """)
+        stmt = _GET_ALL_PAYMENTS.select(cursor)
 
         rows = await self._session.execute(stmt, {
             "from_ts": _from,
             "to_ts": to,
             "limit": limit + 1,
-            "offset": offset
+            **keyset_params(cursor, offset)
         })
 
-        rows = rows.mappings().all()
-        has_more = len(rows) > limit
-
-        rows = rows[:limit]
-
-        return [
-            PaymentEntity(
-                id=row["id"],
-                session_id=row["session_id"],
-                user_id=row["user_id"],
-                provider=row["provider"],
-                provider_payment_id=row["provider_payment_id"],
-                gross_amount_cents=row["gross_amount_cents"],
-                provider_fee_cents=row["provider_fee_cents"],
-                net_amount_cents=row["net_amount_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"]
-            ) for row in rows
-        ], has_more
+        payments = _PAYMENT.all(rows)
+
+        return payments[:limit], len(payments) > limit
 
     async def get_user_payments(
         self,
@@ -78,61 +214,22 @@ class SqlAlchemyAdminPaymentReadRepo(AdminPaymentReadRepoPort):
         limit: int,
         _from: datetime | None,
         to: datetime | None,
-        user_id: UUID
+        user_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[PaymentEntity], bool]:
-        stmt = text("""
-            SELECT
-                id,
-                session_id,
-                user_id,
-                provider,
-                provider_payment_id,
-                gross_amount_cents,
-                provider_fee_cents,
-                net_amount_cents,
-                currency,
-                created_at
-            FROM app.payments
-            WHERE user_id = :user_id
-            AND (
-                CAST(:from_ts AS TIMESTAMPTZ) IS NULL
-                OR created_at >= CAST(:from_ts AS TIMESTAMPTZ)
-                )
-            AND (
-                CAST(:to_ts AS TIMESTAMPTZ) IS NULL
-                OR CAST(:to_ts AS TIMESTAMPTZ) <= created_at
-            )
-            LIMIT :limit
-            OFFSET :offset
-        """)
+        stmt = _GET_USER_PAYMENTS.select(cursor)
 
         rows = await self._session.execute(stmt, {
             "user_id": user_id,
             "from_ts": _from,
             "to_ts": to,
             "limit": limit + 1,
-            "offset": offset
+            **keyset_params(cursor, offset)
         })
 
-        rows = rows.mappings().all()
-        has_more = len(rows) > limit
-
-        rows = rows[:limit]
-
-        return [
-            PaymentEntity(
-                id=row["id"],
-                session_id=row["session_id"],
-                user_id=row["user_id"],
-                provider=row["provider"],
-                provider_payment_id=row["provider_payment_id"],
-                gross_amount_cents=row["gross_amount_cents"],
-                provider_fee_cents=row["provider_fee_cents"],
-                net_amount_cents=row["net_amount_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"]
-            ) for row in rows
-        ], has_more
+        payments = _PAYMENT.all(rows)
+
+        return payments[:limit], len(payments) > limit
 
     async def get_coach_payments(
         self,
@@ -140,58 +237,51 @@ class SqlAlchemyAdminPaymentReadRepo(AdminPaymentReadRepoPort):
         limit: int,
         _from: datetime | None,
         to: datetime | None,
-        coach_id: UUID
+        coach_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[PaymentEntity], bool]:
-        stmt = text("""
-            SELECT
-                id,
-                session_id,
-                user_id,
-                provider,
-                provider_payment_id,
-                gross_amount_cents,
-                provider_fee_cents,
-                net_amount_cents,
-                currency,
-                created_at
-            FROM app.payments
-            WHERE user_id = :coach_id
-            AND (
-                CAST(:from_ts AS TIMESTAMPTZ) IS NULL
-                OR created_at >= CAST(:from_ts AS TIMESTAMPTZ)
-                )
-            AND (
-                CAST(:to_ts AS TIMESTAMPTZ) IS NULL
-                OR CAST(:to_ts AS TIMESTAMPTZ) <= created_at
-            )
-            LIMIT :limit
-            OFFSET :offset
-        """)
+        stmt = _GET_COACH_PAYMENTS.select(cursor)
 
         rows = await self._session.execute(stmt, {
             "coach_id": coach_id,
             "from_ts": _from,
             "to_ts": to,
             "limit": limit + 1,
-            "offset": offset
+            **keyset_params(cursor, offset)
+        })
+
+        payments = _PAYMENT.all(rows)
+
+        return payments[:limit], len(payments) > limit
+
+    async def stream_payments(
+        self,
+        _from: datetime | None,
+        to: datetime | None
+    ) -> AsyncIterator[PaymentEntity]:
+        rows = await self._session.stream(
+            _STREAM_PAYMENTS,
+            {"from_ts": _from, "to_ts": to},
+            execution_options={"yield_per": _STREAM_BATCH_ROWS}
+        )
+
+        async for payment in _PAYMENT.stream(rows):
+            yield payment
+
+    async def get_revenue(
+        self,
+        from_month: date | None,
+        to_month: date | None,
+        coach_id: UUID | None,
+        by_coach: bool,
+        by_month: bool
+    ) -> list[RevenueEntity]:
+        rows = await self._session.execute(_GET_REVENUE, {
+            "from_month": from_month,
+            "to_month": to_month,
+            "coach_id": coach_id,
+            "by_coach": by_coach,
+            "by_month": by_month
         })
 
-        rows = rows.mappings().all()
-        has_more = len(rows) > limit
-
-        rows = rows[:limit]
-
-        return [
-            PaymentEntity(
-                id=row["id"],
-                session_id=row["session_id"],
-                user_id=row["user_id"],
-                provider=row["provider"],
-                provider_payment_id=row["provider_payment_id"],
-                gross_amount_cents=row["gross_amount_cents"],
-                provider_fee_cents=row["provider_fee_cents"],
-                net_amount_cents=row["net_amount_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"]
-            ) for row in rows
-        ], has_more
+        return _REVENUE.all(rows)
@@ -1,7 +1,6 @@
 from datetime import datetime
 from uuid import UUID
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql import text
 from app.domain.session.session_entity import (
     SessionCompleteEntity,
 )
@@ -10,21 +9,27 @@ from app.domain.user.user_profile_entity import UserProfileEntity
 from app.feature.admin.session.repositories import (
     AdminSessionReadRepoPort
 )
+from app.shared.utils.cursor import Cursor
+from app.infrastructure.persistence.sqlalchemy.repositories.keyset import (
+    keyset_params,
+    keyset_statement
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    Column,
+    RowMapper
+)
+from app.infrastructure.persistence.sqlalchemy.uow.predicate_memo import (
+    SESSION_CANCELLED,
+    SESSION_EXISTS,
+    SESSION_OWNER,
+    get_predicate_memo
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
 
 
-class SqlAlchemyAdminSessionReadRepo(AdminSessionReadRepoPort):
-    def __init__(self, session: AsyncSession) -> None:
-        self._session = session
-
-    async def sessions_by_coach_id(
-        self,
-        coach_id: UUID,
-        limit: int,
-        offset: int,
-        _from: datetime | None,
-        to: datetime | None
-    ) -> tuple[list[SessionCompleteEntity], bool]:
-        stmt = text("""
+_SESSIONS_BY_COACH_ID = keyset_statement(
+    "admin_session_read.sessions_by_coach_id",
+    """
            SELECT
             s.id,
             cp.user_id,
@@ -47,7 +52,7 @@ class SqlAlchemyAdminSessionReadRepo(AdminSessionReadRepoPort):
                         'last_name', up.last_name
                     )
                 ) FILTER (WHERE up.user_id IS NOT NULL),
-                '{}'
+                '{{}}'
             ) AS participants
         FROM app.sessions s
         JOIN app.v_coach_public cp
@@ -57,6 +62,7 @@ class SqlAlchemyAdminSessionReadRepo(AdminSessionReadRepoPort):
         LEFT JOIN app.user_profiles up
             ON up.user_id = sp.user_id
         WHERE cp.user_id = :coach_id
+            AND {keyset}
         GROUP BY
             s.id,
             cp.user_id,
@@ -71,55 +77,16 @@ class SqlAlchemyAdminSessionReadRepo(AdminSessionReadRepoPort):
             s.currency,
             s.created_at,
             s.updated_at
+        ORDER BY s.created_at DESC, s.id DESC
         OFFSET :offset
         LIMIT :limit
-        """)
-
-        res = await self._session.execute(stmt, {
-            "coach_id": coach_id,
-            "offset": offset,
-            "limit": limit
-        })
-
-        rows = res.mappings().all()
-        has_more = len(rows) > limit
-        rows[:limit]
-
-        return [
-            SessionCompleteEntity(
-                id=row["id"],
-                coach=UserProfileEntity(
-                    user_id=row["user_id"],
-                    first_name=row["first_name"],
-                    last_name=row["last_name"]
-                ),
-                title=row["title"],
-                starts_at=row["starts_at"],
-                ends_at=row["ends_at"],
-                status=SessionStatus(row["status"]),
-                cancelled_at=row["cancelled_at"],
-                price_cents=row["price_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                participants=[
-                    UserProfileEntity(
-                        user_id=participant["user_id"],
-                        first_name=participant["first_name"],
-                        last_name=participant["last_name"]
-                    ) for participant in row["participants"]
-                ]
-            ) for row in rows
-        ], has_more
+    """,
+    alias="s"
+)
 
-    async def get_all_sessions(
-        self,
-        limit: int,
-        offset: int,
-        _from: datetime | None,
-        to: datetime | None
-    ) -> tuple[list[SessionCompleteEntity], bool]:
-        stmt = text("""
+_GET_ALL_SESSIONS = keyset_statement(
+    "admin_session_read.get_all_sessions",
+    """
            SELECT
             s.id,
             cp.user_id,
@@ -142,7 +109,7 @@ class SqlAlchemyAdminSessionReadRepo(AdminSessionReadRepoPort):
                         'last_name', up.last_name
                     )
                 ) FILTER (WHERE up.user_id IS NOT NULL),
-                '{}'
+                '{{}}'
             ) AS participants
         FROM app.sessions s
         JOIN app.v_coach_public cp
@@ -151,6 +118,7 @@ class SqlAlchemyAdminSessionReadRepo(AdminSessionReadRepoPort):
             ON sp.session_id = s.id
         LEFT JOIN app.user_profiles up
             ON up.user_id = sp.user_id
+        WHERE {keyset}
         GROUP BY
             s.id,
             cp.user_id,
@@ -165,110 +133,122 @@ class SqlAlchemyAdminSessionReadRepo(AdminSessionReadRepoPort):
             s.currency,
             s.created_at,
             s.updated_at
+        ORDER BY s.created_at DESC, s.id DESC
         OFFSET :offset
         LIMIT :limit
-        """)
+    """,
+    alias="s"
+)
+
+_IS_SESSION_STARTED = statement(
+    "admin_session_read.is_session_started",
+    """
+        SELECT
+            app_fcn.is_session_started(
+                :session_id
+            )
+    """
+)
+
+_GET_SESSION_PARTICIPANTS = statement(
+    "admin_session_read.get_session_participants",
+    """
+        SELECT up.first_name, up.last_name
+        FROM app.session_participation sp
+        JOIN app.user_profiles up ON up.user_id = sp.user_id
+        WHERE sp.session_id = :session_id
+        ORDER BY up.last_name, up.first_name
+    """
+)
+
+_PARTICIPANT = RowMapper(UserProfileEntity)
+
+_SESSION_COMPLETE = RowMapper(
+    SessionCompleteEntity,
+    coach=RowMapper(UserProfileEntity),
+    status=Column("status", SessionStatus),
+    participants=Column("participants", _PARTICIPANT.objects)
+)
+
+
+class SqlAlchemyAdminSessionReadRepo(AdminSessionReadRepoPort):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def sessions_by_coach_id(
+        self,
+        coach_id: UUID,
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[SessionCompleteEntity], bool]:
+        stmt = _SESSIONS_BY_COACH_ID.select(cursor)
 
         res = await self._session.execute(stmt, {
-            "offset": offset,
-            "limit": limit
+            "coach_id": coach_id,
+            "limit": limit + 1,
+            **keyset_params(cursor, offset)
         })
 
-        rows = res.mappings().all()
-        has_more = len(rows) > limit
-        rows[:limit]
+        sessions = _SESSION_COMPLETE.all(res)
 
-        return [
-            SessionCompleteEntity(
-                id=row["id"],
-                coach=UserProfileEntity(
-                    user_id=row["user_id"],
-                    first_name=row["first_name"],
-                    last_name=row["last_name"]
-                ),
-                title=row["title"],
-                starts_at=row["starts_at"],
-                ends_at=row["ends_at"],
-                status=SessionStatus(row["status"]),
-                cancelled_at=row["cancelled_at"],
-                price_cents=row["price_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                participants=[
-                    UserProfileEntity(
-                        user_id=participant["user_id"],
-                        first_name=participant["first_name"],
-                        last_name=participant["last_name"]
-                    ) for participant in row["participants"]
-                ]
-            ) for row in rows
-        ], has_more
+        return sessions[:limit], len(sessions) > limit
+
+    async def get_all_sessions(
+        self,
+        limit: int,
+        offset: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[SessionCompleteEntity], bool]:
+        stmt = _GET_ALL_SESSIONS.select(cursor)
+
+        res = await self._session.execute(stmt, {
+            "limit": limit + 1,
+            **keyset_params(cursor, offset)
+        })
+
+        sessions = _SESSION_COMPLETE.all(res)
+
+        return sessions[:limit], len(sessions) > limit
 
     async def exist_session(
         self,
         session_id: UUID
     ) -> bool:
-        result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.session_exists(:session_id)
-            """),
-            {
-                "session_id": session_id
-            }
+        return await get_predicate_memo(self._session).evaluate(
+            SESSION_EXISTS,
+            session_id=session_id
         )
-        return result.scalar_one()
 
     async def is_session_owner(
         self,
         session_id: UUID,
         user_id: UUID
     ) -> bool:
-        result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_session_owner(
-                        :user_id,
-                        :session_id
-                    )
-            """),
-            {
-                "user_id": user_id,
-                "session_id": session_id
-            }
+        return await get_predicate_memo(self._session).evaluate(
+            SESSION_OWNER,
+            session_id=session_id,
+            user_id=user_id
         )
 
-        return result.scalar_one()
-
     async def is_session_cancelled(
         self,
         session_id: UUID
     ) -> bool:
-        result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_session_cancelled(:session_id)
-            """),
-            {
-                "session_id": session_id
-            }
+        return await get_predicate_memo(self._session).evaluate(
+            SESSION_CANCELLED,
+            session_id=session_id
         )
 
-        return result.scalar_one()
-
     async def is_session_started(
         self,
         session_id: UUID
     ) -> bool:
-        stmt = text("""
-            SELECT
-                app_fcn.is_session_started(
-                    :session_id
-                )
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_IS_SESSION_STARTED, {
             "session_id": session_id
         })
 
@@ -279,13 +259,7 @@ class SqlAlchemyAdminSessionReadRepo(AdminSessionReadRepoPort):
         session_id: UUID
     ) -> list[tuple[str, str]]:
         res = await self._session.execute(
-            text("""
-                SELECT up.first_name, up.last_name
-                FROM app.session_participation sp
-                JOIN app.user_profiles up ON up.user_id = sp.user_id
-                WHERE sp.session_id = :session_id
-                ORDER BY up.last_name, up.first_name
-            """),
+            _GET_SESSION_PARTICIPANTS,
             {"session_id": session_id}
         )
         rows = res.all()
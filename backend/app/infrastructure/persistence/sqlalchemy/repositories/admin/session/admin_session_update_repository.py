@@ -1,7 +1,6 @@
 from uuid import UUID
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql import text
 from app.domain.auth.auth_exceptions import PermissionDeniedError
 from app.domain.session.session_exception import (
     SessionNotFoundError,
@@ -11,6 +10,19 @@ from app.feature.admin.session.repositories import (
     AdminSessionUpdateRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.session_listing_cache import (
+    invalidate_session_listing
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_CANCEL_SESSION = statement(
+    "admin_session_update.cancel_session",
+    """
+        SELECT
+            app_fcn.cancel_session(:session_id)
+    """
+)
 
 
 class SqlAlchemyAdminSessionUpdateRepo(
@@ -23,13 +35,8 @@ class SqlAlchemyAdminSessionUpdateRepo(
             self,
             session_id: UUID
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.cancel_session(:session_id)
-        """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_CANCEL_SESSION, {
                 "session_id": session_id
             })
         except DBAPIError as exc:
@@ -45,3 +52,5 @@ class SqlAlchemyAdminSessionUpdateRepo(
                 raise SessionStartedError()
 
             raise
+
+        await invalidate_session_listing(self._session)
@@ -1,10 +1,34 @@
 from uuid import UUID
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql import text
 from app.domain.user.user_profile_entity import AdminUserAttendanceRead
 from app.feature.admin.session.repositories import (
     AdminSessionAttendanceReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    RowMapper
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_IS_SESSION_ATTENDED = statement(
+    "admin_session_attendance.is_session_attended",
+    """
+        SELECT
+            app_fcn.is_session_attended(
+                :session_id
+            )
+    """
+)
+
+_GET_SESSION_ATTENDANCE_LIST = statement(
+    "admin_session_attendance.get_session_attendance_list",
+    """
+        SELECT *
+        FROM app_fcn.fetch_attendance_list(:session_id)
+    """
+)
+
+_ATTENDANCE = RowMapper(AdminUserAttendanceRead)
 
 
 class SqlAlchemyAdminSessionAttendanceReadRepo(
@@ -18,12 +42,7 @@ class SqlAlchemyAdminSessionAttendanceReadRepo(
         session_id: UUID
     ) -> bool:
         result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_session_attended(
-                        :session_id
-                    )
-            """),
+            _IS_SESSION_ATTENDED,
             {
                 "session_id": session_id
             }
@@ -35,22 +54,8 @@ class SqlAlchemyAdminSessionAttendanceReadRepo(
         self,
         session_id: UUID
     ) -> list[AdminUserAttendanceRead]:
-        stmt = text("""
-            SELECT *
-            FROM app_fcn.fetch_attendance_list(:session_id)
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_GET_SESSION_ATTENDANCE_LIST, {
             "session_id": session_id
         })
 
-        rows = res.mappings().all()
-
-        return [
-            AdminUserAttendanceRead(
-                user_id=row["user_id"],
-                first_name=row["first_name"],
-                last_name=row["last_name"],
-                attended=row["attended"]
-            )for row in rows
-        ]
+        return _ATTENDANCE.all(res)
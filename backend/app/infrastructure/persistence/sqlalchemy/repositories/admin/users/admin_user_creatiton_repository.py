@@ -1,13 +1,22 @@
 from uuid import UUID
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql.expression import text
 from app.domain.auth.auth_exceptions import PermissionDeniedError
 from app.domain.auth.role import Role
 from app.feature.admin.users.repositories import (
     AdminUserCreationRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_GRANT_ROLE = statement(
+    "admin_user_creation.grant_role",
+    """
+        SELECT
+         app_fcn.admin_user_grant_role(:role_name, :user_id)
+    """
+)
 
 
 class SqlAlchemyAdminUserCreationRepo(AdminUserCreationRepoPort):
@@ -19,13 +28,8 @@ class SqlAlchemyAdminUserCreationRepo(AdminUserCreationRepoPort):
         user_id: UUID,
         role: Role,
     ) -> None:
-        stmt = text("""
-                SELECT
-                 app_fcn.admin_user_grant_role(:role_name, :user_id)
-                """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_GRANT_ROLE, {
                     "user_id": str(user_id),
                     "role_name": role
                 }
@@ -1,5 +1,4 @@
 from sqlalchemy.exc import DBAPIError
-from sqlalchemy.sql.expression import text
 from app.domain.auth.auth_exceptions import PermissionDeniedError
 from app.feature.admin.users.repositories import (
     AdminUserDeletionRepoPort
@@ -9,6 +8,16 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.role import Role
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_REVOKE_ROLE = statement(
+    "admin_user_deletion.revoke_role",
+    """
+        SELECT
+            app_fcn.admin_user_revoke_role(:role_name, :user_id)
+    """
+)
 
 
 class SqlAlchemyAdminUserDeletionRepo(AdminUserDeletionRepoPort):
@@ -20,12 +29,8 @@ class SqlAlchemyAdminUserDeletionRepo(AdminUserDeletionRepoPort):
         user_id: UUID,
         role: Role
     ) -> None:
-        stmt = text("""
-                SELECT
-                    app_fcn.admin_user_revoke_role(:role_name, :user_id)
-            """)
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_REVOKE_ROLE, {
                     "user_id": str(user_id),
                     "role_name": role
                 }
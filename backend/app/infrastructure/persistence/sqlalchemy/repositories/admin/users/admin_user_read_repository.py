@@ -5,8 +5,83 @@ from app.domain.user.user_entity import AdminUserRead
 from app.feature.admin.users.repositories import (
     AdminUserReadRepoPort
 )
-from sqlalchemy import text
+from app.infrastructure.persistence.sqlalchemy.repositories.keyset import (
+    keyset_params,
+    keyset_statement
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    Column,
+    RowMapper
+)
+from app.shared.utils.cursor import Cursor
 from sqlalchemy.ext.asyncio.session import AsyncSession
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_GET_ALL_USERS = keyset_statement(
+    "admin_user_read.get_all_users",
+    """
+        SELECT
+            u.id,
+            u.email,
+            u.disabled_at,
+            u.disabled_reason,
+            u.created_at,
+            COALESCE(
+                array_agg(DISTINCT r.role_name ORDER by r.role_name),
+                '{{}}'
+            ) AS roles
+        FROM app.users u
+        LEFT JOIN app.user_roles ur on  ur.user_id = u.id
+        LEFT JOIN app.roles r on ur.role_id = r.id
+        WHERE {keyset}
+        GROUP BY
+            u.id,
+            u.email,
+            u.disabled_at,
+            u.disabled_reason,
+            u.created_at
+        ORDER BY u.created_at DESC, u.id DESC
+        OFFSET :offset
+        LIMIT :limit_plus_one
+    """,
+    alias="u"
+)
+
+_GET_USER_BY_ID = statement(
+    "admin_user_read.get_user_by_id",
+    """
+        SELECT
+            u.id,
+            u.email,
+            u.disabled_at,
+            u.disabled_reason,
+            u.created_at,
+            COALESCE(
+                array_agg(DISTINCT r.role_name ORDER by r.role_name),
+                '{}'
+            ) AS roles
+        FROM app.users u
+        LEFT JOIN app.user_roles ur
+            ON ur.user_id = u.id
+        LEFT JOIN app.roles r
+            ON ur.role_id = r.id
+        WHERE u.id = :user_id
+        GROUP BY
+            u.id,
+            u.email,
+            u.disabled_at,
+            u.disabled_reason,
+            u.created_at
+    """
+)
+
+
+def _roles(roles: list[str]) -> set[Role]:
+    return {Role(role) for role in roles}
+
+
+_ADMIN_USER = RowMapper(AdminUserRead, roles=Column("roles", _roles))
 
 
 class SqlalchemyAdminUserReadRepo(AdminUserReadRepoPort):
@@ -16,96 +91,31 @@ class SqlalchemyAdminUserReadRepo(AdminUserReadRepoPort):
     async def get_all_users(
         self,
         offset: int,
-        limit: int
+        limit: int,
+        cursor: Cursor | None = None
     ) -> tuple[list[AdminUserRead], bool]:
 
         res = await self._session.execute(
-            text("""
-                SELECT
-                    u.id,
-                    u.email,
-                    u.disabled_at,
-                    u.disabled_reason,
-                    u.created_at,
-                    COALESCE(
-                        array_agg(DISTINCT r.role_name ORDER by r.role_name),
-                        '{}'
-                    ) AS roles
-                FROM app.users u
-                LEFT JOIN app.user_roles ur on  ur.user_id = u.id
-                LEFT JOIN app.roles r on ur.role_id = r.id
-                GROUP BY
-                    u.id,
-                    u.email,
-                    u.disabled_at,
-                    u.disabled_reason,
-                    u.created_at
-                ORDER BY u.created_at DESC
-                OFFSET :offset
-                LIMIT :limit_plus_one
-            """),
+            _GET_ALL_USERS.select(cursor),
             {
-                "offset": offset,
+                **keyset_params(cursor, offset),
                 "limit_plus_one": limit + 1
             }
         )
 
-        rows = res.mappings().all()
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-
-        return [
-            AdminUserRead(
-                id=row["id"],
-                email=row["email"],
-                roles={Role(role) for role in row["roles"]},
-                disabled_at=row["disabled_at"],
-                disabled_reason=row["disabled_reason"],
-                created_at=row["created_at"],
-            ) for row in rows
-        ], has_more
+        users = _ADMIN_USER.all(res)
+
+        return users[:limit], len(users) > limit
 
     async def get_user_by_id(
         self,
         user_id: UUID
     ) -> AdminUserRead:
         res = await self._session.execute(
-            text("""
-                SELECT
-                    u.id,
-                    u.email,
-                    u.disabled_at,
-                    u.disabled_reason,
-                    u.created_at,
-                    COALESCE(
-                        array_agg(DISTINCT r.role_name ORDER by r.role_name),
-                        '{}'
-                    ) AS roles
-                FROM app.users u
-                LEFT JOIN app.user_roles ur
-                    ON ur.user_id = u.id
-                LEFT JOIN app.roles r
-                    ON ur.role_id = r.id
-                WHERE u.id = :user_id
-                GROUP BY
-                    u.id,
-                    u.email,
-                    u.disabled_at,
-                    u.disabled_reason,
-                    u.created_at
-            """),
+            _GET_USER_BY_ID,
             {
                 "user_id": str(user_id)
             }
         )
 
-        row = res.mappings().one()
-
-        return AdminUserRead(
-            id=row["id"],
-            email=row["email"],
-            disabled_at=row["disabled_at"],
-            disabled_reason=row["disabled_reason"],
-            created_at=row["created_at"],
-            roles={Role(role) for role in row["roles"]},
-        )
+        return _ADMIN_USER.one(res)
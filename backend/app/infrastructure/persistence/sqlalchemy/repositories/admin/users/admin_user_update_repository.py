@@ -1,5 +1,4 @@
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.auth_exceptions import PermissionDeniedError
@@ -7,6 +6,27 @@ from app.feature.admin.users.repositories import (
     AdminUserUpdateRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+from app.infrastructure.persistence.sqlalchemy.user_status_cache import (
+    invalidate_user_status
+)
+
+
+_DISABLE_USER = statement(
+    "admin_user_update.disable_user",
+    """
+        SELECT
+            app_fcn.admin_user_disable_user(:user_id)
+    """
+)
+
+_REENABLE_USER = statement(
+    "admin_user_update.reenable_user",
+    """
+        SELECT
+            app_fcn.admin_user_enable_user(:user_id)
+    """
+)
 
 
 class SqlAlchemyAdminUserUpdateRepo(AdminUserUpdateRepoPort):
@@ -17,13 +37,11 @@ class SqlAlchemyAdminUserUpdateRepo(AdminUserUpdateRepoPort):
         self,
         user_id: UUID
     ) -> None:
-        stmt = text("""
-                SELECT
-                    app_fcn.admin_user_disable_user(:user_id)
-            """)
-
         try:
-            await self._session.execute(stmt, {"user_id": str(user_id)})
+            await self._session.execute(
+                _DISABLE_USER,
+                {"user_id": str(user_id)}
+            )
         except DBAPIError as exc:
             code = get_sqlstate(exc)
 
@@ -32,16 +50,17 @@ class SqlAlchemyAdminUserUpdateRepo(AdminUserUpdateRepoPort):
 
             raise
 
+        invalidate_user_status(self._session, user_id)
+
     async def reenable_user(
         self,
         user_id: UUID
     ) -> None:
-        stmt = text("""
-                SELECT
-                    app_fcn.admin_user_enable_user(:user_id)
-            """)
         try:
-            await self._session.execute(stmt, {"user_id": str(user_id)})
+            await self._session.execute(
+                _REENABLE_USER,
+                {"user_id": str(user_id)}
+            )
         except DBAPIError as exc:
             code = get_sqlstate(exc)
 
@@ -49,3 +68,5 @@ class SqlAlchemyAdminUserUpdateRepo(AdminUserUpdateRepoPort):
                 raise PermissionDeniedError() from exc
 
             raise
+
+        invalidate_user_status(self._session, user_id)
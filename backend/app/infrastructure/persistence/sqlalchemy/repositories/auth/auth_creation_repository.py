@@ -1,5 +1,4 @@
 from uuid import uuid4
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.user.user_entity import NewUserEntity
@@ -9,6 +8,23 @@ from app.feature.auth.repositories.auth_creation_respository_port import (
     AuthCreationRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_REGISTER = statement(
+    "auth_creation.register",
+    """
+        SELECT
+            app_fcn.register_user(
+                :id,
+                :email,
+                :password_hash,
+                :first_name,
+                :last_name,
+                :role_name
+            )
+    """
+)
 
 
 class SqlAlchemyAuthCreationRepo(AuthCreationRepoPort):
@@ -22,20 +38,8 @@ class SqlAlchemyAuthCreationRepo(AuthCreationRepoPort):
     ) -> None:
 
         id = uuid4()
-        stmt = text("""
-                SELECT
-                    app_fcn.register_user(
-                        :id,
-                        :email,
-                        :password_hash,
-                        :first_name,
-                        :last_name,
-                        :role_name
-                    )
-            """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_REGISTER, {
                     "id": id,
                     "email": user.email,
                     "password_hash": user.password_hash,
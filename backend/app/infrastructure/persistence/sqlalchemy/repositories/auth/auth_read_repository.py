@@ -1,5 +1,4 @@
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.refresh_token_entity import RefreshTokenEntity
 from app.domain.auth.role import Role
@@ -7,6 +6,99 @@ from app.domain.user.user_entity import UserEntity
 from app.feature.auth.repositories.auth_read_repository_port import (
     AuthReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.uow.predicate_memo import (
+    USER_DISABLED,
+    get_predicate_memo
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    Column,
+    RowMapper
+)
+from app.infrastructure.persistence.sqlalchemy.rls import (
+    CURRENT_USER_SETTING
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+from app.infrastructure.persistence.sqlalchemy.user_status_cache import (
+    COACH,
+    DISABLED,
+    get_user_status_cache
+)
+
+
+_EXIST_EMAIL = statement(
+    "auth_read.exist_email",
+    """
+        SELECT app_fcn.auth_exists_by_email(:email)
+    """
+)
+
+_GET_USER_BY_EMAIL = statement(
+    "auth_read.get_user_by_email",
+    """
+        SELECT *
+        FROM app_fcn.auth_user_by_email(:email)
+    """
+)
+
+_GET_REFRESH_TOKEN = statement(
+    "auth_read.get_refresh_token",
+    """
+        SELECT
+            user_id,
+            token_hash,
+            created_at,
+            expires_at,
+            revoked_at
+        FROM app_fcn.get_active_refresh_token(:token_hash)
+    """
+)
+
+_GET_USER_BY_ID = statement(
+    "auth_read.get_user_by_id",
+    """
+        SELECT *
+            FROM app_fcn.auth_user_by_id(:user_id)
+    """
+)
+
+_EXISTS_COACH = statement(
+    "auth_read.exists_coach",
+    """
+        SELECT EXISTS(
+            SELECT 1
+            FROM app.user_roles ur
+            JOIN app.roles r ON r.id = ur.role_id
+            WHERE ur.user_id = :coach_id
+            AND r.role_name = 'coach'
+        )
+    """
+)
+
+_EXISTS_USER = statement(
+    "auth_read.exists_user",
+    """
+        SELECT EXISTS(
+            SELECT 1
+            FROM app.users
+            WHERE id = :user_id
+        )
+    """
+)
+
+
+def _roles(roles: list[str]) -> set[Role]:
+    return {Role(role) for role in roles}
+
+
+_USER = RowMapper(UserEntity, roles=Column("roles", _roles))
+
+_USER_BY_EMAIL = RowMapper(
+    UserEntity,
+    id="user_id",
+    roles=Column("roles", _roles)
+)
+
+_REFRESH_TOKEN = RowMapper(RefreshTokenEntity)
 
 
 class SqlAlchemyAuthReadRepo(AuthReadRepoPort):
@@ -15,9 +107,7 @@ class SqlAlchemyAuthReadRepo(AuthReadRepoPort):
 
     async def exist_email(self, email: str) -> bool:
         res = await self._session.execute(
-            text("""
-                SELECT app_fcn.auth_exists_by_email(:email)
-            """),
+            _EXIST_EMAIL,
             {
                 "email": email
             }
@@ -27,54 +117,26 @@ class SqlAlchemyAuthReadRepo(AuthReadRepoPort):
 
     async def get_user_by_email(self, email: str) -> UserEntity | None:
         res = await self._session.execute(
-            text("""
-                SELECT *
-                FROM app_fcn.auth_user_by_email(:email)
-            """),
+            _GET_USER_BY_EMAIL,
             {
                 "email": email
             }
         )
-        row = res.mappings().one_or_none()
-
-        if row is None:
-            return None
 
-        roles = {Role(r) for r in row["roles"]}
-
-        return UserEntity(
-            id=row["user_id"],
-            email=row["email"],
-            password_hash=row["password_hash"],
-            roles=roles,
-            disabled_at=row["disabled_at"],
-            disabled_reason=row["disabled_reason"]
-        )
+        return _USER_BY_EMAIL.one_or_none(res)
 
     async def get_refresh_token(
         self,
         token_hash: str
     ) -> RefreshTokenEntity | None:
         res = await self._session.execute(
-            text("""
-                SELECT
-                    user_id,
-                    token_hash,
-                    created_at,
-                    expires_at,
-                    revoked_at
-                FROM app_fcn.get_active_refresh_token(:token_hash)
-            """),
+            _GET_REFRESH_TOKEN,
             {
                 "token_hash": token_hash
             }
         )
 
-        row = res.mappings().one_or_none()
-        if not row:
-            return None
-
-        return RefreshTokenEntity(**row)
+        return _REFRESH_TOKEN.one_or_none(res)
 
     async def get_user_by_id(
             self,
@@ -82,80 +144,75 @@ class SqlAlchemyAuthReadRepo(AuthReadRepoPort):
     ) -> UserEntity:
 
         res = await self._session.execute(
-            text("""
-            SELECT *
-                FROM app_fcn.auth_user_by_id(:user_id)
-            """),
+            _GET_USER_BY_ID,
             {
                 "user_id": user_id
             }
         )
-        row = res.mappings().one()
 
-        roles = {Role(r) for r in row["roles"]}
-
-        return UserEntity(
-            id=row["id"],
-            email=row["email"],
-            password_hash=row["password_hash"],
-            roles=roles,
-            disabled_at=row["disabled_at"],
-            disabled_reason=row["disabled_reason"]
-        )
+        return _USER.one(res)
 
     async def is_user_disabled(
         self,
         user_id: UUID
     ) -> bool:
-        res = await self._session.execute(
-            text("""
-                SELECT EXISTS(
-                    SELECT 1
-                    FROM app.users
-                    WHERE id = :user_id
-                        AND disabled_at IS NOT NULL
-                )
-            """),
-            {
-                "user_id": str(user_id)
-            }
+        cache = get_user_status_cache(self._session)
+        generation = 0
+
+        if cache is not None:
+            cached = cache.get(DISABLED, user_id)
+
+            if cached is not None:
+                return cached
+
+            generation = cache.generation
+
+        disabled = await get_predicate_memo(self._session).evaluate(
+            USER_DISABLED,
+            user_id=user_id
         )
 
-        return res.scalar_one()
+        # RLS hides other users' rows, so "not disabled" is only a fact
+        # when the bound actor asked about itself.
+        if cache is not None and (
+            disabled
+            or str(self._session.info.get(CURRENT_USER_SETTING))
+            == str(user_id)
+        ):
+            cache.put(DISABLED, user_id, disabled, generation)
+
+        return disabled
 
     async def exists_coach(
         self,
         coach_id: UUID
     ) -> bool:
-        stmt = text("""
-            SELECT EXISTS(
-                SELECT 1
-                FROM app.user_roles ur
-                JOIN app.roles r ON r.id = ur.role_id
-                WHERE ur.user_id = :coach_id
-                AND r.role_name = 'coach'
-            )
-        """)
-
-        res = await self._session.execute(stmt, {
+        cache = get_user_status_cache(self._session)
+
+        generation = 0
+
+        if cache is not None:
+            if cache.get(COACH, coach_id):
+                return True
+
+            generation = cache.generation
+
+        res = await self._session.execute(_EXISTS_COACH, {
             "coach_id": coach_id
         })
+        is_coach = res.scalar_one()
 
-        return res.scalar_one()
+        # Only a found role is cached, an invisible row reads as absent.
+        if cache is not None and is_coach:
+            cache.put(COACH, coach_id, True, generation)
+
+        return is_coach
 
     async def exists_user(
         self,
         user_id
     ) -> bool:
-        stmt = text("""
-            SELECT EXISTS(
-                SELECT 1
-                FROM app.users
-                WHERE id = :user_id
-            )
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_EXISTS_USER, {
             "user_id": user_id
         })
 
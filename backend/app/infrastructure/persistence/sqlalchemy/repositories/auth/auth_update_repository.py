@@ -1,10 +1,64 @@
 from uuid import UUID
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql import text
 from app.domain.auth.refresh_token_entity import NewRefreshTokenEntity
 from app.feature.auth.repositories.auth_update_repository_port import (
     AuthUpdateRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_REVOKE_REFRESH_TOKEN = statement(
+    "auth_update.revoke_refresh_token",
+    """
+        SELECT
+            app_fcn.revoke_refresh_token(:token_hash)
+    """
+)
+
+_CREATE_REFRESH_TOKEN = statement(
+    "auth_update.create_refresh_token",
+    """
+        SELECT
+            app_fcn.create_refresh_token(
+                :user_id,
+                :token_hash,
+                :expires_at
+            )
+    """
+)
+
+_ROTATE_REFRESH_TOKEN = statement(
+    "auth_update.rotate_refresh_token",
+    """
+        SELECT
+            app_fcn.rotate_refresh_token(
+                :new_id,
+                :old_hash,
+                :user_id
+            )
+    """
+)
+
+_REVOKE_ALL_REFRESH_TOKEN = statement(
+    "auth_update.revoke_all_refresh_token",
+    """
+        SELECT
+            app_fcn.revoke_all_refresh_token(
+                :user_id
+            )
+    """
+)
+
+_PURGE_REFRESH_TOKENS = statement(
+    "auth_update.purge_refresh_tokens",
+    """
+        SELECT
+            app_fcn.purge_refresh_tokens(
+                :grace_seconds,
+                :limit
+            )
+    """
+)
 
 
 class SqlAlchemyAuthUpdateRepo(AuthUpdateRepoPort):
@@ -16,12 +70,7 @@ class SqlAlchemyAuthUpdateRepo(AuthUpdateRepoPort):
 
     async def revoke_refresh_token(self, token_hash: str) -> None:
         await self._session.execute(
-            text(
-                """
-                    SELECT
-                        app_fcn.revoke_refresh_token(:token_hash)
-                """
-            ),
+            _REVOKE_REFRESH_TOKEN,
             {"token_hash": token_hash}
             )
 
@@ -33,16 +82,7 @@ class SqlAlchemyAuthUpdateRepo(AuthUpdateRepoPort):
 
         # insert new refresh token
         res = await self._session.execute(
-            text(
-                """
-                    SELECT
-                        app_fcn.create_refresh_token(
-                            :user_id,
-                            :token_hash,
-                            :expires_at
-                        )
-                """
-            ),
+            _CREATE_REFRESH_TOKEN,
             {
                 "user_id": new_token.user_id,
                 "token_hash": new_token.token_hash,
@@ -54,16 +94,7 @@ class SqlAlchemyAuthUpdateRepo(AuthUpdateRepoPort):
         # revoke and link old → new
         if current_token_hash:
             await self._session.execute(
-                text(
-                    """
-                        SELECT
-                            app_fcn.rotate_refresh_token(
-                                :new_id,
-                                :old_hash,
-                                :user_id
-                            )
-                    """
-                ),
+                _ROTATE_REFRESH_TOKEN,
                 {
                     "new_id": new_id,
                     "old_hash": current_token_hash,
@@ -73,13 +104,23 @@ class SqlAlchemyAuthUpdateRepo(AuthUpdateRepoPort):
 
     async def revoke_all_refresh_token(self, user_id: UUID) -> None:
         await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.revoke_all_refresh_token(
-                        :user_id
-                    )
-            """),
+            _REVOKE_ALL_REFRESH_TOKEN,
             {
                 "user_id": user_id
             }
         )
+
+    async def purge_refresh_tokens(
+        self,
+        grace_seconds: int,
+        limit: int
+    ) -> int:
+        result = await self._session.execute(
+            _PURGE_REFRESH_TOKENS,
+            {
+                "grace_seconds": grace_seconds,
+                "limit": limit
+            }
+        )
+
+        return result.scalar_one()
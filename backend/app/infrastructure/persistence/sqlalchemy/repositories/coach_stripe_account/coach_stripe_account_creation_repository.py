@@ -1,8 +1,19 @@
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.feature.coach.repositories import (
     CoachStripeAccountCreationRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_CREATE_ACCOUNT = statement(
+    "coach_stripe_account_creation.create_account",
+    """
+        SELECT
+            app_fcn.create_coach_stripe_account(
+                :stripe_acount_id
+            )
+    """
+)
 
 
 class SqlAlchemyCoachStripeAccountCreationRepo(
@@ -15,13 +26,6 @@ class SqlAlchemyCoachStripeAccountCreationRepo(
         self,
         stripe_acount_id: str
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.create_coach_stripe_account(
-                    :stripe_acount_id
-                )
-        """)
-
-        await self._session.execute(stmt, {
+        await self._session.execute(_CREATE_ACCOUNT, {
             "stripe_acount_id": stripe_acount_id
         })
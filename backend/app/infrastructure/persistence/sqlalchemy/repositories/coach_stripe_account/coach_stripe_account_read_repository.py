@@ -1,9 +1,40 @@
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.feature.coach.repositories import (
     CoachStripeAccountReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_ACCOUNT_EXISTS = statement(
+    "coach_stripe_account_read.account_exists",
+    """
+        SELECT
+            app_fcn.stripe_account_exists(
+                :coach_id
+            )
+    """
+)
+
+_GET_ACCOUNT_ID = statement(
+    "coach_stripe_account_read.get_account_id",
+    """
+        SELECT
+            app_fcn.get_stripe_account_id(
+                :coach_id
+            )
+    """
+)
+
+_IS_COACH_ACCOUNT_VALID = statement(
+    "coach_stripe_account_read.is_coach_account_valid",
+    """
+        SELECT
+            app_fcn.stripe_account_is_valid(
+                :coach_id
+            )
+    """
+)
 
 
 class SqlAlchemyCoachStripeAccountReadRepo(
@@ -16,14 +47,7 @@ class SqlAlchemyCoachStripeAccountReadRepo(
         self,
         coach_id: UUID
     ) -> bool:
-        stmt = text("""
-            SELECT
-                app_fcn.stripe_account_exists(
-                    :coach_id
-                )
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_ACCOUNT_EXISTS, {
             "coach_id": coach_id
         })
 
@@ -33,14 +57,7 @@ class SqlAlchemyCoachStripeAccountReadRepo(
         self,
         coach_id: UUID
     ) -> str | None:
-        stmt = text("""
-            SELECT
-                app_fcn.get_stripe_account_id(
-                    :coach_id
-                )
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_GET_ACCOUNT_ID, {
             "coach_id": coach_id
         })
 
@@ -50,14 +67,7 @@ class SqlAlchemyCoachStripeAccountReadRepo(
         self,
         coach_id: UUID
     ) -> bool:
-        stmt = text("""
-            SELECT
-                app_fcn.stripe_account_is_valid(
-                    :coach_id
-                )
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_IS_COACH_ACCOUNT_VALID, {
             "coach_id": coach_id
         })
 
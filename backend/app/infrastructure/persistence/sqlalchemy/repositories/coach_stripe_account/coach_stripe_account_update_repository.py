@@ -1,8 +1,22 @@
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql.expression import text
 from app.feature.stripe.repositories import (
     CoachStripeAccountUpdateRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_UPDATE_BY_ACCOUNT_ID = statement(
+    "coach_stripe_account_update.update_by_account_id",
+    """
+        SELECT
+            app_fcn.update_by_stripe_account_id(
+                :account_id,
+                :details_submitted,
+                :charges_enabled,
+                :payouts_enabled
+            )
+    """
+)
 
 
 class SqlAlchemyCoachStripeAccountUpdateRepo(
@@ -18,17 +32,7 @@ class SqlAlchemyCoachStripeAccountUpdateRepo(
         charges_enabled: bool,
         payouts_enabled: bool
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.update_by_stripe_account_id(
-                    :account_id,
-                    :details_submitted,
-                    :charges_enabled,
-                    :payouts_enabled
-                )
-        """)
-
-        await self._session.execute(stmt, {
+        await self._session.execute(_UPDATE_BY_ACCOUNT_ID, {
             "account_id": account_id,
             "details_submitted": details_submitted,
             "charges_enabled": charges_enabled,
@@ -1,6 +1,5 @@
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.expression import text
 from app.domain.auth.auth_exceptions import PermissionDeniedError
 from app.domain.credit.credit_entity import NewCreditEntity
 from app.domain.credit.credit_exception import (
@@ -13,6 +12,34 @@ from app.feature.session.repositories import (
 from app.shared.database.sqlstate_extractor import (
     get_sqlstate
 )
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_CREATE_CREDIT_ENTRY = statement(
+    "credit_ledger_creation.create_credit_entry",
+    """
+        SELECT
+         app_fcn.create_credit_entry(
+            :user_id,
+            :amount_cents,
+            :currency,
+            :cause
+         )
+    """
+)
+
+_APPEND_CREDIT_LEDGER = statement(
+    "credit_ledger_creation.append_credit_ledger",
+    """
+        SELECT
+            app_fcn.append_credit_ledger(
+                :user_id,
+                :amount_cents,
+                :currency,
+                :cause
+            )
+    """
+)
 
 
 class SqlAlchemyCreditLedgerCreationRepo(
@@ -25,18 +52,8 @@ class SqlAlchemyCreditLedgerCreationRepo(
         self,
         entry: NewCreditEntity
     ) -> None:
-        stmt = text("""
-            SELECT
-             app_fcn.create_credit_entry(
-                :user_id,
-                :amount_cents,
-                :currency,
-                :cause
-             )
-        """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_CREATE_CREDIT_ENTRY, {
                 "user_id": entry.user_id,
                 "amount_cents": entry.amount_cents,
                 "currency": entry.currency,
@@ -60,17 +77,7 @@ class SqlAlchemyCreditLedgerCreationRepo(
         self,
         credit: NewCreditEntity
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.append_credit_ledger(
-                    :user_id,
-                    :amount_cents,
-                    :currency,
-                    :cause
-                )
-        """)
-
-        await self._session.execute(stmt, {
+        await self._session.execute(_APPEND_CREDIT_LEDGER, {
             "user_id": credit.user_id,
             "amount_cents": credit.amount_cents,
             "currency": credit.currency,
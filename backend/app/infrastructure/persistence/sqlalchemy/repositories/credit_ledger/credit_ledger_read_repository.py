@@ -1,6 +1,5 @@
 from datetime import datetime
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.auth_exceptions import PermissionDeniedError
@@ -8,7 +7,60 @@ from app.domain.credit.credit_entity import CreditEntity
 from app.feature.credit.respositories import (
     CreditLedgerReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.repositories.keyset import (
+    keyset_params,
+    keyset_statement
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    RowMapper
+)
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.shared.utils.cursor import Cursor
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_GET_CREDIT_BY_USER_ID = keyset_statement(
+    "credit_ledger_read.get_credit_by_user_id",
+    """
+        SELECT
+            id,
+            user_id,
+            payment_id,
+            amount_cents,
+            currency,
+            balance_after_cents,
+            cause,
+            created_at
+        FROM app.credit_ledger
+        WHERE
+            user_id = :user_id
+            AND (
+                CAST(:from_ts as timestamptz) IS NULL
+                OR created_at >= CAST(:from_ts AS timestamptz)
+            )
+            AND (
+                CAST(:to_ts as timestamptz) IS NULL
+                OR created_at <= CAST(:to_ts AS timestamptz)
+            )
+        AND {keyset}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+        OFFSET :offset
+    """
+)
+
+_FETCH_CREDIT_BY_USER_ID = statement(
+    "credit_ledger_read.fetch_credit_by_user_id",
+    """
+        SELECT
+            app_fcn.fetch_credit(
+                :user_id,
+                :currency
+            )
+    """
+)
+
+_CREDIT = RowMapper(CreditEntity)
 
 
 class SqlAlchemyCreditLedgerReadRepo(CreditLedgerReadRepoPort):
@@ -21,78 +73,31 @@ class SqlAlchemyCreditLedgerReadRepo(CreditLedgerReadRepoPort):
         offset: int,
         _from: datetime | None,
         to: datetime | None,
-        user_id: UUID
+        user_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[CreditEntity], bool]:
         res = await self._session.execute(
-            text(
-                """
-                SELECT
-                    id,
-                    user_id,
-                    payment_id,
-                    amount_cents,
-                    currency,
-                    balance_after_cents,
-                    cause,
-                    created_at
-                FROM app.credit_ledger
-                WHERE
-                    user_id = :user_id
-                    AND (
-                        CAST(:from_ts as timestamptz) IS NULL
-                        OR created_at >= CAST(:from_ts AS timestamptz)
-                    )
-                    AND (
-                        CAST(:to_ts as timestamptz) IS NULL
-                        OR created_at <= CAST(:to_ts AS timestamptz)
-                    )
-                ORDER BY created_at DESC
-                LIMIT :limit
-                OFFSET :offset
-                """
-            ),
+            _GET_CREDIT_BY_USER_ID.select(cursor),
             {
                 "user_id": user_id,
                 "from_ts": _from,
                 "to_ts": to,
-                "offset": offset,
+                **keyset_params(cursor, offset),
                 "limit": limit + 1
             }
         )
 
-        rows = res.mappings().all()
+        credits = _CREDIT.all(res)
 
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-
-        return [
-            CreditEntity(
-                id=row["id"],
-                user_id=row['user_id'],
-                payment_id=row['payment_id'],
-                amount_cents=row["amount_cents"],
-                currency=row["currency"],
-                balance_after_cents=row["balance_after_cents"],
-                cause=row["cause"],
-                created_at=row["created_at"]
-            ) for row in rows
-        ], has_more
+        return credits[:limit], len(credits) > limit
 
     async def fetch_credit_by_user_id(
         self,
         user_id: UUID,
         currency: str
     ) -> int:
-        stmt = text("""
-            SELECT
-                app_fcn.fetch_credit(
-                    :user_id,
-                    :currency
-                )
-        """)
-
         try:
-            result = await self._session.execute(stmt, {
+            result = await self._session.execute(_FETCH_CREDIT_BY_USER_ID, {
                 "user_id": user_id,
                 "currency": currency
             })
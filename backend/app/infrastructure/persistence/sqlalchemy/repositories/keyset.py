@@ -0,0 +1,80 @@
+from typing import Any
+from sqlalchemy.sql.expression import TextClause
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+from app.shared.utils.cursor import Cursor
+
+
+def _after_cursor(alias: str | None) -> str:
+    prefix = f"{alias}." if alias else ""
+
+    return (
+        f"({prefix}created_at, {prefix}id) < ("
+        "CAST(:cursor_created_at AS timestamptz), "
+        "CAST(:cursor_id AS uuid))"
+    )
+
+
+def keyset_params(cursor: Cursor | None, offset: int) -> dict[str, Any]:
+    """Bind parameters for a ``keyset_statement`` and ``OFFSET``.
+
+    A cursor takes precedence over the offset, which is then reset to 0.
+
+    Args:
+        cursor (Cursor | None): Position returned by the previous page.
+        offset (int): Offset requested by legacy clients.
+
+    Returns:
+        dict[str, Any]: Parameters to merge into the statement binds.
+    """
+    if cursor is None:
+        return {"offset": offset}
+
+    return {
+        "offset": 0,
+        "cursor_created_at": cursor.created_at,
+        "cursor_id": cursor.id,
+    }
+
+
+class KeysetStatement:
+    """Registered statement pair for the first and the following pages."""
+
+    def __init__(self, first_page: TextClause, after_cursor: TextClause):
+        self.first_page = first_page
+        self.after_cursor = after_cursor
+
+    def select(self, cursor: Cursor | None) -> TextClause:
+        return self.first_page if cursor is None else self.after_cursor
+
+
+def keyset_statement(
+    name: str,
+    template: str,
+    alias: str | None = None
+) -> KeysetStatement:
+    """Declare a keyset paginated statement in the statement registry.
+
+    Lists are ordered by ``created_at DESC, id DESC``. After a cursor, the
+    ``{keyset}`` condition is a row comparison matching that order, so the
+    ``(created_at DESC, id DESC)`` indexes can seek directly to the cursor
+    instead of skipping ``OFFSET`` rows. The first page uses a constant
+    ``TRUE`` so the planner does not carry an unused OR branch. Both
+    variants are registered up front, so a listing never builds its SQL
+    at request time.
+
+    Args:
+        name (str): Unique name, ``<repository>.<method>``.
+        template (str): SQL with a ``{keyset}`` placeholder, formatted
+            with ``str.format`` (literal braces are doubled).
+        alias (str | None): Table alias owning ``created_at`` and ``id``.
+
+    Returns:
+        KeysetStatement: Statement to select with the request cursor.
+    """
+    return KeysetStatement(
+        first_page=statement(name, template.format(keyset="TRUE")),
+        after_cursor=statement(
+            f"{name}.after_cursor",
+            template.format(keyset=_after_cursor(alias))
+        )
+    )
@@ -1,5 +1,4 @@
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.feature.me.repositories.me_delete_repository_port import (
@@ -9,6 +8,19 @@ from app.shared.database.sqlstate_extractor import get_sqlstate
 from app.domain.auth.auth_exceptions import (
     PermissionDeniedError
 )
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+from app.infrastructure.persistence.sqlalchemy.user_status_cache import (
+    invalidate_user_status
+)
+
+
+_SOFT_DELETE_USER = statement(
+    "me_delete.soft_delete_user",
+    """
+        SELECT
+            app_fcn.me_self_delete(:user_id)
+    """
+)
 
 
 class SqlAlchemyMeDeleteRepo(MeDeleteRepoPort):
@@ -19,13 +31,11 @@ class SqlAlchemyMeDeleteRepo(MeDeleteRepoPort):
             self,
             user_id: UUID,
     ) -> None:
-        stmt = text("""
-                SELECT
-                    app_fcn.me_self_delete(:user_id)
-            """)
-
         try:
-            await self._session.execute(stmt, {"user_id": user_id})
+            await self._session.execute(
+                _SOFT_DELETE_USER,
+                {"user_id": user_id}
+            )
         except DBAPIError as exc:
             code = get_sqlstate(exc)
 
@@ -33,3 +43,5 @@ class SqlAlchemyMeDeleteRepo(MeDeleteRepoPort):
                 raise PermissionDeniedError() from exc
 
             raise
+
+        invalidate_user_status(self._session, user_id)
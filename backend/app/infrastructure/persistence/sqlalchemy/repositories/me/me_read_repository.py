@@ -1,12 +1,58 @@
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql import text
 from app.domain.auth.role import Role
 from app.domain.user.user_entity import UserEntity
 from app.domain.user.user_profile_entity import UserProfileEntity
 from app.feature.me.repositories.me_read_repository_port import (
     MeReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    Column,
+    RowMapper
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_GET = statement(
+    "me_read.get",
+    """
+        SELECT
+            u.id,
+            u.email,
+            u.password_hash,
+            u.disabled_at,
+            u.disabled_reason,
+            array_agg(r.role_name) as roles
+        FROM app.users u
+        JOIN app.user_roles ur ON ur.user_id = u.id
+        JOIN app.roles r ON r.id = ur.role_id
+        where u.id = :user_id
+        GROUP BY
+            u.id,
+            u.email,
+            u.password_hash,
+            u.disabled_at,
+            u.disabled_reason
+    """
+)
+
+_GET_PROFILE_BY_ID = statement(
+    "me_read.get_profile_by_id",
+    """
+        SELECT user_id, first_name, last_name
+        FROM app.user_profiles
+        WHERE user_id = :user_id
+    """
+)
+
+
+def _roles(roles: list[str]) -> set[Role]:
+    return {Role(role) for role in roles}
+
+
+_USER = RowMapper(UserEntity, roles=Column("roles", _roles))
+
+_USER_PROFILE = RowMapper(UserProfileEntity)
 
 
 class SqlAlchemyMeReadRepo(MeReadRepoPort):
@@ -14,59 +60,19 @@ class SqlAlchemyMeReadRepo(MeReadRepoPort):
         self._session = session
 
     async def get(self, user_id: UUID) -> UserEntity:
-        stmt = text("""
-            SELECT
-                u.id,
-                u.email,
-                u.password_hash,
-                u.disabled_at,
-                u.disabled_reason,
-                array_agg(r.role_name) as roles
-            FROM app.users u
-            JOIN app.user_roles ur ON ur.user_id = u.id
-            JOIN app.roles r ON r.id = ur.role_id
-            where u.id = :user_id
-            GROUP BY
-                u.id,
-                u.email,
-                u.password_hash,
-                u.disabled_at,
-                u.disabled_reason
-            """)
-
         res = await self._session.execute(
-            stmt,
+            _GET,
             {"user_id": str(user_id)}
         )
-        row = res.mappings().one()
 
-        roles = {Role(r) for r in row["roles"]}
-
-        return UserEntity(
-            id=row["id"],
-            email=row["email"],
-            password_hash=row["password_hash"],
-            roles=roles,
-            disabled_at=row["disabled_at"],
-            disabled_reason=row["disabled_reason"]
-        )
+        return _USER.one(res)
 
     async def get_profile_by_id(self, user_id: UUID) -> UserProfileEntity:
         res = await self._session.execute(
-            text("""
-            SELECT user_id, first_name, last_name
-            FROM app.user_profiles
-            WHERE user_id = :user_id
-            """),
+            _GET_PROFILE_BY_ID,
             {
                 "user_id": user_id
             }
         )
 
-        row = res.mappings().one()
-
-        return UserProfileEntity(
-            user_id=row["user_id"],
-            first_name=row["first_name"],
-            last_name=row["last_name"],
-        )
+        return _USER_PROFILE.one(res)
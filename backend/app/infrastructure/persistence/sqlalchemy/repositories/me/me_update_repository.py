@@ -1,5 +1,4 @@
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.auth_exceptions import (
@@ -11,6 +10,35 @@ from app.feature.me.repositories.me_update_repository_port import (
     MeUpdateRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_UPDATE_EMAIL_BY_USER_ID = statement(
+    "me_update.update_email_by_user_id",
+    """
+        SELECT
+            app_fcn.me_change_email(:user_id, :email)
+    """
+)
+
+_UPDATE_PASSWORD_BY_ID = statement(
+    "me_update.update_password_by_id",
+    """
+        SELECT
+            app_fcn.me_change_password(:user_id, :password_hash)
+    """
+)
+
+_UPDATE_PROFILE_BY_ID = statement(
+    "me_update.update_profile_by_id",
+    """
+        UPDATE app.user_profiles up
+        SET
+            first_name = :first_name,
+            last_name = :last_name
+        WHERE up.user_id = :user_id
+    """
+)
 
 
 class SqlAlchemyMeUpdateRepo(MeUpdateRepoPort):
@@ -18,14 +46,8 @@ class SqlAlchemyMeUpdateRepo(MeUpdateRepoPort):
         self._session = session
 
     async def update_email_by_user_id(self, email: str, user_id: UUID):
-        stmt = text(
-                """
-                SELECT
-                    app_fcn.me_change_email(:user_id, :email)
-                """
-            )
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_UPDATE_EMAIL_BY_USER_ID, {
                     "email": email,
                     "user_id": user_id
                 }
@@ -40,13 +62,8 @@ class SqlAlchemyMeUpdateRepo(MeUpdateRepoPort):
                 raise EmailAlreadyExistError()
 
     async def update_password_by_id(self, user_id: UUID, password_hash: str):
-        stmt = text("""
-                SELECT
-                    app_fcn.me_change_password(:user_id, :password_hash)
-            """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_UPDATE_PASSWORD_BY_ID, {
                     "password_hash": password_hash,
                     "user_id": user_id
                 }
@@ -68,13 +85,7 @@ class SqlAlchemyMeUpdateRepo(MeUpdateRepoPort):
     ):
 
         await self._session.execute(
-            text("""
-                UPDATE app.user_profiles up
-                SET
-                    first_name = :first_name,
-                    last_name = :last_name
-                WHERE up.user_id = :user_id
-            """),
+            _UPDATE_PROFILE_BY_ID,
             {
                 "first_name": first_name,
                 "last_name": last_name,
@@ -1,9 +1,27 @@
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.payment.payment_entity import NewPaymentEntity
 from app.feature.stripe.repositories import (
     PaymentCreationRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_CREATE_PAYMENT = statement(
+    "payment_creation.create_payment",
+    """
+        SELECT
+            app_fcn.create_payment(
+                :session_id,
+                :user_id,
+                :provider,
+                :provider_payment_id,
+                :gross_amount_cents,
+                :provider_fee_cents,
+                :net_amount_cents,
+                :currency
+            )
+    """
+)
 
 
 class SqlAlchemyPaymentCreationRepo(PaymentCreationRepoPort):
@@ -17,21 +35,7 @@ class SqlAlchemyPaymentCreationRepo(PaymentCreationRepoPort):
         self,
         new_payment: NewPaymentEntity
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.create_payment(
-                    :session_id,
-                    :user_id,
-                    :provider,
-                    :provider_payment_id,
-                    :gross_amount_cents,
-                    :provider_fee_cents,
-                    :net_amount_cents,
-                    :currency
-                )
-        """)
-
-        await self._session.execute(stmt, {
+        await self._session.execute(_CREATE_PAYMENT, {
             "session_id": new_payment.session_id,
             "user_id": new_payment.user_id,
             "provider": new_payment.provider,
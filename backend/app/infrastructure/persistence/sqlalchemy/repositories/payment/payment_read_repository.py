@@ -1,11 +1,75 @@
 from datetime import datetime
 from uuid import UUID
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql import text
 from app.domain.payment.payment_entity import PaymentEntity
 from app.feature.payment.repostories.payment_read_repository import (
     PaymentReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.repositories.keyset import (
+    keyset_params,
+    keyset_statement
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    RowMapper
+)
+from app.shared.utils.cursor import Cursor
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_GET_PAYMENT_BY_USER_ID = keyset_statement(
+    "payment_read.get_payment_by_user_id",
+    """
+        SELECT
+            id,
+            session_id,
+            user_id,
+            provider,
+            provider_payment_id,
+            gross_amount_cents,
+            provider_fee_cents,
+            net_amount_cents,
+            currency,
+            created_at
+        FROM app.payments
+        WHERE
+            user_id = :user_id
+            AND (
+                CAST(:from_ts AS timestamptz) IS NULL
+                OR created_at >= CAST(:from_ts AS timestamptz)
+            )
+            AND (
+                CAST(:to_ts AS timestamptz) IS NULL
+                OR created_at <= CAST(:to_ts AS timestamptz)
+            )
+        AND {keyset}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+        OFFSET :offset
+    """
+)
+
+_IS_ALREAD_PAID = statement(
+    "payment_read.is_alread_paid",
+    """
+        SELECT
+            app_fcn.is_already_paid(
+                :session_id,
+                :user_id
+            )
+    """
+)
+
+_GET_PAYMENT_FOR_SESSION = statement(
+    "payment_read.get_payment_for_session",
+    """
+        SELECT *
+        FROM app_fcn.get_payment_for_session(
+                :session_id
+            )
+    """
+)
+
+_PAYMENT = RowMapper(PaymentEntity)
 
 
 class SqlAlchemyPaymentReadRepo(PaymentReadRepoPort):
@@ -18,79 +82,30 @@ class SqlAlchemyPaymentReadRepo(PaymentReadRepoPort):
         limit: int,
         _from: datetime | None,
         to: datetime | None,
-        user_id: UUID
+        user_id: UUID,
+        cursor: Cursor | None = None
     ) -> tuple[list[PaymentEntity], bool]:
         res = await self._session.execute(
-            text("""
-                SELECT
-                    id,
-                    session_id,
-                    user_id,
-                    provider,
-                    provider_payment_id,
-                    gross_amount_cents,
-                    provider_fee_cents,
-                    net_amount_cents,
-                    currency,
-                    created_at
-                FROM app.payments
-                WHERE
-                    user_id = :user_id
-                    AND (
-                        CAST(:from_ts AS timestamptz) IS NULL
-                        OR created_at >= CAST(:from_ts AS timestamptz)
-                    )
-                    AND (
-                        CAST(:to_ts AS timestamptz) IS NULL
-                        OR created_at <= CAST(:to_ts AS timestamptz)
-                    )
-                ORDER BY created_at DESC
-                LIMIT :limit
-                OFFSET :offset
-            """),
+            _GET_PAYMENT_BY_USER_ID.select(cursor),
             {
                 "user_id": user_id,
                 "from_ts": _from,
                 "to_ts": to,
                 "limit": limit + 1,
-                "offset": offset
+                **keyset_params(cursor, offset)
             }
         )
 
-        rows = res.mappings().all()
+        payments = _PAYMENT.all(res)
 
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-
-        return [
-            PaymentEntity(
-                id=row["id"],
-                session_id=row["session_id"],
-                user_id=row["user_id"],
-                provider=row["provider"],
-                provider_payment_id=row["provider_payment_id"],
-                gross_amount_cents=row["gross_amount_cents"],
-                provider_fee_cents=row["provider_fee_cents"],
-                net_amount_cents=row["net_amount_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"]
-            ) for row in rows
-        ], has_more
+        return payments[:limit], len(payments) > limit
 
     async def is_alread_paid(
         self,
         session_id: UUID,
         user_id: UUID
     ) -> bool:
-        stmt = text("""
-            SELECT
-                app_fcn.is_already_paid(
-                    :session_id,
-                    :user_id
-                )
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_IS_ALREAD_PAID, {
             "session_id": session_id,
             "user_id": user_id
         })
@@ -101,14 +116,7 @@ class SqlAlchemyPaymentReadRepo(PaymentReadRepoPort):
         self,
         session_id: UUID
     ) -> tuple[int, str]:
-        stmt = text("""
-            SELECT *
-            FROM app_fcn.get_payment_for_session(
-                    :session_id
-                )
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_GET_PAYMENT_FOR_SESSION, {
             "session_id": session_id
         })
 
@@ -1,11 +1,41 @@
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.payment_intent.payment_intent_entity import PaymentIntentEntity
 from app.domain.payment_intent.payment_intent_providers import PaymentProvider
 from app.feature.stripe.repositories import (
     PaymentIntentReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    RowMapper
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_INTENT_EXISTS = statement(
+    "payment_intent_read.intent_exists",
+    """
+        SELECT
+            app_fcn.intent_exists(
+                :user_id,
+                :session_id,
+                :provider
+            )
+    """
+)
+
+_GET_BY_IDENTITY = statement(
+    "payment_intent_read.get_by_identity",
+    """
+        SELECT *
+        FROM app_fcn.get_by_identity(
+                :user_id,
+                :session_id,
+                :provider
+        )
+    """
+)
+
+_PAYMENT_INTENT = RowMapper(PaymentIntentEntity)
 
 
 class SqlAlchemyPaymentIntentReadRepo(
@@ -23,16 +53,7 @@ class SqlAlchemyPaymentIntentReadRepo(
         session_id: UUID,
         provider: PaymentProvider
     ) -> bool:
-        stmt = text("""
-            SELECT
-                app_fcn.intent_exists(
-                    :user_id,
-                    :session_id,
-                    :provider
-                )
-        """)
-
-        result = await self._session.execute(stmt, {
+        result = await self._session.execute(_INTENT_EXISTS, {
             "user_id": user_id,
             "session_id": session_id,
             "provider": provider
@@ -46,31 +67,10 @@ class SqlAlchemyPaymentIntentReadRepo(
         session_id: UUID,
         provider: PaymentProvider
     ) -> PaymentIntentEntity:
-        stmt = text("""
-            SELECT *
-            FROM app_fcn.get_by_identity(
-                    :user_id,
-                    :session_id,
-                    :provider
-            )
-        """)
-
-        result = await self._session.execute(stmt, {
+        result = await self._session.execute(_GET_BY_IDENTITY, {
             "user_id": user_id,
             "session_id": session_id,
             "provider": provider
         })
 
-        row = result.mappings().one()
-
-        return PaymentIntentEntity(
-            id=row["id"],
-            user_id=row["user_id"],
-            session_id=row["session_id"],
-            provider=row["provider"],
-            provider_intent_id=row["provider_intent_id"],
-            status=row["status"],
-            credit_applied_cents=row["credit_applied_cents"],
-            amount_cents=row["amount_cents"],
-            currency=row["currency"]
-        )
+        return _PAYMENT_INTENT.one(result)
@@ -1,4 +1,3 @@
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.auth_exceptions import PermissionDeniedError
@@ -13,6 +12,26 @@ from app.feature.session.repositories import (
     PaymentIntentCreationRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_CREATE_PAYMENT_INTENT = statement(
+    "payment_intent_creation.create_payment_intent",
+    """
+        SELECT
+            app_fcn.create_payment_intent(
+                :user_id,
+                :session_id,
+                :provider,
+                :provider_intent_id,
+                :provider_checkout_id,
+                :status,
+                :amount_cents,
+                :credit_applied,
+                :currency
+            )
+    """
+)
 
 
 class SqlAlchemyPaymentIntentCreationRepo(
@@ -25,26 +44,13 @@ class SqlAlchemyPaymentIntentCreationRepo(
         self,
         payment_intent: NewPaymentIntentEntity
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.create_payment_intent(
-                    :user_id,
-                    :session_id,
-                    :provider,
-                    :provider_intent_id,
-                    :status,
-                    :amount_cents,
-                    :credit_applied,
-                    :currency
-                )
-        """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_CREATE_PAYMENT_INTENT, {
                 "user_id": payment_intent.user_id,
                 "session_id": payment_intent.session_id,
                 "provider": payment_intent.provider,
                 "provider_intent_id": payment_intent.provider_intent_id,
+                "provider_checkout_id": payment_intent.provider_checkout_id,
                 "status": payment_intent.status,
                 "amount_cents": payment_intent.amount_cents,
                 "credit_applied": payment_intent.credit_applied_cents,
@@ -1,12 +1,51 @@
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.payment_intent.payment_intent_providers import PaymentProvider
+from app.domain.session_participation.session_participation_entity import (
+    ReleasedParticipationEntity
+)
 from app.feature.stripe.repositories import (
     PaymentIntentUpdateRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_MARK_PAYMENT_INTENT = statement(
+    "payment_intent_update.mark_payment_intent",
+    """
+        SELECT
+            app_fcn.mark_payment_intent(
+                :provider_payment_id,
+                :provider_status
+            )
+    """
+)
+
+_SET_PROVIDER_ID = statement(
+    "payment_intent_update.set_provider_id",
+    """
+        SELECT
+            app_fcn.set_provider_id(
+                :user_id,
+                :session_id,
+                :provider,
+                :provider_intent_id
+            )
+    """
+)
+
+_CANCEL_FOR_PARTICIPATIONS = statement(
+    "payment_intent_update.cancel_for_participations",
+    """
+        SELECT provider_checkout_id
+        FROM app_fcn.cancel_payment_intents(
+            CAST(:session_ids AS uuid[]),
+            CAST(:user_ids AS uuid[])
+        )
+    """
+)
 
 
 class SqlAlchemyPaymentIntentUpdateRepo(
@@ -23,15 +62,7 @@ class SqlAlchemyPaymentIntentUpdateRepo(
         provider_payment_id: str,
         provider_status: str,
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.mark_payment_intent(
-                    :provider_payment_id,
-                    :provider_status
-                )
-        """)
-
-        await self._session.execute(stmt, {
+        await self._session.execute(_MARK_PAYMENT_INTENT, {
             "provider_payment_id": provider_payment_id,
             "provider_status": provider_status
         })
@@ -43,18 +74,8 @@ class SqlAlchemyPaymentIntentUpdateRepo(
         provider: PaymentProvider,
         provider_intent_id: str
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.set_provider_id(
-                    :user_id,
-                    :session_id,
-                    :provider,
-                    :provider_intent_id
-                )
-        """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_SET_PROVIDER_ID, {
                 "user_id": user_id,
                 "session_id": session_id,
                 "provider": provider,
@@ -66,3 +87,14 @@ class SqlAlchemyPaymentIntentUpdateRepo(
 
             if code == 'AP404':
                 return
+
+    async def cancel_for_participations(
+        self,
+        participations: list[ReleasedParticipationEntity]
+    ) -> list[str | None]:
+        result = await self._session.execute(_CANCEL_FOR_PARTICIPATIONS, {
+            "session_ids": [p.session_id for p in participations],
+            "user_ids": [p.user_id for p in participations]
+        })
+
+        return list(result.scalars())
@@ -0,0 +1,192 @@
+from dataclasses import dataclass, fields
+from operator import itemgetter
+from typing import Any, Callable, Generic, Iterable, Mapping, TypeVar
+from sqlalchemy.engine import Result, Row
+from sqlalchemy.ext.asyncio import AsyncResult
+
+T = TypeVar("T")
+
+RowBuilder = Callable[[Row[Any]], T]
+
+# A column index, or a function of the row for converted columns and
+# nested entities.
+_Reader = int | Callable[[Row[Any]], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class Column:
+    """Result column feeding an entity field.
+
+    Attributes:
+        name: Column name in the result.
+        convert: Applied to the value, e.g. an enum or a JSON decoder.
+    """
+    name: str
+    convert: Callable[[Any], Any] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class OptionalRow:
+    """Nested entity that is ``None`` when its key column is NULL, e.g.
+    the side of an outer join that matched nothing.
+
+    Attributes:
+        mapper: Builds the entity from the same row.
+        key: Column that is NULL exactly when there is no entity.
+    """
+    mapper: "RowMapper[Any]"
+    key: str = "id"
+
+
+class RowMapper(Generic[T]):
+    """Builds entities from result rows by position.
+
+    Each entity field reads the column of the same name, unless it is
+    mapped to another column name, to a ``Column`` with a converter, or
+    to a nested ``RowMapper`` (or ``OptionalRow``) reading the same row.
+
+    The first time a result shape (its column names) is seen, the index
+    of every column is resolved and a constructor closing over them is
+    kept. Rows are then hydrated by position, with a single
+    ``itemgetter`` call when no field needs a converter, instead of a
+    ``RowMapping`` key lookup per field.
+    """
+
+    def __init__(
+        self,
+        entity: type[T],
+        **columns: "str | Column | OptionalRow | RowMapper[Any]"
+    ) -> None:
+        names = [field.name for field in fields(entity)]  # type: ignore
+        unknown = set(columns) - set(names)
+
+        if unknown:
+            raise ValueError(
+                f"{entity.__name__} has no field {sorted(unknown)}"
+            )
+
+        self._entity = entity
+        self._specs = {
+            name: _spec(columns.get(name, name)) for name in names
+        }
+        self._shapes: dict[tuple[str, ...], RowBuilder[T]] = {}
+
+    def all(self, result: Result[Any]) -> list[T]:
+        return list(map(self.builder(result.keys()), result))
+
+    def one(self, result: Result[Any]) -> T:
+        return self.builder(result.keys())(result.one())
+
+    def one_or_none(self, result: Result[Any]) -> T | None:
+        row = result.one_or_none()
+
+        return None if row is None else self.builder(result.keys())(row)
+
+    async def stream(self, result: AsyncResult[Any]):
+        build = self.builder(result.keys())
+
+        async for row in result:
+            yield build(row)
+
+    def objects(self, items: Iterable[Mapping[str, Any]]) -> list[T]:
+        """Build entities from JSON objects, e.g. a ``json_agg`` column.
+
+        Only column names are applied: converters are skipped and nested
+        mappers are not supported.
+        """
+        names = [spec.name for spec in self._specs.values()]  # type: ignore
+        entity = self._entity
+
+        return [entity(*[item[name] for name in names]) for item in items]
+
+    def builder(self, keys: Iterable[str]) -> RowBuilder[T]:
+        """Constructor for rows of a result shape.
+
+        Args:
+            keys (Iterable[str]): Result column names, in order.
+
+        Raises:
+            KeyError: If a mapped column is missing from the result.
+
+        Returns:
+            RowBuilder[T]: Function building one entity from one row.
+        """
+        keys = tuple(keys)
+        build = self._shapes.get(keys)
+
+        if build is None:
+            build = self._shapes[keys] = self._build(keys)
+
+        return build
+
+    def _build(self, keys: tuple[str, ...]) -> RowBuilder[T]:
+        entity = self._entity
+        readers = self._readers(keys)
+
+        if all(isinstance(reader, int) for reader in readers):
+            if len(readers) == 1:
+                index = readers[0]
+                return lambda row: entity(row[index])
+
+            values = itemgetter(*readers)
+            return lambda row: entity(*values(row))
+
+        getters = [
+            itemgetter(reader) if isinstance(reader, int) else reader
+            for reader in readers
+        ]
+
+        return lambda row: entity(*[get(row) for get in getters])
+
+    def _readers(self, keys: tuple[str, ...]) -> list[_Reader]:
+        readers: list[_Reader] = []
+
+        for name, spec in self._specs.items():
+            if isinstance(spec, RowMapper):
+                readers.append(spec.builder(keys))
+                continue
+
+            if isinstance(spec, OptionalRow):
+                readers.append(_optional(
+                    self._index(name, spec.key, keys),
+                    spec.mapper.builder(keys)
+                ))
+                continue
+
+            index = self._index(name, spec.name, keys)
+
+            if spec.convert is None:
+                readers.append(index)
+            else:
+                readers.append(_converted(index, spec.convert))
+
+        return readers
+
+    def _index(self, name: str, column: str, keys: tuple[str, ...]) -> int:
+        if column not in keys:
+            raise KeyError(
+                f"{self._entity.__name__}.{name}: "
+                f"no {column!r} column in {keys}"
+            )
+
+        return keys.index(column)
+
+
+def _spec(
+    column: "str | Column | OptionalRow | RowMapper[Any]"
+) -> "Column | OptionalRow | RowMapper":
+    return Column(column) if isinstance(column, str) else column
+
+
+def _converted(
+    index: int,
+    convert: Callable[[Any], Any]
+) -> Callable[[Row[Any]], Any]:
+    return lambda row: convert(row[index])
+
+
+def _optional(
+    index: int,
+    build: RowBuilder[Any]
+) -> Callable[[Row[Any]], Any]:
+    return lambda row: None if row[index] is None else build(row)
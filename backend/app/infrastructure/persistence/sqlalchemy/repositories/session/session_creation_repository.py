@@ -1,7 +1,7 @@
 from sqlalchemy.exc import DBAPIError
-from sqlalchemy.sql.expression import text
 from app.domain.auth.auth_exceptions import PermissionDeniedError
 from app.domain.session.session_entity import NewSessionEntity
+from app.domain.session.session_exception import SessionOverlappingError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.feature.session.repositories.session_creation_repository_port import (
     SessionCreationRepoPort
@@ -9,6 +9,28 @@ from app.feature.session.repositories.session_creation_repository_port import (
 from uuid import uuid4
 
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.session_listing_cache import (
+    invalidate_session_listing
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_CREATE_SESSION = statement(
+    "session_creation.create_session",
+    """
+        SELECT
+            app_fcn.session_create_session(
+                :id,
+                :coach_id,
+                :title,
+                :starts_at,
+                :ends_at,
+                :price_cents,
+                :currency,
+                :capacity
+            )
+    """
+)
 
 
 class SqlAlchemySessionCreationRepo(SessionCreationRepoPort):
@@ -19,27 +41,16 @@ class SqlAlchemySessionCreationRepo(SessionCreationRepoPort):
         self,
         session: NewSessionEntity
     ) -> None:
-        stmt = text("""
-                SELECT
-                    app_fcn.session_create_session(
-                        :id,
-                        :coach_id,
-                        :title,
-                        :starts_at,
-                        :ends_at,
-                        :price_cents,
-                        :currency
-                    )
-            """)
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_CREATE_SESSION, {
                     "id": uuid4(),
                     "coach_id": session.coach_id,
                     "title": session.title,
                     "starts_at": session.starts_at,
                     "ends_at": session.ends_at,
                     "price_cents": session.price_cents,
-                    "currency": session.currency
+                    "currency": session.currency,
+                    "capacity": session.capacity
                 }
             )
         except DBAPIError as exc:
@@ -48,4 +59,10 @@ class SqlAlchemySessionCreationRepo(SessionCreationRepoPort):
             if code == "AP401":
                 raise PermissionDeniedError() from exc
 
+            # exclusion_violation: excl_sessions_no_overlap
+            if code == "23P01":
+                raise SessionOverlappingError() from exc
+
             raise
+
+        await invalidate_session_listing(self._session)
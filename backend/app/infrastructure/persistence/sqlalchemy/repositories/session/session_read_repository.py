@@ -1,8 +1,11 @@
 from datetime import datetime
+from typing import Any
 from uuid import UUID
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql.expression import text
+from app.domain.auth.auth_exceptions import PermissionDeniedError
 from app.domain.session.session_entity import (
+    RegistrationPreflightEntity,
     SessionCompleteEntity,
     SessionEntity,
     SessionWithCoachEntity
@@ -12,6 +15,351 @@ from app.domain.user.user_profile_entity import UserProfileEntity
 from app.feature.session.repositories.session_read_repository_port import (
     SessionReadRepoPort
 )
+from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.shared.utils.cursor import Cursor
+from app.infrastructure.persistence.sqlalchemy.repositories.keyset import (
+    keyset_params,
+    keyset_statement
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    Column,
+    OptionalRow,
+    RowMapper
+)
+from app.infrastructure.persistence.sqlalchemy.uow.predicate_memo import (
+    SESSION_CANCELLED,
+    SESSION_EXISTS,
+    SESSION_OWNER,
+    get_predicate_memo
+)
+from app.infrastructure.persistence.sqlalchemy.session_listing_cache import (
+    get_session_listing_cache
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_GET_SESSION_BY_ID = statement(
+    "session_read.get_session_by_id",
+    """
+        SELECT
+            s.id,
+            cp.user_id as coach_id,
+            cp.first_name,
+            cp.last_name,
+            s.title,
+            s.starts_at,
+            s.ends_at,
+            s.status::text,
+            s.cancelled_at,
+            s.price_cents,
+            s.currency,
+            s.created_at,
+            s.updated_at
+        FROM app.sessions s
+        JOIN app.v_coach_public cp ON cp.user_id = s.coach_id
+        WHERE id=:id
+    """
+)
+
+_GET_ALL_SESSIONS = keyset_statement(
+    "session_read.get_all_sessions",
+    """
+        SELECT
+            s.id,
+            cp.user_id as coach_id,
+            cp.first_name,
+            cp.last_name,
+            s.title,
+            s.starts_at,
+            s.ends_at,
+            s.status::text,
+            s.cancelled_at,
+            s.price_cents,
+            s.currency,
+            s.created_at,
+            s.updated_at
+        FROM app.sessions s
+        JOIN app.v_coach_public cp ON cp.user_id = s.coach_id
+        WHERE (
+            CAST(:from_ts as timestamptz) IS NULL
+            OR starts_at >= CAST(:from_ts as timestamptz)
+        )
+        AND (
+            CAST(:to_ts as timestamptz) IS NULL
+            OR ends_at <= CAST(:to_ts as timestamptz)
+        )
+        AND {keyset}
+        ORDER BY s.created_at DESC, s.id DESC
+        LIMIT :limit
+        OFFSET :offset
+    """,
+    alias="s"
+)
+
+_GET_SESSIONS_BY_COACH_ID = keyset_statement(
+    "session_read.get_sessions_by_coach_id",
+    """
+        SELECT
+            id,
+            coach_id,
+            title,
+            starts_at,
+            ends_at,
+            status::text,
+            cancelled_at,
+            price_cents,
+            currency,
+            created_at,
+            updated_at
+        FROM app.sessions
+        WHERE coach_id = :coach_id
+        AND (
+            CAST(:from_ts as timestamptz) IS NULL
+            OR starts_at >= CAST(:from_ts as timestamptz)
+        )
+        AND (
+            CAST(:to_ts as timestamptz) IS NULL
+            OR ends_at <= CAST(:to_ts as timestamptz)
+        )
+        AND {keyset}
+        ORDER BY created_at DESC, id DESC
+        LIMIT :limit
+        OFFSET :offset
+    """
+)
+
+_PUBLIC_EXISTS_SESSION = statement(
+    "session_read.public_exists_session",
+    """
+        SELECT EXISTS(
+            SELECT 1
+            FROM app.sessions
+            WHERE id = :session_id
+        )
+    """
+)
+
+_GET_SESSION_VERSION = statement(
+    "session_read.get_session_version",
+    """
+        SELECT app_fcn.get_session_version(:session_id)
+    """
+)
+
+_GET_COACH_SESSIONS_VERSION = statement(
+    "session_read.get_coach_sessions_version",
+    """
+        SELECT app_fcn.get_coach_sessions_version(:coach_id)
+    """
+)
+
+_GET_PARTICIPANT_SESSIONS_VERSION = statement(
+    "session_read.get_participant_sessions_version",
+    """
+        SELECT app_fcn.get_participant_sessions_version(:user_id)
+    """
+)
+
+_SYSTEM_GET_SESSION_BY_ID = statement(
+    "session_read.system_get_session_by_id",
+    """
+        SELECT *
+        FROM app_fcn.get_session_for_registration(
+            :session_id
+        )
+    """
+)
+
+_GET_REGISTRATION_PREFLIGHT = statement(
+    "session_read.get_registration_preflight",
+    """
+        SELECT *
+        FROM app_fcn.get_registration_preflight(
+            :user_id,
+            :session_id
+        )
+    """
+)
+
+_IS_SESSION_FINISHED = statement(
+    "session_read.is_session_finished",
+    """
+        SELECT
+            app_fcn.is_session_finished(
+                :session_id
+            )
+    """
+)
+
+_IS_SESSION_STARTED = statement(
+    "session_read.is_session_started",
+    """
+        SELECT
+            app_fcn.is_session_started(
+                :session_id
+            )
+    """
+)
+
+_GET_OWN_SESSIONS = keyset_statement(
+    "session_read.get_own_sessions",
+    """
+        SELECT
+            s.id,
+            cp.user_id,
+            cp.first_name,
+            cp.last_name,
+            s.title,
+            s.starts_at,
+            s.ends_at,
+            s.status,
+            s.cancelled_at,
+            s.price_cents,
+            s.currency,
+            s.created_at,
+            s.updated_at,
+            p.participants
+        FROM app.session_participation own
+        JOIN app.sessions s
+            ON s.id = own.session_id
+        JOIN app.v_coach_public cp
+            ON cp.user_id = s.coach_id
+        CROSS JOIN LATERAL (
+            SELECT COALESCE(
+                json_agg(
+                    json_build_object(
+                        'user_id', up.user_id,
+                        'first_name', up.first_name,
+                        'last_name', up.last_name
+                    )
+                    ORDER BY up.last_name, up.first_name, up.user_id
+                ),
+                '[]'::json
+            ) AS participants
+            FROM app.session_participation sp
+            JOIN app.user_profiles up
+                ON up.user_id = sp.user_id
+            WHERE sp.session_id = s.id
+        ) p
+        WHERE own.user_id = :user_id
+            AND own.cancelled_at IS NULL
+            AND (
+                own.paid_at IS NOT NULL
+                OR s.price_cents = 0
+            )
+            AND (
+                CAST(:from_ts AS timestamptz) IS NULL
+                OR s.starts_at >= CAST(:from_ts AS timestamptz)
+            )
+            AND (
+                CAST(:to_ts AS timestamptz) IS NULL
+                OR s.ends_at <= CAST(:to_ts AS timestamptz)
+            )
+            AND {keyset}
+        ORDER BY s.created_at DESC, s.id DESC
+        OFFSET :offset
+        LIMIT :limit
+    """,
+    alias="s"
+)
+
+_GET_SESSION_PARTICIPANTS = statement(
+    "session_read.get_session_participants",
+    """
+        SELECT up.first_name, up.last_name
+        FROM app.session_participation sp
+        JOIN app.user_profiles up ON up.user_id = sp.user_id
+        WHERE sp.session_id = :session_id
+        ORDER BY up.last_name, up.first_name
+    """
+)
+
+_GET_COMPLETE_SESSION_BY_ID = statement(
+    "session_read.get_complete_session_by_id",
+    """
+        SELECT *
+        FROM app_fcn.get_complete_session(
+            :session_id
+        )
+    """
+)
+
+_GET_OWN_COACH_SESSIONS = statement(
+    "session_read.get_own_coach_sessions",
+    """
+        SELECT *
+        FROM app_fcn.get_own_coach_sessions(
+            :coach_id,
+            :limit,
+            :offset,
+            :from_ts,
+            :to_ts,
+            :cursor_created_at,
+            :cursor_id
+        )
+    """
+)
+
+
+_PARTICIPANT = RowMapper(UserProfileEntity)
+
+_SESSION = RowMapper(
+    SessionEntity,
+    status=Column("status", SessionStatus)
+)
+
+_SESSION_WITH_COACH = RowMapper(
+    SessionWithCoachEntity,
+    coach=RowMapper(UserProfileEntity, user_id="coach_id"),
+    status=Column("status", SessionStatus)
+)
+
+# The session columns are NULL when the session does not exist.
+_REGISTRATION_PREFLIGHT = RowMapper(
+    RegistrationPreflightEntity,
+    session=OptionalRow(_SESSION)
+)
+
+_SESSION_COMPLETE = RowMapper(
+    SessionCompleteEntity,
+    coach=RowMapper(UserProfileEntity),
+    participants=Column("participants", _PARTICIPANT.objects)
+)
+
+
+def _optional_datetime(value: str | None) -> datetime | None:
+    return None if value is None else datetime.fromisoformat(value)
+
+
+def _cached_session(data: dict[str, Any]) -> SessionWithCoachEntity:
+    """Rebuild a session cached as JSON by ``SessionListingCache``."""
+    coach = data["coach"]
+
+    return SessionWithCoachEntity(
+        id=UUID(data["id"]),
+        coach=UserProfileEntity(
+            user_id=UUID(coach["user_id"]),
+            first_name=coach["first_name"],
+            last_name=coach["last_name"]
+        ),
+        title=data["title"],
+        starts_at=datetime.fromisoformat(data["starts_at"]),
+        ends_at=datetime.fromisoformat(data["ends_at"]),
+        status=SessionStatus(data["status"]),
+        cancelled_at=_optional_datetime(data["cancelled_at"]),  # type: ignore
+        price_cents=data["price_cents"],
+        currency=data["currency"],
+        created_at=datetime.fromisoformat(data["created_at"]),
+        updated_at=datetime.fromisoformat(data["updated_at"])
+    )
+
+
+def _cached_page(
+    data: list[Any]
+) -> tuple[list[SessionWithCoachEntity], bool]:
+    items, has_more = data
+
+    return [_cached_session(item) for item in items], has_more
 
 
 class SqlAlchemySessionReadRepo(SessionReadRepoPort):
@@ -21,121 +369,73 @@ class SqlAlchemySessionReadRepo(SessionReadRepoPort):
     async def get_session_by_id(
         self,
         session_id: UUID
+    ) -> SessionWithCoachEntity:
+        cache = get_session_listing_cache(self._session)
+
+        if cache is None:
+            return await self._get_session_by_id(session_id)
+
+        return await cache.get_or_load(
+            ("get_session_by_id", session_id),
+            lambda: self._get_session_by_id(session_id),
+            _cached_session
+        )
+
+    async def _get_session_by_id(
+        self,
+        session_id: UUID
     ) -> SessionWithCoachEntity:
         result = await self._session.execute(
-            text(
-                """SELECT
-                    s.id,
-                    cp.user_id as coach_id,
-                    cp.first_name,
-                    cp.last_name,
-                    s.title,
-                    s.starts_at,
-                    s.ends_at,
-                    s.status::text,
-                    s.cancelled_at,
-                    s.price_cents,
-                    s.currency,
-                    s.created_at,
-                    s.updated_at
-                FROM app.sessions s
-                JOIN app.v_coach_public cp ON cp.user_id = s.coach_id
-                WHERE id=:id
-                """
-            ),
+            _GET_SESSION_BY_ID,
             {
                 'id': session_id
             }
         )
 
-        row = result.mappings().one()
-
-        return SessionWithCoachEntity(
-            id=row["id"],
-            coach=UserProfileEntity(
-                user_id=row["coach_id"],
-                first_name=row["first_name"],
-                last_name=row["last_name"]
-            ),
-            title=row["title"],
-            starts_at=row["starts_at"],
-            ends_at=row["ends_at"],
-            status=SessionStatus(row["status"]),
-            cancelled_at=row["cancelled_at"],
-            price_cents=row["price_cents"],
-            currency=row["currency"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
-        )
+        return _SESSION_WITH_COACH.one(result)
 
     async def get_all_sessions(
         self,
         offset: int,
         limit: int,
         _from: datetime | None,
-        to: datetime | None
+        to: datetime | None,
+        cursor: Cursor | None = None
+    ) -> tuple[list[SessionWithCoachEntity], bool]:
+        cache = get_session_listing_cache(self._session)
+
+        if cache is None:
+            return await self._get_all_sessions(
+                offset, limit, _from, to, cursor
+            )
+
+        return await cache.get_or_load(
+            ("get_all_sessions", offset, limit, _from, to, cursor),
+            lambda: self._get_all_sessions(offset, limit, _from, to, cursor),
+            _cached_page
+        )
+
+    async def _get_all_sessions(
+        self,
+        offset: int,
+        limit: int,
+        _from: datetime | None,
+        to: datetime | None,
+        cursor: Cursor | None
     ) -> tuple[list[SessionWithCoachEntity], bool]:
         res = await self._session.execute(
-            text("""
-                SELECT
-                    s.id,
-                    cp.user_id as coach_id,
-                    cp.first_name,
-                    cp.last_name,
-                    s.title,
-                    s.starts_at,
-                    s.ends_at,
-                    s.status::text,
-                    s.cancelled_at,
-                    s.price_cents,
-                    s.currency,
-                    s.created_at,
-                    s.updated_at
-                FROM app.sessions s
-                JOIN app.v_coach_public cp ON cp.user_id = s.coach_id
-                WHERE (
-                    CAST(:from_ts as timestamptz) IS NULL
-                    OR starts_at >= CAST(:from_ts as timestamptz)
-                )
-                AND (
-                    CAST(:to_ts as timestamptz) IS NULL
-                    OR ends_at <= CAST(:to_ts as timestamptz)
-                )
-                ORDER BY created_at DESC
-                LIMIT :limit
-                OFFSET :offset
-            """),
+            _GET_ALL_SESSIONS.select(cursor),
             {
                 "from_ts": _from,
                 "to_ts": to,
                 "limit": limit + 1,
-                "offset": offset
+                **keyset_params(cursor, offset)
             }
         )
 
-        rows = res.mappings().all()
-        has_more = len(rows) > limit
-        rows[:limit]
-
-        return [
-            SessionWithCoachEntity(
-                id=row["id"],
-                coach=UserProfileEntity(
-                    user_id=row["coach_id"],
-                    first_name=row["first_name"],
-                    last_name=row["last_name"]
-                ),
-                title=row["title"],
-                starts_at=row["starts_at"],
-                ends_at=row["ends_at"],
-                status=SessionStatus(row["status"]),
-                cancelled_at=row["cancelled_at"],
-                price_cents=row["price_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"]
-            ) for row in rows
-        ], has_more
+        sessions = _SESSION_WITH_COACH.all(res)
+
+        return sessions[:limit], len(sessions) > limit
 
     async def get_sessions_by_coach_id(
         self,
@@ -143,220 +443,145 @@ class SqlAlchemySessionReadRepo(SessionReadRepoPort):
         offset: int,
         limit: int,
         _from: datetime | None,
-        to: datetime | None
+        to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[SessionEntity], bool]:
         res = await self._session.execute(
-            text("""
-                SELECT
-                    id,
-                    coach_id,
-                    title,
-                    starts_at,
-                    ends_at,
-                    status::text,
-                    cancelled_at,
-                    price_cents,
-                    currency,
-                    created_at,
-                    updated_at
-                FROM app.sessions
-                WHERE coach_id = :coach_id
-                AND (
-                    CAST(:from_ts as timestamptz) IS NULL
-                    OR starts_at >= CAST(:from_ts as timestamptz)
-                )
-                AND (
-                    CAST(:to_ts as timestamptz) IS NULL
-                    OR ends_at <= CAST(:to_ts as timestamptz)
-                )
-                ORDER BY created_at DESC
-                LIMIT :limit
-                OFFSET :offset
-            """),
+            _GET_SESSIONS_BY_COACH_ID.select(cursor),
             {
                 "coach_id": coach_id,
                 "from_ts": _from,
                 "to_ts": to,
                 "limit": limit + 1,
-                "offset": offset
+                **keyset_params(cursor, offset)
             }
         )
 
-        rows = res.mappings().all()
-        has_more = len(rows) > limit
-        rows[:limit]
-
-        return [
-            SessionEntity(
-                id=row["id"],
-                coach_id=row["coach_id"],
-                title=row["title"],
-                starts_at=row["starts_at"],
-                ends_at=row["ends_at"],
-                status=SessionStatus(row["status"]),
-                cancelled_at=row["cancelled_at"],
-                price_cents=row["price_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"]
-            ) for row in rows
-        ], has_more
-
-    async def is_session_overlapping(
-        self,
-        starts_at: datetime,
-        ends_at: datetime
-    ) -> bool:
-        res = await self._session.execute(
-            text("""
-                    SELECT
-                        app_fcn.is_session_overlapping(:starts_at, :ends_at)
-            """),
-            {
-                "starts_at": starts_at,
-                "ends_at": ends_at
-            }
-        )
+        sessions = _SESSION.all(res)
 
-        return res.scalar_one()
+        return sessions[:limit], len(sessions) > limit
 
-    async def is_session_overlapping_except(
+    async def public_exists_session(
         self,
-        starts_at: datetime,
-        ends_at: datetime,
-        except_session_id: UUID
+        session_id: UUID
     ) -> bool:
-        result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_session_overlapping_except(
-                        :starts_at,
-                        :ends_at,
-                        :except_session
-                    )
-            """),
-            {
-                "starts_at": starts_at,
-                "ends_at": ends_at,
-                "except_session": except_session_id
-            }
-        )
+        cache = get_session_listing_cache(self._session)
 
-        return result.scalar_one()
+        if cache is None:
+            return await self._public_exists_session(session_id)
 
-    async def public_exists_session(
+        return await cache.get_or_load(
+            ("public_exists_session", session_id),
+            lambda: self._public_exists_session(session_id)
+        )
+
+    async def _public_exists_session(
         self,
         session_id: UUID
     ) -> bool:
-        stmt = text("""
-            SELECT EXISTS(
-                SELECT 1
-                FROM app.sessions
-                WHERE id = :session_id
-            )
-        """)
+        res = await self._session.execute(_PUBLIC_EXISTS_SESSION,  {
+            "session_id": session_id
+        })
 
-        res = await self._session.execute(stmt,  {
+        return res.scalar_one()
+
+    async def get_session_version(
+        self,
+        session_id: UUID
+    ) -> str | None:
+        res = await self._session.execute(_GET_SESSION_VERSION, {
             "session_id": session_id
         })
 
         return res.scalar_one()
 
+    async def get_coach_sessions_version(
+        self,
+        coach_id: UUID
+    ) -> str:
+        res = await self._session.execute(_GET_COACH_SESSIONS_VERSION, {
+            "coach_id": coach_id
+        })
+
+        return res.scalar_one()
+
+    async def get_participant_sessions_version(
+        self,
+        user_id: UUID
+    ) -> str:
+        res = await self._session.execute(
+            _GET_PARTICIPANT_SESSIONS_VERSION,
+            {
+                "user_id": user_id
+            }
+        )
+
+        return res.scalar_one()
+
     async def exist_session(
         self,
         session_id: UUID
     ) -> bool:
-        result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.session_exists(:session_id)
-            """),
-            {
-                "session_id": session_id
-            }
+        return await get_predicate_memo(self._session).evaluate(
+            SESSION_EXISTS,
+            session_id=session_id
         )
-        return result.scalar_one()
 
     async def is_session_owner(
         self,
         session_id: UUID,
         user_id: UUID
     ) -> bool:
-        result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_session_owner(
-                        :user_id,
-                        :session_id
-                    )
-            """),
-            {
-                "user_id": user_id,
-                "session_id": session_id
-            }
+        return await get_predicate_memo(self._session).evaluate(
+            SESSION_OWNER,
+            session_id=session_id,
+            user_id=user_id
         )
 
-        return result.scalar_one()
-
     async def is_session_cancelled(
         self,
         session_id: UUID
     ) -> bool:
-        result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_session_cancelled(:session_id)
-            """),
-            {
-                "session_id": session_id
-            }
+        return await get_predicate_memo(self._session).evaluate(
+            SESSION_CANCELLED,
+            session_id=session_id
         )
 
-        return result.scalar_one()
-
     async def system_get_session_by_id(
         self,
         session_id: UUID
     ) -> SessionEntity:
-        stmt = text("""
-            SELECT *
-            FROM app_fcn.get_session_for_registration(
-                :session_id
-            )
-        """)
-
-        result = await self._session.execute(stmt, {
+        result = await self._session.execute(_SYSTEM_GET_SESSION_BY_ID, {
             "session_id": session_id
         })
 
-        row = result.mappings().one()
-
-        return SessionEntity(
-            id=row["id"],
-            coach_id=row["coach_id"],
-            title=row["title"],
-            starts_at=row["starts_at"],
-            ends_at=row["ends_at"],
-            status=row["status"],
-            cancelled_at=row["cancelled_at"],
-            price_cents=row["price_cents"],
-            currency=row["currency"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"]
-        )
+        return _SESSION.one(result)
+
+    async def get_registration_preflight(
+        self,
+        session_id: UUID,
+        user_id: UUID
+    ) -> RegistrationPreflightEntity:
+        try:
+            result = await self._session.execute(_GET_REGISTRATION_PREFLIGHT, {
+                "user_id": user_id,
+                "session_id": session_id
+            })
+        except DBAPIError as exc:
+            code = get_sqlstate(exc)
+
+            if code == 'AP401':
+                raise PermissionDeniedError() from exc
+
+            raise
+
+        return _REGISTRATION_PREFLIGHT.one(result)
 
     async def is_session_finished(
         self,
         session_id: UUID
     ) -> bool:
-        stmt = text("""
-            SELECT
-                app_fcn.is_session_finished(
-                    :session_id
-                )
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_IS_SESSION_FINISHED, {
             "session_id": session_id
         })
 
@@ -366,14 +591,7 @@ class SqlAlchemySessionReadRepo(SessionReadRepoPort):
         self,
         session_id: UUID
     ) -> bool:
-        stmt = text("""
-            SELECT
-                app_fcn.is_session_started(
-                    :session_id
-                )
-        """)
-
-        res = await self._session.execute(stmt, {
+        res = await self._session.execute(_IS_SESSION_STARTED, {
             "session_id": session_id
         })
 
@@ -385,121 +603,29 @@ class SqlAlchemySessionReadRepo(SessionReadRepoPort):
         limit: int,
         offset: int,
         _from: datetime | None,
-        to: datetime | None
+        to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[SessionCompleteEntity], bool]:
-        stmt = text("""
-        SELECT
-            s.id,
-            cp.user_id,
-            cp.first_name,
-            cp.last_name,
-            s.title,
-            s.starts_at,
-            s.ends_at,
-            s.status,
-            s.cancelled_at,
-            s.price_cents,
-            s.currency,
-            s.created_at,
-            s.updated_at,
-            COALESCE(
-                array_agg(
-                    json_build_object(
-                        'user_id', up.user_id,
-                        'first_name', up.first_name,
-                        'last_name', up.last_name
-                    )
-                ) FILTER (WHERE up.user_id IS NOT NULL),
-                '{}'
-            ) AS participants
-        FROM app.sessions s
-        JOIN app.v_coach_public cp
-            ON cp.user_id = s.coach_id
-        LEFT JOIN app.session_participation sp
-            ON sp.session_id = s.id
-        LEFT JOIN app.user_profiles up
-            ON up.user_id = sp.user_id
-        WHERE EXISTS (
-            SELECT 1
-                FROM app.session_participation sp2
-                join app.sessions s2 on s2.id = sp2.session_id 
-                WHERE sp2.session_id = s.id
-                    AND sp2.user_id = :user_id
-                    and sp2.cancelled_at IS NULL
-                    and (
-                    	sp2.paid_at is not null
-                    	or s2.price_cents = 0
-                    )
-        )
-        GROUP BY
-            s.id,
-            cp.user_id,
-            cp.first_name,
-            cp.last_name,
-            s.title,
-            s.starts_at,
-            s.ends_at,
-            s.status,
-            s.cancelled_at,
-            s.price_cents,
-            s.currency,
-            s.created_at,
-            s.updated_at
-        OFFSET :offset
-        LIMIT :limit
-        """)
+        stmt = _GET_OWN_SESSIONS.select(cursor)
 
         rows = await self._session.execute(stmt, {
             "user_id": user_id,
             "from_ts": _from,
             "to_ts": to,
-            "offset": offset,
-            "limit": limit + 1
+            "limit": limit + 1,
+            **keyset_params(cursor, offset)
         })
 
-        rows = rows.mappings().all()
-        has_more = len(rows) > limit
-
-        rows = rows[:limit]
+        sessions = _SESSION_COMPLETE.all(rows)
 
-        return [
-            SessionCompleteEntity(
-                id=row["id"],
-                coach=UserProfileEntity(
-                    user_id=row["user_id"],
-                    first_name=row["first_name"],
-                    last_name=row["last_name"]
-                ),
-                title=row["title"],
-                starts_at=row["starts_at"],
-                ends_at=row["ends_at"],
-                status=row["status"],
-                cancelled_at=row["cancelled_at"],
-                price_cents=row["price_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                participants=[UserProfileEntity(
-                    user_id=participant["user_id"],
-                    first_name=participant["first_name"],
-                    last_name=participant["last_name"]
-                    ) for participant in row["participants"]
-                ]
-            ) for row in rows
-        ], has_more
+        return sessions[:limit], len(sessions) > limit
 
     async def get_session_participants(
         self,
         session_id: UUID
     ) -> list[tuple[str, str]]:
         res = await self._session.execute(
-            text("""
-                SELECT up.first_name, up.last_name
-                FROM app.session_participation sp
-                JOIN app.user_profiles up ON up.user_id = sp.user_id
-                WHERE sp.session_id = :session_id
-                ORDER BY up.last_name, up.first_name
-            """),
+            _GET_SESSION_PARTICIPANTS,
             {"session_id": session_id}
         )
         rows = res.all()
@@ -509,43 +635,11 @@ class SqlAlchemySessionReadRepo(SessionReadRepoPort):
         self,
         session_id: UUID
     ) -> SessionCompleteEntity:
-        stmt = text("""
-                SELECT *
-                FROM app_fcn.get_complete_session(
-                    :session_id
-                )
-        """)
-
-        row = await self._session.execute(stmt, {
+        row = await self._session.execute(_GET_COMPLETE_SESSION_BY_ID, {
             "session_id": session_id
         })
 
-        row = row.mappings().one()
-
-        return SessionCompleteEntity(
-            id=row["id"],
-            coach=UserProfileEntity(
-                user_id=row["user_id"],
-                first_name=row["first_name"],
-                last_name=row["last_name"]
-            ),
-            title=row["title"],
-            starts_at=row["starts_at"],
-            ends_at=row["ends_at"],
-            status=row["status"],
-            cancelled_at=row["cancelled_at"],
-            price_cents=row["price_cents"],
-            currency=row["currency"],
-            created_at=row["created_at"],
-            updated_at=row["updated_at"],
-            participants=[
-                UserProfileEntity(
-                    user_id=participant["user_id"],
-                    first_name=participant["first_name"],
-                    last_name=participant["last_name"]
-                )for participant in row["participants"]
-            ]
-        )
+        return _SESSION_COMPLETE.one(row)
 
     async def get_own_coach_sessions(
         self,
@@ -553,56 +647,19 @@ class SqlAlchemySessionReadRepo(SessionReadRepoPort):
         limit: int,
         offset: int,
         _from: datetime | None,
-        to: datetime | None
+        to: datetime | None,
+        cursor: Cursor | None = None
     ) -> tuple[list[SessionCompleteEntity], bool]:
-        stmt = text("""
-                SELECT *
-                FROM app_fcn.get_own_coach_sessions(
-                    :coach_id,
-                    :limit,
-                    :offset,
-                    :from_ts,
-                    :to_ts
-                )
-        """)
-
-        rows = await self._session.execute(stmt, {
+        rows = await self._session.execute(_GET_OWN_COACH_SESSIONS, {
             "coach_id": user_id,
             "limit": limit + 1,
-            "offset": offset,
+            "offset": 0 if cursor else offset,
             "from_ts": _from,
-            "to_ts": to
+            "to_ts": to,
+            "cursor_created_at": cursor.created_at if cursor else None,
+            "cursor_id": cursor.id if cursor else None
         })
 
-        rows = rows.mappings().all()
-
-        has_more = len(rows) > limit
+        sessions = _SESSION_COMPLETE.all(rows)
 
-        rows = rows[:limit]
-
-        return [
-            SessionCompleteEntity(
-                id=row["id"],
-                coach=UserProfileEntity(
-                    user_id=row["user_id"],
-                    first_name=row["first_name"],
-                    last_name=row["last_name"]
-                ),
-                title=row["title"],
-                starts_at=row["starts_at"],
-                ends_at=row["ends_at"],
-                status=row["status"],
-                cancelled_at=row["cancelled_at"],
-                price_cents=row["price_cents"],
-                currency=row["currency"],
-                created_at=row["created_at"],
-                updated_at=row["updated_at"],
-                participants=[
-                    UserProfileEntity(
-                        user_id=participant["user_id"],
-                        first_name=participant["first_name"],
-                        last_name=participant["last_name"]
-                    )for participant in row["participants"]
-                ]
-            ) for row in rows
-        ], has_more
+        return sessions[:limit], len(sessions) > limit
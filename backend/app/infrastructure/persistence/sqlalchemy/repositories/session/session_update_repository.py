@@ -1,6 +1,5 @@
 from datetime import datetime
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.auth_exceptions import PermissionDeniedError
@@ -13,6 +12,32 @@ from app.feature.session.repositories.session_update_repository_port import (
     SessionUpdateRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.session_listing_cache import (
+    invalidate_session_listing
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_UPDATE_SESSION = statement(
+    "session_update.update_session",
+    """
+        SELECT
+            app_fcn.session_update(
+                :session_id,
+                :title,
+                :starts_at,
+                :ends_at
+            )
+    """
+)
+
+_CANCEL_SESSION = statement(
+    "session_update.cancel_session",
+    """
+        SELECT
+            app_fcn.cancel_session(:session_id)
+    """
+)
 
 
 class SqlAlchemySessionUpdateRepo(SessionUpdateRepoPort):
@@ -26,18 +51,8 @@ class SqlAlchemySessionUpdateRepo(SessionUpdateRepoPort):
         starts_at: datetime,
         ends_at: datetime
     ) -> None:
-        stmt = text("""
-                SELECT
-                    app_fcn.session_update(
-                        :session_id,
-                        :title,
-                        :starts_at,
-                        :ends_at
-                    )
-            """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_UPDATE_SESSION, {
                     "session_id": session_id,
                     "title": title,
                     "starts_at": starts_at,
@@ -50,22 +65,20 @@ class SqlAlchemySessionUpdateRepo(SessionUpdateRepoPort):
             if code == "AP401":
                 raise PermissionDeniedError() from exc
 
-            if code == "AP409":
+            # exclusion_violation: excl_sessions_no_overlap
+            if code == "23P01":
                 raise SessionOverlappingError() from exc
 
             raise
 
+        await invalidate_session_listing(self._session)
+
     async def cancel_session(
             self,
             session_id: UUID
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.cancel_session(:session_id)
-        """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_CANCEL_SESSION, {
                 "session_id": session_id
             })
         except DBAPIError as exc:
@@ -81,3 +94,5 @@ class SqlAlchemySessionUpdateRepo(SessionUpdateRepoPort):
                 raise SessionStartedError()
 
             raise
+
+        await invalidate_session_listing(self._session)
@@ -1,7 +1,6 @@
 import json
 from uuid import UUID
 
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.auth_exceptions import PermissionDeniedError
@@ -15,6 +14,18 @@ from app.feature.session.repositories import (
     SessionAttendanceCreationRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_CREATE_ATTENDANCE = statement(
+    "session_attendance_creation.create_attendance",
+    """
+        SELECT app_fcn.create_attendance(
+            :session_id,
+            :attendance_list
+        )
+    """
+)
 
 
 class SqlAlchemySessionAttendanceCreationRepo(
@@ -36,15 +47,8 @@ class SqlAlchemySessionAttendanceCreationRepo(
             for user_id, attended in attendance_list.items()
         ]
 
-        stmt = text("""
-            SELECT app_fcn.create_attendance(
-                :session_id,
-                :attendance_list
-            )
-            """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_CREATE_ATTENDANCE, {
                     "session_id": session_id,
                     "attendance_list": json.dumps(payload)
                 }
@@ -1,6 +1,5 @@
 import json
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.auth_exceptions import PermissionDeniedError
@@ -9,7 +8,51 @@ from app.domain.user.user_profile_entity import UserProfileEntity
 from app.feature.session.repositories import (
     SessionAttendanceReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    RowMapper
+)
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_IS_SESSION_ATTENDED = statement(
+    "session_attendance_read.is_session_attended",
+    """
+        SELECT
+            app_fcn.is_session_attended(
+                :session_id
+            )
+    """
+)
+
+_GET_ATTENDANCE = statement(
+    "session_attendance_read.get_attendance",
+    """
+        SELECT *
+        FROM app_fcn.get_pre_attendance(:session_id)
+    """
+)
+
+_IS_SESSION_ATTENDANCE_OPEN = statement(
+    "session_attendance_read.is_session_attendance_open",
+    """
+        SELECT
+            app_fcn.is_attendance_open(:session_id)
+    """
+)
+
+_IS_ATTENDANCE_PAYLOAD_VALID = statement(
+    "session_attendance_read.is_attendance_payload_valid",
+    """
+        SELECT
+            app_fcn.is_attendance_payload_valid(
+                :session_id,
+                :attendance_list
+            )
+    """
+)
+
+_USER_PROFILE = RowMapper(UserProfileEntity)
 
 
 class SqlAlchemySessionAttendanceReadRepo(
@@ -23,12 +66,7 @@ class SqlAlchemySessionAttendanceReadRepo(
         session_id: UUID
     ) -> bool:
         result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_session_attended(
-                        :session_id
-                    )
-            """),
+            _IS_SESSION_ATTENDED,
             {
                 "session_id": session_id
             }
@@ -40,14 +78,8 @@ class SqlAlchemySessionAttendanceReadRepo(
         self,
         session_id: UUID
     ) -> list[UserProfileEntity]:
-        stmt = text(
-                """
-                SELECT *
-                FROM app_fcn.get_pre_attendance(:session_id)
-                """
-            )
         try:
-            result = await self._session.execute(stmt, {
+            result = await self._session.execute(_GET_ATTENDANCE, {
                     "session_id": session_id
                 }
             )
@@ -59,25 +91,14 @@ class SqlAlchemySessionAttendanceReadRepo(
 
             raise
 
-        rows = result.mappings().all()
-
-        return [
-            UserProfileEntity(
-                user_id=row["user_id"],
-                first_name=row["first_name"],
-                last_name=row["last_name"]
-            ) for row in rows
-        ]
+        return _USER_PROFILE.all(result)
 
     async def is_session_attendance_open(
         self,
         session_id: UUID
     ) -> bool:
         result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_attendance_open(:session_id)
-            """),
+            _IS_SESSION_ATTENDANCE_OPEN,
             {
                 "session_id": session_id
             }
@@ -96,15 +117,10 @@ class SqlAlchemySessionAttendanceReadRepo(
             } for uid, attended in attendance_list.items()
         ]
 
-        stmt = text("""
-                SELECT
-                    app_fcn.is_attendance_payload_valid(
-                        :session_id,
-                        :attendance_list
-                    )
-            """)
         try:
-            result = await self._session.execute(stmt, {
+            result = await self._session.execute(
+                _IS_ATTENDANCE_PAYLOAD_VALID,
+                {
                     "session_id": session_id,
                     "attendance_list": json.dumps(payload)
                 }
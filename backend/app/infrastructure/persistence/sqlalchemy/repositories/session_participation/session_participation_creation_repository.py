@@ -1,5 +1,4 @@
 from datetime import datetime
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.auth_exceptions import PermissionDeniedError
@@ -16,6 +15,20 @@ from app.feature.session.repositories import (
     SessionParticipationCreationRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_CREATE_PARTICIPATION = statement(
+    "session_participation_creation.create_participation",
+    """
+        SELECT
+            app_fcn.create_session_participation(
+                :user_id,
+                :session_id,
+                :expires_at
+            )
+    """
+)
 
 
 class SqlAlchemySessionParticipationCreationRepo(
@@ -29,17 +42,8 @@ class SqlAlchemySessionParticipationCreationRepo(
         participation: NewSessionParticipationEntity,
         expires_at: datetime
     ) -> None:
-        stmt = text("""
-                SELECT
-                    app_fcn.create_session_participation(
-                        :user_id,
-                        :session_id,
-                        :expires_at
-                    )
-            """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_CREATE_PARTICIPATION, {
                 "user_id": participation.user_id,
                 "session_id": participation.session_id,
                 "expires_at": expires_at
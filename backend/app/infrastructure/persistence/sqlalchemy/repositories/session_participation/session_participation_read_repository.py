@@ -1,10 +1,48 @@
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.sql.expression import text
 from app.feature.session.repositories import (
     SessionParticipationReadRepoPort
 )
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_HAS_ACTIVE_PARTICIPATION = statement(
+    "session_participation_read.has_active_participation",
+    """
+        SELECT
+            app_fcn.has_active_participation(
+                :user_id,
+                :session_id
+            )
+    """
+)
+
+_IS_SESSION_FULL = statement(
+    "session_participation_read.is_session_full",
+    """
+        SELECT
+            app_fcn.is_session_full(:session_id)
+    """
+)
+
+_IS_REGISTRATION_OPEN = statement(
+    "session_participation_read.is_registration_open",
+    """
+        SELECT
+            app_fcn.is_registration_open(:session_id)
+    """
+)
+
+_GET_USER_REGISTERED_SESSION_IDS = statement(
+    "session_participation_read.get_user_registered_session_ids",
+    """
+        SELECT sp.session_id
+        FROM app.session_participation sp
+        WHERE sp.user_id = :user_id
+          AND sp.cancelled_at IS NULL
+    """
+)
 
 
 class SqlAlchemySessionParticipationReadRepo(SessionParticipationReadRepoPort):
@@ -17,13 +55,7 @@ class SqlAlchemySessionParticipationReadRepo(SessionParticipationReadRepoPort):
         user_id: UUID
     ) -> bool:
         result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.has_active_participation(
-                        :user_id,
-                        :session_id
-                    )
-            """),
+            _HAS_ACTIVE_PARTICIPATION,
             {
                 "user_id": user_id,
                 "session_id": session_id
@@ -37,10 +69,7 @@ class SqlAlchemySessionParticipationReadRepo(SessionParticipationReadRepoPort):
         session_id: UUID
     ) -> bool:
         result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_session_full(:session_id, 6)
-            """),
+            _IS_SESSION_FULL,
             {
                 "session_id": session_id
             }
@@ -53,10 +82,7 @@ class SqlAlchemySessionParticipationReadRepo(SessionParticipationReadRepoPort):
         session_id: UUID
     ) -> bool:
         result = await self._session.execute(
-            text("""
-                SELECT
-                    app_fcn.is_registration_open(:session_id)
-            """),
+            _IS_REGISTRATION_OPEN,
             {
                 "session_id": session_id
             }
@@ -69,12 +95,7 @@ class SqlAlchemySessionParticipationReadRepo(SessionParticipationReadRepoPort):
         user_id: UUID
     ) -> list[UUID]:
         result = await self._session.execute(
-            text("""
-                SELECT sp.session_id
-                FROM app.session_participation sp
-                WHERE sp.user_id = :user_id
-                  AND sp.cancelled_at IS NULL
-            """),
+            _GET_USER_REGISTERED_SESSION_IDS,
             {
                 "user_id": user_id
             }
@@ -1,8 +1,10 @@
 from uuid import UUID
-from sqlalchemy import text
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.domain.auth.auth_exceptions import PermissionDeniedError
+from app.domain.session_participation.session_participation_entity import (
+    ReleasedParticipationEntity
+)
 from app.domain.session.session_exception import (
     NoActiveParticipationFoundError,
     SessionNotFoundError
@@ -11,6 +13,51 @@ from app.feature.stripe.repositories import (
     SessionParticipationUpdateRepoPort
 )
 from app.shared.database.sqlstate_extractor import get_sqlstate
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_USER_PAID = statement(
+    "session_participation_update.user_paid",
+    """
+        SELECT
+            app_fcn.mark_participation_paid(
+                :session_id,
+                :user_id
+            )
+    """
+)
+
+_CANCEL_UNPAID = statement(
+    "session_participation_update.cancel_unpaid",
+    """
+        SELECT
+            app_fcn.cancel_unpaid_participation(
+                :session_id,
+                :user_id
+            )
+    """
+)
+
+_CANCEL_REGISTRATION = statement(
+    "session_participation_update.cancel_registration",
+    """
+        SELECT
+            app_fcn.cancel_participation(
+                :user_id,
+                :session_id
+            )
+    """
+)
+
+_RELEASE_EXPIRED = statement(
+    "session_participation_update.release_expired",
+    """
+        SELECT
+            session_id,
+            user_id
+        FROM app_fcn.release_expired_participations(:limit)
+    """
+)
 
 
 class SqlAlchemySessionParticipationUpdateRepo(
@@ -27,15 +74,7 @@ class SqlAlchemySessionParticipationUpdateRepo(
         session_id: UUID,
         user_id: UUID
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.mark_participation_paid(
-                    :session_id,
-                    :user_id
-                )
-        """)
-
-        await self._session.execute(stmt, {
+        await self._session.execute(_USER_PAID, {
             "session_id": session_id,
             "user_id": user_id
         })
@@ -45,15 +84,7 @@ class SqlAlchemySessionParticipationUpdateRepo(
         session_id: UUID,
         user_id: UUID
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.cancel_unpaid_participation(
-                    :session_id,
-                    :user_id
-                )
-        """)
-
-        await self._session.execute(stmt, {
+        await self._session.execute(_CANCEL_UNPAID, {
             "session_id": session_id,
             "user_id": user_id
         })
@@ -63,16 +94,8 @@ class SqlAlchemySessionParticipationUpdateRepo(
         user_id: UUID,
         session_id: UUID
     ) -> None:
-        stmt = text("""
-            SELECT
-                app_fcn.cancel_participation(
-                    :user_id,
-                    :session_id
-                )
-        """)
-
         try:
-            await self._session.execute(stmt, {
+            await self._session.execute(_CANCEL_REGISTRATION, {
                 "user_id": user_id,
                 "session_id": session_id
             })
@@ -87,3 +110,19 @@ class SqlAlchemySessionParticipationUpdateRepo(
 
             if code == "AB404":
                 raise NoActiveParticipationFoundError()
+
+    async def release_expired(
+        self,
+        limit: int
+    ) -> list[ReleasedParticipationEntity]:
+        result = await self._session.execute(_RELEASE_EXPIRED, {
+            "limit": limit
+        })
+
+        return [
+            ReleasedParticipationEntity(
+                session_id=row.session_id,
+                user_id=row.user_id
+            )
+            for row in result
+        ]
@@ -0,0 +1,8 @@
+from .stripe_event_inbox_repository import (
+    SqlAlchemyStripeEventInboxRepo
+)
+
+
+__all__ = [
+    "SqlAlchemyStripeEventInboxRepo"
+]
@@ -0,0 +1,147 @@
+from sqlalchemy.ext.asyncio.session import AsyncSession
+from app.domain.stripe.stripe_inbox_entity import (
+    StripeInboxEventEntity,
+    StripeInboxStatsEntity
+)
+from app.feature.stripe.repositories import StripeEventInboxRepoPort
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    RowMapper
+)
+from app.infrastructure.persistence.sqlalchemy.statements import statement
+
+
+_ENQUEUE = statement(
+    "stripe_event_inbox.enqueue",
+    """
+        SELECT
+            app_fcn.enqueue_stripe_event(
+                :event_id,
+                :event_type,
+                CAST(:payload AS jsonb)
+            )
+    """
+)
+
+_CLAIM_NEXT = statement(
+    "stripe_event_inbox.claim_next",
+    """
+        SELECT
+            event_id,
+            event_type,
+            payload,
+            attempts
+        FROM app_fcn.claim_stripe_event(
+            :lease_seconds
+        )
+    """
+)
+
+_LOCK = statement(
+    "stripe_event_inbox.lock",
+    """
+        SELECT
+            app_fcn.lock_stripe_event(
+                :event_id
+            )
+    """
+)
+
+_COMPLETE = statement(
+    "stripe_event_inbox.complete",
+    """
+        SELECT
+            app_fcn.complete_stripe_event(
+                :event_id
+            )
+    """
+)
+
+_FAIL = statement(
+    "stripe_event_inbox.fail",
+    """
+        SELECT
+            app_fcn.fail_stripe_event(
+                :event_id,
+                :error,
+                :retry_in_seconds,
+                :max_attempts
+            )
+    """
+)
+
+_STATS = statement(
+    "stripe_event_inbox.stats",
+    """
+        SELECT
+            pending,
+            due,
+            dead,
+            oldest_pending_seconds
+        FROM app_fcn.stripe_inbox_stats()
+    """
+)
+
+_INBOX_EVENT = RowMapper(StripeInboxEventEntity)
+
+_INBOX_STATS = RowMapper(StripeInboxStatsEntity)
+
+
+class SqlAlchemyStripeEventInboxRepo(StripeEventInboxRepoPort):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def enqueue(
+        self,
+        event_id: str,
+        event_type: str,
+        payload: str
+    ) -> bool:
+        res = await self._session.execute(_ENQUEUE, {
+            "event_id": event_id,
+            "event_type": event_type,
+            "payload": payload
+        })
+
+        return res.scalar_one()
+
+    async def claim_next(
+        self,
+        lease_seconds: float
+    ) -> StripeInboxEventEntity | None:
+        res = await self._session.execute(_CLAIM_NEXT, {
+            "lease_seconds": lease_seconds
+        })
+        return _INBOX_EVENT.one_or_none(res)
+
+    async def lock(self, event_id: str) -> bool:
+        res = await self._session.execute(_LOCK, {
+            "event_id": event_id
+        })
+
+        return res.scalar_one()
+
+    async def complete(self, event_id: str) -> None:
+        await self._session.execute(_COMPLETE, {
+            "event_id": event_id
+        })
+
+    async def fail(
+        self,
+        event_id: str,
+        error: str,
+        retry_in_seconds: float,
+        max_attempts: int
+    ) -> bool:
+        res = await self._session.execute(_FAIL, {
+            "event_id": event_id,
+            "error": error,
+            "retry_in_seconds": retry_in_seconds,
+            "max_attempts": max_attempts
+        })
+
+        return bool(res.scalar_one())
+
+    async def stats(self) -> StripeInboxStatsEntity:
+        res = await self._session.execute(_STATS)
+
+        return _INBOX_STATS.one(res)
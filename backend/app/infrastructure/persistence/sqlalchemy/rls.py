@@ -0,0 +1,140 @@
+from uuid import UUID
+import asyncpg
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.sql.expression import text
+
+
+CURRENT_USER_SETTING = "app.current_user_id"
+
+SET_CURRENT_USER_STMT = text(
+    "SELECT set_config('app.current_user_id', :user_id, true)"
+)
+
+
+def with_actor_prologue(begin_query: str, user_id: UUID) -> str:
+    """Append the RLS actor binding to a BEGIN statement.
+
+    The result is a single simple-protocol message, so the transaction
+    and its actor are established in one network round trip. The binding
+    is transaction-local (``is_local = true``), exactly like the
+    standalone ``set_config`` call it replaces.
+
+    Args:
+        begin_query (str): BEGIN statement generated by asyncpg.
+        user_id (UUID): Actor bound to ``app.current_user_id``.
+
+    Returns:
+        str: BEGIN statement followed by the ``set_config`` call.
+    """
+    # Re-parsing guarantees the inlined literal is a canonical UUID.
+    actor = str(UUID(str(user_id)))
+
+    return (
+        f"{begin_query.rstrip().rstrip(';')}; "
+        f"SELECT set_config('{CURRENT_USER_SETTING}', '{actor}', true);"
+    )
+
+
+class ActorBindingConnection(asyncpg.Connection):
+    """asyncpg connection able to piggyback the RLS actor on BEGIN.
+
+    SQLAlchemy starts asyncpg transactions lazily, right before the first
+    statement of the transaction. When an actor is pending, that BEGIN is
+    extended with the ``set_config`` call instead of sending it separately.
+    """
+    __slots__ = ("_pending_actor",)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._pending_actor: UUID | None = None
+
+    def bind_actor_on_begin(self, user_id: UUID) -> None:
+        self._pending_actor = user_id
+
+    def clear_pending_actor(self) -> None:
+        self._pending_actor = None
+
+    async def execute(
+        self,
+        query: str,
+        *args,
+        timeout: float | None = None
+    ) -> str:
+        user_id = self._pending_actor
+
+        if user_id is not None and not args and query.startswith("BEGIN"):
+            self._pending_actor = None
+            query = with_actor_prologue(query, user_id)
+
+        return await super().execute(query, *args, timeout=timeout)
+
+
+class ActorBoundSession(Session):
+    """Session that binds ``session.info`` actor to every transaction."""
+
+
+@event.listens_for(ActorBoundSession, "after_begin")
+def _bind_actor_on_begin(
+    session: Session,
+    transaction: SessionTransaction,
+    connection: Connection
+) -> None:
+    user_id = session.info.get(CURRENT_USER_SETTING)
+
+    if user_id is None:
+        return
+
+    pooled = connection.connection
+    driver = pooled.driver_connection
+
+    if (
+        isinstance(driver, ActorBindingConnection)
+        and not driver.is_in_transaction()
+        and getattr(pooled.dbapi_connection, "isolation_level", None)
+        != "autocommit"
+    ):
+        driver.bind_actor_on_begin(user_id)
+        return
+
+    # Transaction already open on the driver: bind with its own statement.
+    connection.execute(SET_CURRENT_USER_STMT, {"user_id": str(user_id)})
+
+
+def _clear_pending_actor(dbapi_connection, connection_record) -> None:
+    driver = getattr(dbapi_connection, "driver_connection", None)
+
+    if isinstance(driver, ActorBindingConnection):
+        driver.clear_pending_actor()
+
+
+def install_actor_binding(engine: AsyncEngine) -> None:
+    """Make sure no pending actor outlives a pool checkout.
+
+    Args:
+        engine (AsyncEngine): Engine created with ``ActorBindingConnection``.
+    """
+    event.listen(engine.sync_engine, "checkin", _clear_pending_actor)
+
+
+async def bind_current_user(session: AsyncSession, user_id: UUID) -> None:
+    """Bind the RLS actor (``app.current_user_id``) to a session.
+
+    The actor is recorded on the session and sent together with the BEGIN
+    of every transaction the session opens, saving the dedicated
+    ``set_config`` round trip. If a transaction is already open it is
+    bound immediately.
+
+    Args:
+        session (AsyncSession): Request session.
+        user_id (UUID): Authenticated actor id.
+    """
+    session.info[CURRENT_USER_SETTING] = user_id
+
+    if session.in_transaction():
+        await session.execute(
+            SET_CURRENT_USER_STMT,
+            {"user_id": str(user_id)}
+        )
@@ -0,0 +1,199 @@
+import asyncio
+import logging
+from hashlib import blake2b
+from time import time
+from typing import Any, Awaitable, Callable, TypeVar
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.shared.cache.cache_backend_port import (
+    CacheBackendPort,
+    CacheUnavailableError
+)
+
+logger = logging.getLogger(__name__)
+
+SESSION_LISTING_CHANNEL = "app_session_listing"
+
+SESSION_LISTING_CACHE_INFO_KEY = "session_listing_cache"
+
+_WROTE_SESSIONS_INFO_KEY = "wrote_sessions"
+
+T = TypeVar("T")
+
+
+class SessionListingCache:
+    """Read-through cache of the public session reads.
+
+    Results are stored in ``backend`` as JSON for ``ttl_seconds`` under
+    keys prefixed with a generation counter kept in the backend itself.
+    Invalidating increments the generation, which orphans every cached
+    page at once; orphans age out with their TTL. Sharing the backend
+    between processes therefore shares both the pages and invalidations.
+
+    The generation is bumped by the write repositories as they run and
+    again by ``SESSION_LISTING_CHANNEL`` notifications once the write has
+    committed, so a page read from a snapshot taken in between cannot
+    outlive the commit. While the notification listener is disconnected
+    the cache is bypassed. Backend failures are counted and fall back to
+    the database.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackendPort,
+        ttl_seconds: float = 30,
+        namespace: str = "sessions",
+        clock: Callable[[], float] = time
+    ) -> None:
+        self._backend = backend
+        self._ttl_seconds = ttl_seconds
+        self._namespace = namespace
+        self._generation_key = f"{namespace}:generation"
+        self._clock = clock
+        self._suspended = False
+        self._pending: set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.errors = 0
+        self.invalidations = 0
+        self.served_age_total = 0.0
+        self.served_age_max = 0.0
+
+    async def get_or_load(
+        self,
+        key: tuple,
+        load: Callable[[], Awaitable[T]],
+        decode: Callable[[Any], T] = lambda value: value
+    ) -> T:
+        """Return the cached result for ``key``, loading it on a miss.
+
+        Args:
+            key (tuple): Query name and every argument of the query.
+            load (Callable[[], Awaitable[T]]): Runs the query.
+            decode (Callable[[Any], T]): Rebuilds the result from its
+                JSON form, e.g. entities from objects.
+
+        Returns:
+            T: Cached or freshly loaded result.
+        """
+        if self._suspended or self._ttl_seconds <= 0:
+            self.bypassed += 1
+            return await load()
+
+        try:
+            # incr by 0 reads the generation in one round trip.
+            generation = await self._backend.incr(self._generation_key, 0)
+            cache_key = self._key(generation, key)
+            entry = await self._backend.get(cache_key)
+        except CacheUnavailableError as exc:
+            self._failed(exc)
+            return await load()
+
+        if entry is not None:
+            stored_at, value = orjson.loads(entry)
+            age = max(0.0, self._clock() - stored_at)
+            self.hits += 1
+            self.served_age_total += age
+            self.served_age_max = max(self.served_age_max, age)
+            return decode(value)
+
+        self.misses += 1
+        value = await load()
+
+        try:
+            await self._backend.set(
+                cache_key,
+                orjson.dumps((self._clock(), value)),
+                self._ttl_seconds
+            )
+        except CacheUnavailableError as exc:
+            self._failed(exc)
+
+        return value
+
+    async def invalidate_all(self) -> None:
+        self.invalidations += 1
+
+        try:
+            await self._backend.incr(self._generation_key)
+        except CacheUnavailableError as exc:
+            # Cached pages now live until their TTL.
+            self._failed(exc)
+
+    def invalidate(self, payload: str) -> None:
+        """Schedule ``invalidate_all`` for a listener notification."""
+        task = asyncio.get_running_loop().create_task(self.invalidate_all())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def suspend(self) -> None:
+        self._suspended = True
+
+    def resume(self) -> None:
+        self._suspended = False
+
+    def status(self) -> dict[str, int | float | bool]:
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "bypassed": self.bypassed,
+            "errors": self.errors,
+            "invalidations": self.invalidations,
+            "served_age_avg_seconds": round(
+                self.served_age_total / self.hits, 3
+            ) if self.hits else 0.0,
+            "served_age_max_seconds": round(self.served_age_max, 3),
+            "ttl_seconds": self._ttl_seconds,
+            "suspended": self._suspended,
+        }
+
+    def _key(self, generation: int, key: tuple) -> str:
+        # Arguments may contain spaces and exceed memcached's 250 byte
+        # key limit, so they are hashed.
+        digest = blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+        return f"{self._namespace}:{generation}:{digest}"
+
+    def _failed(self, exc: CacheUnavailableError) -> None:
+        self.errors += 1
+        logger.warning("session listing cache: %s", exc)
+
+
+def get_session_listing_cache(
+    session: AsyncSession
+) -> SessionListingCache | None:
+    """Return the session listing cache attached to a session, if any.
+
+    A session that wrote sessions reads around the cache: it would see,
+    and store, its own uncommitted rows.
+
+    Args:
+        session (AsyncSession): Request session.
+
+    Returns:
+        SessionListingCache | None: Cache installed by the session factory.
+    """
+    if session.info.get(_WROTE_SESSIONS_INFO_KEY):
+        return None
+
+    return session.info.get(SESSION_LISTING_CACHE_INFO_KEY)
+
+
+async def invalidate_session_listing(session: AsyncSession) -> None:
+    """Drop the cached session listings right away.
+
+    Listings cached again before the transaction commits are dropped by
+    the trigger notification once it does.
+
+    Args:
+        session (AsyncSession): Session running the session write.
+    """
+    cache = get_session_listing_cache(session)
+    session.info[_WROTE_SESSIONS_INFO_KEY] = True
+
+    if cache is not None:
+        await cache.invalidate_all()
@@ -3,22 +3,48 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
 )
+from app.infrastructure.persistence.sqlalchemy.rls import ActorBoundSession
+from app.infrastructure.persistence.sqlalchemy.session_listing_cache import (
+    SESSION_LISTING_CACHE_INFO_KEY,
+    SessionListingCache
+)
+from app.infrastructure.persistence.sqlalchemy.user_status_cache import (
+    USER_STATUS_CACHE_INFO_KEY,
+    UserStatusCache
+)
 
 
 def create_session_factory(
-    engine: AsyncEngine
+    engine: AsyncEngine,
+    user_status_cache: UserStatusCache | None = None,
+    session_listing_cache: SessionListingCache | None = None
 ) -> async_sessionmaker[AsyncSession]:
     """Create an async SQLAlchemy session factory.
 
     Args:
         engine (AsyncEngine): SQLAlchemy async engine.
+        user_status_cache (UserStatusCache | None): Cache shared by the
+            sessions of the factory, disabled when ``None``.
+        session_listing_cache (SessionListingCache | None): Public session
+            read cache shared by the sessions of the factory, disabled
+            when ``None``.
 
     Returns:
         async_sessionmaker[AsyncSession]: Session factory.
     """
+    info = {}
+
+    if user_status_cache is not None:
+        info[USER_STATUS_CACHE_INFO_KEY] = user_status_cache
+
+    if session_listing_cache is not None:
+        info[SESSION_LISTING_CACHE_INFO_KEY] = session_listing_cache
+
     return async_sessionmaker(
         bind=engine,
+        info=info,
         expire_on_commit=False,
         autoflush=False,
         autocommit=False,
+        sync_session_class=ActorBoundSession,
     )
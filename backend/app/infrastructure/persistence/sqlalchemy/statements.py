@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+from weakref import WeakKeyDictionary
+from sqlalchemy import event
+from sqlalchemy.engine import Dialect, Engine
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql.expression import TextClause, text
+from sqlalchemy.util import LRUCache
+
+
+@dataclass(frozen=True)
+class StatementCacheConfig:
+    """Statement cache sizing of an engine.
+
+    Attributes:
+        prepared_statement_cache_size: asyncpg prepared statements kept per
+            connection, ``0`` disables the cache.
+        query_cache_size: Compiled statements kept by SQLAlchemy per engine.
+    """
+    prepared_statement_cache_size: int = 100
+    query_cache_size: int = 500
+
+
+class StatementRegistry:
+    """Named SQL statements shared by every repository.
+
+    Statements are declared once, at import time, instead of building a
+    new ``text()`` object on each call. A shared object keeps its
+    memoized cache key, so SQLAlchemy finds the compiled form without
+    walking the statement again, and the identical SQL string lets the
+    asyncpg prepared statement cache reuse the server-side statement.
+    """
+
+    def __init__(self) -> None:
+        self._statements: dict[str, TextClause] = {}
+
+    def register(self, name: str, sql: str) -> TextClause:
+        """Declare a statement.
+
+        Args:
+            name (str): Unique name, ``<repository>.<method>``.
+            sql (str): Statement SQL using ``:param`` binds.
+
+        Raises:
+            ValueError: If the name is already bound to another statement.
+
+        Returns:
+            TextClause: Statement to pass to ``session.execute``.
+        """
+        existing = self._statements.get(name)
+
+        if existing is not None:
+            if existing.text != sql:
+                raise ValueError(f"statement {name!r} is already registered")
+            return existing
+
+        stmt = text(sql)
+        self._statements[name] = stmt
+
+        return stmt
+
+    def get(self, name: str) -> TextClause:
+        return self._statements[name]
+
+    def names(self) -> list[str]:
+        return sorted(self._statements)
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    def compile_all(self, dialect: Dialect) -> int:
+        """Compile every registered statement against a dialect.
+
+        Called at startup so a malformed statement fails the boot rather
+        than the first request that uses it.
+
+        Args:
+            dialect (Dialect): Dialect of the engine running the queries.
+
+        Returns:
+            int: Number of compiled statements.
+        """
+        for stmt in self._statements.values():
+            stmt.compile(dialect=dialect)
+
+        return len(self._statements)
+
+
+STATEMENTS = StatementRegistry()
+
+
+def statement(name: str, sql: str) -> TextClause:
+    """Declare a repository statement in the shared registry.
+
+    Args:
+        name (str): Unique name, ``<repository>.<method>``.
+        sql (str): Statement SQL using ``:param`` binds.
+
+    Returns:
+        TextClause: Registered statement.
+    """
+    return STATEMENTS.register(name, sql)
+
+
+class StatementCacheStats:
+    """Cumulative hit/miss counters of the statement caches of an engine.
+
+    ``compiled_*`` count lookups in SQLAlchemy's compiled cache,
+    ``prepared_*`` count lookups in the per-connection asyncpg prepared
+    statement cache. A prepared miss costs an extra Parse round trip.
+    """
+
+    def __init__(self) -> None:
+        self.compiled_hits = 0
+        self.compiled_misses = 0
+        self.prepared_lookups = 0
+        self.prepared_misses = 0
+
+    @property
+    def prepared_hits(self) -> int:
+        return self.prepared_lookups - self.prepared_misses
+
+
+class CountingLRUCache(LRUCache):
+    """asyncpg prepared statement cache recording its hit ratio.
+
+    The asyncpg adapter checks ``operation in cache`` and stores a new
+    entry whenever it has to prepare (missing or stale statement), so
+    every store is a miss.
+    """
+    __slots__ = ("stats",)
+
+    def __init__(self, capacity: int, stats: StatementCacheStats) -> None:
+        super().__init__(capacity)
+        self.stats = stats
+
+    def __contains__(self, key: object) -> bool:
+        self.stats.prepared_lookups += 1
+        return super().__contains__(key)
+
+    def __setitem__(self, key, value) -> None:
+        self.stats.prepared_misses += 1
+        super().__setitem__(key, value)
+
+
+_engine_stats: WeakKeyDictionary[Engine, StatementCacheStats] = (
+    WeakKeyDictionary()
+)
+
+
+def install_statement_cache_stats(engine: AsyncEngine) -> StatementCacheStats:
+    """Count compiled and prepared statement cache hits for an engine.
+
+    Args:
+        engine (AsyncEngine): Engine using the asyncpg driver.
+
+    Returns:
+        StatementCacheStats: Counters updated by the engine.
+    """
+    sync_engine = engine.sync_engine
+    stats = StatementCacheStats()
+    _engine_stats[sync_engine] = stats
+
+    @event.listens_for(sync_engine, "connect")
+    def _count_prepared(dbapi_connection, connection_record) -> None:
+        cache = getattr(dbapi_connection, "_prepared_statement_cache", None)
+
+        if cache is not None and not isinstance(cache, CountingLRUCache):
+            dbapi_connection._prepared_statement_cache = CountingLRUCache(
+                cache.capacity,
+                stats
+            )
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _count_compiled(
+        conn,
+        cursor,
+        statement,
+        parameters,
+        context,
+        executemany
+    ) -> None:
+        if context is None:
+            return
+
+        if context.cache_hit is CacheStats.CACHE_HIT:
+            stats.compiled_hits += 1
+        elif context.cache_hit is CacheStats.CACHE_MISS:
+            stats.compiled_misses += 1
+
+    return stats
+
+
+def statement_cache_status(engine: AsyncEngine) -> dict[str, int]:
+    """Snapshot the statement cache counters of an engine.
+
+    Args:
+        engine (AsyncEngine): Engine passed to
+            ``install_statement_cache_stats``.
+
+    Returns:
+        dict[str, int]: Cache counters, empty if not instrumented.
+    """
+    stats = _engine_stats.get(engine.sync_engine)
+
+    if stats is None:
+        return {}
+
+    return {
+        "registered": len(STATEMENTS),
+        "compiled_hits": stats.compiled_hits,
+        "compiled_misses": stats.compiled_misses,
+        "prepared_hits": stats.prepared_hits,
+        "prepared_misses": stats.prepared_misses,
+    }
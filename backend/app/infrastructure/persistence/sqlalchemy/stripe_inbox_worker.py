@@ -0,0 +1,187 @@
+import asyncio
+import logging
+import stripe
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.domain.stripe.stripe_inbox_entity import StripeInboxEventEntity
+from app.feature.stripe.stripe_service import StripeService
+from app.infrastructure.persistence.sqlalchemy.uow.stripe.stripe_uow import (
+    SqlAlchemyStripeUoW
+)
+
+logger = logging.getLogger(__name__)
+
+
+class StripeInboxWorker:
+    """Process the Stripe webhook inbox in background tasks.
+
+    Each of the ``concurrency`` tasks claims one due event at a time with
+    ``FOR UPDATE SKIP LOCKED``, so workers in every process share the
+    inbox without blocking each other. The claim leases the event for
+    ``lease_seconds`` and commits, so Stripe is called without holding a
+    row lock or a connection; the event is then locked again and applied
+    in a second transaction. A failed attempt is recorded in a
+    transaction of its own with exponential backoff, until
+    ``max_attempts`` parks the event as dead. Should recording it fail
+    too, the event is retried once its lease is over.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        service: StripeService,
+        stripe_client: stripe.StripeClient,
+        concurrency: int = 2,
+        poll_seconds: float = 2,
+        max_attempts: int = 8,
+        backoff_seconds: float = 5,
+        max_backoff_seconds: float = 900,
+        lease_seconds: float = 60
+    ) -> None:
+        self._session_factory = session_factory
+        self._service = service
+        self._stripe_client = stripe_client
+        self._concurrency = concurrency
+        self._poll_seconds = poll_seconds
+        self._max_attempts = max_attempts
+        self._backoff_seconds = backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._lease_seconds = lease_seconds
+        self._tasks: list[asyncio.Task] = []
+        self.processed = 0
+        self.retried = 0
+        self.dead = 0
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._run())
+            for _ in range(self._concurrency)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def backoff(self, attempts: int) -> float:
+        """Delay before retrying an event that failed ``attempts`` times.
+
+        Args:
+            attempts (int): Failed attempts before this one.
+
+        Returns:
+            float: Seconds until the next attempt.
+        """
+        return min(
+            self._backoff_seconds * 2 ** attempts,
+            self._max_backoff_seconds
+        )
+
+    def status(self) -> dict[str, int]:
+        return {
+            "workers": len(self._tasks),
+            "processed": self.processed,
+            "retried": self.retried,
+            "dead": self.dead,
+        }
+
+    async def run_once(self) -> bool:
+        """Claim and process one due event.
+
+        Returns:
+            bool: ``True`` when an event was claimed.
+        """
+        async with self._session_factory() as session:
+            async with session.begin():
+                event = await SqlAlchemyStripeUoW(
+                    session
+                ).stripe_event_inbox_repo.claim_next(self._lease_seconds)
+
+        if event is None:
+            return False
+
+        try:
+            await self._process(event)
+        except Exception as exc:
+            await self._record_failure(event, exc)
+
+        return True
+
+    async def _process(self, event: StripeInboxEventEntity) -> None:
+        stripe_event = self._service.parse_inbox_event(event)
+        balance = await self._service.fetch_balance(
+            stripe_event,
+            self._stripe_client
+        )
+
+        async with self._session_factory() as session:
+            async with session.begin():
+                uow = SqlAlchemyStripeUoW(session)
+
+                # Already applied by a worker that claimed it after the
+                # lease expired.
+                if not await uow.stripe_event_inbox_repo.lock(
+                    event.event_id
+                ):
+                    return
+
+                await self._service.apply_stripe_event(
+                    uow,
+                    stripe_event,
+                    balance
+                )
+                await uow.stripe_event_inbox_repo.complete(event.event_id)
+
+        self.processed += 1
+
+    async def _record_failure(
+        self,
+        event: StripeInboxEventEntity,
+        exc: Exception
+    ) -> None:
+        try:
+            async with self._session_factory() as session:
+                async with session.begin():
+                    dead = await SqlAlchemyStripeUoW(
+                        session
+                    ).stripe_event_inbox_repo.fail(
+                        event_id=event.event_id,
+                        error=repr(exc),
+                        retry_in_seconds=self.backoff(event.attempts),
+                        max_attempts=self._max_attempts
+                    )
+        except Exception:
+            logger.exception(
+                "could not record the failure of stripe event %s, "
+                "retrying after its lease",
+                event.event_id
+            )
+            return
+
+        if dead:
+            self.dead += 1
+            logger.error(
+                "stripe event %s is dead after %d attempts",
+                event.event_id,
+                event.attempts + 1,
+                exc_info=exc
+            )
+        else:
+            self.retried += 1
+            logger.warning(
+                "stripe event %s failed: %r",
+                event.event_id,
+                exc
+            )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.run_once()
+            except Exception:
+                logger.exception("stripe inbox worker failed")
+                claimed = False
+
+            if not claimed:
+                await asyncio.sleep(self._poll_seconds)
@@ -0,0 +1,259 @@
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+from sqlalchemy.sql.expression import TextClause, text
+from app.infrastructure.persistence.sqlalchemy.rls import (
+    CURRENT_USER_SETTING
+)
+
+MEMO_INFO_KEY = "predicate_memo"
+
+HINTS_INFO_KEY = "predicate_hints"
+
+_MEMO_EXECUTION_OPTION = "predicate_memo_batch"
+
+_BIND_PARAM = re.compile(r"(?<!:):(\w+)")
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """Guard predicate that can be memoized and batched.
+
+    Attributes:
+        name: Unique name, also used as memo key prefix.
+        expression: Boolean SQL expression using ``:param`` binds.
+        params: Bind parameter names, in key order.
+        family: Predicates of the same family are fetched together.
+    """
+    name: str
+    expression: str
+    params: tuple[str, ...]
+    family: str
+
+
+USER_DISABLED = Predicate(
+    name="user_disabled",
+    expression="""EXISTS(
+        SELECT 1
+        FROM app.users
+        WHERE id = :user_id
+            AND disabled_at IS NOT NULL
+    )""",
+    params=("user_id",),
+    family="session",
+)
+
+SESSION_EXISTS = Predicate(
+    name="session_exists",
+    expression="app_fcn.session_exists(:session_id)",
+    params=("session_id",),
+    family="session",
+)
+
+SESSION_CANCELLED = Predicate(
+    name="session_cancelled",
+    expression="app_fcn.is_session_cancelled(:session_id)",
+    params=("session_id",),
+    family="session",
+)
+
+SESSION_OWNER = Predicate(
+    name="session_owner",
+    expression="app_fcn.is_session_owner(:user_id, :session_id)",
+    params=("session_id", "user_id"),
+    family="session",
+)
+
+PREDICATES: tuple[Predicate, ...] = (
+    SESSION_EXISTS,
+    SESSION_CANCELLED,
+    SESSION_OWNER,
+    USER_DISABLED,
+)
+
+
+class PredicateMemo:
+    """Transaction-scoped cache of guard predicate results.
+
+    A miss evaluates the requested predicate together with every sibling
+    of its family that can be bound from the same arguments, the RLS
+    actor bound to the session and the hints given by
+    ``hint_predicate_params``, in a single ``SELECT``. Services usually
+    run ``is_user_disabled`` on the actor, then ``exist_session``,
+    ``is_session_cancelled`` and ``is_session_owner`` on the session of
+    the route, which then costs one round trip.
+
+    Results are dropped when the transaction ends and whenever another
+    statement runs on the session, since it may have changed the state
+    the predicates describe.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._results: dict[tuple[Any, ...], bool] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    async def evaluate(self, predicate: Predicate, **params: Any) -> bool:
+        key = _key(predicate, params)
+
+        if key in self._results:
+            self.hits += 1
+            return self._results[key]
+
+        self.misses += 1
+        calls = [(predicate, params)] + self._siblings(predicate, params)
+
+        await self._load(calls)
+
+        return self._results[key]
+
+    def _siblings(
+        self,
+        predicate: Predicate,
+        params: dict[str, Any]
+    ) -> list[tuple[Predicate, dict[str, Any]]]:
+        known = dict(params)
+
+        actor = self._session.info.get(CURRENT_USER_SETTING)
+        if actor is not None:
+            known.setdefault("user_id", actor)
+
+        for name, value in self._session.info.get(HINTS_INFO_KEY, {}).items():
+            known.setdefault(name, value)
+
+        siblings = []
+        for sibling in PREDICATES:
+            if sibling is predicate or sibling.family != predicate.family:
+                continue
+
+            if not all(name in known for name in sibling.params):
+                continue
+
+            sibling_params = {name: known[name] for name in sibling.params}
+
+            if _key(sibling, sibling_params) not in self._results:
+                siblings.append((sibling, sibling_params))
+
+        return siblings
+
+    async def _load(
+        self,
+        calls: list[tuple[Predicate, dict[str, Any]]]
+    ) -> None:
+        binds: dict[str, Any] = {}
+
+        for index, (_, params) in enumerate(calls):
+            binds.update({
+                f"p{index}_{name}": _bind_value(value)
+                for name, value in params.items()
+            })
+
+        stmt = _batch_statement(tuple(predicate for predicate, _ in calls))
+
+        result = await self._session.execute(stmt, binds)
+        row = result.one()
+
+        for index, (predicate, params) in enumerate(calls):
+            self._results[_key(predicate, params)] = bool(row[index])
+
+
+@lru_cache(maxsize=64)
+def _batch_statement(predicates: tuple[Predicate, ...]) -> TextClause:
+    # Only a handful of predicate combinations exist, so each batch is
+    # built once and then reuses its compiled and prepared statement.
+    columns = []
+
+    for index, predicate in enumerate(predicates):
+        prefix = f"p{index}_"
+        expression = _BIND_PARAM.sub(
+            lambda match: f":{prefix}{match.group(1)}",
+            predicate.expression
+        )
+
+        columns.append(f"{expression} AS p{index}")
+
+    return text(
+        "SELECT " + ", ".join(columns)
+    ).execution_options(**{_MEMO_EXECUTION_OPTION: True})
+
+
+def _key(predicate: Predicate, params: dict[str, Any]) -> tuple[Any, ...]:
+    return (predicate.name,) + tuple(
+        str(params[name]) for name in predicate.params
+    )
+
+
+def _bind_value(value: Any) -> Any:
+    return str(value) if isinstance(value, UUID) else value
+
+
+def hint_predicate_params(
+    session: AsyncSession,
+    path_params: dict[str, Any]
+) -> None:
+    """Let predicate batches bind the session id of the route.
+
+    Predicates of that session are then fetched with the first guard of
+    the request, usually ``is_user_disabled`` on the actor. Other path
+    parameters are ignored: ``user_id`` names the actor in predicates,
+    not the user of an admin route.
+
+    Args:
+        session (AsyncSession): Request session.
+        path_params (dict[str, Any]): Path parameters of the request.
+    """
+    try:
+        session_id = UUID(str(path_params["session_id"]))
+    except (KeyError, ValueError):
+        return
+
+    session.info[HINTS_INFO_KEY] = {"session_id": session_id}
+
+
+def get_predicate_memo(session: AsyncSession) -> PredicateMemo:
+    """Return the predicate memo attached to a session.
+
+    Args:
+        session (AsyncSession): Request session.
+
+    Returns:
+        PredicateMemo: Memo shared by every UoW built on the session.
+    """
+    memo = session.info.get(MEMO_INFO_KEY)
+
+    if memo is None:
+        memo = PredicateMemo(session)
+        session.info[MEMO_INFO_KEY] = memo
+
+    return memo
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_on_transaction_end(
+    session: Session,
+    transaction: SessionTransaction
+) -> None:
+    memo = session.info.get(MEMO_INFO_KEY)
+
+    if memo is not None:
+        memo.clear()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _clear_on_foreign_statement(state: ORMExecuteState) -> None:
+    if state.execution_options.get(_MEMO_EXECUTION_OPTION):
+        return
+
+    memo = state.session.info.get(MEMO_INFO_KEY)
+
+    if memo is not None:
+        memo.clear()
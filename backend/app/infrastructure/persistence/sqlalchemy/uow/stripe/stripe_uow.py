@@ -8,7 +8,8 @@ from app.infrastructure.persistence.sqlalchemy.repositories import (
     SqlAlchemySessionParticipationUpdateRepo,
     SqlAlchemyPaymentCreationRepo,
     SqlAlchemyCreditLedgerCreationRepo,
-    SqlAlchemyCoachStripeAccountUpdateRepo
+    SqlAlchemyCoachStripeAccountUpdateRepo,
+    SqlAlchemyStripeEventInboxRepo
 )
 
 
@@ -35,3 +36,6 @@ class SqlAlchemyStripeUoW(StripeUoWPort):
         self.coach_stripe_account_update_repo = (
             SqlAlchemyCoachStripeAccountUpdateRepo(session)
         )
+        self.stripe_event_inbox_repo = (
+            SqlAlchemyStripeEventInboxRepo(session)
+        )
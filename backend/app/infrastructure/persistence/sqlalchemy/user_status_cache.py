@@ -0,0 +1,161 @@
+from time import monotonic
+from typing import Callable
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+USER_STATUS_CHANNEL = "app_user_status"
+
+USER_STATUS_CACHE_INFO_KEY = "user_status_cache"
+
+DISABLED = "disabled"
+COACH = "coach"
+
+
+class UserStatusCache:
+    """Process-wide TTL cache of per-user status flags.
+
+    Holds flags that are read on almost every request and change rarely
+    (disabled, coach role). Entries expire after ``ttl_seconds`` and are
+    dropped as soon as a ``USER_STATUS_CHANNEL`` notification names the
+    user, so every worker process converges on the committed state.
+
+    While the notification listener is disconnected the cache is
+    suspended: lookups miss and nothing is stored, because invalidations
+    could be lost.
+
+    A value read from the database is only stored under the
+    ``generation`` read before the query. Every invalidation bumps it,
+    so a read that raced with a status change and its notification
+    cannot put the old value back for ``ttl_seconds``.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 30,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = monotonic
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[str, dict[str, tuple[bool, float]]] = {}
+        self._suspended = False
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, flag: str, user_id: UUID | str) -> bool | None:
+        if self._suspended:
+            self.misses += 1
+            return None
+
+        entry = self._entries.get(str(user_id), {}).get(flag)
+
+        if entry is None or entry[1] <= self._clock():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry[0]
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def put(
+        self,
+        flag: str,
+        user_id: UUID | str,
+        value: bool,
+        generation: int
+    ) -> None:
+        if (
+            self._suspended
+            or self._ttl_seconds <= 0
+            or generation != self._generation
+        ):
+            return
+
+        key = str(user_id)
+
+        if (
+            key not in self._entries
+            and len(self._entries) >= self._max_entries
+        ):
+            self._evict()
+
+        self._entries.setdefault(key, {})[flag] = (
+            value,
+            self._clock() + self._ttl_seconds
+        )
+
+    def invalidate(self, user_id: UUID | str) -> None:
+        self.invalidations += 1
+        self._generation += 1
+        self._entries.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def suspend(self) -> None:
+        self._suspended = True
+        self._generation += 1
+        self._entries.clear()
+
+    def resume(self) -> None:
+        self._suspended = False
+
+    def status(self) -> dict[str, int | bool]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "suspended": self._suspended,
+        }
+
+    def _evict(self) -> None:
+        now = self._clock()
+        expired = [
+            key for key, flags in self._entries.items()
+            if all(expires_at <= now for _, expires_at in flags.values())
+        ]
+
+        for key in expired:
+            del self._entries[key]
+
+        if len(self._entries) >= self._max_entries:
+            # Oldest insertion first: dicts keep insertion order.
+            del self._entries[next(iter(self._entries))]
+
+
+def get_user_status_cache(session: AsyncSession) -> UserStatusCache | None:
+    """Return the user status cache attached to a session, if any.
+
+    Args:
+        session (AsyncSession): Request session.
+
+    Returns:
+        UserStatusCache | None: Cache installed by the session factory.
+    """
+    return session.info.get(USER_STATUS_CACHE_INFO_KEY)
+
+
+def invalidate_user_status(session: AsyncSession, user_id: UUID) -> None:
+    """Drop a user's cached status in this process right away.
+
+    Other processes are invalidated by the trigger notification once the
+    transaction commits.
+
+    Args:
+        session (AsyncSession): Session running the status change.
+        user_id (UUID): User whose status changes.
+    """
+    cache = get_user_status_cache(session)
+
+    if cache is not None:
+        cache.invalidate(user_id)
+
+
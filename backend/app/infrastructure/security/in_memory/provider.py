@@ -13,7 +13,7 @@ from app.infrastructure.security.in_memory.refresh_token_generator import (
 from app.shared.security.jwt_port import JwtPort
 from app.shared.security.password_hasher_port import PasswordHasherPort
 from app.shared.security.token_generator_port import (
-    RefreshTokenGeneratorPort
+    TokenGeneratorPort
 )
 from app.shared.security.token_hasher_port import TokenHasherPort
 
@@ -30,5 +30,5 @@ def get_in_memory_token_hasher() -> TokenHasherPort:
     return InMemoryTokenHasher()
 
 
-def get_in_memory_refresh_token_generator() -> RefreshTokenGeneratorPort:
+def get_in_memory_refresh_token_generator() -> TokenGeneratorPort:
     return InMemoryRefreshTokenGenerator()
@@ -1,9 +1,9 @@
 from app.shared.security.token_generator_port import (
-    RefreshTokenGeneratorPort
+    TokenGeneratorPort
 )
 import secrets
 
 
-class InMemoryRefreshTokenGenerator(RefreshTokenGeneratorPort):
+class InMemoryRefreshTokenGenerator(TokenGeneratorPort):
     def generate(self) -> str:
         return secrets.token_urlsafe(64)
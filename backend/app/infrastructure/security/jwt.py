@@ -1,13 +1,70 @@
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
+from time import time
+from typing import Callable
 from uuid import UUID
 from app.domain.auth.actor_entity import Actor, TokenActor
-from app.domain.auth.permission import ROLE_PERMISSIONS, Permission
+from app.domain.auth.permission import permissions_for
 from app.domain.auth.role import Role
 from app.shared.security.jwt_port import JwtPort
 from jose import jwt, JWTError
 from app.feature.auth.auth_exception import InvalidTokenError
 
 
+class VerifiedTokenCache:
+    """Bounded LRU of access tokens whose signature was already checked.
+
+    Entries are keyed by the full token string, so a hit means the exact
+    same signed bytes were verified before. Each entry keeps the token's
+    ``exp`` claim and is dropped once it is reached, so a cached token
+    never outlives its expiry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[Actor, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> Actor | None:
+        entry = self._entries.get(token)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry[1] <= self._clock():
+            del self._entries[token]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, token: str, actor: Actor, expires_at: float) -> None:
+        if self._max_entries <= 0:
+            return
+
+        self._entries[token] = (actor, expires_at)
+        self._entries.move_to_end(token)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def status(self) -> dict[str, int | bool]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
 class JoseJwt(JwtPort):
     def __init__(
         self,
@@ -16,11 +73,13 @@ class JoseJwt(JwtPort):
         algorithm: str,
         issuer: str,
         access_ttl_seconds: int,
+        verified_cache: VerifiedTokenCache | None = None,
     ):
         self._secret = secret
         self._algorithm = algorithm
         self._issuer = issuer
         self._access_ttl = timedelta(seconds=access_ttl_seconds)
+        self._verified = verified_cache or VerifiedTokenCache()
 
     def issue_access_token(self, *, actor: TokenActor) -> str:
         now = datetime.now(timezone.utc)
@@ -40,6 +99,11 @@ class JoseJwt(JwtPort):
         )
 
     def decode_access_token(self, token: str) -> Actor:
+        actor = self._verified.get(token)
+
+        if actor is not None:
+            return actor
+
         try:
             payload = jwt.decode(
                 token,
@@ -47,15 +111,20 @@ class JoseJwt(JwtPort):
                 algorithms=[self._algorithm],
                 issuer=self._issuer,
             )
-        except JWTError as exc:
+            permissions = permissions_for(Role(r) for r in payload["roles"])
+        except (JWTError, KeyError, ValueError) as exc:
             raise InvalidTokenError() from exc
 
-        permissions: set[Permission] = set()
-        for r in payload["roles"]:
-            permissions |= ROLE_PERMISSIONS[Role(r)]
-
-        return Actor(
+        actor = Actor(
             id=UUID(payload["sub"]),
             type="user",
-            permissions=frozenset(permissions),
+            permissions=permissions,
         )
+
+        if "exp" in payload:
+            self._verified.put(token, actor, float(payload["exp"]))
+
+        return actor
+
+    def cache_status(self) -> dict[str, int | bool]:
+        return self._verified.status()
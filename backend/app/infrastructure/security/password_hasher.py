@@ -1,17 +1,59 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+from app.shared.exceptions.commons import ServiceBusyError
 from app.shared.security.password_hasher_port import PasswordHasherPort
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 
+T = TypeVar("T")
+
 
 class Argon2PasswordHasher(PasswordHasherPort):
-    def __init__(self) -> None:
+    """Argon2 hasher running off the event loop on a bounded thread pool.
+
+    argon2-cffi releases the GIL while hashing, so ``max_workers`` hashes
+    run in parallel while the event loop keeps serving other requests.
+    At most ``max_pending`` more calls may wait for a worker; beyond that
+    the call fails fast with ``ServiceBusyError`` instead of queueing
+    behind a login storm.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 32) -> None:
         self._hasher = PasswordHasher()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="argon2"
+        )
+        self._capacity = max_workers + max_pending
+        self._in_flight = 0
+        self.rejected = 0
+
+    async def hash(self, plain: str) -> str:
+        return await self._submit(lambda: self._hasher.hash(plain))
 
-    def hash(self, plain: str) -> str:
-        return self._hasher.hash(plain)
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._submit(lambda: self._verify(plain, hashed))
 
-    def verify(self, plain: str, hashed: str) -> bool:
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _verify(self, plain: str, hashed: str) -> bool:
         try:
             return self._hasher.verify(hashed, plain)
         except VerifyMismatchError:
             return False
+
+    async def _submit(self, fn: Callable[[], T]) -> T:
+        if self._in_flight >= self._capacity:
+            self.rejected += 1
+            raise ServiceBusyError()
+
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                fn
+            )
+        finally:
+            self._in_flight -= 1
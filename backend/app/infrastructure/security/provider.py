@@ -1,7 +1,8 @@
+import hmac
 from app.domain.auth.actor_entity import Actor
+from app.domain.auth.permission import Permission
+from app.domain.auth.permission_rules import ensure_has_permission
 from app.feature.auth.auth_exception import InvalidTokenError
-from app.infrastructure.security.jwt import JoseJwt
-from app.infrastructure.security.password_hasher import Argon2PasswordHasher
 from app.infrastructure.security.refresh_token_generator import (
     TokenGenerator
 )
@@ -11,13 +12,10 @@ from app.shared.security.token_generator_port import (
     TokenGeneratorPort
 )
 from app.infrastructure.settings.provider import (
-    get_jwt_algorithm,
-    get_jwt_secret,
-    get_jwt_issuer,
-    get_access_token_ttl,
+    get_monitoring_token,
     get_token_hmac_secret,
 )
-from fastapi import Depends, HTTPException
+from fastapi import Depends, HTTPException, Request
 from app.shared.security.token_hasher_port import TokenHasherPort
 from app.infrastructure.security.token_hasher import HmacSha256TokenHasher
 from functools import lru_cache
@@ -28,18 +26,8 @@ def get_token_generator() -> TokenGeneratorPort:
     return TokenGenerator()
 
 
-def get_jwt(
-    secret: str = Depends(get_jwt_secret),
-    algorithm: str = Depends(get_jwt_algorithm),
-    issuer: str = Depends(get_jwt_issuer),
-    access_ttl_seconds: int = Depends(get_access_token_ttl)
-) -> JwtPort:
-    return JoseJwt(
-        secret=secret,
-        algorithm=algorithm,
-        issuer=issuer,
-        access_ttl_seconds=access_ttl_seconds
-    )
+def get_jwt(request: Request) -> JwtPort:
+    return request.app.state.jwt
 
 
 @lru_cache
@@ -49,9 +37,8 @@ def get_token_hasher(
     return HmacSha256TokenHasher(secret)
 
 
-@lru_cache
-def get_password_hasher() -> PasswordHasherPort:
-    return Argon2PasswordHasher()
+def get_password_hasher(request: Request) -> PasswordHasherPort:
+    return request.app.state.password_hasher
 
 
 def get_current_actor(
@@ -66,3 +53,21 @@ def get_current_actor(
             detail="Invalid or expired token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+def require_monitoring_access(
+    token: str = Depends(oauth2_scheme),
+    jwt: JwtPort = Depends(get_jwt),
+    monitoring_token: str | None = Depends(get_monitoring_token)
+) -> None:
+    """Let through the monitoring token, for scrapers, or an admin."""
+    if monitoring_token and hmac.compare_digest(
+        token.encode(),
+        monitoring_token.encode()
+    ):
+        return
+
+    ensure_has_permission(
+        get_current_actor(token, jwt),
+        Permission.ADMIN_READ_METRICS
+    )
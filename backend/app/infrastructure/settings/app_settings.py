@@ -1,7 +1,11 @@
-from typing import no_type_check
+from typing import Literal, no_type_check
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 from urllib.parse import quote_plus
+from app.infrastructure.persistence.sqlalchemy.pool import PoolConfig
+from app.infrastructure.persistence.sqlalchemy.statements import (
+    StatementCacheConfig
+)
 
 
 @no_type_check
@@ -26,14 +30,67 @@ class AppSettings(BaseSettings):
     postgres_app_system: str
     postgres_app_system_password: str
 
+    app_user_pool_size: int = Field(default=5)
+    app_user_pool_max_overflow: int = Field(default=10)
+    app_user_pool_timeout_seconds: float = Field(default=30)
+    app_user_pool_recycle_seconds: int = Field(default=1800)
+    app_user_pool_pre_ping: bool = Field(default=True)
+
+    app_system_pool_size: int = Field(default=10)
+    app_system_pool_max_overflow: int = Field(default=20)
+    app_system_pool_timeout_seconds: float = Field(default=30)
+    app_system_pool_recycle_seconds: int = Field(default=1800)
+    app_system_pool_pre_ping: bool = Field(default=True)
+
+    postgres_prepared_statement_cache_size: int = Field(default=256)
+    postgres_query_cache_size: int = Field(default=500)
+
+    user_status_cache_ttl_seconds: float = Field(default=30)
+    user_status_cache_max_entries: int = Field(default=10_000)
+
+    session_cache_backend: Literal["memory", "memcached"] = Field(
+        default="memory"
+    )
+    session_cache_ttl_seconds: float = Field(default=30)
+    session_cache_max_entries: int = Field(default=2048)
+    session_cache_socket_path: str = Field(
+        default="/run/memcached/memcached.sock"
+    )
+    session_cache_socket_pool_size: int = Field(default=8)
+    session_cache_socket_timeout_seconds: float = Field(default=0.05)
+
+    password_hasher_max_workers: int = Field(default=4)
+    password_hasher_max_pending: int = Field(default=32)
+
+    stripe_inbox_workers: int = Field(default=2)
+    stripe_inbox_poll_seconds: float = Field(default=2)
+    stripe_inbox_max_attempts: int = Field(default=8)
+    stripe_inbox_backoff_seconds: float = Field(default=5)
+    stripe_inbox_max_backoff_seconds: float = Field(default=900)
+    stripe_inbox_lease_seconds: float = Field(default=60)
+
+    participation_sweeper_interval_seconds: float = Field(default=30)
+    participation_sweeper_batch_size: int = Field(default=200)
+    participation_sweeper_max_batches: int = Field(default=50)
+
+    refresh_token_compaction_interval_seconds: float = Field(default=300)
+    refresh_token_compaction_grace_seconds: int = Field(default=86_400)
+    refresh_token_compaction_batch_size: int = Field(default=1000)
+    refresh_token_compaction_max_batches: int = Field(default=100)
+
     jwt_secret: str
     jwt_algorithm: str
     jwt_access_ttl_seconds: int
     jwt_refresh_ttl_seconds: int
     jwt_issuer: str
+    jwt_verified_cache_size: int = Field(default=10_000)
 
     refresh_token_hmac_secret: str
 
+    # Bearer token accepted on /metrics and /health/* besides an admin
+    # access token, for scrapers. Unset, only admins are let through.
+    monitoring_token: str | None = Field(default=None)
+
     stripe_secret_key: str
     stripe_webhook_secret: str
 
@@ -79,3 +136,61 @@ class AppSettings(BaseSettings):
             f"{self.postgres_port}/"
             f"{self.postgres_app_db}"
         )
+
+    def app_system_listen_dsn(self) -> str:
+        """Build the plain asyncpg DSN for the app_system role.
+
+        Used by connections that bypass SQLAlchemy, such as LISTEN.
+
+        Returns:
+            str: PostgreSQL DSN using the app_system credentials.
+        """
+        return self.app_system_dsn().replace(
+            "postgresql+asyncpg://",
+            "postgresql://",
+            1
+        )
+
+    def app_user_pool_config(self) -> PoolConfig:
+        """Build the connection pool sizing for the app_user role.
+
+        Returns:
+            PoolConfig: Pool settings for the app_user engine.
+        """
+        return PoolConfig(
+            pool_size=self.app_user_pool_size,
+            max_overflow=self.app_user_pool_max_overflow,
+            timeout_seconds=self.app_user_pool_timeout_seconds,
+            recycle_seconds=self.app_user_pool_recycle_seconds,
+            pre_ping=self.app_user_pool_pre_ping,
+        )
+
+    def app_system_pool_config(self) -> PoolConfig:
+        """Build the connection pool sizing for the app_system role.
+
+        The system role serves auth, registration and webhooks, so it
+        defaults to a larger pool than the app_user role.
+
+        Returns:
+            PoolConfig: Pool settings for the app_system engine.
+        """
+        return PoolConfig(
+            pool_size=self.app_system_pool_size,
+            max_overflow=self.app_system_pool_max_overflow,
+            timeout_seconds=self.app_system_pool_timeout_seconds,
+            recycle_seconds=self.app_system_pool_recycle_seconds,
+            pre_ping=self.app_system_pool_pre_ping,
+        )
+
+    def statement_cache_config(self) -> StatementCacheConfig:
+        """Build the statement cache sizing shared by both roles.
+
+        Returns:
+            StatementCacheConfig: Statement cache settings for the engines.
+        """
+        return StatementCacheConfig(
+            prepared_statement_cache_size=(
+                self.postgres_prepared_statement_cache_size
+            ),
+            query_cache_size=self.postgres_query_cache_size,
+        )
@@ -2,6 +2,9 @@ from typing import AsyncGenerator
 from fastapi import Request
 from sqlalchemy.ext.asyncio.session import AsyncSession
 from app.infrastructure.settings.app_settings import AppSettings
+from app.infrastructure.persistence.sqlalchemy.uow.predicate_memo import (
+    hint_predicate_params
+)
 import stripe
 
 
@@ -33,6 +36,10 @@ def get_token_hmac_secret(request: Request) -> str:
     return request.app.state.settings.refresh_token_hmac_secret
 
 
+def get_monitoring_token(request: Request) -> str | None:
+    return request.app.state.settings.monitoring_token
+
+
 def get_session_participation_ttl(request: Request) -> int:
     return request.app.state.settings.session_participation_ttl_seconds
 
@@ -57,6 +64,7 @@ async def get_app_user_session(
     request: Request,
 ) -> AsyncGenerator[AsyncSession, None]:
     session: AsyncSession = request.app.state.app_user_session_factory()
+    hint_predicate_params(session, request.path_params)
     try:
         yield session
         await session.commit()
@@ -71,6 +79,7 @@ async def get_app_system_session(
     request: Request
 ) -> AsyncGenerator[AsyncSession, None]:
     session: AsyncSession = request.app.state.app_system_session_factory()
+    hint_predicate_params(session, request.path_params)
     try:
         yield session
         await session.commit()
@@ -1,7 +1,9 @@
 from contextlib import asynccontextmanager
+from dataclasses import asdict
+from typing import Any
 from fastapi.middleware.cors import CORSMiddleware
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, Response
 from sqlalchemy import text
 
 from app.infrastructure.settings.app_settings import AppSettings
@@ -9,9 +11,50 @@ from app.infrastructure.persistence.sqlalchemy.engines import (
     create_app_engine,
     create_system_engine,
 )
+from app.infrastructure.persistence.sqlalchemy.pool import (
+    engines_pool_status
+)
 from app.infrastructure.persistence.sqlalchemy.sessions import (
     create_session_factory,
 )
+from app.infrastructure.persistence.sqlalchemy.statements import (
+    STATEMENTS,
+    statement_cache_status
+)
+from app.infrastructure.persistence.sqlalchemy.user_status_cache import (
+    USER_STATUS_CHANNEL,
+    UserStatusCache
+)
+from app.infrastructure.persistence.sqlalchemy.session_listing_cache import (
+    SESSION_LISTING_CHANNEL,
+    SessionListingCache
+)
+from app.infrastructure.persistence.sqlalchemy.notification_listener import (
+    CacheInvalidationListener
+)
+from app.infrastructure.metrics.prometheus import CONTENT_TYPE, METRICS
+from app.infrastructure.metrics.request_metrics import MetricsMiddleware
+from app.infrastructure.cache.lru_cache_backend import LruCacheBackend
+from app.shared.cache.cache_backend_port import CacheBackendPort
+from app.infrastructure.cache.memcached_socket_backend import (
+    MemcachedSocketBackend
+)
+from app.infrastructure.persistence.sqlalchemy.stripe_inbox_worker import (
+    StripeInboxWorker
+)
+from app.infrastructure.persistence.sqlalchemy.participation_sweeper import (
+    ParticipationSweeper
+)
+from app.infrastructure.persistence.sqlalchemy.refresh_token_compactor import (
+    RefreshTokenCompactor
+)
+from app.infrastructure.persistence.sqlalchemy.uow.stripe.stripe_uow import (
+    SqlAlchemyStripeUoW
+)
+from app.feature.stripe.stripe_dependencies import get_stripe_service
+from app.infrastructure.security.password_hasher import Argon2PasswordHasher
+from app.infrastructure.security.jwt import JoseJwt, VerifiedTokenCache
+from app.infrastructure.security.provider import require_monitoring_access
 from app.feature.auth.auth_router import router as auth_router
 from app.feature.admin.users.admin_users_router import (
     router as admin_users_router
@@ -26,6 +69,7 @@ from app.feature.admin.credit.admin_credit_router import (
     router as admin_credit_router
 )
 from app.shared.handlers import register_exception_handlers
+from app.shared.utils.json_response import FastJSONResponse
 import logging
 import stripe
 
@@ -53,8 +97,17 @@ async def lifespan(api: FastAPI):
     """
     settings = AppSettings()  # pyright: ignore[reportCallIssue]
 
-    app_user_engine = create_app_engine(settings.app_user_dsn())
-    app_system_engine = create_system_engine(settings.app_system_dsn())
+    app_user_engine = create_app_engine(
+        settings.app_user_dsn(),
+        settings.app_user_pool_config(),
+        settings.statement_cache_config()
+    )
+    app_system_engine = create_system_engine(
+        settings.app_system_dsn(),
+        settings.app_system_pool_config(),
+        settings.statement_cache_config()
+    )
+    STATEMENTS.compile_all(app_user_engine.dialect)
     stripe.api_key = settings.stripe_secret_key
     stripe_client = stripe.StripeClient(
         api_key=settings.stripe_secret_key
@@ -72,24 +125,116 @@ async def lifespan(api: FastAPI):
     except Exception as exc:
         raise RuntimeError("app_system DB connection failed") from exc
 
+    user_status_cache = UserStatusCache(
+        ttl_seconds=settings.user_status_cache_ttl_seconds,
+        max_entries=settings.user_status_cache_max_entries
+    )
+    session_cache_backend: CacheBackendPort
+
+    if settings.session_cache_backend == "memcached":
+        session_cache_backend = MemcachedSocketBackend(
+            settings.session_cache_socket_path,
+            pool_size=settings.session_cache_socket_pool_size,
+            timeout_seconds=settings.session_cache_socket_timeout_seconds
+        )
+    else:
+        session_cache_backend = LruCacheBackend(
+            max_entries=settings.session_cache_max_entries
+        )
+    session_listing_cache = SessionListingCache(
+        session_cache_backend,
+        ttl_seconds=settings.session_cache_ttl_seconds
+    )
+    cache_listener = CacheInvalidationListener(
+        settings.app_system_listen_dsn(),
+        {
+            USER_STATUS_CHANNEL: user_status_cache,
+            SESSION_LISTING_CHANNEL: session_listing_cache,
+        }
+    )
+    cache_listener.start()
+
     api.state.settings = settings
     api.state.stripe_client = stripe_client
     api.state.app_user_engine = app_user_engine
     api.state.app_system_engine = app_system_engine
+    api.state.user_status_cache = user_status_cache
+    api.state.session_listing_cache = session_listing_cache
+    api.state.password_hasher = Argon2PasswordHasher(
+        max_workers=settings.password_hasher_max_workers,
+        max_pending=settings.password_hasher_max_pending
+    )
+    api.state.jwt = JoseJwt(
+        secret=settings.jwt_secret,
+        algorithm=settings.jwt_algorithm,
+        issuer=settings.jwt_issuer,
+        access_ttl_seconds=settings.jwt_access_ttl_seconds,
+        verified_cache=VerifiedTokenCache(
+            max_entries=settings.jwt_verified_cache_size
+        )
+    )
     api.state.app_user_session_factory = create_session_factory(
-        app_user_engine
+        app_user_engine,
+        user_status_cache,
+        session_listing_cache
     )
     api.state.app_system_session_factory = create_session_factory(
-        app_system_engine
+        app_system_engine,
+        user_status_cache,
+        session_listing_cache
+    )
+
+    stripe_inbox_worker = StripeInboxWorker(
+        api.state.app_system_session_factory,
+        get_stripe_service(),
+        stripe_client,
+        concurrency=settings.stripe_inbox_workers,
+        poll_seconds=settings.stripe_inbox_poll_seconds,
+        max_attempts=settings.stripe_inbox_max_attempts,
+        backoff_seconds=settings.stripe_inbox_backoff_seconds,
+        max_backoff_seconds=settings.stripe_inbox_max_backoff_seconds,
+        lease_seconds=settings.stripe_inbox_lease_seconds
+    )
+    stripe_inbox_worker.start()
+    api.state.stripe_inbox_worker = stripe_inbox_worker
+
+    participation_sweeper = ParticipationSweeper(
+        api.state.app_system_session_factory,
+        get_stripe_service(),
+        stripe_client,
+        interval_seconds=settings.participation_sweeper_interval_seconds,
+        batch_size=settings.participation_sweeper_batch_size,
+        max_batches=settings.participation_sweeper_max_batches
     )
+    participation_sweeper.start()
+    api.state.participation_sweeper = participation_sweeper
+
+    refresh_token_compactor = RefreshTokenCompactor(
+        api.state.app_system_session_factory,
+        interval_seconds=settings.refresh_token_compaction_interval_seconds,
+        grace_seconds=settings.refresh_token_compaction_grace_seconds,
+        batch_size=settings.refresh_token_compaction_batch_size,
+        max_batches=settings.refresh_token_compaction_max_batches
+    )
+    refresh_token_compactor.start()
+    api.state.refresh_token_compactor = refresh_token_compactor
 
     yield
 
+    await refresh_token_compactor.stop()
+    await participation_sweeper.stop()
+    await stripe_inbox_worker.stop()
+    api.state.password_hasher.shutdown()
+    await cache_listener.stop()
+    await session_cache_backend.close()
     await app_user_engine.dispose()
     await app_system_engine.dispose()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -101,6 +246,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost, so the latency includes every other middleware.
+app.add_middleware(MetricsMiddleware)
 
 register_exception_handlers(app)
 
@@ -116,6 +263,11 @@ app.include_router(admin_session_router)
 app.include_router(admin_payment_router)
 app.include_router(admin_credit_router)
 
+# Probes below /health/ and the metrics expose internals: only the
+# monitoring token or an admin may read them. /health stays open for
+# container liveness checks.
+MONITORING = [Depends(require_monitoring_access)]
+
 
 @app.get("/health", include_in_schema=False)
 async def health() -> dict[str, str]:
@@ -133,3 +285,140 @@ async def health() -> dict[str, str]:
     This endpoint MUST remain fast, side-effect free, and always available.
     """
     return {"status": "ok"}
+
+
+@app.get(
+    "/health/pools",
+    include_in_schema=False,
+    dependencies=MONITORING
+)
+async def pool_health(request: Request) -> dict[str, dict[str, int | float]]:
+    """
+    Connection pool probe endpoint.
+
+    Returns the live pool gauges (size, checked out, overflow) and the
+    cumulative acquisition counters (checkouts, timeouts, wait time) of
+    the app_user and app_system engines, to size pools from real load.
+
+    This endpoint performs no database round trip.
+    """
+    return engines_pool_status({
+        "app_user": request.app.state.app_user_engine,
+        "app_system": request.app.state.app_system_engine,
+    })
+
+
+@app.get(
+    "/health/statements",
+    include_in_schema=False,
+    dependencies=MONITORING
+)
+async def statement_health(request: Request) -> dict[str, dict[str, int]]:
+    """
+    Statement cache probe endpoint.
+
+    Returns the number of registered repository statements and the
+    cumulative hit/miss counters of the SQLAlchemy compiled cache and of
+    the asyncpg prepared statement cache, per engine.
+
+    This endpoint performs no database round trip.
+    """
+    return {
+        "app_user": statement_cache_status(
+            request.app.state.app_user_engine
+        ),
+        "app_system": statement_cache_status(
+            request.app.state.app_system_engine
+        ),
+    }
+
+
+@app.get(
+    "/health/caches",
+    include_in_schema=False,
+    dependencies=MONITORING
+)
+async def cache_health(request: Request) -> dict[str, dict[str, Any]]:
+    """
+    In-process cache probe endpoint.
+
+    Returns the size and hit/miss/invalidation counters of the user
+    status cache, and whether it is suspended because its invalidation
+    listener is disconnected, plus the verified access token cache and
+    the public session cache (hit ratio and age of the pages served).
+
+    This endpoint performs no database round trip.
+    """
+    return {
+        "user_status": request.app.state.user_status_cache.status(),
+        "jwt": request.app.state.jwt.cache_status(),
+        "sessions": request.app.state.session_listing_cache.status(),
+    }
+
+
+@app.get(
+    "/health/webhooks",
+    include_in_schema=False,
+    dependencies=MONITORING
+)
+async def webhook_health(request: Request) -> dict[str, dict[str, Any]]:
+    """
+    Stripe webhook inbox probe endpoint.
+
+    Returns the inbox depth (pending, due, dead events) and lag (age of
+    the oldest pending event in seconds), plus the processed/retried/dead
+    counters of this process's inbox workers.
+
+    This endpoint performs one database round trip.
+    """
+    async with request.app.state.app_system_session_factory() as session:
+        stats = await SqlAlchemyStripeUoW(
+            session
+        ).stripe_event_inbox_repo.stats()
+
+    return {
+        "inbox": asdict(stats),
+        "workers": request.app.state.stripe_inbox_worker.status(),
+    }
+
+
+@app.get(
+    "/health/sweeper",
+    include_in_schema=False,
+    dependencies=MONITORING
+)
+async def sweeper_health(request: Request) -> dict[str, dict[str, Any]]:
+    """
+    Background cleanup probe endpoint.
+
+    Returns, for this process since startup, the registrations released,
+    payment intents cancelled and checkouts expired by the participation
+    sweeper, and the dead refresh tokens deleted by the compaction job,
+    each with the row counts and duration of its last pass.
+
+    This endpoint performs no database round trip.
+    """
+    return {
+        "participations": request.app.state.participation_sweeper.status(),
+        "refresh_tokens": request.app.state.refresh_token_compactor.status(),
+    }
+
+
+@app.get(
+    "/metrics",
+    include_in_schema=False,
+    dependencies=MONITORING
+)
+async def metrics() -> Response:
+    """
+    Prometheus scrape endpoint.
+
+    Returns, in the Prometheus text format, the HTTP request latency
+    histograms labelled by route template and status, the database
+    round trips per request, and the statement duration histograms of
+    the app_user and app_system engines labelled by statement
+    fingerprint, with the normalized SQL of each fingerprint.
+
+    This endpoint performs no database round trip.
+    """
+    return Response(METRICS.render(), media_type=CONTENT_TYPE)
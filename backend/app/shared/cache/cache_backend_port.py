@@ -0,0 +1,19 @@
+from typing import Protocol
+
+
+class CacheUnavailableError(Exception):
+    """Raised by a cache backend that cannot serve a command."""
+
+
+class CacheBackendPort(Protocol):
+    """Key value store for serialized entries and integer counters."""
+
+    async def get(self, key: str) -> bytes | None: ...
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl_seconds: float
+    ) -> None: ...
+    async def incr(self, key: str, delta: int = 1) -> int: ...
+    async def close(self) -> None: ...
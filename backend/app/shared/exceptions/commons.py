@@ -8,3 +8,11 @@ class ForbiddenError(Exception):
 
 class NotFoundError(Exception):
     pass
+
+
+class InvalidCursorError(Exception):
+    pass
+
+
+class ServiceBusyError(Exception):
+    pass
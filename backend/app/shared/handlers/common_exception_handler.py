@@ -4,7 +4,9 @@ from fastapi.responses import JSONResponse
 from app.shared.exceptions.commons import (
     UnauthorizedError,
     ForbiddenError,
-    NotFoundError
+    InvalidCursorError,
+    NotFoundError,
+    ServiceBusyError
 )
 import logging
 
@@ -77,3 +79,48 @@ def register_exception_handler(app: FastAPI):
             },
             status_code=404
         )
+
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor(
+        request: Request,
+        exc: InvalidCursorError
+    ) -> JSONResponse:
+        logger.info(
+            "Invalid cursor",
+            extra={
+                "error": exc.__class__.__name__,
+                "path": str(request.url.path),
+                "client": request.client.host if request.client else None,
+            }
+        )
+
+        return JSONResponse(
+            content={
+                "code": "invalid_cursor",
+                "error": "Invalid pagination cursor"
+            },
+            status_code=400
+        )
+
+    @app.exception_handler(ServiceBusyError)
+    async def service_busy(
+        request: Request,
+        exc: ServiceBusyError
+    ) -> JSONResponse:
+        logger.warning(
+            "Service busy",
+            extra={
+                "error": exc.__class__.__name__,
+                "path": str(request.url.path),
+                "client": request.client.host if request.client else None,
+            }
+        )
+
+        return JSONResponse(
+            content={
+                "code": "service_busy",
+                "error": "Service is busy, retry later"
+            },
+            status_code=503,
+            headers={"Retry-After": "1"}
+        )
@@ -0,0 +1,2 @@
+DEFAULT_SESSION_CAPACITY = 6
+MIN_SESSION_CAPACITY = 1
@@ -2,5 +2,5 @@ from typing import Protocol
 
 
 class PasswordHasherPort(Protocol):
-    def hash(self, plain: str) -> str: ...
-    def verify(self, plain: str, hashed: str) -> bool: ...
+    async def hash(self, plain: str) -> str: ...
+    async def verify(self, plain: str, hashed: str) -> bool: ...
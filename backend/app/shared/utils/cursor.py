@@ -0,0 +1,85 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol, Sequence
+from uuid import UUID
+from app.shared.exceptions.commons import InvalidCursorError
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Keyset position in a list ordered by ``(created_at, id)`` DESC."""
+    created_at: datetime
+    id: UUID
+
+
+class _Keyed(Protocol):
+    @property
+    def id(self) -> UUID:
+        ...
+
+    @property
+    def created_at(self) -> datetime:
+        ...
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    payload = json.dumps(
+        [cursor.created_at.isoformat(), str(cursor.id)],
+        separators=(",", ":")
+    )
+
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str | None) -> Cursor | None:
+    """Decode an opaque cursor received from a client.
+
+    Args:
+        token (str | None): Cursor returned as ``next_cursor``.
+
+    Raises:
+        InvalidCursorError: If the token was not produced by
+            ``encode_cursor``.
+
+    Returns:
+        Cursor | None: Decoded position, ``None`` when no token is given.
+    """
+    if token is None:
+        return None
+
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+
+        cursor = Cursor(
+            created_at=datetime.fromisoformat(created_at),
+            id=UUID(id)
+        )
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise InvalidCursorError() from exc
+
+    if cursor.created_at.tzinfo is None:
+        raise InvalidCursorError()
+
+    return cursor
+
+
+def next_cursor(items: Sequence[_Keyed], has_more: bool) -> str | None:
+    """Build the cursor of the page following ``items``.
+
+    Args:
+        items (Sequence[_Keyed]): Current page, in keyset order.
+        has_more (bool): Whether another page exists.
+
+    Returns:
+        str | None: Opaque cursor, ``None`` on the last page.
+    """
+    if not has_more or not items:
+        return None
+
+    last = items[-1]
+
+    return encode_cursor(Cursor(created_at=last.created_at, id=last.id))
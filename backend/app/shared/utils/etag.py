@@ -0,0 +1,76 @@
+from hashlib import blake2b
+from fastapi import Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Build a weak entity tag from the version of a representation.
+
+    Args:
+        *parts (object): Everything the representation depends on: the
+            route, its query parameters and the database version.
+
+    Returns:
+        str: Weak ``ETag`` header value.
+    """
+    digest = blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Whether an ``If-None-Match`` header matches ``etag``.
+
+    Uses the weak comparison required for ``If-None-Match``: the ``W/``
+    prefix is ignored on both sides.
+
+    Args:
+        if_none_match (str | None): Raw request header.
+        etag (str): Current entity tag of the representation.
+
+    Returns:
+        bool: ``True`` when the client copy is current.
+    """
+    if if_none_match is None:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    current = _opaque_tag(etag)
+
+    return any(
+        _opaque_tag(tag) == current
+        for tag in if_none_match.split(",")
+    )
+
+
+def set_etag(response: Response, etag: str, private: bool = False) -> None:
+    """Send ``etag`` and ask clients to revalidate before reusing a copy.
+
+    Args:
+        response (Response): Response being built.
+        etag (str): Entity tag of the representation.
+        private (bool): Whether the representation is user specific and
+            must not be stored by shared caches.
+    """
+    response.headers.update(_validator_headers(etag, private))
+
+
+def not_modified(etag: str, private: bool = False) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=_validator_headers(etag, private)
+    )
+
+
+def _validator_headers(etag: str, private: bool) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache" if private else "no-cache",
+    }
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+
+    return tag[2:] if tag.startswith("W/") else tag
@@ -0,0 +1,118 @@
+import csv
+import io
+import zlib
+from typing import AsyncIterable, AsyncIterator, Literal
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+ExportFormat = Literal["csv", "ndjson"]
+
+_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+# Rows are flushed to the client in chunks of about this size.
+_CHUNK_BYTES = 64 * 1024
+
+
+def export_response(
+    rows: AsyncIterable[BaseModel],
+    model: type[BaseModel],
+    format: ExportFormat,
+    filename: str,
+    accept_encoding: str | None = None
+) -> StreamingResponse:
+    """Stream ``rows`` as a CSV or NDJSON download.
+
+    Rows are encoded as they are read, so memory use does not depend on
+    the size of the export. The body is gzip compressed on the fly when
+    the client accepts it.
+
+    Args:
+        rows (AsyncIterable[BaseModel]): Rows to export, typically read
+            through a server-side cursor.
+        model (type[BaseModel]): Row model; its fields are the CSV
+            columns.
+        format (ExportFormat): ``csv`` or ``ndjson``.
+        filename (str): Download name, without extension.
+        accept_encoding (str | None): Raw ``Accept-Encoding`` header.
+
+    Returns:
+        StreamingResponse: Attachment response.
+    """
+    body = _encode(rows, list(model.model_fields), format)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}.{format}"',
+        "Cache-Control": "no-store",
+        "Vary": "Accept-Encoding",
+    }
+
+    if accepts_gzip(accept_encoding):
+        body = _gzip(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        body,
+        media_type=_MEDIA_TYPES[format],
+        headers=headers
+    )
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    if not accept_encoding:
+        return False
+
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+
+        q = params.strip().removeprefix("q=").strip()
+        try:
+            return not q or float(q) > 0
+        except ValueError:
+            return False
+
+    return False
+
+
+async def _encode(
+    rows: AsyncIterable[BaseModel],
+    fields: list[str],
+    format: ExportFormat
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+
+    if format == "csv":
+        writer.writerow(fields)
+
+    async for row in rows:
+        if format == "csv":
+            values = row.model_dump(mode="json")
+            writer.writerow(values[field] for field in fields)
+        else:
+            buffer.write(row.model_dump_json())
+            buffer.write("\n")
+
+        if buffer.tell() >= _CHUNK_BYTES:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    # wbits=31 writes the gzip header and trailer around the deflate data.
+    compressor = zlib.compressobj(wbits=31)
+
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
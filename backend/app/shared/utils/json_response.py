@@ -0,0 +1,63 @@
+from typing import Any, Mapping, Sequence
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# OPT_UTC_Z renders UTC datetimes with a "Z" suffix, as pydantic does.
+_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    orjson encodes dataclasses, dicts, UUIDs and datetimes natively;
+    pydantic models are dumped through their compiled serializer.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+def page_response(
+    items: Sequence[Any],
+    limit: int,
+    offset: int,
+    has_more: bool,
+    next_cursor: str | None,
+    headers: Mapping[str, str] | None = None
+) -> FastJSONResponse:
+    """Encode a page of trusted service rows without revalidating them.
+
+    Returning a response skips the route ``response_model``, which is
+    then only the documented schema: ``items`` must already have its
+    shape. Rows are plain dicts or dataclasses built from repository
+    entities, so no model is constructed per row.
+
+    Args:
+        items (Sequence[Any]): Page rows.
+        limit (int): Requested page size.
+        offset (int): Requested offset.
+        has_more (bool): Whether another page follows.
+        next_cursor (str | None): Keyset cursor of the next page.
+        headers (Mapping[str, str] | None): Extra response headers.
+
+    Returns:
+        FastJSONResponse: Paginated response body.
+    """
+    return FastJSONResponse(
+        {
+            "items": items,
+            "limit": limit,
+            "offset": offset,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
+        },
+        headers=headers
+    )
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.__pydantic_serializer__.to_python(value, mode="json")
+
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
@@ -0,0 +1,66 @@
+"""Per-request CPU spent turning a bearer token into an ``Actor``.
+
+Compares the former path (a fresh ``JoseJwt`` per request, full signature
+check and permission rebuild) with the lifespan singleton that serves a
+reused token from its verified-token cache. No server is needed.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.jwt_verification --iterations 20000
+"""
+import argparse
+from time import perf_counter
+from uuid import uuid4
+from app.domain.auth.actor_entity import TokenActor
+from app.domain.auth.role import Role
+from app.infrastructure.security.jwt import JoseJwt, VerifiedTokenCache
+
+_SETTINGS = {
+    "secret": "benchmark-secret",
+    "algorithm": "HS256",
+    "issuer": "benchmark",
+    "access_ttl_seconds": 900,
+}
+
+
+def _run(label: str, decode, iterations: int) -> float:
+    start = perf_counter()
+    for _ in range(iterations):
+        decode()
+    elapsed = perf_counter() - start
+
+    per_call = elapsed / iterations * 1_000_000
+    print(f"{label:<12} {per_call:8.2f} us/request")
+
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    singleton = JoseJwt(**_SETTINGS)
+    token = singleton.issue_access_token(
+        actor=TokenActor(id=uuid4(), roles=[Role.USER, Role.COACH])
+    )
+
+    per_request = _run(
+        "per request",
+        lambda: JoseJwt(
+            **_SETTINGS,
+            verified_cache=VerifiedTokenCache(max_entries=0)
+        ).decode_access_token(token),
+        args.iterations
+    )
+    cached = _run(
+        "cached",
+        lambda: singleton.decode_access_token(token),
+        args.iterations
+    )
+
+    print(f"speedup      {per_request / cached:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""HTTP load harness for the FastAPI app.
+
+Runs scripted scenarios against ``app.main:app`` in process, through
+``httpx.ASGITransport`` with the application lifespan entered, or
+against a running server, and records per route throughput and
+p50/p95/p99 latencies into a JSON file comparable across commits.
+
+See ``python -m benchmarks.load --help``.
+"""
@@ -0,0 +1,136 @@
+"""Per route latency samples, percentiles and JSON reports."""
+import json
+import subprocess
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from math import ceil
+from pathlib import Path
+from typing import Any
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """Nearest-rank percentile of ``samples``, 0.0 when empty."""
+    if not samples:
+        return 0.0
+
+    ordered = sorted(samples)
+
+    return ordered[max(ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+@dataclass(slots=True)
+class RouteSamples:
+    """Latencies in seconds and status codes of one route."""
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter[int] = field(default_factory=Counter)
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        count = len(self.latencies)
+        summary: dict[str, Any] = {
+            "count": count,
+            "rps": count / elapsed if elapsed else 0.0,
+            "statuses": {
+                str(status): n for status, n in sorted(self.statuses.items())
+            },
+        }
+
+        for p in PERCENTILES:
+            summary[f"p{p}_ms"] = percentile(self.latencies, p) * 1000
+
+        summary["max_ms"] = max(self.latencies, default=0.0) * 1000
+
+        return summary
+
+
+@dataclass
+class Recorder:
+    """Samples of one scenario, keyed by ``"METHOD /route/template"``."""
+    routes: dict[str, RouteSamples] = field(default_factory=dict)
+
+    def record(self, route: str, status: int, seconds: float) -> None:
+        samples = self.routes.get(route)
+
+        if samples is None:
+            samples = self.routes[route] = RouteSamples()
+
+        samples.latencies.append(seconds)
+        samples.statuses[status] += 1
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        total = sum(len(s.latencies) for s in self.routes.values())
+
+        return {
+            "requests": total,
+            "elapsed_s": elapsed,
+            "rps": total / elapsed if elapsed else 0.0,
+            "routes": {
+                route: samples.summary(elapsed)
+                for route, samples in sorted(self.routes.items())
+            },
+        }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(
+    path: Path,
+    config: dict[str, Any],
+    scenarios: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    report = {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "config": config,
+        "scenarios": scenarios,
+    }
+    path.write_text(json.dumps(report, indent=2) + "\n")
+
+    return report
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float
+) -> list[str]:
+    """Routes whose p95 grew, or throughput dropped, by more than
+    ``threshold`` (a ratio) since ``baseline``."""
+    regressions = []
+
+    for name, scenario in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name, {}).get("routes", {})
+
+        for route, now in scenario["routes"].items():
+            old = before.get(route)
+
+            if old is None:
+                continue
+
+            if old["p95_ms"] and now["p95_ms"] > old["p95_ms"] * (
+                1 + threshold
+            ):
+                regressions.append(
+                    f"{name} {route}: p95 {old['p95_ms']:.1f}ms -> "
+                    f"{now['p95_ms']:.1f}ms"
+                )
+
+            if now["rps"] < old["rps"] * (1 - threshold):
+                regressions.append(
+                    f"{name} {route}: {old['rps']:.0f} -> "
+                    f"{now['rps']:.0f} req/s"
+                )
+
+    return regressions
@@ -0,0 +1,204 @@
+"""Scripted load scenarios.
+
+Each scenario performs its unrecorded setup (logins) and returns the
+jobs to run, each job issuing one or more recorded requests. Routes
+are recorded under their template, like ``"GET /sessions/{session_id}"``.
+"""
+import asyncio
+from dataclasses import dataclass
+from itertools import cycle
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+import httpx
+from benchmarks.load.recorder import Recorder
+from benchmarks.load.seed import PASSWORD, LoadFixture
+from benchmarks.load.stripe_stub import account_updated, sign
+
+Job = Callable[[], Awaitable[None]]
+
+# Stays within the password hasher's default workers + pending slots.
+SETUP_LOGINS = 8
+
+
+@dataclass
+class Harness:
+    client: httpx.AsyncClient
+    fixture: LoadFixture
+    recorder: Recorder
+    requests: int
+    webhook_secret: str
+
+    async def call(
+        self,
+        route: str,
+        url: str,
+        **kwargs: Any
+    ) -> httpx.Response:
+        method = route.split(" ", 1)[0]
+        start = perf_counter()
+        response = await self.client.request(method, url, **kwargs)
+        self.recorder.record(
+            route,
+            response.status_code,
+            perf_counter() - start
+        )
+
+        return response
+
+    async def login(self, email: str) -> str:
+        """Access token of ``email``, outside of the recorded requests."""
+        response = await self.client.post(
+            "/auth/login",
+            json={"email": email, "password": PASSWORD}
+        )
+        response.raise_for_status()
+
+        return response.json()["access_token"]
+
+    async def login_all(self, emails: list[str]) -> list[str]:
+        slots = asyncio.Semaphore(SETUP_LOGINS)
+
+        async def login(email: str) -> str:
+            async with slots:
+                return await self.login(email)
+
+        return await asyncio.gather(*(login(email) for email in emails))
+
+
+def _bearer(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+async def browse(h: Harness) -> list[Job]:
+    """Anonymous browsing: the first listing page, then one session."""
+    session_ids = cycle(h.fixture.browse_session_ids)
+
+    async def job() -> None:
+        await h.call("GET /sessions/", "/sessions/", params={"limit": 20})
+        await h.call(
+            "GET /sessions/{session_id}",
+            f"/sessions/{next(session_ids)}"
+        )
+
+    return [job] * h.requests
+
+
+async def login_refresh(h: Harness) -> list[Job]:
+    """Login followed by two refresh token rotations.
+
+    The refresh token is passed explicitly: the login cookie is scoped
+    to ``/refresh`` and the client keeps no cookies.
+    """
+    emails = cycle(h.fixture.user_emails)
+
+    async def job() -> None:
+        response = await h.call(
+            "POST /auth/login",
+            "/auth/login",
+            json={"email": next(emails), "password": PASSWORD}
+        )
+
+        for _ in range(2):
+            token = response.cookies.get("refresh_token")
+
+            if token is None:
+                return
+
+            response = await h.call(
+                "POST /auth/refresh",
+                "/auth/refresh",
+                headers={"Cookie": f"refresh_token={token}"}
+            )
+
+    return [job] * h.requests
+
+
+async def registration_rush(h: Harness) -> list[Job]:
+    """Every user registers to the same free session at once."""
+    tokens = await h.login_all(h.fixture.user_emails)
+    url = f"/sessions/{h.fixture.rush_session_id}/register"
+
+    def job(token: str) -> Job:
+        async def register() -> None:
+            await h.call(
+                "POST /sessions/{session_id}/register",
+                url,
+                headers=_bearer(token)
+            )
+
+        return register
+
+    return [job(token) for token in tokens]
+
+
+async def attendance(h: Harness) -> list[Job]:
+    """The coach submits attendance once for each started session."""
+    headers = _bearer(await h.login(h.fixture.coach_email))
+    body = {"attendance": [
+        {"user_id": str(user_id), "attended": True}
+        for user_id in h.fixture.participant_ids
+    ]}
+
+    def job(session_id: str) -> Job:
+        async def submit() -> None:
+            await h.call(
+                "PUT /sessions/{session_id}/attendance",
+                f"/sessions/{session_id}/attendance",
+                json=body,
+                headers=headers
+            )
+
+        return submit
+
+    return [job(str(s)) for s in h.fixture.attendance_session_ids]
+
+
+async def webhooks(h: Harness) -> list[Job]:
+    """Burst of signed ``account.updated`` deliveries for the coach."""
+    payloads = [
+        account_updated(
+            f"{h.fixture.event_prefix}{i}",
+            h.fixture.account_id
+        ) for i in range(h.requests)
+    ]
+
+    def job(payload: str) -> Job:
+        async def deliver() -> None:
+            await h.call(
+                "POST /stripe/event",
+                "/stripe/event",
+                content=payload,
+                headers={
+                    "Content-Type": "application/json",
+                    "Stripe-Signature": sign(payload, h.webhook_secret),
+                }
+            )
+
+        return deliver
+
+    return [job(payload) for payload in payloads]
+
+
+SCENARIOS: dict[str, Callable[[Harness], Awaitable[list[Job]]]] = {
+    "browse": browse,
+    "login_refresh": login_refresh,
+    "registration_rush": registration_rush,
+    "attendance": attendance,
+    "webhooks": webhooks,
+}
+
+
+async def run_jobs(jobs: list[Job], concurrency: int) -> float:
+    """Run ``jobs`` on ``concurrency`` workers; returns the wall time."""
+    pending = iter(jobs)
+
+    async def worker() -> None:
+        for job in pending:
+            await job()
+
+    start = perf_counter()
+    await asyncio.gather(*(
+        worker() for _ in range(max(min(concurrency, len(jobs)), 1))
+    ))
+
+    return perf_counter() - start
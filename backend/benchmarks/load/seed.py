@@ -0,0 +1,216 @@
+"""Fixture rows for the load scenarios, seeded and removed through a
+role that bypasses RLS.
+
+Sessions are placed in random far-off slots, one hour apart, since the
+overlap exclusion constraint spans every coach. Attendance is recorded
+once per session and only after it starts, while registration closes
+at the start: attendance sessions are seeded in the future with their
+participants, then moved into the past in one update.
+"""
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+from argon2 import PasswordHasher
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.sql.expression import text
+
+PASSWORD = "load-test-password"
+
+INSERT_USERS = text("""
+    INSERT INTO app.users (id, email, password_hash)
+    SELECT id, email, :password_hash
+    FROM unnest(CAST(:ids AS uuid[]), CAST(:emails AS text[]))
+        AS u(id, email)
+""")
+
+INSERT_PROFILES = text("""
+    INSERT INTO app.user_profiles (user_id, first_name, last_name)
+    SELECT id, 'Load', 'User ' || left(id::text, 8)
+    FROM unnest(CAST(:ids AS uuid[])) AS id
+""")
+
+INSERT_ROLES = text("""
+    INSERT INTO app.user_roles (user_id, role_id)
+    SELECT u.id, r.id
+    FROM unnest(CAST(:ids AS uuid[])) AS u(id)
+    CROSS JOIN app.roles r
+    WHERE r.role_name = ANY(CAST(:roles AS text[]))
+""")
+
+INSERT_ACCOUNT = text("""
+    INSERT INTO app.coach_stripe_accounts (
+        coach_id, stripe_account_id, charges_enabled, payouts_enabled,
+        details_submitted
+    )
+    VALUES (:coach_id, :account_id, true, true, true)
+""")
+
+INSERT_SESSIONS = text("""
+    INSERT INTO app.sessions (
+        id, coach_id, title, starts_at, ends_at, price_cents, capacity
+    )
+    SELECT
+        id, :coach_id, 'Load test', starts_at,
+        starts_at + interval '30 minutes', 0, :capacity
+    FROM unnest(CAST(:ids AS uuid[]), CAST(:starts AS timestamptz[]))
+        AS s(id, starts_at)
+""")
+
+INSERT_PARTICIPATIONS = text("""
+    INSERT INTO app.session_participation (
+        id, session_id, user_id, expires_at
+    )
+    SELECT gen_random_uuid(), s.id, u.id, now() + interval '1 day'
+    FROM unnest(CAST(:session_ids AS uuid[])) AS s(id)
+    CROSS JOIN unnest(CAST(:user_ids AS uuid[])) AS u(id)
+""")
+
+MOVE_SESSIONS = text("""
+    UPDATE app.sessions s
+    SET starts_at = v.starts_at,
+        ends_at = v.starts_at + interval '30 minutes'
+    FROM unnest(CAST(:ids AS uuid[]), CAST(:starts AS timestamptz[]))
+        AS v(id, starts_at)
+    WHERE s.id = v.id
+""")
+
+DELETE_ATTENDANCE = text("""
+    DELETE FROM app.session_attendance
+    WHERE session_id = ANY(CAST(:ids AS uuid[]))
+""")
+
+DELETE_EVENTS = text("""
+    DELETE FROM app.stripe_webhook_events
+    WHERE event_id LIKE :prefix || '%'
+""")
+
+DELETE_ACCOUNT = text("""
+    DELETE FROM app.coach_stripe_accounts
+    WHERE coach_id = :coach_id
+""")
+
+DELETE_USERS = text("""
+    DELETE FROM app.users
+    WHERE id = ANY(CAST(:ids AS uuid[]))
+""")
+
+
+@dataclass(frozen=True, slots=True)
+class LoadFixture:
+    run: str
+    coach_id: UUID
+    account_id: str
+    user_ids: list[UUID]
+    browse_session_ids: list[UUID]
+    rush_session_id: UUID
+    attendance_session_ids: list[UUID]
+    participant_ids: list[UUID]
+
+    @property
+    def coach_email(self) -> str:
+        return email(self.run, "coach")
+
+    @property
+    def user_emails(self) -> list[str]:
+        return [email(self.run, str(i)) for i in range(len(self.user_ids))]
+
+    @property
+    def event_prefix(self) -> str:
+        return f"evt_load_{self.run}_"
+
+    @property
+    def session_ids(self) -> list[UUID]:
+        return [
+            *self.browse_session_ids,
+            self.rush_session_id,
+            *self.attendance_session_ids,
+        ]
+
+
+def email(run: str, name: str) -> str:
+    return f"load-{run}-{name}@example.com"
+
+
+def _slots(base: datetime, count: int) -> list[datetime]:
+    return [base + timedelta(hours=i) for i in range(count)]
+
+
+def _far_off(sign: int) -> datetime:
+    now = datetime.now(timezone.utc).replace(
+        minute=0, second=0, microsecond=0
+    )
+
+    return now + sign * timedelta(hours=random.randrange(24 * 365, 10 ** 6))
+
+
+async def seed(
+    admin: AsyncEngine,
+    users: int,
+    sessions: int,
+    capacity: int,
+    attendance_sessions: int,
+    participants: int
+) -> LoadFixture:
+    run = uuid4().hex[:12]
+    user_ids = [uuid4() for _ in range(users)]
+    fixture = LoadFixture(
+        run=run,
+        coach_id=uuid4(),
+        account_id=f"acct_load_{run}",
+        user_ids=user_ids,
+        browse_session_ids=[uuid4() for _ in range(sessions)],
+        rush_session_id=uuid4(),
+        attendance_session_ids=[uuid4() for _ in range(attendance_sessions)],
+        participant_ids=user_ids[:participants],
+    )
+    password_hash = PasswordHasher().hash(PASSWORD)
+    future = _slots(_far_off(1), sessions + 1 + attendance_sessions)
+
+    async with admin.begin() as conn:
+        await conn.execute(INSERT_USERS, {
+            "ids": [fixture.coach_id, *fixture.user_ids],
+            "emails": [fixture.coach_email, *fixture.user_emails],
+            "password_hash": password_hash,
+        })
+        await conn.execute(INSERT_PROFILES, {
+            "ids": [fixture.coach_id, *fixture.user_ids]
+        })
+        await conn.execute(INSERT_ROLES, {
+            "ids": [fixture.coach_id, *fixture.user_ids],
+            "roles": ["user"],
+        })
+        await conn.execute(INSERT_ROLES, {
+            "ids": [fixture.coach_id],
+            "roles": ["coach"],
+        })
+        await conn.execute(INSERT_ACCOUNT, {
+            "coach_id": fixture.coach_id,
+            "account_id": fixture.account_id,
+        })
+        await conn.execute(INSERT_SESSIONS, {
+            "coach_id": fixture.coach_id,
+            "ids": fixture.session_ids,
+            "starts": future,
+            "capacity": max(capacity, participants, 1),
+        })
+        await conn.execute(INSERT_PARTICIPATIONS, {
+            "session_ids": fixture.attendance_session_ids,
+            "user_ids": fixture.participant_ids,
+        })
+        await conn.execute(MOVE_SESSIONS, {
+            "ids": fixture.attendance_session_ids,
+            "starts": _slots(_far_off(-1), attendance_sessions),
+        })
+
+    return fixture
+
+
+async def cleanup(admin: AsyncEngine, fixture: LoadFixture) -> None:
+    async with admin.begin() as conn:
+        await conn.execute(DELETE_ATTENDANCE, {"ids": fixture.session_ids})
+        await conn.execute(DELETE_EVENTS, {"prefix": fixture.event_prefix})
+        await conn.execute(DELETE_ACCOUNT, {"coach_id": fixture.coach_id})
+        await conn.execute(DELETE_USERS, {
+            "ids": [fixture.coach_id, *fixture.user_ids]
+        })
@@ -0,0 +1,45 @@
+"""Local stand-in for Stripe's webhook sender.
+
+Builds event payloads and ``Stripe-Signature`` headers the way Stripe
+signs deliveries (HMAC-SHA256 of ``"{timestamp}.{payload}"`` with the
+endpoint secret), so ``stripe.Webhook.construct_event`` accepts them
+without any call to Stripe.
+"""
+import hashlib
+import hmac
+import json
+import time
+
+
+def sign(payload: str, secret: str, timestamp: int | None = None) -> str:
+    """``Stripe-Signature`` header value for ``payload``."""
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    signature = hmac.new(
+        secret.encode("utf-8"),
+        f"{timestamp}.{payload}".encode("utf-8"),
+        hashlib.sha256
+    ).hexdigest()
+
+    return f"t={timestamp},v1={signature}"
+
+
+def account_updated(event_id: str, account_id: str) -> str:
+    """``account.updated`` payload for a fully onboarded account.
+
+    Processing it updates ``app.coach_stripe_accounts`` only, without
+    calling the Stripe API.
+    """
+    return json.dumps({
+        "id": event_id,
+        "object": "event",
+        "type": "account.updated",
+        "created": int(time.time()),
+        "livemode": False,
+        "data": {"object": {
+            "id": account_id,
+            "object": "account",
+            "details_submitted": True,
+            "charges_enabled": True,
+            "payouts_enabled": True,
+        }},
+    })
@@ -0,0 +1,237 @@
+"""Paginated list serialization: validated DTOs vs trusted rows.
+
+Encodes ``--items`` payment and session rows ``--rounds`` times per
+page, without a database or a network round trip:
+
+- ``validated``: the former flow, one DTO per row built by the service,
+  the page DTO built by the router, then FastAPI validating the
+  ``response_model`` again and rendering it through the stdlib encoder.
+- ``trusted``: the service projects entities into plain rows and the
+  router returns ``page_response``, encoded once by orjson.
+
+Both must produce the same JSON document.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.page_serialization --items 100 --rounds 2000
+"""
+import argparse
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from pydantic import BaseModel
+from app.domain.payment.payment_entity import PaymentEntity
+from app.domain.session.session_entity import SessionWithCoachEntity
+from app.domain.session.session_status import SessionStatus
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.feature.admin.payment.admin_payment_dto import (
+    GetPaymentOutputDTO,
+    PaginatedPaymentOutputDTO
+)
+from app.feature.session.session_dto import (
+    CoachPublicDto,
+    GetOutputDto,
+    PaginatedSessionsOutputDTO
+)
+from app.shared.utils.json_response import page_response
+
+NOW = datetime(2030, 1, 1, 9, 30, 15, 250000, tzinfo=timezone.utc)
+
+
+def _payments(count: int) -> list[PaymentEntity]:
+    return [
+        PaymentEntity(
+            id=uuid4(),
+            session_id=uuid4(),
+            user_id=uuid4(),
+            provider="stripe",
+            provider_payment_id=f"pi_{i:024d}",
+            gross_amount_cents=1500 + i,
+            provider_fee_cents=50,
+            net_amount_cents=1450 + i,
+            currency="EUR",
+            created_at=NOW - timedelta(seconds=i)
+        ) for i in range(count)
+    ]
+
+
+def _sessions(count: int) -> list[SessionWithCoachEntity]:
+    coach = UserProfileEntity(uuid4(), "Ada", "Lovelace")
+
+    return [
+        SessionWithCoachEntity(
+            id=uuid4(),
+            coach=coach,
+            title=f"Session {i}",
+            starts_at=NOW + timedelta(days=i),
+            ends_at=NOW + timedelta(days=i, hours=1),
+            status=SessionStatus.SCHEDULED,
+            cancelled_at=None,  # type: ignore[arg-type]
+            price_cents=1500,
+            currency="EUR",
+            created_at=NOW,
+            updated_at=NOW
+        ) for i in range(count)
+    ]
+
+
+def _payment_dto(payment: PaymentEntity) -> GetPaymentOutputDTO:
+    return GetPaymentOutputDTO(
+        id=payment.id,
+        user_id=payment.user_id,
+        session_id=payment.session_id,
+        provider=payment.provider,
+        provider_payment_id=payment.provider_payment_id,
+        gross_amount_cents=payment.gross_amount_cents,
+        provider_fee_cents=payment.provider_fee_cents,
+        net_amount_cents=payment.net_amount_cents,
+        currency=payment.currency,
+        created_at=payment.created_at
+    )
+
+
+def _session_dto(session: SessionWithCoachEntity) -> GetOutputDto:
+    return GetOutputDto(
+        id=session.id,
+        coach=CoachPublicDto(
+            id=session.coach.user_id,
+            first_name=session.coach.first_name,
+            last_name=session.coach.last_name
+        ),
+        title=session.title,
+        starts_at=session.starts_at,
+        ends_at=session.ends_at,
+        price_cents=session.price_cents,
+        currency=session.currency,
+        status=session.status
+    )
+
+
+def _payment_row(payment: PaymentEntity) -> dict[str, Any]:
+    # Same projection as AdminPaymentService.get_payments.
+    return {
+        "id": payment.id,
+        "user_id": payment.user_id,
+        "session_id": payment.session_id,
+        "provider": payment.provider,
+        "provider_payment_id": payment.provider_payment_id,
+        "gross_amount_cents": payment.gross_amount_cents,
+        "provider_fee_cents": payment.provider_fee_cents,
+        "net_amount_cents": payment.net_amount_cents,
+        "currency": payment.currency,
+        "created_at": payment.created_at,
+    }
+
+
+def _session_row(session: SessionWithCoachEntity) -> dict[str, Any]:
+    # Same projection as SessionService.get_all_sessions.
+    return {
+        "id": session.id,
+        "coach": {
+            "id": session.coach.user_id,
+            "first_name": session.coach.first_name,
+            "last_name": session.coach.last_name,
+        },
+        "title": session.title,
+        "starts_at": session.starts_at,
+        "ends_at": session.ends_at,
+        "price_cents": session.price_cents,
+        "currency": session.currency,
+        "status": session.status,
+    }
+
+
+def _validated(
+    entities: list,
+    to_dto: Callable[[Any], BaseModel],
+    page_model: type[BaseModel]
+) -> Callable[[], Awaitable[bytes]]:
+    field = create_model_field(
+        name="response",
+        type_=page_model,
+        mode="serialization"
+    )
+
+    async def encode() -> bytes:
+        page = page_model(
+            items=[to_dto(entity) for entity in entities],
+            limit=len(entities),
+            offset=0,
+            has_more=True,
+            next_cursor="cursor"
+        )
+        content = await serialize_response(
+            field=field,
+            response_content=page
+        )
+
+        return bytes(JSONResponse(content).body)
+
+    return encode
+
+
+def _trusted(
+    entities: list,
+    to_row: Callable[[Any], dict[str, Any]]
+) -> Callable[[], Awaitable[bytes]]:
+    async def encode() -> bytes:
+        return bytes(page_response(
+            [to_row(entity) for entity in entities],
+            len(entities),
+            0,
+            True,
+            "cursor"
+        ).body)
+
+    return encode
+
+
+async def _time(encode: Callable[[], Awaitable[bytes]], rounds: int) -> float:
+    await encode()
+    start = perf_counter()
+
+    for _ in range(rounds):
+        await encode()
+
+    return (perf_counter() - start) / rounds
+
+
+async def main(items: int, rounds: int) -> None:
+    payments, sessions = _payments(items), _sessions(items)
+    cases = {
+        "payments": (
+            _validated(payments, _payment_dto, PaginatedPaymentOutputDTO),
+            _trusted(payments, _payment_row)
+        ),
+        "sessions": (
+            _validated(sessions, _session_dto, PaginatedSessionsOutputDTO),
+            _trusted(sessions, _session_row)
+        ),
+    }
+
+    for name, (validated, trusted) in cases.items():
+        assert json.loads(await validated()) == json.loads(await trusted()), (
+            f"{name}: encodings differ"
+        )
+
+        legacy = await _time(validated, rounds)
+        current = await _time(trusted, rounds)
+        print(
+            f"{name:<9} validated={legacy * 1e6:.1f}us "
+            f"trusted={current * 1e6:.1f}us speedup={legacy / current:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.items, args.rounds))
@@ -0,0 +1,118 @@
+"""Latency of unrelated endpoints during a login storm.
+
+Serves a ``/login`` route verifying an Argon2 hash next to a trivial
+``/ping`` route, fires a burst of concurrent logins and measures ``/ping``
+latency meanwhile. Compares hashing inline on the event loop (the former
+``Argon2PasswordHasher``) with the pooled asynchronous hasher.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.password_hashing --logins 64 --pings 200
+"""
+import argparse
+import asyncio
+from statistics import quantiles
+from time import perf_counter
+import httpx
+from argon2 import PasswordHasher
+from fastapi import FastAPI
+from app.infrastructure.security.password_hasher import Argon2PasswordHasher
+from app.shared.exceptions.commons import ServiceBusyError
+from app.shared.security.password_hasher_port import PasswordHasherPort
+
+PING_INTERVAL_SECONDS = 0.005
+
+
+class InlineArgon2Hasher(PasswordHasherPort):
+    """Former behaviour: hashing blocks the event loop."""
+
+    def __init__(self) -> None:
+        self._hasher = PasswordHasher()
+
+    async def hash(self, plain: str) -> str:
+        return self._hasher.hash(plain)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return self._hasher.verify(hashed, plain)
+
+
+def _build_app(hasher: PasswordHasherPort, hashed: str) -> FastAPI:
+    api = FastAPI()
+
+    @api.post("/login")
+    async def login() -> dict[str, bool]:
+        try:
+            return {"ok": await hasher.verify("password", hashed)}
+        except ServiceBusyError:
+            return {"ok": False}
+
+    @api.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return api
+
+
+async def _storm(
+    hasher: PasswordHasherPort,
+    hashed: str,
+    logins: int,
+    pings: int
+) -> list[float]:
+    transport = httpx.ASGITransport(app=_build_app(hasher, hashed))
+    latencies: list[float] = []
+
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench"
+    ) as client:
+        async def ping() -> None:
+            # Latency is taken from the scheduled send time, so time
+            # spent waiting for a blocked loop is not hidden.
+            origin = perf_counter()
+            for index in range(pings):
+                scheduled = origin + index * PING_INTERVAL_SECONDS
+                await asyncio.sleep(max(scheduled - perf_counter(), 0))
+                await client.get("/ping")
+                latencies.append(perf_counter() - scheduled)
+
+        await asyncio.gather(
+            ping(),
+            *(client.post("/login") for _ in range(logins))
+        )
+
+    return latencies
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    cuts = quantiles(latencies, n=100)
+    print(
+        f"{label:<8} /ping p50 {cuts[49] * 1000:8.2f} ms"
+        f"   p99 {cuts[98] * 1000:8.2f} ms"
+        f"   max {max(latencies) * 1000:8.2f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--pings", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    hashed = PasswordHasher().hash("password")
+
+    _report("inline", await _storm(
+        InlineArgon2Hasher(), hashed, args.logins, args.pings
+    ))
+
+    pooled = Argon2PasswordHasher(
+        max_workers=args.workers,
+        max_pending=args.logins
+    )
+    _report("pooled", await _storm(pooled, hashed, args.logins, args.pings))
+    pooled.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
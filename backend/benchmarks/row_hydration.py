@@ -0,0 +1,202 @@
+"""Repository row hydration: keyed mappings vs positional row mappers.
+
+Hydrates ``--rows`` payment and session rows ``--rounds`` times from
+in-memory results shaped like the repository queries, without a
+database:
+
+- ``mappings``: the former flow, ``result.mappings().all()`` then one
+  keyword argument per field looked up by column name.
+- ``mapper``: ``RowMapper.all``, one positional constructor call per
+  row.
+
+It then measures the memory held per entity with ``tracemalloc``, for
+the slotted domain dataclasses and an otherwise identical copy with an
+instance ``__dict__``.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.row_hydration --rows 10000 --rounds 20
+"""
+import argparse
+import asyncio
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Any, Callable
+from uuid import uuid4
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+from app.domain.payment.payment_entity import PaymentEntity
+from app.domain.session.session_entity import SessionWithCoachEntity
+from app.domain.session.session_status import SessionStatus
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    Column,
+    RowMapper
+)
+
+NOW = datetime(2030, 1, 1, 9, 30, tzinfo=timezone.utc)
+
+PAYMENT_KEYS = [
+    "id", "session_id", "user_id", "provider", "provider_payment_id",
+    "gross_amount_cents", "provider_fee_cents", "net_amount_cents",
+    "currency", "created_at",
+]
+
+SESSION_KEYS = [
+    "id", "coach_id", "first_name", "last_name", "title", "starts_at",
+    "ends_at", "status", "cancelled_at", "price_cents", "currency",
+    "created_at", "updated_at",
+]
+
+# Same mappers as the payment and session read repositories.
+_PAYMENT = RowMapper(PaymentEntity)
+
+_SESSION_WITH_COACH = RowMapper(
+    SessionWithCoachEntity,
+    coach=RowMapper(UserProfileEntity, user_id="coach_id"),
+    status=Column("status", SessionStatus)
+)
+
+
+def _payment_rows(count: int) -> list[tuple]:
+    return [
+        (
+            uuid4(), uuid4(), uuid4(), "stripe", f"pi_{i:024d}", 1500 + i,
+            50, 1450 + i, "EUR", NOW - timedelta(seconds=i)
+        ) for i in range(count)
+    ]
+
+
+def _session_rows(count: int) -> list[tuple]:
+    coach_id = uuid4()
+
+    return [
+        (
+            uuid4(), coach_id, "Ada", "Lovelace", f"Session {i}",
+            NOW + timedelta(days=i), NOW + timedelta(days=i, hours=1),
+            "scheduled", None, 1500, "EUR", NOW, NOW
+        ) for i in range(count)
+    ]
+
+
+def _payments_by_key(result: IteratorResult) -> list[PaymentEntity]:
+    return [
+        PaymentEntity(
+            id=row["id"],
+            session_id=row["session_id"],
+            user_id=row["user_id"],
+            provider=row["provider"],
+            provider_payment_id=row["provider_payment_id"],
+            gross_amount_cents=row["gross_amount_cents"],
+            provider_fee_cents=row["provider_fee_cents"],
+            net_amount_cents=row["net_amount_cents"],
+            currency=row["currency"],
+            created_at=row["created_at"]
+        ) for row in result.mappings().all()
+    ]
+
+
+def _sessions_by_key(result: IteratorResult) -> list[SessionWithCoachEntity]:
+    return [
+        SessionWithCoachEntity(
+            id=row["id"],
+            coach=UserProfileEntity(
+                user_id=row["coach_id"],
+                first_name=row["first_name"],
+                last_name=row["last_name"]
+            ),
+            title=row["title"],
+            starts_at=row["starts_at"],
+            ends_at=row["ends_at"],
+            status=SessionStatus(row["status"]),
+            cancelled_at=row["cancelled_at"],
+            price_cents=row["price_cents"],
+            currency=row["currency"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        ) for row in result.mappings().all()
+    ]
+
+
+def _time(
+    hydrate: Callable[[IteratorResult], list],
+    keys: list[str],
+    rows: list[tuple],
+    rounds: int
+) -> float:
+    elapsed = 0.0
+
+    for _ in range(rounds):
+        result = IteratorResult(SimpleResultMetaData(keys), iter(rows))
+        start = perf_counter()
+        hydrate(result)
+        elapsed += perf_counter() - start
+
+    return elapsed / rounds
+
+
+def _bytes_per_entity(entity: type, rows: list[tuple]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    entities = [entity(*row) for row in rows]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    grown = sum(
+        stat.size_diff for stat in after.compare_to(before, "filename")
+    )
+
+    return grown / len(entities)
+
+
+def _with_dict(entity: type) -> type:
+    return make_dataclass(
+        f"{entity.__name__}WithDict",
+        [(field.name, Any) for field in fields(entity)],
+        frozen=True
+    )
+
+
+async def main(rows: int, rounds: int) -> None:
+    payments, sessions = _payment_rows(rows), _session_rows(rows)
+    cases: dict[str, tuple[Any, ...]] = {
+        "payments": (PAYMENT_KEYS, payments, _payments_by_key, _PAYMENT.all),
+        "sessions": (
+            SESSION_KEYS, sessions, _sessions_by_key, _SESSION_WITH_COACH.all
+        ),
+    }
+
+    for name, (keys, data, by_key, mapper) in cases.items():
+        assert by_key(
+            IteratorResult(SimpleResultMetaData(keys), iter(data))
+        ) == mapper(
+            IteratorResult(SimpleResultMetaData(keys), iter(data))
+        ), f"{name}: hydrations differ"
+
+        legacy = _time(by_key, keys, data, rounds)
+        current = _time(mapper, keys, data, rounds)
+        print(
+            f"{name:<9} mappings={legacy * 1e3:.1f}ms "
+            f"mapper={current * 1e3:.1f}ms speedup={legacy / current:.1f}x"
+        )
+
+    # Shared field values: only the entity objects themselves are counted.
+    for entity in (PaymentEntity, UserProfileEntity):
+        width = len(fields(entity))
+        data = [payments[0][:width]] * rows
+        slotted = _bytes_per_entity(entity, data)
+        unslotted = _bytes_per_entity(_with_dict(entity), data)
+        print(
+            f"{entity.__name__:<18} slots={slotted:.0f}B "
+            f"dict={unslotted:.0f}B saved={1 - slotted / unslotted:.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.rounds))
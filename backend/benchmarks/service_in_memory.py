@@ -0,0 +1,325 @@
+"""Service logic throughput on the in-memory persistence backend.
+
+Drives ``SessionService``, ``CoachService`` and ``StripeService``
+through the in-memory UoWs for ``--ops`` calls per case, without a
+database, so the numbers are the cost of the service and repository
+logic alone:
+
+- ``create_session``: coach session creation, overlap check included.
+- ``register_free``: registration to a free session.
+- ``own_sessions``: a coach's paginated listing of ``--sessions``
+  sessions, ``--limit`` per page.
+- ``session_by_id``: a coach reading one session with its participants.
+- ``payment_failed``: a ``payment_intent.payment_failed`` webhook for a
+  held seat.
+- ``release_expired``: one sweep releasing a lapsed seat.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.service_in_memory --ops 5000 --sessions 200
+"""
+import argparse
+import asyncio
+from datetime import timedelta
+from itertools import count
+from time import perf_counter
+from typing import Awaitable, Callable
+from uuid import UUID, uuid4
+import stripe
+from app.domain.auth.actor_entity import Actor
+from app.domain.auth.permission import permissions_for
+from app.domain.auth.role import Role
+from app.domain.payment_intent.payment_intent_entity import (
+    NewPaymentIntentEntity
+)
+from app.domain.payment_intent.payment_intent_providers import PaymentProvider
+from app.domain.session_participation.session_participation_entity import (
+    NewSessionParticipationEntity
+)
+from app.domain.user.user_entity import UserEntity
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.feature.coach.coach_service import CoachService
+from app.feature.session.session_dto import SessionCreationInputDTO
+from app.feature.session.session_service import SessionService
+from app.feature.stripe.stripe_service import StripeService
+from app.infrastructure.persistence.in_memory.storage import (
+    CoachStripeAccountRow,
+    InMemoryStorage
+)
+from app.infrastructure.persistence.in_memory.uow.coach.coach_uow import (
+    InMemoryCoachUoW
+)
+from app.infrastructure.persistence.in_memory.uow.session import (
+    InMemorySessionUoW
+)
+from app.infrastructure.persistence.in_memory.uow.stripe.stripe_uow import (
+    InMemoryStripeUoW
+)
+from app.shared.utils.time import utcnow
+
+SESSIONS = SessionService()
+COACHES = CoachService()
+STRIPE = StripeService()
+
+# Large enough that no run fills a session.
+CAPACITY = 10_000_000
+
+
+def _actor(storage: InMemoryStorage, *roles: Role) -> Actor:
+    user_id = uuid4()
+    storage.add_user(
+        UserEntity(
+            id=user_id,
+            email=f"{user_id.hex}@bench.test",
+            password_hash="hash",
+            roles={Role.USER, *roles},
+            disabled_at=None,
+            disabled_reason=None
+        ),
+        UserProfileEntity(user_id, "Bench", user_id.hex[:8])
+    )
+
+    return Actor(user_id, "user", permissions_for({Role.USER, *roles}))
+
+
+def _coach(storage: InMemoryStorage) -> Actor:
+    coach = _actor(storage, Role.COACH)
+    storage.coach_stripe_accounts[coach.id] = CoachStripeAccountRow(
+        coach_id=coach.id,
+        stripe_account_id=f"acct_{coach.id.hex}",
+        details_submitted=True,
+        charges_enabled=True,
+        payouts_enabled=True
+    )
+
+    return coach
+
+
+def _session_input(slot: int, price_cents: int) -> SessionCreationInputDTO:
+    starts_at = utcnow() + timedelta(days=1, hours=2 * slot)
+
+    return SessionCreationInputDTO(
+        title=f"Session {slot}",
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(hours=1),
+        price_cents=price_cents,
+        currency="EUR",
+        capacity=CAPACITY
+    )
+
+
+async def _create_session(
+    storage: InMemoryStorage,
+    coach: Actor,
+    slot: int,
+    price_cents: int = 0
+) -> UUID:
+    await SESSIONS.create_session(
+        uow=InMemorySessionUoW(storage, coach.id),
+        actor=coach,
+        input=_session_input(slot, price_cents)
+    )
+
+    return storage.sessions_by_coach[coach.id][-1]
+
+
+async def _hold_seat(
+    storage: InMemoryStorage,
+    session_id: UUID,
+    user: Actor,
+    expires_in: timedelta
+) -> None:
+    uow = InMemorySessionUoW(storage, user.id)
+
+    await uow.payment_intent_creation_repo.create_payment_intent(
+        NewPaymentIntentEntity(
+            user_id=user.id,
+            session_id=session_id,
+            provider=PaymentProvider.STRIPE,
+            provider_intent_id=None,
+            provider_checkout_id=f"cs_{user.id.hex}",
+            status="open",
+            credit_applied_cents=0,
+            amount_cents=1500,
+            currency="EUR"
+        )
+    )
+    await uow.session_participation_creation_repo.create_participation(
+        participation=NewSessionParticipationEntity(session_id, user.id),
+        expires_at=utcnow() + expires_in
+    )
+
+
+def _payment_failed(user: Actor, session_id: UUID) -> stripe.Event:
+    return stripe.Event.construct_from({
+        "id": f"evt_{user.id.hex}",
+        "object": "event",
+        "type": "payment_intent.payment_failed",
+        "data": {"object": {
+            "id": f"pi_{user.id.hex}",
+            "object": "payment_intent",
+            "status": "requires_payment_method",
+            "metadata": {
+                "user_id": str(user.id),
+                "session_id": str(session_id)
+            }
+        }}
+    }, "sk_test")
+
+
+async def _create_case(ops: int) -> Callable[[], Awaitable[None]]:
+    storage = InMemoryStorage()
+    coach = _coach(storage)
+    slots = count()
+    inputs = [_session_input(slot, 0) for slot in range(ops)]
+
+    async def call() -> None:
+        await SESSIONS.create_session(
+            uow=InMemorySessionUoW(storage, coach.id),
+            actor=coach,
+            input=inputs[next(slots)]
+        )
+
+    return call
+
+
+async def _register_case(ops: int) -> Callable[[], Awaitable[None]]:
+    storage = InMemoryStorage()
+    session_id = await _create_session(storage, _coach(storage), 0)
+    users = iter([_actor(storage) for _ in range(ops)])
+
+    async def call() -> None:
+        user = next(users)
+        await SESSIONS.register_user(
+            session_id=session_id,
+            actor=user,
+            uow=InMemorySessionUoW(storage, user.id),
+            session_ttl=900,
+            front_end_url="http://front.test"
+        )
+
+    return call
+
+
+async def _listing_case(
+    sessions: int,
+    limit: int
+) -> Callable[[], Awaitable[None]]:
+    storage = InMemoryStorage()
+    coach = _coach(storage)
+
+    for slot in range(sessions):
+        await _create_session(storage, coach, slot)
+
+    async def call() -> None:
+        await COACHES.get_own_sessions(
+            actor=coach,
+            uow=InMemoryCoachUoW(storage, coach.id),
+            limit=limit,
+            offset=0,
+            _from=None,
+            to=None
+        )
+
+    return call
+
+
+async def _by_id_case(participants: int) -> Callable[[], Awaitable[None]]:
+    storage = InMemoryStorage()
+    coach = _coach(storage)
+    session_id = await _create_session(storage, coach, 0)
+
+    for _ in range(participants):
+        user = _actor(storage)
+        await SESSIONS.register_user(
+            session_id=session_id,
+            actor=user,
+            uow=InMemorySessionUoW(storage, user.id),
+            session_ttl=900,
+            front_end_url="http://front.test"
+        )
+
+    async def call() -> None:
+        await COACHES.get_session_by_id(
+            session_id,
+            InMemoryCoachUoW(storage, coach.id),
+            coach
+        )
+
+    return call
+
+
+async def _payment_failed_case(ops: int) -> Callable[[], Awaitable[None]]:
+    storage = InMemoryStorage()
+    session_id = await _create_session(storage, _coach(storage), 0, 1500)
+    events = []
+
+    for _ in range(ops):
+        user = _actor(storage)
+        await _hold_seat(storage, session_id, user, timedelta(minutes=15))
+        events.append(_payment_failed(user, session_id))
+
+    pending = iter(events)
+
+    async def call() -> None:
+        await STRIPE.handle_stripe_event(
+            InMemoryStripeUoW(storage),
+            next(pending),
+            stripe_client=None  # type: ignore[arg-type]
+        )
+
+    return call
+
+
+async def _release_case(ops: int) -> Callable[[], Awaitable[None]]:
+    storage = InMemoryStorage()
+    session_id = await _create_session(storage, _coach(storage), 0, 1500)
+
+    for _ in range(ops):
+        user = _actor(storage)
+        await _hold_seat(storage, session_id, user, timedelta(minutes=-1))
+
+    async def call() -> None:
+        await STRIPE.release_expired_participations(
+            InMemoryStripeUoW(storage),
+            batch_size=1
+        )
+
+    return call
+
+
+async def _time(call: Callable[[], Awaitable[None]], ops: int) -> float:
+    start = perf_counter()
+
+    for _ in range(ops):
+        await call()
+
+    return perf_counter() - start
+
+
+async def main(ops: int, sessions: int, limit: int) -> None:
+    cases = {
+        "create_session": _create_case(ops),
+        "register_free": _register_case(ops),
+        "own_sessions": _listing_case(sessions, limit),
+        "session_by_id": _by_id_case(limit),
+        "payment_failed": _payment_failed_case(ops),
+        "release_expired": _release_case(ops),
+    }
+
+    for name, case in cases.items():
+        elapsed = await _time(await case, ops)
+        print(
+            f"{name:<16} {ops / elapsed:>10.0f} ops/s "
+            f"{elapsed / ops * 1e6:.1f}us/op"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.ops, args.sessions, args.limit))
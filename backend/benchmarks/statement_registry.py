@@ -0,0 +1,65 @@
+"""Per-execution CPU spent resolving repository SQL to its compiled form.
+
+Compares building a fresh ``text()`` object on every call (the former
+repository pattern) with the statements declared once in the registry.
+Both go through SQLAlchemy's compiled cache exactly like
+``Connection.execute`` does; no database is needed.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.statement_registry --iterations 20000
+"""
+import argparse
+from time import perf_counter
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.sql.expression import TextClause, text
+from sqlalchemy.util import LRUCache
+import app.main  # noqa: F401  (imports every repository)
+from app.infrastructure.persistence.sqlalchemy.statements import STATEMENTS
+
+
+def _resolve(stmt: TextClause, dialect, cache: LRUCache) -> None:
+    stmt._compile_w_cache(
+        dialect,
+        compiled_cache=cache,
+        column_keys=[],
+        for_executemany=False,
+        schema_translate_map=None,
+    )
+
+
+def _run(label: str, make, iterations: int) -> float:
+    dialect = PGDialect_asyncpg()
+    cache: LRUCache = LRUCache(500)
+    names = STATEMENTS.names()
+
+    start = perf_counter()
+    for index in range(iterations):
+        _resolve(make(names[index % len(names)]), dialect, cache)
+    elapsed = perf_counter() - start
+
+    per_call = elapsed / iterations * 1_000_000
+    print(f"{label:<12} {per_call:8.2f} us/statement")
+
+    return per_call
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{len(STATEMENTS)} registered statements")
+
+    fresh = _run(
+        "fresh text()",
+        lambda name: text(STATEMENTS.get(name).text),
+        args.iterations
+    )
+    registered = _run("registered", STATEMENTS.get, args.iterations)
+
+    print(f"speedup      {fresh / registered:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
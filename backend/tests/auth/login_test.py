@@ -5,14 +5,14 @@ from uuid import uuid4
 from app.domain.auth.refresh_token_entity import RefreshTokenEntity
 from app.domain.auth.role import Role
 from app.infrastructure.persistence.in_memory.storage import (
-    InMemoryAuthStorage,
+    InMemoryStorage,
 )
 from app.infrastructure.security.in_memory.jwt import InMemoryJwt
 from app.infrastructure.security.in_memory.password_hasher import (
     InMemoryPasswordHasher
 )
 from app.infrastructure.persistence.in_memory.uow.auth import (
-    InMemoryLoginUoW
+    InMemoryAuthUoW
 )
 
 from app.domain.user.user_entity import UserEntity
@@ -34,14 +34,14 @@ from app.shared.utils.time import utcnow
 
 @pytest.mark.anyio
 async def test_login_success():
-    storage = InMemoryAuthStorage()
+    storage = InMemoryStorage()
 
     user_id = uuid4()
     user = UserEntity(
         id=user_id,
         email="test@test.com",
         roles={Role.USER, },
-        password_hash="secret",
+        password_hash="secret-password",
         disabled_at=None,
         disabled_reason=None
     )
@@ -50,18 +50,18 @@ async def test_login_success():
     storage.users_by_email[user.email] = user_id
 
     service = AuthService()
-    uow = InMemoryLoginUoW(storage)
+    uow = InMemoryAuthUoW(storage)
 
     access, refresh = await service.login(
         input=LoginInputDTO(
             email="test@test.com",
-            password="secret"
+            password="secret-password"
         ),
         existing_refresh=None,
         uow=uow,
         refresh_token_ttl=3600,
         token_hasher=InMemoryTokenHasher(),
-        refresh_token_generator=InMemoryRefreshTokenGenerator(),
+        token_generator=InMemoryRefreshTokenGenerator(),
         jwt=InMemoryJwt(),
         password_hasher=InMemoryPasswordHasher(),
     )
@@ -73,21 +73,21 @@ async def test_login_success():
 
 @pytest.mark.anyio
 async def test_login_invalid_email():
-    storage = InMemoryAuthStorage()
+    storage = InMemoryStorage()
     service = AuthService()
 
-    uow = InMemoryLoginUoW(storage)
+    uow = InMemoryAuthUoW(storage)
 
     with pytest.raises(InvalidEmailError):
         await service.login(
-            LoginInputDTO(email="nope@test.com", password="secret"),
+            LoginInputDTO(email="nope@test.com", password="secret-password"),
             existing_refresh=None,
             refresh_token_ttl=3600,
             uow=uow,
             jwt=InMemoryJwt(),
             password_hasher=InMemoryPasswordHasher(),
             token_hasher=InMemoryTokenHasher(),
-            refresh_token_generator=InMemoryRefreshTokenGenerator(),
+            token_generator=InMemoryRefreshTokenGenerator(),
         )
 
     assert len(storage.refresh_tokens) == 0
@@ -95,7 +95,7 @@ async def test_login_invalid_email():
 
 @pytest.mark.anyio
 async def test_login_invalid_password():
-    storage = InMemoryAuthStorage()
+    storage = InMemoryStorage()
     user_id = uuid4()
 
     storage.users[user_id] = UserEntity(
@@ -109,30 +109,30 @@ async def test_login_invalid_password():
     storage.users_by_email["test@test.com"] = user_id
 
     service = AuthService()
-    uow = InMemoryLoginUoW(storage)
+    uow = InMemoryAuthUoW(storage)
 
     with pytest.raises(InvalidPasswordError):
         await service.login(
-            LoginInputDTO(email="test@test.com", password="wrong"),
+            LoginInputDTO(email="test@test.com", password="wrong-password"),
             existing_refresh=None,
             refresh_token_ttl=3600,
             uow=uow,
             jwt=InMemoryJwt(),
             password_hasher=InMemoryPasswordHasher(),
             token_hasher=InMemoryTokenHasher(),
-            refresh_token_generator=InMemoryRefreshTokenGenerator(),
+            token_generator=InMemoryRefreshTokenGenerator(),
         )
 
 
 @pytest.mark.anyio
 async def test_login_revokes_existing_refresh_token():
-    storage = InMemoryAuthStorage()
+    storage = InMemoryStorage()
     user_id = uuid4()
 
     user = UserEntity(
         id=user_id,
         email="test@test.com",
-        password_hash="secret",
+        password_hash="secret-password",
         roles={Role.USER, },
         disabled_at=None,
         disabled_reason=None,
@@ -151,17 +151,17 @@ async def test_login_revokes_existing_refresh_token():
     )
 
     service = AuthService()
-    uow = InMemoryLoginUoW(storage)
+    uow = InMemoryAuthUoW(storage)
 
     _, _ = await service.login(
-        LoginInputDTO(email="test@test.com", password="secret"),
+        LoginInputDTO(email="test@test.com", password="secret-password"),
         existing_refresh=old_token_hash,
         refresh_token_ttl=3600,
         uow=uow,
         jwt=InMemoryJwt(),
         password_hasher=InMemoryPasswordHasher(),
         token_hasher=InMemoryTokenHasher(),
-        refresh_token_generator=InMemoryRefreshTokenGenerator(),
+        token_generator=InMemoryRefreshTokenGenerator(),
     )
 
     assert storage.refresh_tokens[old_token_hash].revoked_at is not None
@@ -170,13 +170,13 @@ async def test_login_revokes_existing_refresh_token():
 
 @pytest.mark.anyio
 async def test_login_ignores_expired_refresh_token():
-    storage = InMemoryAuthStorage()
+    storage = InMemoryStorage()
     user_id = uuid4()
 
     storage.users[user_id] = UserEntity(
         id=user_id,
         email="test@test.com",
-        password_hash="secret",
+        password_hash="secret-password",
         roles={Role.USER, },
         disabled_at=None,
         disabled_reason=None,
@@ -193,17 +193,17 @@ async def test_login_ignores_expired_refresh_token():
     )
 
     service = AuthService()
-    uow = InMemoryLoginUoW(storage)
+    uow = InMemoryAuthUoW(storage)
 
     access, refresh = await service.login(
-        input=LoginInputDTO(email="test@test.com", password="secret"),
+        input=LoginInputDTO(email="test@test.com", password="secret-password"),
         existing_refresh=token_hash,
         refresh_token_ttl=3600,
         uow=uow,
         jwt=InMemoryJwt(),
         password_hasher=InMemoryPasswordHasher(),
         token_hasher=InMemoryTokenHasher(),
-        refresh_token_generator=InMemoryRefreshTokenGenerator(),
+        token_generator=InMemoryRefreshTokenGenerator(),
     )
 
     new_hash = InMemoryTokenHasher().hash(refresh)
@@ -217,13 +217,13 @@ async def test_login_ignores_expired_refresh_token():
 
 @pytest.mark.anyio
 async def test_login_disabled_user():
-    storage = InMemoryAuthStorage()
+    storage = InMemoryStorage()
     user_id = uuid4()
 
     storage.users[user_id] = UserEntity(
         id=user_id,
         email="test@test.com",
-        password_hash="secret",
+        password_hash="secret-password",
         roles={Role.USER, },
         disabled_at=utcnow(),
         disabled_reason="admin ban",
@@ -231,18 +231,18 @@ async def test_login_disabled_user():
     storage.users_by_email["test@test.com"] = user_id
 
     service = AuthService()
-    uow = InMemoryLoginUoW(storage)
+    uow = InMemoryAuthUoW(storage)
 
     with pytest.raises(UserDisabledError):
         await service.login(
-            LoginInputDTO(email="test@test.com", password="secret"),
+            LoginInputDTO(email="test@test.com", password="secret-password"),
             existing_refresh=None,
             refresh_token_ttl=3600,
             uow=uow,
             jwt=InMemoryJwt(),
             password_hasher=InMemoryPasswordHasher(),
             token_hasher=InMemoryTokenHasher(),
-            refresh_token_generator=InMemoryRefreshTokenGenerator(),
+            token_generator=InMemoryRefreshTokenGenerator(),
         )
 
     assert len(storage.refresh_tokens) == 0
@@ -250,13 +250,13 @@ async def test_login_disabled_user():
 
 @pytest.mark.anyio
 async def test_login_rotates_existing_refresh_token():
-    storage = InMemoryAuthStorage()
+    storage = InMemoryStorage()
     user_id = uuid4()
 
     storage.users[user_id] = UserEntity(
         id=user_id,
         email="test@test.com",
-        password_hash="secret",
+        password_hash="secret-password",
         roles={Role.USER, },
         disabled_at=None,
         disabled_reason=None,
@@ -277,17 +277,17 @@ async def test_login_rotates_existing_refresh_token():
     )
 
     service = AuthService()
-    uow = InMemoryLoginUoW(storage)
+    uow = InMemoryAuthUoW(storage)
 
     access, new_refresh = await service.login(
-        input=LoginInputDTO(email="test@test.com", password="secret"),
+        input=LoginInputDTO(email="test@test.com", password="secret-password"),
         existing_refresh=old_refresh_plain,
         refresh_token_ttl=3600,
         uow=uow,
         jwt=InMemoryJwt(),
         password_hasher=InMemoryPasswordHasher(),
         token_hasher=InMemoryTokenHasher(),
-        refresh_token_generator=InMemoryRefreshTokenGenerator(),
+        token_generator=InMemoryRefreshTokenGenerator(),
     )
 
     # old token revoked
@@ -301,13 +301,13 @@ async def test_login_rotates_existing_refresh_token():
 
 @pytest.mark.anyio
 async def test_login_fails_for_disabled_user():
-    storage = InMemoryAuthStorage()
+    storage = InMemoryStorage()
     user_id = uuid4()
 
     storage.users[user_id] = UserEntity(
         id=user_id,
         email="test@test.com",
-        password_hash="secret",
+        password_hash="secret-password",
         roles={Role.USER, Role.ADMIN},
         disabled_at=utcnow(),
         disabled_reason="banned",
@@ -315,16 +315,19 @@ async def test_login_fails_for_disabled_user():
     storage.users_by_email["test@test.com"] = user_id
 
     service = AuthService()
-    uow = InMemoryLoginUoW(storage)
+    uow = InMemoryAuthUoW(storage)
 
     with pytest.raises(UserDisabledError):
         await service.login(
-            input=LoginInputDTO(email="test@test.com", password="secret"),
+            input=LoginInputDTO(
+                email="test@test.com",
+                password="secret-password"
+            ),
             existing_refresh=None,
             refresh_token_ttl=3600,
             uow=uow,
             jwt=InMemoryJwt(),
             password_hasher=InMemoryPasswordHasher(),
             token_hasher=InMemoryTokenHasher(),
-            refresh_token_generator=InMemoryRefreshTokenGenerator(),
+            token_generator=InMemoryRefreshTokenGenerator(),
         )
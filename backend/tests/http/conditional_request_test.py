@@ -0,0 +1,94 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+import pytest
+from app.domain.auth.role import Role
+from app.domain.session_participation.session_participation_entity import (
+    SessionParticipationEntity
+)
+from app.feature.session.session_router import router
+from app.infrastructure.persistence.in_memory.functions import rename_user
+from app.infrastructure.persistence.in_memory.repositories.session import (
+    session_read_repository
+)
+from app.shared.utils.etag import etag_matches, make_etag
+
+
+@pytest.fixture
+def participant(storage, add_actor, add_session):
+    """Participant of a session, returned with the participants URL."""
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    session_id = add_session(add_actor("Coach", Role.COACH), now)
+    user = add_actor("Lovelace")
+    storage.add_participation(SessionParticipationEntity(
+        id=uuid4(),
+        session_id=session_id,
+        user_id=user.id,
+        paid_at=now,
+        registred_at=now,
+        cancelled_at=None,  # type: ignore[arg-type]
+        expires_at=None  # type: ignore[arg-type]
+    ))
+
+    return user, f"/sessions/{session_id}/participants"
+
+
+@pytest.fixture
+def participant_queries(monkeypatch) -> list[object]:
+    """Session ids of every participant list read."""
+    repo = session_read_repository.InMemorySessionReadRepo
+    read = repo.get_session_participants
+    queries: list[object] = []
+
+    async def counted(self, session_id):
+        queries.append(session_id)
+        return await read(self, session_id)
+
+    monkeypatch.setattr(repo, "get_session_participants", counted)
+
+    return queries
+
+
+def test_weak_comparison_ignores_prefix_and_lists():
+    etag = make_etag("session", "1:2:3")
+
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"x", {etag.removeprefix("W/")}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches(make_etag("session", "1:2:4"), etag)
+
+
+def test_matching_etag_skips_the_participant_query(
+    make_client,
+    participant,
+    participant_queries
+):
+    _, url = participant
+    client = make_client(router)
+
+    first = client.get(url)
+    second = client.get(url, headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert len(participant_queries) == 1
+
+
+def test_new_version_returns_the_full_body(make_client, storage, participant):
+    user, url = participant
+    client = make_client(router)
+
+    etag = client.get(url).headers["etag"]
+    rename_user(storage, user.id, "Ada", "King")
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json() == [{"first_name": "Ada", "last_name": "King"}]
+
+
+def test_missing_session_is_not_found(make_client):
+    response = make_client(router).get(f"/sessions/{uuid4()}/participants")
+
+    assert response.status_code == 404
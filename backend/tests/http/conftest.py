@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta
+from typing import Callable
+from uuid import UUID, uuid4
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from app.domain.auth.actor_entity import Actor
+from app.domain.auth.permission import permissions_for
+from app.domain.auth.role import Role
+from app.domain.payment.payment_entity import PaymentEntity
+from app.domain.user.user_entity import UserEntity
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.infrastructure.persistence.in_memory import (
+    provider as in_memory_provider
+)
+from app.infrastructure.persistence.in_memory.storage import (
+    InMemoryStorage,
+    SessionRow
+)
+from app.infrastructure.persistence.sqlalchemy import (
+    provider as sqlalchemy_provider
+)
+from app.infrastructure.security.provider import get_current_actor
+from app.shared.handlers import register_exception_handlers
+from app.shared.utils.time import utcnow
+
+# Every SQLAlchemy UoW provider, replaced by its in-memory counterpart.
+_UOW_OVERRIDES = {
+    getattr(sqlalchemy_provider, name.replace("in_memory_", "")): getattr(
+        in_memory_provider, name
+    )
+    for name in dir(in_memory_provider)
+    if name.startswith("get_in_memory_") and name.endswith("_uow")
+}
+
+
+@pytest.fixture
+def storage() -> InMemoryStorage:
+    return InMemoryStorage()
+
+
+@pytest.fixture
+def make_client(
+    storage: InMemoryStorage
+) -> Callable[..., TestClient]:
+    """Client for an app serving ``router`` from ``storage``, with the
+    repository exception handlers and ``actor`` as the caller."""
+
+    def make(router: APIRouter, actor: Actor | None = None) -> TestClient:
+        app = FastAPI()
+        app.include_router(router)
+        register_exception_handlers(app)
+        app.dependency_overrides.update(_UOW_OVERRIDES)
+        app.dependency_overrides[
+            in_memory_provider.get_in_memory_storage
+        ] = lambda: storage
+
+        if actor is not None:
+            app.dependency_overrides[get_current_actor] = lambda: actor
+
+        return TestClient(app)
+
+    return make
+
+
+@pytest.fixture
+def add_actor(storage: InMemoryStorage) -> Callable[..., Actor]:
+    def add(last_name: str, *roles: Role) -> Actor:
+        user_id = uuid4()
+        storage.add_user(
+            UserEntity(
+                id=user_id,
+                email=f"{last_name.lower()}.{user_id.hex}@test.com",
+                password_hash="hash",
+                roles={Role.USER, *roles},
+                disabled_at=None,
+                disabled_reason=None
+            ),
+            UserProfileEntity(user_id, "Ada", last_name)
+        )
+
+        return Actor(user_id, "user", permissions_for({Role.USER, *roles}))
+
+    return add
+
+
+@pytest.fixture
+def add_session(storage: InMemoryStorage) -> Callable[..., UUID]:
+    def add(
+        coach: Actor,
+        starts_at: datetime,
+        title: str = "Session",
+        created_at: datetime | None = None
+    ) -> UUID:
+        now = utcnow()
+        session = SessionRow(
+            id=uuid4(),
+            coach_id=coach.id,
+            title=title,
+            starts_at=starts_at,
+            ends_at=starts_at + timedelta(hours=1),
+            price_cents=1500,
+            currency="EUR",
+            capacity=10,
+            created_at=created_at or now,
+            updated_at=now
+        )
+        storage.add_session(session)
+
+        return session.id
+
+    return add
+
+
+@pytest.fixture
+def add_payment(storage: InMemoryStorage) -> Callable[..., PaymentEntity]:
+    def add(
+        session_id: UUID,
+        created_at: datetime,
+        provider_payment_id: str = "pi_1"
+    ) -> PaymentEntity:
+        payment = PaymentEntity(
+            id=uuid4(),
+            session_id=session_id,
+            user_id=uuid4(),
+            provider="stripe",
+            provider_payment_id=provider_payment_id,
+            gross_amount_cents=1500,
+            provider_fee_cents=50,
+            net_amount_cents=1450,
+            currency="EUR",
+            created_at=created_at
+        )
+        storage.add_payment(payment)
+
+        return payment
+
+    return add
@@ -0,0 +1,92 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta, timezone
+import pytest
+from app.domain.auth.role import Role
+from app.feature.admin.payment.admin_payment_router import router
+from app.shared.utils.export import accepts_gzip
+
+_START = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def admin(add_actor):
+    return add_actor("Admin", Role.ADMIN)
+
+
+@pytest.fixture
+def payments(add_actor, add_session, add_payment):
+    """Creates ``count`` payments from 2030 on, one second apart, after
+    one payment made in 2029."""
+    session_id = add_session(add_actor("Coach", Role.COACH), _START)
+
+    def add(count: int) -> None:
+        add_payment(session_id, _START - timedelta(days=1), "pi_2029")
+
+        for i in range(count):
+            add_payment(session_id, _START + timedelta(seconds=i), f"pi_{i}")
+
+    return add
+
+
+def test_csv_export_streams_every_row(make_client, admin, payments):
+    payments(5000)
+
+    response = make_client(router, admin).get(
+        "/admin/payment/export",
+        params={"_from": "2030-01-01T00:00:00Z"},
+        headers={"Accept-Encoding": "identity"}
+    )
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "payments.csv" in response.headers["content-disposition"]
+    assert len(rows) == 5000
+    assert rows[0]["provider_payment_id"] == "pi_0"
+    assert rows[-1]["provider_payment_id"] == "pi_4999"
+
+
+def test_ndjson_export_is_gzipped_when_accepted(
+    make_client,
+    admin,
+    payments
+):
+    payments(3)
+
+    with make_client(router, admin).stream(
+        "GET",
+        "/admin/payment/export",
+        params={"format": "ndjson", "_from": "2030-01-01T00:00:00Z"},
+        headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+
+    lines = gzip.decompress(raw).decode().splitlines()
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert [json.loads(line)["currency"] for line in lines] == ["EUR"] * 3
+
+
+def test_export_checks_permissions_before_streaming(
+    make_client,
+    add_actor,
+    payments
+):
+    payments(3)
+    client = make_client(router, add_actor("Member"))
+
+    response = client.get("/admin/payment/export")
+
+    assert response.status_code == 403
+    assert "pi_0" not in response.text
+
+
+def test_accept_encoding_honours_q_values():
+    assert accepts_gzip("gzip, deflate")
+    assert accepts_gzip("br;q=1.0, gzip;q=0.8")
+    assert not accepts_gzip("gzip;q=0")
+    assert not accepts_gzip("identity")
+    assert not accepts_gzip(None)
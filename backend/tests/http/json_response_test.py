@@ -0,0 +1,84 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+import pytest
+from app.domain.auth.role import Role
+from app.domain.session.session_entity import SessionWithCoachEntity
+from app.domain.session.session_status import SessionStatus
+from app.feature.session.session_dto import (
+    CoachPublicDto,
+    GetOutputDto,
+    PaginatedSessionsOutputDTO
+)
+from app.feature.session.session_router import router
+from app.infrastructure.persistence.in_memory.functions import (
+    session_with_coach
+)
+from app.shared.utils.json_response import FastJSONResponse
+
+
+@pytest.fixture
+def sessions(storage, add_actor, add_session) -> list[SessionWithCoachEntity]:
+    """Four sessions of one coach, newest first."""
+    now = datetime(2030, 1, 1, 9, 30, tzinfo=timezone.utc)
+    coach = add_actor("Lovelace", Role.COACH)
+    session_ids = [
+        add_session(
+            coach,
+            now + timedelta(days=i),
+            title=f"Session {i}",
+            created_at=now - timedelta(microseconds=i)
+        ) for i in range(4)
+    ]
+
+    return [
+        session_with_coach(storage, storage.sessions[session_id])
+        for session_id in session_ids
+    ]
+
+
+def test_session_page_matches_the_documented_schema(make_client, sessions):
+    response = make_client(router).get(
+        "/sessions/",
+        params={"limit": 3}
+    )
+    page = PaginatedSessionsOutputDTO.model_validate_json(response.content)
+    expected = [
+        GetOutputDto(
+            id=session.id,
+            coach=CoachPublicDto(
+                id=session.coach.user_id,
+                first_name=session.coach.first_name,
+                last_name=session.coach.last_name
+            ),
+            title=session.title,
+            starts_at=session.starts_at,
+            ends_at=session.ends_at,
+            price_cents=session.price_cents,
+            currency=session.currency,
+            status=session.status
+        ).model_dump(mode="json") for session in sessions[:3]
+    ]
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()["items"] == expected
+    assert page.has_more and page.next_cursor is not None
+
+
+def test_models_render_like_pydantic():
+    model = GetOutputDto(
+        id=uuid4(),
+        coach=CoachPublicDto(id=uuid4(), first_name="Ada", last_name="L"),
+        title="Session",
+        starts_at=datetime(2030, 1, 1, tzinfo=timezone.utc),
+        ends_at=datetime(2030, 1, 1, 1, 0, 0, 5, tzinfo=timezone.utc),
+        price_cents=0,
+        currency="EUR",
+        status=SessionStatus.SCHEDULED
+    )
+
+    body = FastJSONResponse({"session": model}).body
+
+    assert json.loads(body)["session"] == json.loads(model.model_dump_json())
+    assert b'"2030-01-01T00:00:00Z"' in body
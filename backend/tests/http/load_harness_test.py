@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+import stripe
+from benchmarks.load.recorder import Recorder, compare, percentile
+from benchmarks.load.scenarios import run_jobs
+from benchmarks.load.stripe_stub import account_updated, sign
+
+
+def test_percentile_is_nearest_rank():
+    samples = [float(i) for i in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 95) == 95.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([3.0], 99) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_recorder_summary_per_route():
+    recorder = Recorder()
+
+    for ms in (10, 20, 30, 40):
+        recorder.record("GET /sessions/", 200, ms / 1000)
+
+    recorder.record("POST /auth/login", 401, 0.005)
+    summary = recorder.summary(elapsed=2.0)
+    listing = summary["routes"]["GET /sessions/"]
+
+    assert summary["requests"] == 5
+    assert listing["count"] == 4
+    assert listing["rps"] == 2.0
+    assert listing["p50_ms"] == pytest.approx(20)
+    assert listing["p99_ms"] == pytest.approx(40)
+    assert summary["routes"]["POST /auth/login"]["statuses"] == {"401": 1}
+
+
+def test_compare_reports_slower_routes_only():
+    def report(p95_ms: float, rps: float) -> dict:
+        return {"scenarios": {"browse": {"routes": {
+            "GET /sessions/": {"p95_ms": p95_ms, "rps": rps}
+        }}}}
+
+    assert compare(report(10, 100), report(10.5, 95), 0.1) == []
+    assert len(compare(report(10, 100), report(12, 80), 0.1)) == 2
+
+
+def test_stub_signature_is_accepted_by_stripe():
+    payload = account_updated("evt_load_1", "acct_load")
+
+    event = stripe.Webhook.construct_event(
+        payload=payload.encode("utf-8"),
+        sig_header=sign(payload, "whsec_test"),
+        secret="whsec_test"
+    )
+
+    assert event.type == "account.updated"
+    assert isinstance(event.data.object, stripe.Account)
+
+    with pytest.raises(stripe.SignatureVerificationError):
+        stripe.Webhook.construct_event(
+            payload=payload.encode("utf-8"),
+            sig_header=sign(payload, "whsec_other"),
+            secret="whsec_test"
+        )
+
+
+def test_run_jobs_bounds_concurrency():
+    running, peak, done = 0, 0, []
+
+    def job(i: int):
+        async def run() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            done.append(i)
+
+        return run
+
+    asyncio.run(run_jobs([job(i) for i in range(20)], concurrency=4))
+
+    assert sorted(done) == list(range(20))
+    assert peak == 4
@@ -0,0 +1,165 @@
+from types import SimpleNamespace
+from uuid import uuid4
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+from app.domain.auth.actor_entity import Actor
+from app.domain.auth.permission import ROLE_PERMISSIONS
+from app.domain.auth.role import Role
+from app.feature.auth.auth_exception import InvalidTokenError
+from app.infrastructure.metrics.prometheus import METRICS, MetricsRegistry
+from app.infrastructure.metrics.request_metrics import MetricsMiddleware
+from app.infrastructure.persistence.sqlalchemy.query_metrics import (
+    fingerprint,
+    install_query_metrics,
+    normalize
+)
+from app.infrastructure.security.provider import require_monitoring_access
+from app.shared.handlers import register_exception_handlers
+
+
+class _Jwt:
+    def decode_access_token(self, token):
+        if token not in {"admin", "user"}:
+            raise InvalidTokenError()
+
+        role = Role.ADMIN if token == "admin" else Role.USER
+
+        return Actor(uuid4(), "user", frozenset(ROLE_PERMISSIONS[role]))
+
+
+@pytest.fixture
+def client():
+    METRICS.clear()
+    fingerprint.cache_clear()
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    install_query_metrics(
+        SimpleNamespace(sync_engine=engine),  # type: ignore[arg-type]
+        "app_user"
+    )
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/sessions/{session_id}")
+    async def get_session(session_id: int):
+        if session_id == 0:
+            raise HTTPException(status_code=404)
+
+        with engine.connect() as conn:
+            for _ in range(session_id):
+                conn.execute(text("SELECT 1"))
+
+        return {"id": session_id}
+
+    @app.get("/metrics")
+    async def metrics():
+        return METRICS.render()
+
+    yield TestClient(app)
+
+    METRICS.clear()
+    engine.dispose()
+
+
+def test_normalize_strips_values_and_comments():
+    assert normalize(
+        "SELECT *  FROM app.sessions -- public\n"
+        "WHERE id = $1 AND title = 'it''s' AND capacity > 6\n"
+        "AND status IN ('a', 'b')"
+    ) == (
+        "SELECT * FROM app.sessions WHERE id = ? AND title = ? "
+        "AND capacity > ? AND status IN (?)"
+    )
+    assert fingerprint("SELECT 1") == fingerprint("SELECT   2")
+    assert fingerprint("SELECT 1") != fingerprint("SELECT 1 FROM t")
+
+
+def test_requests_are_labelled_by_route_template(client):
+    client.get("/sessions/3")
+    client.get("/sessions/1")
+    client.get("/sessions/0")
+    client.get("/missing")
+
+    body = METRICS.render()
+    route = 'method="GET",route="/sessions/{session_id}"'
+
+    assert (
+        f'http_request_duration_seconds_count{{{route},status="200"}} 2'
+        in body
+    )
+    assert (
+        f'http_request_duration_seconds_count{{{route},status="404"}} 1'
+        in body
+    )
+    assert 'route="unmatched",status="404"' in body
+    assert "/sessions/3" not in body
+
+
+def test_round_trips_are_counted_per_request(client):
+    client.get("/sessions/3")
+
+    body = METRICS.render()
+    route = 'method="GET",route="/sessions/{session_id}"'
+
+    assert f'http_request_db_round_trips_sum{{{route}}} 3' in body
+    assert (
+        f'http_request_db_round_trips_bucket{{{route},le="2.0"}} 0' in body
+    )
+    assert (
+        f'http_request_db_round_trips_bucket{{{route},le="3.0"}} 1' in body
+    )
+    assert (
+        'db_query_duration_seconds_count{engine="app_user",'
+        f'fingerprint="{fingerprint("SELECT 1")}"}} 3'
+    ) in body
+    assert 'statement="SELECT ?"} 1' in body
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency", "Latency.", ("path",), (1, 0.5))
+    latency.observe(('say "hi"\n',), 0.5)
+    latency.observe(('say "hi"\n',), 3)
+
+    assert registry.render().splitlines() == [
+        "# HELP latency Latency.",
+        "# TYPE latency histogram",
+        'latency_bucket{path="say \\"hi\\"\\n",le="0.5"} 1',
+        'latency_bucket{path="say \\"hi\\"\\n",le="1.0"} 1',
+        'latency_bucket{path="say \\"hi\\"\\n",le="+Inf"} 2',
+        'latency_sum{path="say \\"hi\\"\\n"} 3.5',
+        'latency_count{path="say \\"hi\\"\\n"} 2',
+    ]
+
+    with pytest.raises(ValueError):
+        registry.gauge("latency", "Duplicate.", ())
+
+
+@pytest.mark.parametrize(("token", "status"), [
+    (None, 401),
+    ("forged", 401),
+    ("user", 403),
+    ("admin", 200),
+    ("scraper-secret", 200),
+])
+def test_metrics_need_the_monitoring_token_or_an_admin(token, status):
+    app = FastAPI()
+    app.state.jwt = _Jwt()
+    app.state.settings = SimpleNamespace(monitoring_token="scraper-secret")
+    register_exception_handlers(app)
+
+    @app.get("/metrics", dependencies=[Depends(require_monitoring_access)])
+    async def metrics():
+        return "ok"
+
+    headers = {} if token is None else {"Authorization": f"Bearer {token}"}
+
+    assert TestClient(app).get("/metrics", headers=headers).status_code == (
+        status
+    )
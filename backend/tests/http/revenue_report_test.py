@@ -0,0 +1,75 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+import pytest
+from app.domain.auth.role import Role
+from app.feature.admin.payment.admin_payment_router import router
+
+_JANUARY = datetime(2030, 1, 10, tzinfo=timezone.utc)
+_FEBRUARY = datetime(2030, 2, 10, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def coaches(add_actor, add_session, add_payment):
+    """Two coaches paid for three sessions in January and one in
+    February."""
+    first = add_actor("First", Role.COACH)
+    second = add_actor("Second", Role.COACH)
+
+    for coach, paid_at in (
+        (first, _JANUARY),
+        (first, _JANUARY),
+        (second, _JANUARY),
+        (first, _FEBRUARY),
+    ):
+        add_payment(add_session(coach, paid_at), paid_at)
+
+    return first, second
+
+
+def test_monthly_totals_read_the_rollup(make_client, add_actor, coaches):
+    client = make_client(router, add_actor("Admin", Role.ADMIN))
+
+    response = client.get(
+        "/admin/payment/revenue",
+        params={"_from": "2030-01-01", "to": "2030-01-01"}
+    )
+
+    assert response.status_code == 200
+    assert [
+        (item["month"], item["payment_count"], item["net_amount_cents"])
+        for item in response.json()["items"]
+    ] == [("2030-01-01", 3, 4350)]
+
+
+def test_coach_grouping_keeps_both_dimensions(
+    make_client,
+    add_actor,
+    coaches
+):
+    first, _ = coaches
+    client = make_client(router, add_actor("Admin", Role.ADMIN))
+
+    response = client.get(
+        "/admin/payment/revenue",
+        params={"group_by": "coach_month", "coach_id": str(first.id)}
+    )
+
+    assert response.status_code == 200
+    assert [
+        (item["coach_id"], item["month"], item["payment_count"])
+        for item in response.json()["items"]
+    ] == [
+        (str(first.id), "2030-01-01", 2),
+        (str(first.id), "2030-02-01", 1),
+    ]
+
+
+def test_unknown_coach_is_not_found(make_client, add_actor, coaches):
+    client = make_client(router, add_actor("Admin", Role.ADMIN))
+
+    response = client.get(
+        "/admin/payment/revenue",
+        params={"coach_id": str(uuid4())}
+    )
+
+    assert response.status_code == 404
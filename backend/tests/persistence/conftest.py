@@ -0,0 +1,51 @@
+from contextlib import asynccontextmanager
+import pytest
+
+
+class _Result:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one(self):
+        return self._value
+
+
+class _Session:
+    def __init__(self, factory: "_SessionFactory"):
+        self._factory = factory
+
+    @asynccontextmanager
+    async def begin(self):
+        try:
+            yield
+        except Exception:
+            self._factory.log.append("rollback")
+            raise
+        self._factory.log.append("commit")
+
+    async def execute(self, stmt, params):
+        self._factory.params.append(params)
+        return _Result(self._factory.results.pop(0))
+
+
+class _SessionFactory:
+    """Stands in for an ``async_sessionmaker``.
+
+    Transactions append ``commit`` or ``rollback`` to ``log``, which
+    tests share to check what ran inside them. ``execute`` records its
+    parameters and returns the next of ``results`` as a scalar.
+    """
+
+    def __init__(self):
+        self.log: list[str] = []
+        self.params: list[dict] = []
+        self.results: list[object] = []
+
+    @asynccontextmanager
+    async def __call__(self):
+        yield _Session(self)
+
+
+@pytest.fixture
+def session_factory() -> _SessionFactory:
+    return _SessionFactory()
@@ -0,0 +1,354 @@
+from datetime import timedelta
+from uuid import UUID, uuid4
+import pytest
+import stripe
+from app.domain.auth.actor_entity import Actor
+from app.domain.auth.permission import permissions_for
+from app.domain.auth.role import Role
+from app.domain.payment.payment_entity import PaymentEntity
+from app.domain.payment_intent.payment_intent_entity import (
+    NewPaymentIntentEntity
+)
+from app.domain.payment_intent.payment_intent_providers import PaymentProvider
+from app.domain.credit.credit_cause import CreditCause
+from app.domain.session.session_exception import (
+    AlreadyActiveParticipationError,
+    OwnerCantRegisterToOwnSessionError,
+    SessionNotFoundError,
+    SessionOverlappingError
+)
+from app.domain.session_participation.session_participation_entity import (
+    NewSessionParticipationEntity
+)
+from app.domain.user.user_entity import UserEntity
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.feature.coach.coach_service import CoachService
+from app.feature.session.session_dto import SessionCreationInputDTO
+from app.feature.session.session_service import SessionService
+from app.feature.stripe.stripe_service import StripeService
+from app.infrastructure.persistence.in_memory.functions import (
+    append_credit,
+    balance,
+    cancel_session
+)
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryAdminCreditLedgerReadRepo,
+    InMemoryCreditLedgerReadRepo
+)
+from app.infrastructure.persistence.in_memory.storage import (
+    CoachStripeAccountRow,
+    InMemoryStorage,
+    intent_key
+)
+from app.infrastructure.persistence.in_memory.uow.coach.coach_uow import (
+    InMemoryCoachUoW
+)
+from app.infrastructure.persistence.in_memory.uow.session import (
+    InMemorySessionUoW
+)
+from app.infrastructure.persistence.in_memory.uow.stripe.stripe_uow import (
+    InMemoryStripeUoW
+)
+from app.shared.utils.time import utcnow
+
+pytestmark = pytest.mark.anyio
+
+
+def _actor(storage: InMemoryStorage, last_name: str, *roles: Role) -> Actor:
+    user_id = uuid4()
+    storage.add_user(
+        UserEntity(
+            id=user_id,
+            email=f"{last_name.lower()}@test.com",
+            password_hash="hash",
+            roles={Role.USER, *roles},
+            disabled_at=None,
+            disabled_reason=None
+        ),
+        UserProfileEntity(user_id, "Test", last_name)
+    )
+
+    return Actor(user_id, "user", permissions_for({Role.USER, *roles}))
+
+
+def _coach(storage: InMemoryStorage, last_name: str = "Coach") -> Actor:
+    coach = _actor(storage, last_name, Role.COACH)
+    storage.coach_stripe_accounts[coach.id] = CoachStripeAccountRow(
+        coach_id=coach.id,
+        stripe_account_id=f"acct_{coach.id.hex}",
+        details_submitted=True,
+        charges_enabled=True,
+        payouts_enabled=True
+    )
+
+    return coach
+
+
+async def _create_session(
+    storage: InMemoryStorage,
+    coach: Actor,
+    price_cents: int = 0,
+    hours: int = 24
+) -> UUID:
+    starts_at = utcnow() + timedelta(hours=hours)
+
+    await SessionService().create_session(
+        uow=InMemorySessionUoW(storage, coach.id),
+        actor=coach,
+        input=SessionCreationInputDTO(
+            title="Morning yoga",
+            starts_at=starts_at,
+            ends_at=starts_at + timedelta(hours=1),
+            price_cents=price_cents,
+            currency="eur",
+            capacity=10
+        )
+    )
+
+    return storage.sessions_by_coach[coach.id][-1]
+
+
+async def _hold_seat(
+    storage: InMemoryStorage,
+    session_id: UUID,
+    user: Actor,
+    expires_in: timedelta
+) -> None:
+    """Unpaid seat with its Stripe checkout, as ``register_user`` leaves
+    it after redirecting to Stripe."""
+    uow = InMemorySessionUoW(storage, user.id)
+
+    await uow.payment_intent_creation_repo.create_payment_intent(
+        NewPaymentIntentEntity(
+            user_id=user.id,
+            session_id=session_id,
+            provider=PaymentProvider.STRIPE,
+            provider_intent_id=None,
+            provider_checkout_id=f"cs_{user.id.hex}",
+            status="open",
+            credit_applied_cents=0,
+            amount_cents=1500,
+            currency="EUR"
+        )
+    )
+    await uow.session_participation_creation_repo.create_participation(
+        participation=NewSessionParticipationEntity(session_id, user.id),
+        expires_at=utcnow() + expires_in
+    )
+
+
+async def test_session_lifecycle_through_services():
+    storage = InMemoryStorage()
+    coach = _coach(storage)
+    user = _actor(storage, "Member")
+    session_id = await _create_session(storage, coach)
+
+    with pytest.raises(SessionOverlappingError):
+        await _create_session(storage, coach)
+
+    coach_uow = InMemoryCoachUoW(storage, coach.id)
+    before = await CoachService().get_session_version(
+        session_id, coach_uow, coach
+    )
+
+    required_payment, url = await SessionService().register_user(
+        session_id=session_id,
+        actor=user,
+        uow=InMemorySessionUoW(storage, user.id),
+        session_ttl=900,
+        front_end_url="http://front.test"
+    )
+
+    assert (required_payment, url) == (False, None)
+
+    session = await CoachService().get_session_by_id(
+        session_id, coach_uow, coach
+    )
+    sessions, has_more, _ = await CoachService().get_own_sessions(
+        actor=coach,
+        uow=coach_uow,
+        limit=10,
+        offset=0,
+        _from=None,
+        to=None
+    )
+
+    assert session.currency == "EUR"
+    assert [p.last_name for p in session.participants] == ["Member"]
+    assert [s.id for s in sessions] == [session_id]
+    assert not has_more
+    assert await CoachService().get_session_version(
+        session_id, coach_uow, coach
+    ) != before
+
+
+async def _register(storage: InMemoryStorage, session_id: UUID, user: Actor):
+    return await SessionService().register_user(
+        session_id=session_id,
+        actor=user,
+        uow=InMemorySessionUoW(storage, user.id),
+        session_ttl=900,
+        front_end_url="http://front.test"
+    )
+
+
+async def test_registration_preflight_guards():
+    storage = InMemoryStorage()
+    coach = _coach(storage)
+    user = _actor(storage, "Member")
+    session_id = await _create_session(storage, coach)
+
+    with pytest.raises(SessionNotFoundError):
+        await _register(storage, uuid4(), user)
+
+    with pytest.raises(OwnerCantRegisterToOwnSessionError):
+        await _register(storage, session_id, coach)
+
+    await _register(storage, session_id, user)
+
+    with pytest.raises(AlreadyActiveParticipationError):
+        await _register(storage, session_id, user)
+
+
+async def test_registration_is_paid_with_credit_in_session_currency():
+    storage = InMemoryStorage()
+    coach = _coach(storage)
+    user = _actor(storage, "Member")
+    session_id = await _create_session(storage, coach, price_cents=1500)
+    append_credit(storage, user.id, 2000, "EUR", CreditCause.ADMIN_ADJUSTMENT)
+    append_credit(storage, user.id, 5000, "USD", CreditCause.ADMIN_ADJUSTMENT)
+
+    assert await _register(storage, session_id, user) == (False, None)
+
+    assert balance(storage, user.id, "EUR") == 500
+    assert balance(storage, user.id, "USD") == 5000
+
+
+async def test_credit_balance_snapshot_matches_the_ledger():
+    storage = InMemoryStorage()
+    coach = _coach(storage)
+    user = _actor(storage, "Member")
+    admin = _actor(storage, "Admin", Role.ADMIN)
+    paid_with_credit = await _create_session(
+        storage, coach, price_cents=1500
+    )
+    paid_by_card = await _create_session(
+        storage, coach, price_cents=1500, hours=72
+    )
+    append_credit(storage, user.id, 2000, "EUR", CreditCause.ADMIN_ADJUSTMENT)
+    append_credit(storage, user.id, 700, "USD", CreditCause.ADMIN_ADJUSTMENT)
+    await _register(storage, paid_with_credit, user)
+    storage.add_payment(PaymentEntity(
+        id=uuid4(),
+        session_id=paid_by_card,
+        user_id=user.id,
+        provider="stripe",
+        provider_payment_id="pi_card",
+        gross_amount_cents=1500,
+        provider_fee_cents=75,
+        net_amount_cents=1425,
+        currency="EUR",
+        created_at=utcnow()
+    ))
+    cancel_session(storage, paid_by_card)
+
+    ledger = storage.credit_ledger_by_user[user.id]
+    eur = [entry for entry in ledger if entry.currency == "EUR"]
+
+    assert [entry.cause for entry in eur] == [
+        CreditCause.ADMIN_ADJUSTMENT,
+        CreditCause.SESSION_USAGE,
+        CreditCause.SESSION_CANCELLED
+    ]
+    assert balance(storage, user.id, "EUR") == sum(
+        entry.amount_cents for entry in eur
+    ) == eur[-1].balance_after_cents == 2000 - 1500 + 1425
+    assert balance(storage, user.id, "USD") == 700
+    assert await InMemoryCreditLedgerReadRepo(
+        storage, user.id
+    ).fetch_credit_by_user_id(user.id, "EUR") == 1925
+    assert await InMemoryAdminCreditLedgerReadRepo(
+        storage, admin.id
+    ).get_balance_drift() == []
+
+
+async def test_sessions_of_different_coaches_cannot_overlap():
+    storage = InMemoryStorage()
+    first, second = _coach(storage), _coach(storage, "Other")
+    await _create_session(storage, first)
+
+    with pytest.raises(SessionOverlappingError):
+        await _create_session(storage, second)
+
+    later = await _create_session(storage, second, hours=26)
+    session = storage.sessions[later]
+    second_repo = InMemorySessionUoW(storage, second.id).session_update_repo
+
+    with pytest.raises(SessionOverlappingError):
+        await second_repo.update_session(
+            later,
+            session.title,
+            session.starts_at - timedelta(minutes=90),
+            session.ends_at
+        )
+
+    first_repo = InMemorySessionUoW(storage, first.id).session_update_repo
+    await first_repo.cancel_session(storage.sessions_by_coach[first.id][0])
+    await _create_session(storage, second)
+
+
+async def test_release_expired_cancels_intents():
+    storage = InMemoryStorage()
+    coach = _coach(storage)
+    late, on_time = _actor(storage, "Late"), _actor(storage, "OnTime")
+    session_id = await _create_session(storage, coach, price_cents=1500)
+
+    await _hold_seat(storage, session_id, late, timedelta(minutes=-1))
+    await _hold_seat(storage, session_id, on_time, timedelta(minutes=15))
+
+    sweep = await StripeService().release_expired_participations(
+        InMemoryStripeUoW(storage), batch_size=100
+    )
+
+    assert sweep.released == 1
+    assert sweep.checkout_ids == (f"cs_{late.id.hex}",)
+    assert storage.sessions[session_id].seats_taken == 1
+    assert storage.payment_intents[
+        intent_key(late.id, session_id, PaymentProvider.STRIPE)
+    ].status == "canceled"
+
+
+async def test_payment_failed_event_frees_the_seat():
+    storage = InMemoryStorage()
+    coach = _coach(storage)
+    user = _actor(storage, "Member")
+    session_id = await _create_session(storage, coach, price_cents=1500)
+    await _hold_seat(storage, session_id, user, timedelta(minutes=15))
+
+    event = stripe.Event.construct_from({
+        "id": "evt_1",
+        "object": "event",
+        "type": "payment_intent.payment_failed",
+        "data": {"object": {
+            "id": "pi_1",
+            "object": "payment_intent",
+            "status": "requires_payment_method",
+            "metadata": {
+                "user_id": str(user.id),
+                "session_id": str(session_id)
+            }
+        }}
+    }, "sk_test")
+
+    await StripeService().handle_stripe_event(
+        InMemoryStripeUoW(storage), event, stripe_client=None  # type: ignore
+    )
+
+    intent = storage.payment_intents[
+        intent_key(user.id, session_id, PaymentProvider.STRIPE)
+    ]
+
+    assert intent.provider_intent_id == "pi_1"
+    assert intent.status == "requires_payment_method"
+    assert storage.participations[session_id][user.id].cancelled_at
+    assert storage.sessions[session_id].seats_taken == 0
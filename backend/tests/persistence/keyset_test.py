@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+import pytest
+from app.infrastructure.persistence.sqlalchemy.repositories.keyset import (
+    keyset_params,
+    keyset_statement
+)
+from app.shared.exceptions.commons import InvalidCursorError
+from app.shared.utils.cursor import (
+    Cursor,
+    decode_cursor,
+    encode_cursor,
+    next_cursor
+)
+
+
+@dataclass(frozen=True)
+class _Row:
+    id: UUID
+    created_at: datetime
+
+
+def test_cursor_round_trip():
+    cursor = Cursor(
+        created_at=datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc),
+        id=uuid4()
+    )
+
+    assert decode_cursor(encode_cursor(cursor)) == cursor
+
+
+def test_missing_cursor_decodes_to_none():
+    assert decode_cursor(None) is None
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "W10", "WyJ4IiwieSJd"])
+def test_invalid_cursor_is_rejected(token):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+def test_naive_cursor_is_rejected():
+    token = encode_cursor(Cursor(created_at=datetime(2025, 3, 1), id=uuid4()))
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+def test_next_cursor_points_at_last_row():
+    rows = [
+        _Row(id=uuid4(), created_at=datetime.now(timezone.utc))
+        for _ in range(3)
+    ]
+
+    cursor = decode_cursor(next_cursor(rows, has_more=True))
+
+    assert cursor == Cursor(created_at=rows[-1].created_at, id=rows[-1].id)
+    assert next_cursor(rows, has_more=False) is None
+
+
+_USERS = keyset_statement(
+    "keyset_test.list_users",
+    "SELECT u.id FROM app.users u WHERE {keyset} "
+    "ORDER BY u.created_at DESC, u.id DESC",
+    "u"
+)
+
+
+def test_no_cursor_keeps_offset_pagination():
+    assert _USERS.select(None).text == (
+        "SELECT u.id FROM app.users u WHERE TRUE "
+        "ORDER BY u.created_at DESC, u.id DESC"
+    )
+    assert keyset_params(None, 40) == {"offset": 40}
+
+
+def test_cursor_overrides_offset():
+    cursor = Cursor(created_at=datetime.now(timezone.utc), id=uuid4())
+
+    assert "WHERE (u.created_at, u.id) < (" in _USERS.select(cursor).text
+    assert keyset_params(cursor, 40) == {
+        "offset": 0,
+        "cursor_created_at": cursor.created_at,
+        "cursor_id": cursor.id,
+    }
@@ -0,0 +1,141 @@
+from uuid import uuid4
+import pytest
+import stripe
+from app.domain.session_participation.session_participation_entity import (
+    ParticipationSweepEntity,
+    ReleasedParticipationEntity
+)
+from app.feature.stripe.stripe_service import StripeService
+from app.infrastructure.persistence.sqlalchemy.participation_sweeper import (
+    ParticipationSweeper
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class _ScriptedService(StripeService):
+    def __init__(self, log: list[str], batches, failing=()):
+        self._log = log
+        self._batches = list(batches)
+        self._failing = set(failing)
+
+    async def release_expired_participations(self, uow, batch_size):
+        return self._batches.pop(0)
+
+    async def expire_checkout(self, stripe_client, checkout_id):
+        self._log.append(checkout_id)
+        if checkout_id in self._failing:
+            raise stripe.InvalidRequestError("already expired", None)
+
+
+class _ParticipationRepo:
+    def __init__(self, released):
+        self.released = released
+
+    async def release_expired(self, limit):
+        return self.released[:limit]
+
+
+class _IntentRepo:
+    def __init__(self):
+        self.cancelled: list[ReleasedParticipationEntity] = []
+
+    async def cancel_for_participations(self, participations):
+        self.cancelled.extend(participations)
+        return ["cs_1", None][:len(participations)]
+
+
+class _UoW:
+    def __init__(self, released):
+        self.session_participation_update_repo = _ParticipationRepo(released)
+        self.payment_intent_update_repo = _IntentRepo()
+
+
+def _sweep(released: int, *checkout_ids: str) -> ParticipationSweepEntity:
+    return ParticipationSweepEntity(
+        released=released,
+        intents_cancelled=len(checkout_ids),
+        checkout_ids=checkout_ids
+    )
+
+
+def _sweeper(factory, service, batch_size=2) -> ParticipationSweeper:
+    return ParticipationSweeper(
+        session_factory=factory,  # type: ignore[arg-type]
+        service=service,
+        stripe_client=None,  # type: ignore[arg-type]
+        batch_size=batch_size,
+        max_batches=5
+    )
+
+
+async def test_pass_drains_batches_until_a_short_one(session_factory):
+    service = _ScriptedService(session_factory.log, [
+        _sweep(2, "cs_1"),
+        _sweep(2),
+        _sweep(1, "cs_2"),
+        _sweep(0),
+    ])
+
+    stats = await _sweeper(session_factory, service).run_once()
+
+    assert stats["batches"] == 3
+    assert stats["released"] == 5
+    assert stats["intents_cancelled"] == 2
+    assert stats["checkouts_expired"] == 2
+    assert stats["duration_ms"] >= 0
+
+
+async def test_checkouts_are_expired_after_commit(session_factory):
+    service = _ScriptedService(session_factory.log, [_sweep(1, "cs_1")])
+
+    await _sweeper(session_factory, service).run_once()
+
+    assert session_factory.log == ["commit", "cs_1"]
+
+
+async def test_stripe_error_is_counted_not_raised(session_factory):
+    service = _ScriptedService(
+        session_factory.log,
+        [_sweep(2, "cs_1", "cs_2"), _sweep(0)],
+        failing={"cs_1"}
+    )
+    sweeper = _sweeper(session_factory, service)
+
+    await sweeper.run_once()
+
+    assert sweeper.status()["checkouts_expired"] == 1
+    assert sweeper.status()["checkout_errors"] == 1
+    assert sweeper.status()["passes"] == 1
+
+
+async def test_released_participations_cancel_their_intents():
+    released = [
+        ReleasedParticipationEntity(session_id=uuid4(), user_id=uuid4())
+        for _ in range(2)
+    ]
+    uow = _UoW(released)
+
+    sweep = await StripeService().release_expired_participations(
+        uow,  # type: ignore[arg-type]
+        batch_size=10
+    )
+
+    assert uow.payment_intent_update_repo.cancelled == released
+    assert sweep == ParticipationSweepEntity(
+        released=2,
+        intents_cancelled=2,
+        checkout_ids=("cs_1",)
+    )
+
+
+async def test_nothing_expired_touches_no_intent():
+    uow = _UoW([])
+
+    sweep = await StripeService().release_expired_participations(
+        uow,  # type: ignore[arg-type]
+        batch_size=10
+    )
+
+    assert sweep.released == 0
+    assert uow.payment_intent_update_repo.cancelled == []
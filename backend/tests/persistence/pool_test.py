@@ -0,0 +1,82 @@
+import sqlite3
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from app.infrastructure.persistence.sqlalchemy.pool import (
+    InstrumentedPoolMixin,
+    pool_status
+)
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+def make_pool(**kwargs) -> InstrumentedQueuePool:
+    return InstrumentedQueuePool(
+        lambda: sqlite3.connect(":memory:"),
+        **kwargs
+    )
+
+
+def test_pool_status_tracks_checked_out_connections():
+    pool = make_pool(pool_size=2, max_overflow=1)
+
+    first = pool.connect()
+    second = pool.connect()
+    third = pool.connect()
+
+    status = pool_status(pool)
+
+    assert status["checked_out"] == 3
+    assert status["overflow"] == 1
+    assert status["checkouts"] == 3
+    assert status["timeouts"] == 0
+
+    for conn in (first, second, third):
+        conn.close()
+
+    assert pool_status(pool)["checked_out"] == 0
+
+
+def test_pool_status_counts_timeouts():
+    pool = make_pool(pool_size=1, max_overflow=0, timeout=0.01)
+
+    held = pool.connect()
+
+    with pytest.raises(exc.TimeoutError):
+        pool.connect()
+
+    status = pool_status(pool)
+
+    assert status["timeouts"] == 1
+    assert status["checkouts"] == 1
+
+    held.close()
+
+
+def test_failed_checkout_is_not_a_wait():
+    def refuse():
+        raise sqlite3.OperationalError("database is down")
+
+    pool = InstrumentedQueuePool(refuse, pool_size=1, max_overflow=0)
+
+    with pytest.raises(sqlite3.OperationalError):
+        pool.connect()
+
+    status = pool_status(pool)
+
+    assert status["checkouts"] == 0
+    assert status["timeouts"] == 0
+    assert status["wait_seconds_total"] == 0
+
+
+def test_pool_stats_survive_recreate():
+    pool = make_pool(pool_size=1, max_overflow=0)
+    pool.connect().close()
+
+    recreated = pool.recreate()
+
+    assert recreated.stats is pool.stats
+    assert pool_status(recreated)["checkouts"] == 1
@@ -0,0 +1,130 @@
+from uuid import uuid4
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from app.infrastructure.persistence.sqlalchemy.rls import (
+    CURRENT_USER_SETTING
+)
+from app.infrastructure.persistence.sqlalchemy.uow.predicate_memo import (
+    MEMO_INFO_KEY,
+    SESSION_CANCELLED,
+    SESSION_EXISTS,
+    SESSION_OWNER,
+    USER_DISABLED,
+    PredicateMemo,
+    hint_predicate_params
+)
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def one(self):
+        return self._row
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.info = {}
+        self.statements = []
+
+    async def execute(self, stmt, params):
+        self.statements.append((str(stmt), params))
+        return _Result(tuple(True for _ in params))
+
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_session_family_is_fetched_in_one_statement():
+    session = _RecordingSession()
+    actor_id = uuid4()
+    session_id = uuid4()
+    session.info[CURRENT_USER_SETTING] = actor_id
+    memo = PredicateMemo(session)
+
+    await memo.evaluate(SESSION_EXISTS, session_id=session_id)
+    await memo.evaluate(SESSION_CANCELLED, session_id=session_id)
+    await memo.evaluate(
+        SESSION_OWNER,
+        session_id=session_id,
+        user_id=actor_id
+    )
+
+    assert len(session.statements) == 1
+    sql, params = session.statements[0]
+    assert "app_fcn.is_session_owner(:p2_user_id, :p2_session_id)" in sql
+    assert params["p2_user_id"] == str(actor_id)
+    assert (memo.hits, memo.misses) == (2, 1)
+
+
+async def test_other_arguments_are_not_served_from_memo():
+    session = _RecordingSession()
+    memo = PredicateMemo(session)
+
+    await memo.evaluate(USER_DISABLED, user_id=uuid4())
+    await memo.evaluate(USER_DISABLED, user_id=uuid4())
+
+    assert len(session.statements) == 2
+
+
+async def test_actor_guard_is_fetched_with_the_route_session():
+    session = _RecordingSession()
+    actor_id = uuid4()
+    session_id = uuid4()
+    session.info[CURRENT_USER_SETTING] = actor_id
+    hint_predicate_params(session, {"session_id": str(session_id)})
+    memo = PredicateMemo(session)
+
+    await memo.evaluate(USER_DISABLED, user_id=actor_id)
+    await memo.evaluate(SESSION_EXISTS, session_id=session_id)
+    await memo.evaluate(SESSION_CANCELLED, session_id=session_id)
+    await memo.evaluate(
+        SESSION_OWNER,
+        session_id=session_id,
+        user_id=actor_id
+    )
+
+    assert len(session.statements) == 1
+    assert (memo.hits, memo.misses) == (3, 1)
+
+
+async def test_session_guards_fetch_the_actor_guard():
+    session = _RecordingSession()
+    actor_id = uuid4()
+    session.info[CURRENT_USER_SETTING] = actor_id
+    memo = PredicateMemo(session)
+
+    await memo.evaluate(SESSION_EXISTS, session_id=uuid4())
+    await memo.evaluate(USER_DISABLED, user_id=actor_id)
+
+    assert len(session.statements) == 1
+
+
+async def test_malformed_route_session_id_is_not_hinted():
+    session = _RecordingSession()
+    hint_predicate_params(session, {"session_id": "not-a-uuid"})
+    memo = PredicateMemo(session)
+
+    await memo.evaluate(USER_DISABLED, user_id=uuid4())
+
+    sql, _ = session.statements[0]
+    assert "session_exists" not in sql
+
+
+async def test_memo_is_cleared_by_other_statements():
+    recording = _RecordingSession()
+    memo = PredicateMemo(recording)
+    session_id = uuid4()
+
+    await memo.evaluate(SESSION_EXISTS, session_id=session_id)
+
+    with Session(create_engine("sqlite://")) as session:
+        session.info[MEMO_INFO_KEY] = memo
+        session.execute(text("SELECT 1"))
+
+    await memo.evaluate(SESSION_EXISTS, session_id=session_id)
+
+    assert len(recording.statements) == 2
+    assert (memo.hits, memo.misses) == (0, 2)
@@ -0,0 +1,64 @@
+import pytest
+from app.infrastructure.persistence.sqlalchemy.periodic_worker import (
+    PeriodicBatchWorker
+)
+from app.infrastructure.persistence.sqlalchemy.refresh_token_compactor import (
+    RefreshTokenCompactor
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def _compactor(factory, max_batches=10) -> RefreshTokenCompactor:
+    return RefreshTokenCompactor(
+        session_factory=factory,  # type: ignore[arg-type]
+        grace_seconds=3600,
+        batch_size=100,
+        max_batches=max_batches
+    )
+
+
+async def test_pass_deletes_in_batches_until_a_short_one(session_factory):
+    session_factory.results.extend([100, 100, 7, 0])
+    compactor = _compactor(session_factory)
+
+    stats = await compactor.run_once()
+
+    assert stats["batches"] == 3
+    assert stats["deleted"] == 207
+    assert session_factory.log == ["commit"] * 3
+    assert session_factory.params[0] == {
+        "grace_seconds": 3600,
+        "limit": 100
+    }
+
+
+async def test_pass_stops_at_max_batches(session_factory):
+    session_factory.results.extend([100, 100, 100])
+    compactor = _compactor(session_factory, max_batches=2)
+
+    stats = await compactor.run_once()
+
+    assert stats["batches"] == 2
+    assert session_factory.results == [100]
+
+
+async def test_totals_accumulate_across_passes(session_factory):
+    session_factory.results.extend([3, 0])
+    compactor = _compactor(session_factory)
+
+    await compactor.run_once()
+    await compactor.run_once()
+
+    assert compactor.status()["passes"] == 2
+    assert compactor.status()["deleted"] == 3
+    assert compactor.status()["last_pass"]["deleted"] == 0
+
+
+def test_worker_without_its_hooks_cannot_be_created(session_factory):
+    class _Unsettled(PeriodicBatchWorker[int]):
+        async def _run_batch(self, session):
+            return 0
+
+    with pytest.raises(TypeError):
+        _Unsettled(session_factory, 1, 1, 1)  # type: ignore[abstract]
@@ -0,0 +1,22 @@
+from uuid import uuid4
+import pytest
+from app.infrastructure.persistence.sqlalchemy.rls import with_actor_prologue
+
+
+def test_prologue_appends_transaction_local_binding():
+    user_id = uuid4()
+
+    query = with_actor_prologue(
+        "BEGIN ISOLATION LEVEL READ COMMITTED;",
+        user_id
+    )
+
+    assert query == (
+        "BEGIN ISOLATION LEVEL READ COMMITTED; "
+        f"SELECT set_config('app.current_user_id', '{user_id}', true);"
+    )
+
+
+def test_prologue_rejects_non_uuid_actor():
+    with pytest.raises(ValueError):
+        with_actor_prologue("BEGIN;", "x'); DROP TABLE app.users; --")
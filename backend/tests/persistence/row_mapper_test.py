@@ -0,0 +1,133 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+import pytest
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+from app.domain.payment.payment_entity import PaymentEntity
+from app.domain.session.session_entity import (
+    RegistrationPreflightEntity,
+    SessionCompleteEntity,
+    SessionEntity
+)
+from app.domain.session.session_status import SessionStatus
+from app.domain.user.user_profile_entity import UserProfileEntity
+from app.infrastructure.persistence.sqlalchemy.repositories.row_mapper import (
+    Column,
+    OptionalRow,
+    RowMapper
+)
+
+_PARTICIPANT = RowMapper(UserProfileEntity)
+
+_SESSION = RowMapper(
+    SessionCompleteEntity,
+    coach=RowMapper(UserProfileEntity, user_id="coach_id"),
+    status=Column("status", SessionStatus),
+    participants=Column("participants", _PARTICIPANT.objects)
+)
+
+
+def _result(keys: list[str], *rows: tuple) -> IteratorResult:
+    return IteratorResult(SimpleResultMetaData(keys), iter(rows))
+
+
+def test_fields_are_read_by_name_whatever_the_column_order():
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    session_id, coach_id, user_id = uuid4(), uuid4(), uuid4()
+    keys = [
+        "participants", "updated_at", "created_at", "currency",
+        "price_cents", "cancelled_at", "status", "ends_at", "starts_at",
+        "title", "last_name", "first_name", "coach_id", "id",
+    ]
+    participants = [
+        {"user_id": user_id, "first_name": "Ada", "last_name": "L"}
+    ]
+
+    session = _SESSION.one(_result(keys, (
+        participants, now, now, "EUR", 1500, None, "scheduled", now, now,
+        "Yoga", "Hopper", "Grace", coach_id, session_id
+    )))
+
+    assert session == SessionCompleteEntity(
+        id=session_id,
+        coach=UserProfileEntity(coach_id, "Grace", "Hopper"),
+        title="Yoga",
+        starts_at=now,
+        ends_at=now,
+        status=SessionStatus.SCHEDULED,
+        cancelled_at=None,  # type: ignore[arg-type]
+        price_cents=1500,
+        currency="EUR",
+        created_at=now,
+        updated_at=now,
+        participants=[UserProfileEntity(user_id, "Ada", "L")]
+    )
+
+
+def test_constructor_is_built_once_per_result_shape():
+    mapper = RowMapper(UserProfileEntity)
+    keys = ("user_id", "first_name", "last_name")
+
+    first = mapper.builder(keys)
+
+    assert mapper.builder(list(keys)) is first
+    assert mapper.builder(("extra",) + keys) is not first
+    assert mapper.all(_result(list(keys), (1, "a", "b"), (2, "c", "d"))) == [
+        UserProfileEntity(1, "a", "b"),  # type: ignore[arg-type]
+        UserProfileEntity(2, "c", "d"),  # type: ignore[arg-type]
+    ]
+
+
+def test_missing_column_and_unknown_field_are_rejected():
+    with pytest.raises(KeyError, match="last_name"):
+        RowMapper(UserProfileEntity).builder(("user_id", "first_name"))
+
+    with pytest.raises(ValueError, match="nickname"):
+        RowMapper(UserProfileEntity, nickname="nick")
+
+
+def test_one_or_none_and_slotted_entities():
+    assert RowMapper(PaymentEntity).one_or_none(_result(["id"])) is None
+    assert not hasattr(UserProfileEntity(uuid4(), "a", "b"), "__dict__")
+
+
+def test_optional_row_is_none_when_its_key_is_null():
+    now = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    session_id, coach_id = uuid4(), uuid4()
+    mapper = RowMapper(
+        RegistrationPreflightEntity,
+        session=OptionalRow(
+            RowMapper(SessionEntity, status=Column("status", SessionStatus))
+        )
+    )
+    keys = [
+        "user_disabled", "session_owner", "session_cancelled",
+        "active_participation", "session_full", "registration_open",
+        "id", "coach_id", "title", "starts_at", "ends_at", "status",
+        "cancelled_at", "price_cents", "currency", "created_at",
+        "updated_at", "credit_cents",
+    ]
+    flags = (False, False, False, False, False, True)
+
+    found, missing = mapper.all(_result(
+        keys,
+        (*flags, session_id, coach_id, "Yoga", now, now, "scheduled",
+         None, 1500, "EUR", now, now, 200),
+        (*flags, *[None] * 11, None)
+    ))
+
+    assert found.session == SessionEntity(
+        id=session_id,
+        coach_id=coach_id,
+        title="Yoga",
+        starts_at=now,
+        ends_at=now,
+        status=SessionStatus.SCHEDULED,
+        cancelled_at=None,  # type: ignore[arg-type]
+        price_cents=1500,
+        currency="EUR",
+        created_at=now,
+        updated_at=now
+    )
+    assert found.credit_cents == 200
+    assert missing.session is None
+    assert missing.registration_open is True
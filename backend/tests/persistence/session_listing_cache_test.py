@@ -0,0 +1,276 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+import pytest
+from app.domain.session.session_status import SessionStatus
+from app.infrastructure.cache.lru_cache_backend import LruCacheBackend
+from app.infrastructure.cache.memcached_socket_backend import (
+    MemcachedSocketBackend
+)
+from app.infrastructure.persistence.sqlalchemy.notification_listener import (
+    CacheInvalidationListener
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.session import (
+    SqlAlchemySessionReadRepo
+)
+from app.infrastructure.persistence.sqlalchemy.session_listing_cache import (
+    SESSION_LISTING_CACHE_INFO_KEY,
+    SESSION_LISTING_CHANNEL,
+    SessionListingCache,
+    invalidate_session_listing
+)
+from app.shared.cache.cache_backend_port import CacheUnavailableError
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    # Notifications and the socket backend run on the asyncio loop.
+    return "asyncio"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Result:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one(self):
+        return self._value
+
+
+class _RowResult:
+    def __init__(self, row: dict):
+        self._row = row
+
+    def keys(self):
+        return list(self._row)
+
+    def one(self):
+        return tuple(self._row.values())
+
+
+class _Session:
+    def __init__(self, cache: SessionListingCache, result=None):
+        self.info = {SESSION_LISTING_CACHE_INFO_KEY: cache}
+        self.queries = 0
+        self._result = _Result(True) if result is None else result
+
+    async def execute(self, stmt, params):
+        self.queries += 1
+        return self._result
+
+
+class _BrokenBackend:
+    async def get(self, key):
+        raise CacheUnavailableError("down")
+
+    async def set(self, key, value, ttl_seconds):
+        raise CacheUnavailableError("down")
+
+    async def incr(self, key, delta=1):
+        raise CacheUnavailableError("down")
+
+
+def _repo(session) -> SqlAlchemySessionReadRepo:
+    return SqlAlchemySessionReadRepo(session)  # type: ignore[arg-type]
+
+
+async def test_second_read_is_served_from_cache():
+    cache = SessionListingCache(LruCacheBackend())
+    session = _Session(cache)
+    session_id = uuid4()
+
+    assert await _repo(session).public_exists_session(session_id)
+    assert await _repo(session).public_exists_session(session_id)
+
+    assert session.queries == 1
+    assert cache.status()["hit_ratio"] == 0.5
+
+
+async def test_cached_session_is_rebuilt_from_json():
+    starts_at = datetime(2026, 3, 1, 18, tzinfo=timezone.utc)
+    cache = SessionListingCache(LruCacheBackend())
+    session = _Session(cache, _RowResult({
+        "id": uuid4(),
+        "coach_id": uuid4(),
+        "first_name": "Ada",
+        "last_name": "Coach",
+        "title": "Morning run",
+        "starts_at": starts_at,
+        "ends_at": starts_at + timedelta(hours=1),
+        "status": "scheduled",
+        "cancelled_at": None,
+        "price_cents": 1500,
+        "currency": "eur",
+        "created_at": starts_at - timedelta(days=2),
+        "updated_at": starts_at - timedelta(days=1),
+    }))
+    session_id = uuid4()
+
+    loaded = await _repo(session).get_session_by_id(session_id)
+    cached = await _repo(session).get_session_by_id(session_id)
+
+    assert session.queries == 1
+    assert cached == loaded
+    assert cached.status is SessionStatus.SCHEDULED
+
+
+async def test_invalidation_orphans_cached_pages():
+    cache = SessionListingCache(LruCacheBackend())
+    session = _Session(cache)
+    session_id = uuid4()
+
+    await _repo(session).public_exists_session(session_id)
+    await cache.invalidate_all()
+    await _repo(session).public_exists_session(session_id)
+
+    assert session.queries == 2
+    assert cache.invalidations == 1
+
+
+async def test_writing_session_reads_around_the_cache():
+    cache = SessionListingCache(LruCacheBackend())
+    writer = _Session(cache)
+    session_id = uuid4()
+
+    await invalidate_session_listing(writer)  # type: ignore[arg-type]
+    await _repo(writer).public_exists_session(session_id)
+    await _repo(writer).public_exists_session(session_id)
+
+    assert writer.queries == 2
+    assert cache.status()["misses"] == 0
+
+
+async def test_suspended_cache_is_bypassed():
+    cache = SessionListingCache(LruCacheBackend())
+    session = _Session(cache)
+    session_id = uuid4()
+
+    cache.suspend()
+    await _repo(session).public_exists_session(session_id)
+    await _repo(session).public_exists_session(session_id)
+
+    assert session.queries == 2
+    assert cache.bypassed == 2
+
+
+async def test_backend_failure_falls_back_to_the_database():
+    cache = SessionListingCache(_BrokenBackend())  # type: ignore[arg-type]
+    session = _Session(cache)
+
+    assert await _repo(session).public_exists_session(uuid4())
+    assert cache.errors == 1
+
+
+async def test_served_age_is_reported():
+    clock = _Clock()
+    cache = SessionListingCache(LruCacheBackend(clock=clock), clock=clock)
+
+    await cache.get_or_load(("page",), _load([1]))
+    clock.now = 4
+    assert await cache.get_or_load(("page",), _load([2])) == [1]
+
+    assert cache.status()["served_age_max_seconds"] == 4
+
+
+async def test_lru_evicts_least_recently_used_and_expires():
+    clock = _Clock()
+    backend = LruCacheBackend(max_entries=2, clock=clock)
+
+    await backend.set("a", b"1", 10)
+    await backend.set("b", b"2", 10)
+    await backend.get("a")
+    await backend.set("c", b"3", 10)
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") == b"1"
+
+    clock.now = 10
+    assert await backend.get("a") is None
+
+
+async def test_notification_bumps_the_generation():
+    cache = SessionListingCache(LruCacheBackend())
+    listener = CacheInvalidationListener(
+        "postgresql://unused",
+        {SESSION_LISTING_CHANNEL: cache}
+    )
+
+    await cache.get_or_load(("page",), _load([1]))
+    listener._on_notify(None, 1, SESSION_LISTING_CHANNEL, str(uuid4()))
+    await asyncio.sleep(0)
+
+    assert await cache.get_or_load(("page",), _load([2])) == [2]
+
+
+async def test_memcached_backend_round_trip(tmp_path):
+    path = str(tmp_path / "memcached.sock")
+    server = await asyncio.start_unix_server(_memcached(), path)
+    backend = MemcachedSocketBackend(path, pool_size=2, timeout_seconds=1)
+
+    try:
+        assert await backend.get("missing") is None
+        await backend.set("page", b'{"items":[1,2]}', 30)
+        assert await backend.get("page") == b'{"items":[1,2]}'
+        assert await backend.incr("generation", 0) == 0
+        assert await backend.incr("generation") == 1
+    finally:
+        await backend.close()
+        server.close()
+
+
+async def test_memcached_backend_unreachable_raises(tmp_path):
+    backend = MemcachedSocketBackend(str(tmp_path / "absent.sock"))
+
+    with pytest.raises(CacheUnavailableError):
+        await backend.get("page")
+
+
+def _load(value):
+    async def load():
+        return value
+
+    return load
+
+
+def _memcached():
+    store: dict[str, bytes] = {}
+
+    async def handle(reader, writer):
+        while line := await reader.readline():
+            cmd, key, *args = line.decode().split()
+
+            if cmd == "get":
+                if key in store:
+                    writer.write(
+                        f"VALUE {key} 0 {len(store[key])}\r\n".encode()
+                        + store[key] + b"\r\n"
+                    )
+                writer.write(b"END\r\n")
+            elif cmd in ("set", "add"):
+                data = (await reader.readexactly(int(args[2]) + 2))[:-2]
+                if cmd == "add" and key in store:
+                    writer.write(b"NOT_STORED\r\n")
+                else:
+                    store[key] = data
+                    writer.write(b"STORED\r\n")
+            elif cmd == "incr":
+                if key not in store:
+                    writer.write(b"NOT_FOUND\r\n")
+                else:
+                    store[key] = str(int(store[key]) + int(args[0])).encode()
+                    writer.write(store[key] + b"\r\n")
+
+            await writer.drain()
+
+        writer.close()
+
+    return handle
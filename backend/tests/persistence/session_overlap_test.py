@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+import pytest
+from sqlalchemy.exc import DBAPIError
+from app.domain.session.session_entity import NewSessionEntity
+from app.domain.session.session_exception import SessionOverlappingError
+from app.infrastructure.persistence.sqlalchemy.repositories.session import (
+    SqlAlchemySessionCreationRepo,
+    SqlAlchemySessionUpdateRepo
+)
+
+pytestmark = pytest.mark.anyio
+
+STARTS_AT = datetime(2030, 1, 1, 9, tzinfo=timezone.utc)
+
+
+class _DriverError(Exception):
+    def __init__(self, sqlstate: str):
+        super().__init__(sqlstate)
+        self.sqlstate = sqlstate
+
+
+class _FailingSession:
+    def __init__(self, sqlstate: str):
+        self.info = {}
+        self._sqlstate = sqlstate
+
+    async def execute(self, stmt, params):
+        raise DBAPIError(str(stmt), params, _DriverError(self._sqlstate))
+
+
+def _new_session() -> NewSessionEntity:
+    return NewSessionEntity(
+        coach_id=uuid4(),
+        title="Morning run",
+        starts_at=STARTS_AT,
+        ends_at=STARTS_AT + timedelta(hours=1),
+        price_cents=0,
+        currency="EUR",
+        capacity=6
+    )
+
+
+async def test_exclusion_violation_on_create_is_overlapping():
+    repo = SqlAlchemySessionCreationRepo(
+        _FailingSession("23P01")  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(SessionOverlappingError):
+        await repo.create_session(_new_session())
+
+
+async def test_exclusion_violation_on_update_is_overlapping():
+    repo = SqlAlchemySessionUpdateRepo(
+        _FailingSession("23P01")  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(SessionOverlappingError):
+        await repo.update_session(
+            session_id=uuid4(),
+            title="Morning run",
+            starts_at=STARTS_AT,
+            ends_at=STARTS_AT + timedelta(hours=1)
+        )
+
+
+async def test_other_database_errors_propagate():
+    repo = SqlAlchemySessionCreationRepo(
+        _FailingSession("23505")  # type: ignore[arg-type]
+    )
+
+    with pytest.raises(DBAPIError):
+        await repo.create_session(_new_session())
@@ -0,0 +1,65 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+import app.main  # noqa: F401
+from app.infrastructure.persistence.sqlalchemy.repositories.keyset import (
+    keyset_statement
+)
+from app.infrastructure.persistence.sqlalchemy.statements import (
+    STATEMENTS,
+    CountingLRUCache,
+    StatementCacheStats,
+    StatementRegistry
+)
+from app.shared.utils.cursor import Cursor
+
+
+def test_register_returns_the_same_statement():
+    registry = StatementRegistry()
+
+    first = registry.register("repo.method", "SELECT 1")
+
+    assert registry.register("repo.method", "SELECT 1") is first
+    assert registry.names() == ["repo.method"]
+
+
+def test_register_rejects_conflicting_sql():
+    registry = StatementRegistry()
+    registry.register("repo.method", "SELECT 1")
+
+    with pytest.raises(ValueError):
+        registry.register("repo.method", "SELECT 2")
+
+
+def test_every_repository_statement_compiles():
+    assert STATEMENTS.compile_all(PGDialect_asyncpg()) == len(STATEMENTS)
+    assert "session_read.get_all_sessions" in STATEMENTS.names()
+    assert "session_read.get_all_sessions.after_cursor" in STATEMENTS.names()
+
+
+def test_keyset_statement_selects_variant_by_cursor():
+    stmt = keyset_statement(
+        "test.keyset",
+        "SELECT '{{}}' FROM t WHERE {keyset} LIMIT :limit",
+        alias="t"
+    )
+    cursor = Cursor(created_at=datetime.now(timezone.utc), id=uuid4())
+
+    assert stmt.select(None).text == (
+        "SELECT '{}' FROM t WHERE TRUE LIMIT :limit"
+    )
+    assert "(t.created_at, t.id) <" in stmt.select(cursor).text
+
+
+def test_prepared_cache_counts_hits_and_misses():
+    stats = StatementCacheStats()
+    cache = CountingLRUCache(10, stats)
+
+    # Mirrors the asyncpg adapter: lookup, then store on miss.
+    for query in ["SELECT 1", "SELECT 1", "SELECT 2", "SELECT 1"]:
+        if query not in cache:
+            cache[query] = object()
+
+    assert stats.prepared_misses == 2
+    assert stats.prepared_hits == 2
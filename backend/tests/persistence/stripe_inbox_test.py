@@ -0,0 +1,242 @@
+import json
+import pytest
+from app.domain.stripe.stripe_inbox_entity import StripeInboxEventEntity
+from app.feature.stripe.stripe_service import StripeService
+from app.infrastructure.persistence.in_memory.repositories import (
+    InMemoryStripeEventInboxRepo
+)
+from app.infrastructure.persistence.in_memory.storage import InMemoryStorage
+from app.infrastructure.persistence.sqlalchemy import stripe_inbox_worker
+from app.infrastructure.persistence.sqlalchemy.stripe_inbox_worker import (
+    StripeInboxWorker
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class _Inbox:
+    def __init__(
+        self,
+        event: StripeInboxEventEntity | None,
+        dead: bool = False,
+        locked: bool = True,
+        fail_error: Exception | None = None
+    ):
+        self.event = event
+        self.dead = dead
+        self.locked = locked
+        self.fail_error = fail_error
+        self.leases: list[float] = []
+        self.completed: list[str] = []
+        self.failures: list[tuple[str, float, int]] = []
+
+    async def claim_next(self, lease_seconds):
+        self.leases.append(lease_seconds)
+        return self.event
+
+    async def lock(self, event_id):
+        return self.locked
+
+    async def complete(self, event_id):
+        self.completed.append(event_id)
+
+    async def fail(self, event_id, error, retry_in_seconds, max_attempts):
+        if self.fail_error is not None:
+            raise self.fail_error
+
+        self.failures.append((event_id, retry_in_seconds, max_attempts))
+        return self.dead
+
+
+class _AccountRepo:
+    def __init__(self):
+        self.updates: list[dict] = []
+
+    async def update_by_account_id(self, **kwargs):
+        self.updates.append(kwargs)
+
+
+class _UoW:
+    def __init__(self, inbox: _Inbox):
+        self.stripe_event_inbox_repo = inbox
+        self.coach_stripe_account_update_repo = _AccountRepo()
+
+
+class _LoggingService(StripeService):
+    def __init__(self, log: list[str]):
+        self._log = log
+
+    async def fetch_balance(self, event, stripe_client):
+        self._log.append("fetch")
+        return None
+
+
+class _FailingService(StripeService):
+    async def apply_stripe_event(self, uow, event, balance):
+        raise RuntimeError("stripe is down")
+
+
+def _event(event_type: str, obj: dict, attempts: int = 0):
+    return StripeInboxEventEntity(
+        event_id="evt_1",
+        event_type=event_type,
+        payload=json.dumps({
+            "id": "evt_1",
+            "object": "event",
+            "type": event_type,
+            "data": {"object": obj},
+        }),
+        attempts=attempts
+    )
+
+
+_ACCOUNT_UPDATED = _event("account.updated", {
+    "id": "acct_1",
+    "object": "account",
+    "details_submitted": True,
+    "charges_enabled": True,
+    "payouts_enabled": False,
+})
+
+
+def _worker(factory, service: StripeService) -> StripeInboxWorker:
+    return StripeInboxWorker(
+        session_factory=factory,
+        service=service,
+        stripe_client=None,  # type: ignore[arg-type]
+        max_attempts=3,
+        backoff_seconds=5,
+        max_backoff_seconds=60,
+        lease_seconds=30
+    )
+
+
+@pytest.fixture
+def use_uow(monkeypatch):
+    def install(inbox: _Inbox) -> _UoW:
+        uow = _UoW(inbox)
+        monkeypatch.setattr(
+            stripe_inbox_worker,
+            "SqlAlchemyStripeUoW",
+            lambda session: uow
+        )
+        return uow
+
+    return install
+
+
+def test_backoff_doubles_up_to_the_cap():
+    worker = _worker(None, StripeService())
+
+    assert [worker.backoff(n) for n in range(6)] == [5, 10, 20, 40, 60, 60]
+
+
+async def test_stored_event_is_dispatched_and_completed(
+    use_uow,
+    session_factory
+):
+    inbox = _Inbox(_ACCOUNT_UPDATED)
+    uow = use_uow(inbox)
+    worker = _worker(session_factory, StripeService())
+
+    assert await worker.run_once()
+
+    assert inbox.leases == [30]
+    assert uow.coach_stripe_account_update_repo.updates == [{
+        "account_id": "acct_1",
+        "details_submitted": True,
+        "charges_enabled": True,
+        "payouts_enabled": False,
+    }]
+    assert inbox.completed == ["evt_1"]
+    assert worker.processed == 1
+
+
+async def test_stripe_is_called_between_transactions(use_uow, session_factory):
+    use_uow(_Inbox(_ACCOUNT_UPDATED))
+    service = _LoggingService(session_factory.log)
+
+    await _worker(session_factory, service).run_once()
+
+    assert session_factory.log == ["commit", "fetch", "commit"]
+
+
+async def test_empty_inbox_claims_nothing(use_uow, session_factory):
+    use_uow(_Inbox(None))
+
+    assert not await _worker(session_factory, StripeService()).run_once()
+    assert session_factory.log == ["commit"]
+
+
+async def test_event_applied_by_another_worker_is_skipped(
+    use_uow,
+    session_factory
+):
+    inbox = _Inbox(_ACCOUNT_UPDATED, locked=False)
+    uow = use_uow(inbox)
+    worker = _worker(session_factory, StripeService())
+
+    await worker.run_once()
+
+    assert uow.coach_stripe_account_update_repo.updates == []
+    assert inbox.completed == []
+    assert worker.processed == 0
+
+
+async def test_failure_is_recorded_in_its_own_transaction(
+    use_uow,
+    session_factory
+):
+    inbox = _Inbox(_event("account.updated", {}, attempts=2))
+    use_uow(inbox)
+    worker = _worker(session_factory, _FailingService())
+
+    assert await worker.run_once()
+
+    assert session_factory.log == ["commit", "rollback", "commit"]
+    assert inbox.completed == []
+    assert inbox.failures == [("evt_1", 20, 3)]
+    assert worker.retried == 1
+
+
+async def test_exhausted_event_is_counted_dead(use_uow, session_factory):
+    use_uow(_Inbox(_event("account.updated", {}), dead=True))
+    worker = _worker(session_factory, _FailingService())
+
+    await worker.run_once()
+
+    assert worker.dead == 1
+    assert worker.retried == 0
+
+
+async def test_unrecorded_failure_waits_for_the_lease(
+    use_uow,
+    session_factory
+):
+    use_uow(_Inbox(
+        _event("account.updated", {}),
+        fail_error=RuntimeError("database is down")
+    ))
+    worker = _worker(session_factory, _FailingService())
+
+    assert await worker.run_once()
+
+    assert session_factory.log == ["commit", "rollback", "rollback"]
+    assert worker.retried == 0
+    assert worker.dead == 0
+
+
+async def test_claimed_event_is_leased():
+    repo = InMemoryStripeEventInboxRepo(InMemoryStorage())
+    await repo.enqueue("evt_1", "account.updated", "{}")
+
+    claimed = await repo.claim_next(lease_seconds=30)
+
+    assert claimed is not None and claimed.event_id == "evt_1"
+    assert await repo.claim_next(lease_seconds=30) is None
+    assert await repo.lock("evt_1")
+
+    await repo.complete("evt_1")
+
+    assert not await repo.lock("evt_1")
+    assert not await repo.fail("evt_1", "late", 5, 3)
@@ -0,0 +1,158 @@
+from uuid import uuid4
+import pytest
+from app.infrastructure.persistence.sqlalchemy.notification_listener import (
+    CacheInvalidationListener
+)
+from app.infrastructure.persistence.sqlalchemy.repositories.auth import (
+    SqlAlchemyAuthReadRepo
+)
+from app.infrastructure.persistence.sqlalchemy.rls import (
+    CURRENT_USER_SETTING
+)
+from app.infrastructure.persistence.sqlalchemy.user_status_cache import (
+    DISABLED,
+    USER_STATUS_CACHE_INFO_KEY,
+    USER_STATUS_CHANNEL,
+    UserStatusCache
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Result:
+    def __init__(self, row):
+        self._row = row
+
+    def one(self):
+        return self._row
+
+
+class _DisabledFlagSession:
+    def __init__(self, disabled: bool, cache: UserStatusCache):
+        self.info = {USER_STATUS_CACHE_INFO_KEY: cache}
+        self.disabled = disabled
+        self.queries = 0
+        self.on_execute = lambda: None
+
+    async def execute(self, stmt, params):
+        self.queries += 1
+        self.on_execute()
+        return _Result((self.disabled,))
+
+
+pytestmark = pytest.mark.anyio
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = UserStatusCache(ttl_seconds=10, clock=clock)
+    user_id = uuid4()
+
+    cache.put(DISABLED, user_id, False, cache.generation)
+    clock.now = 9.9
+    assert cache.get(DISABLED, user_id) is False
+
+    clock.now = 10
+    assert cache.get(DISABLED, user_id) is None
+
+
+def test_notification_invalidates_user():
+    cache = UserStatusCache()
+    user_id = uuid4()
+    listener = CacheInvalidationListener(
+        "postgresql://unused",
+        {USER_STATUS_CHANNEL: cache}
+    )
+
+    cache.put(DISABLED, user_id, False, cache.generation)
+    listener._on_notify(None, 1, USER_STATUS_CHANNEL, str(user_id))
+
+    assert cache.get(DISABLED, user_id) is None
+    assert cache.invalidations == 1
+
+
+def test_suspended_cache_neither_serves_nor_stores():
+    cache = UserStatusCache()
+    user_id = uuid4()
+    cache.put(DISABLED, user_id, True, cache.generation)
+
+    cache.suspend()
+    cache.put(DISABLED, user_id, True, cache.generation)
+    assert cache.get(DISABLED, user_id) is None
+
+    cache.resume()
+    assert cache.get(DISABLED, user_id) is None
+
+
+def test_oldest_user_is_evicted_when_full():
+    cache = UserStatusCache(max_entries=2)
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    for user_id in (first, second, third):
+        cache.put(DISABLED, user_id, True, cache.generation)
+
+    assert cache.get(DISABLED, first) is None
+    assert cache.get(DISABLED, third) is True
+
+
+async def test_actor_status_is_shared_across_requests():
+    cache = UserStatusCache()
+    actor_id = uuid4()
+    sessions = [
+        _DisabledFlagSession(disabled=False, cache=cache)
+        for _ in range(2)
+    ]
+
+    for session in sessions:
+        session.info[CURRENT_USER_SETTING] = actor_id
+        assert await SqlAlchemyAuthReadRepo(
+            session  # type: ignore[arg-type]
+        ).is_user_disabled(actor_id) is False
+
+    assert [session.queries for session in sessions] == [1, 0]
+
+
+async def test_other_user_not_disabled_is_not_cached():
+    cache = UserStatusCache()
+    session = _DisabledFlagSession(disabled=False, cache=cache)
+    session.info[CURRENT_USER_SETTING] = uuid4()
+    other_id = uuid4()
+
+    await SqlAlchemyAuthReadRepo(
+        session  # type: ignore[arg-type]
+    ).is_user_disabled(other_id)
+
+    assert cache.get(DISABLED, other_id) is None
+
+
+def test_put_after_an_invalidation_is_dropped():
+    cache = UserStatusCache()
+    user_id = uuid4()
+    generation = cache.generation
+
+    cache.invalidate(user_id)
+    cache.put(DISABLED, user_id, False, generation)
+
+    assert cache.get(DISABLED, user_id) is None
+
+
+async def test_status_read_racing_an_invalidation_is_not_cached():
+    cache = UserStatusCache()
+    actor_id = uuid4()
+    session = _DisabledFlagSession(disabled=False, cache=cache)
+    session.info[CURRENT_USER_SETTING] = actor_id
+    # The admin's change commits and its notification is handled after
+    # the request read the old status, but before it stores it.
+    session.on_execute = lambda: cache.invalidate(actor_id)
+
+    assert await SqlAlchemyAuthReadRepo(
+        session  # type: ignore[arg-type]
+    ).is_user_disabled(actor_id) is False
+
+    assert cache.get(DISABLED, actor_id) is None
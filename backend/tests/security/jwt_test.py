@@ -0,0 +1,114 @@
+from time import time
+from uuid import uuid4
+import pytest
+from jose.exceptions import ExpiredSignatureError
+from app.domain.auth.actor_entity import TokenActor
+from app.domain.auth.permission import (
+    ROLE_PERMISSIONS,
+    ROLE_SET_PERMISSIONS,
+    permissions_for
+)
+from app.domain.auth.role import Role
+from app.feature.auth.auth_exception import InvalidTokenError
+from app.infrastructure.security import jwt as jwt_module
+from app.infrastructure.security.jwt import JoseJwt, VerifiedTokenCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = time()
+
+    def __call__(self):
+        return self.now
+
+
+def _jwt(cache: VerifiedTokenCache | None = None) -> JoseJwt:
+    return JoseJwt(
+        secret="secret",
+        algorithm="HS256",
+        issuer="tests",
+        access_ttl_seconds=60,
+        verified_cache=cache
+    )
+
+
+def test_every_role_combination_is_precomputed():
+    assert len(ROLE_SET_PERMISSIONS) == 2 ** len(Role)
+    assert permissions_for([Role.USER, Role.COACH]) == (
+        ROLE_PERMISSIONS[Role.USER] | ROLE_PERMISSIONS[Role.COACH]
+    )
+
+
+def test_tokens_with_same_roles_share_permissions():
+    jwt = _jwt()
+    first, second = (
+        jwt.decode_access_token(jwt.issue_access_token(
+            actor=TokenActor(id=uuid4(), roles=[Role.USER, Role.COACH])
+        ))
+        for _ in range(2)
+    )
+
+    assert first.permissions is second.permissions
+
+
+def test_cached_token_skips_verification(monkeypatch):
+    jwt = _jwt()
+    token = jwt.issue_access_token(
+        actor=TokenActor(id=uuid4(), roles=[Role.USER])
+    )
+    actor = jwt.decode_access_token(token)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("token verified twice")
+
+    monkeypatch.setattr(jwt_module.jwt, "decode", fail)
+
+    assert jwt.decode_access_token(token) is actor
+    assert jwt.cache_status()["hits"] == 1
+
+
+def test_cached_token_is_verified_again_after_exp(monkeypatch):
+    clock = _Clock()
+    jwt = _jwt(VerifiedTokenCache(clock=clock))
+    token = jwt.issue_access_token(
+        actor=TokenActor(id=uuid4(), roles=[Role.USER])
+    )
+    jwt.decode_access_token(token)
+
+    def expired(*args, **kwargs):
+        raise ExpiredSignatureError()
+
+    monkeypatch.setattr(jwt_module.jwt, "decode", expired)
+    clock.now += 61
+
+    with pytest.raises(InvalidTokenError):
+        jwt.decode_access_token(token)
+    assert jwt.cache_status()["entries"] == 0
+
+
+def test_least_recently_used_token_is_evicted():
+    cache = VerifiedTokenCache(max_entries=2)
+    jwt = _jwt(cache)
+    tokens = [
+        jwt.issue_access_token(
+            actor=TokenActor(id=uuid4(), roles=[Role.USER])
+        )
+        for _ in range(3)
+    ]
+
+    for token in tokens[:2]:
+        jwt.decode_access_token(token)
+    jwt.decode_access_token(tokens[0])
+    jwt.decode_access_token(tokens[2])
+
+    assert cache.get(tokens[0]) is not None
+    assert cache.get(tokens[1]) is None
+
+
+def test_invalid_token_is_rejected_and_not_cached():
+    jwt = _jwt()
+
+    with pytest.raises(InvalidTokenError):
+        jwt.decode_access_token("not-a-token")
+
+    assert jwt.cache_status()["entries"] == 0
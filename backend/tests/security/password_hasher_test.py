@@ -0,0 +1,52 @@
+import asyncio
+import pytest
+from app.infrastructure.security.password_hasher import Argon2PasswordHasher
+from app.shared.exceptions.commons import ServiceBusyError
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    # The hasher runs on the asyncio loop executor.
+    return "asyncio"
+
+
+async def test_hash_verifies_only_the_same_password():
+    hasher = Argon2PasswordHasher(max_workers=1)
+
+    hashed = await hasher.hash("correct horse")
+
+    assert await hasher.verify("correct horse", hashed)
+    assert not await hasher.verify("battery staple", hashed)
+
+
+async def test_event_loop_keeps_running_while_hashing():
+    hasher = Argon2PasswordHasher(max_workers=2)
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.001)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.gather(*(hasher.hash("password") for _ in range(4)))
+    task.cancel()
+
+    assert ticks > 4
+
+
+async def test_saturated_hasher_fails_fast():
+    hasher = Argon2PasswordHasher(max_workers=1, max_pending=0)
+
+    running = asyncio.create_task(hasher.hash("password"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceBusyError):
+        await hasher.hash("password")
+
+    await running
+    assert hasher.rejected == 1
+    assert await hasher.hash("password")
@@ -41,6 +41,11 @@ CREATE TABLE IF NOT EXISTS app.sessions (
     -- Session end time (UTC)
     ends_at TIMESTAMPTZ NOT NULL,
 
+    -- Half-open [starts_at, ends_at) period, backs the overlap constraint
+    period TSTZRANGE GENERATED ALWAYS AS (
+        tstzrange(starts_at, ends_at, '[)')
+    ) STORED,
+
     -- Session lifecycle status
     status app.session_status NOT NULL DEFAULT 'scheduled',
     
@@ -52,6 +57,15 @@ CREATE TABLE IF NOT EXISTS app.sessions (
 
     -- Session Price currency
     currency TEXT NOT NULL DEFAULT 'EUR',
+
+    -- Maximum number of active participations
+    capacity INTEGER NOT NULL DEFAULT 6,
+
+    -- Seats held by active participations (maintained by triggers)
+    seats_taken INTEGER NOT NULL DEFAULT 0,
+
+    -- Bumped on every participation change (maintained by triggers)
+    participation_version BIGINT NOT NULL DEFAULT 0,
  
     -- Audit fields
     created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
@@ -84,7 +98,20 @@ CREATE TABLE IF NOT EXISTS app.sessions (
         
     -- Price must be positive
     CONSTRAINT chk_sessions_price_not_negative
-    	CHECK (price_cents >= 0)
+    	CHECK (price_cents >= 0),
+
+    -- A session holds at least one seat
+    CONSTRAINT chk_sessions_capacity_positive
+        CHECK (capacity > 0),
+
+    -- The seat counter never leaves [0, capacity]
+    CONSTRAINT chk_sessions_seats_within_capacity
+        CHECK (seats_taken >= 0 AND seats_taken <= capacity),
+
+    -- Active sessions never overlap; cancelling frees the slot
+    CONSTRAINT excl_sessions_no_overlap
+        EXCLUDE USING gist (period WITH &&)
+        WHERE (cancelled_at IS NULL)
 );
 
 -- ------------------------------------------------------------------
@@ -109,6 +136,9 @@ COMMENT ON COLUMN app.sessions.starts_at IS
 COMMENT ON COLUMN app.sessions.ends_at IS
 'Scheduled end timestamp of the session (UTC).';
 
+COMMENT ON COLUMN app.sessions.period IS
+'Half-open [starts_at, ends_at) range, generated from the start and end timestamps. Indexed by the excl_sessions_no_overlap constraint.';
+
 COMMENT ON COLUMN app.sessions.status IS
 'Lifecycle status of the session (scheduled, cancelled, completed).';
 
@@ -121,9 +151,21 @@ COMMENT ON COLUMN app.sessions.price_cents IS
 COMMENT ON COLUMN app.sessions.currency IS
 'ISO 4217 currency code for the session price (e.g. EUR, USD).';
 
+COMMENT ON COLUMN app.sessions.capacity IS
+'Maximum number of active participations for the session.';
+
+COMMENT ON COLUMN app.sessions.seats_taken IS
+'Number of seats held by active participations. Maintained by the session_participation seat triggers; never written directly.';
+
+COMMENT ON COLUMN app.sessions.participation_version IS
+'Counter bumped whenever a participation of the session, or the profile name of a participant, changes. Combined with updated_at it versions the session read models (HTTP ETags). Maintained by triggers; never written directly.';
+
 COMMENT ON COLUMN app.sessions.created_at IS
 'Timestamp when the session record was created (UTC).';
 
 COMMENT ON COLUMN app.sessions.updated_at IS
 'Timestamp when the session record was last updated (UTC).';
 
+
+COMMENT ON CONSTRAINT excl_sessions_no_overlap ON app.sessions IS
+'Rejects a non-cancelled session whose period overlaps another non-cancelled session (SQLSTATE 23P01). The check runs in the GiST index backing the constraint, so concurrent writers cannot both pass it.';
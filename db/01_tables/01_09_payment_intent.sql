@@ -37,6 +37,9 @@ CREATE TABLE IF NOT EXISTS app.payment_intents (
     -- Provider-side payment intent identifier
     provider_intent_id TEXT NULL,
 
+    -- Provider-side checkout session identifier
+    provider_checkout_id TEXT NULL,
+
     -- Current lifecycle status of the intent
     -- (e.g. created, requires_action, succeeded, cancelled, failed)
     status TEXT NOT NULL,
@@ -128,6 +131,9 @@ COMMENT ON COLUMN app.payment_intents.provider IS
 COMMENT ON COLUMN app.payment_intents.provider_intent_id IS
 'Unique identifier of the payment intent on the provider side.';
 
+COMMENT ON COLUMN app.payment_intents.provider_checkout_id IS
+'Identifier of the provider-side checkout session the user pays through. Used to expire abandoned checkouts.';
+
 COMMENT ON COLUMN app.payment_intents.status IS
 'Current lifecycle status of the payment intent.';
 
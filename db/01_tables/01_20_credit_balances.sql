@@ -0,0 +1,84 @@
+-- ------------------------------------------------------------------
+-- Table: app.credit_balances
+--
+-- Purpose:
+-- - Current credit balance per user and currency
+-- - Constant-time balance reads for registrations and dashboards
+--
+-- Design notes:
+-- - Derived from app.credit_ledger, which stays the source of truth
+-- - Maintained in the same transaction as every ledger insert by
+--   trg_credit_ledger_apply_balance
+-- - Never written directly by runtime roles
+-- - Drift against the ledger is reported by the admin reconciliation
+--   endpoint
+-- ------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS app.credit_balances (
+    -- Owner of the balance
+    user_id UUID NOT NULL,
+
+    -- ISO 4217 currency code (e.g. EUR, USD)
+    currency CHAR(3) NOT NULL,
+
+    -- Sum of the user's ledger entries in this currency (in cents)
+    balance_cents INTEGER NOT NULL,
+
+    -- Time of the last ledger entry applied
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    -- ------------------------------------------------------------------
+    -- Constraints
+    -- ------------------------------------------------------------------
+
+    CONSTRAINT pk_credit_balances
+        PRIMARY KEY (user_id, currency),
+
+    CONSTRAINT fk_credit_balances_user_id
+        FOREIGN KEY (user_id)
+        REFERENCES app.users(id),
+
+    -- Credit balance may never become negative
+    CONSTRAINT chk_credit_balances_not_negative
+        CHECK (balance_cents >= 0)
+);
+
+-- Created after 01_18, so ownership is normalized here.
+ALTER TABLE app.credit_balances OWNER TO app_admin;
+
+-- ------------------------------------------------------------------
+-- Backfill from an existing ledger (no-op on a fresh database)
+-- ------------------------------------------------------------------
+INSERT INTO app.credit_balances (
+    user_id,
+    currency,
+    balance_cents,
+    updated_at
+)
+SELECT
+    user_id,
+    currency,
+    SUM(amount_cents),
+    MAX(created_at)
+FROM app.credit_ledger
+GROUP BY user_id, currency
+ON CONFLICT (user_id, currency) DO NOTHING;
+
+-- ------------------------------------------------------------------
+-- Comments
+-- ------------------------------------------------------------------
+
+COMMENT ON TABLE app.credit_balances IS
+'Current credit balance per user and currency, maintained transactionally from app.credit_ledger inserts.';
+
+COMMENT ON COLUMN app.credit_balances.user_id IS
+'Owner of the balance. References app.users(id).';
+
+COMMENT ON COLUMN app.credit_balances.currency IS
+'ISO 4217 currency code of the balance.';
+
+COMMENT ON COLUMN app.credit_balances.balance_cents IS
+'Sum of the user ledger entries in this currency, in cents. Always >= 0.';
+
+COMMENT ON COLUMN app.credit_balances.updated_at IS
+'Timestamp of the last ledger entry applied to the balance.';
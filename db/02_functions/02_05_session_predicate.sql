@@ -87,44 +87,10 @@ COMMENT ON FUNCTION app_fcn.session_exists(uuid) IS
 Side-effect free and idempotent.
 Designed for guard conditions and set-based domain logic.';
 
-create or replace function app_fcn.is_session_overlapping(
-	p_starts_at timestamptz,
-	p_ends_at timestamptz
-)
-returns boolean
-language sql
-security definer
-set search_path = app, app_fcn, pg_temp
-as $$
-	/*
-	 * app_fcn.is_session_overlapping
-	 *
-	 * Returns true if the given time range [p_starts_at, p_ends_at)
-	 * overlaps with any existing non-cancelled session.
-	 *
-	 * Used as a domain-level predicate to enforce the invariant:
-	 *   - active sessions must not overlap in time
-	 *
-	 * Notes:
-	 *   - Uses half-open ranges ([)) to allow back-to-back sessions
-	 *   - Ignores cancelled sessions (cancelled_at IS NULL)
-	 *   - Intended to be called inside transactional domain functions
-	 */
-	SELECT EXISTS (
-		SELECT 1
-		FROM app.sessions
-		WHERE tstzrange(starts_at, ends_at, '[)')
-			&& tstzrange(p_starts_at, p_ends_at, '[)')
-			AND cancelled_at IS NULL
-	);
-$$;
-
-COMMENT ON FUNCTION app_fcn.is_session_overlapping(
+DROP FUNCTION IF EXISTS app_fcn.is_session_overlapping(
 	timestamptz,
 	timestamptz
-) IS
-'Checks whether a given [start, end) time interval overlaps with any existing non-cancelled session.
-Used as a domain predicate to enforce the invariant that active sessions must not overlap.';
+);
 
 create or replace function app_fcn.is_session_owner(
 	p_user_id uuid,
@@ -166,58 +132,11 @@ COMMENT ON FUNCTION app_fcn.is_session_owner(
 ) IS
 'Predicate: returns true if the user is the owning coach of a non-cancelled session.';
 
-create or replace function app_fcn.is_session_overlapping_except(
-	p_starts_at timestamptz,
-	p_ends_at timestamptz,
-	p_excluded_session_id uuid
-)
-returns boolean
-language plpgsql
-security definer
-set search_path = app, app_fcn, pg_temp
-as $$
-	/*
-	 * app_fcn.is_session_overlapping_except
-	 *
-	 * Returns true if the given time range [p_starts_at, p_ends_at)
-	 * overlaps with any existing non-cancelled session,
-	 * excluding the provided session id.
-	 *
-	 * Domain invariant:
-	 *   - active sessions must not overlap in time
-	 *
-	 * Preconditions:
-	 *   - p_excluded_session_id MUST NOT be NULL
-	 *
-	 * Notes:
-	 *   - Uses half-open ranges ([)) to allow back-to-back sessions
-	 *   - Cancelled sessions are ignored (cancelled_at IS NULL)
-	 *   - Raises a domain exception if called with a NULL excluded id
-	 *   - Intended for update flows inside transactional domain functions
-	 */
-	BEGIN
-		IF p_excluded_session_id IS NULL THEN
-			RAISE EXCEPTION 'p_excluded_session_id must not be NULL'
-				USING ERRCODE = 'AP400';
-		END IF;
-	
-		return EXISTS (
-			SELECT 1
-			FROM app.sessions
-			WHERE id <> p_excluded_session_id
-				AND tstzrange(starts_at, ends_at, '[)')
-					&& tstzrange(p_starts_at, p_ends_at, '[)')
-				AND cancelled_at IS NULL
-		);
-	END;
-$$;
-
-COMMENT ON FUNCTION app_fcn.is_session_overlapping_except(
+DROP FUNCTION IF EXISTS app_fcn.is_session_overlapping_except(
 	timestamptz,
 	timestamptz,
 	uuid
-) IS
-'Predicate: checks for overlapping active sessions, excluding the given session id. Raises if excluded id is NULL.';
+);
 
 CREATE OR replace FUNCTION app_fcn.is_session_cancelled(
 	p_session_id uuid
@@ -1,6 +1,7 @@
+DROP FUNCTION IF EXISTS app_fcn.is_session_full(uuid, int);
+
 CREATE OR replace function app_fcn.is_session_full(
-	p_session_id uuid,
-	p_capacity int
+	p_session_id uuid
 )
 returns boolean
 language sql
@@ -9,39 +10,45 @@ security definer
 set search_path = app, app_fcn, pg_temp
 as $$
 	/*
-	 * app_fcn.is_full
+	 * app_fcn.is_session_full
 	 *
-	 * Determines whether a session has reached its maximum capacity.
+	 * Determines whether a session has reached its capacity.
 	 *
-	 * A session is considered "full" when the number of active
-	 * (non-cancelled) participations is greater than or equal to
-	 * the provided capacity.
+	 * A session is considered "full" when its seat counter has reached
+	 * sessions.capacity and no seat can be reclaimed from a lapsed
+	 * registration (unpaid, payment window expired, paid session).
 	 *
 	 * Derived state:
-	 *   - Only participations with cancelled_at IS NULL are counted
+	 *   - sessions.seats_taken, maintained by the session_participation
+	 *     seat triggers
 	 *
 	 * Usage:
-	 *   - Registration eligibility checks
-	 *   - Capacity enforcement before creating participation
+	 *   - Registration eligibility checks (preflight)
 	 *
 	 * Notes:
-	 *   - Does not acquire locks
-	 *   - Intended to be called under an advisory transaction lock
-	 *     by the write-side function enforcing registration invariants
+	 *   - Does not acquire locks; the seat is reserved atomically by
+	 *     the insert trigger, which is the authoritative check
+	 *   - Returns false for unknown sessions
 	 */
-	SELECT count(*) >= p_capacity
-	FROM app.session_participation
-	WHERE session_id = p_session_id
-		AND cancelled_at IS NULL
-		AND (
-			paid_at IS NOT NULL
-			OR expires_at > now()
-		)
+	SELECT COALESCE((
+		SELECT s.seats_taken >= s.capacity
+			AND NOT EXISTS (
+				SELECT 1
+				FROM app.session_participation sp
+				WHERE sp.session_id = s.id
+					AND sp.cancelled_at IS NULL
+					AND sp.paid_at IS NULL
+					AND sp.expires_at <= now()
+					AND s.price_cents > 0
+			)
+		FROM app.sessions s
+		WHERE s.id = p_session_id
+	), false)
 $$;
 
-COMMENT ON FUNCTION app_fcn.is_session_full(uuid, int) IS
-'Returns true if the number of active (non-cancelled) participations
-for a session has reached or exceeded the given capacity.';
+COMMENT ON FUNCTION app_fcn.is_session_full(uuid) IS
+'Returns true if every seat of the session is held by an active
+participation and none can be reclaimed from a lapsed registration.';
 
 
 create or replace function app_fcn.has_active_participation(
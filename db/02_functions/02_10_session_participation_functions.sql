@@ -15,7 +15,7 @@ AS $$
  *
  * This function is responsible for enforcing all participation
  * invariants at the database level and is safe against concurrent
- * registrations through the use of an advisory transaction lock.
+ * registrations.
  *
  * Authorization:
  *   - A user may only create their own participation
@@ -27,17 +27,22 @@ AS $$
  *   - Session must not be full
  *
  * Concurrency:
- *   - A session-scoped advisory transaction lock is used to prevent
- *     race conditions when registering multiple users concurrently
+ *   - A (user, session)-scoped advisory transaction lock serializes
+ *     duplicate attempts by the same user
+ *   - Capacity is enforced by the seat trigger on insert, which takes
+ *     a seat with a single conditional UPDATE of sessions.seats_taken;
+ *     registrations of different users only contend on that row for
+ *     the duration of the increment
  *
  * Notes:
- *   - This function is idempotent with respect to active participation
- *     (duplicate attempts result in a domain error)
- *   - No state outside session participation is mutated
+ *   - Duplicate attempts for an active participation result in a
+ *     domain error
+ *   - Besides the participation, only sessions.seats_taken is mutated
+ *     (and lapsed registrations are released when the session is full)
  */
 BEGIN
     PERFORM pg_advisory_xact_lock(
-        hashtext('session:' || p_session_id::text)
+        hashtext('user:' || p_user_id::text || ':session:' || p_session_id::text)
     );
 
     IF NOT app_fcn.is_self(p_user_id) THEN
@@ -55,16 +60,13 @@ BEGIN
             USING ERRCODE = 'AP410';
     END IF;
 
-    IF app_fcn.has_active_participation(p_session_id, p_user_id) THEN
+    IF app_fcn.has_active_participation(p_user_id, p_session_id) THEN
         RAISE EXCEPTION 'already participating'
-            USING ERRCODE = 'AB409';
-    END IF;
-
-    IF app_fcn.is_session_full(p_session_id, 6) THEN
-        RAISE EXCEPTION 'session full'
-            USING ERRCODE = 'AB409';
+            USING ERRCODE = 'AP409';
     END IF;
 
+    -- Raises AB409 (session full) from the seat trigger when no seat
+    -- is left. A conflicting row keeps the seat it already holds.
     INSERT INTO app.session_participation (
 		id,
         session_id,
@@ -77,9 +79,10 @@ BEGIN
         p_user_id,
         now(),
         p_expires_at
-    );
+    )
 	ON CONFLICT (session_id, user_id)
-	DO NOTHING;
+	DO UPDATE
+	SET expires_at = EXCLUDED.expires_at;
 END;
 $$;
 
@@ -87,8 +90,8 @@ COMMENT ON FUNCTION app_fcn.create_session_participation(uuid, uuid, timestamptz
 'Creates a participation entry for a user in a session.
 
 This function enforces all session participation invariants at the
-database level and uses an advisory transaction lock to prevent
-concurrent overbooking.
+database level. Capacity is enforced by atomically reserving a seat on
+app.sessions.seats_taken, so concurrent registrations cannot overbook.
 
 Authorization:
 - Users may only create their own participation
@@ -97,7 +100,118 @@ Errors:
 - AP401: permission denied
 - AP404: session not found
 - AP410: session cancelled
-- AP409: already participating or session full';
+- AP409: already participating
+- AB409: session full';
+
+
+CREATE OR REPLACE FUNCTION app_fcn.release_lapsed_seats(
+    p_session_id uuid
+)
+RETURNS integer
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+/*
+ * app_fcn.release_lapsed_seats
+ *
+ * Cancels the lapsed registrations of a session so their seats can be
+ * reused.
+ *
+ * A registration is lapsed when it is not cancelled, not paid, its
+ * payment window (expires_at) is over and the session is not free.
+ * Such a registration is no longer active (see
+ * has_active_participation) but still holds a seat until cancelled.
+ *
+ * Effects:
+ *   - Sets cancelled_at; the seat trigger releases the seats
+ *
+ * Returns:
+ *   - The number of released seats
+ *
+ * Notes:
+ *   - Called by the seat trigger when a session looks full
+ *   - Lapsed rows of sessions that already started cannot be cancelled
+ *     and are left untouched
+ */
+DECLARE
+    v_released integer;
+BEGIN
+    UPDATE app.session_participation sp
+    SET cancelled_at = now()
+    FROM app.sessions s
+    WHERE s.id = sp.session_id
+        AND sp.session_id = p_session_id
+        AND sp.cancelled_at IS NULL
+        AND sp.paid_at IS NULL
+        AND sp.expires_at <= now()
+        AND s.price_cents > 0
+        AND s.starts_at > now();
+
+    GET DIAGNOSTICS v_released = ROW_COUNT;
+    RETURN v_released;
+END;
+$$;
+
+COMMENT ON FUNCTION app_fcn.release_lapsed_seats(uuid) IS
+'Cancels unpaid registrations of a session whose payment window expired
+and returns the number of seats released.';
+
+
+CREATE OR REPLACE FUNCTION app_fcn.release_expired_participations(
+    p_limit integer
+)
+RETURNS TABLE (
+    session_id uuid,
+    user_id uuid
+)
+LANGUAGE sql
+VOLATILE
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+    /*
+     * app_fcn.release_expired_participations
+     *
+     * Cancels up to p_limit lapsed registrations across all sessions,
+     * oldest payment window first.
+     *
+     * A registration is lapsed when it is not cancelled, not paid, its
+     * payment window (expires_at) is over and the session is a paid
+     * session that has not started yet (see release_lapsed_seats).
+     *
+     * Concurrency:
+     *   - Rows are claimed with FOR UPDATE SKIP LOCKED, so concurrent
+     *     sweepers and in-flight payments never wait on each other
+     *
+     * Effects:
+     *   - Sets cancelled_at; the seat trigger releases the seats
+     *
+     * Returns:
+     *   - The (session_id, user_id) of every released registration
+     */
+    WITH expired AS (
+        SELECT sp.id
+        FROM app.session_participation sp
+        JOIN app.sessions s ON s.id = sp.session_id
+        WHERE sp.cancelled_at IS NULL
+            AND sp.paid_at IS NULL
+            AND sp.expires_at <= now()
+            AND s.price_cents > 0
+            AND s.starts_at > now()
+        ORDER BY sp.expires_at
+        LIMIT p_limit
+        FOR UPDATE OF sp SKIP LOCKED
+    )
+    UPDATE app.session_participation sp
+    SET cancelled_at = now()
+    FROM expired
+    WHERE sp.id = expired.id
+    RETURNING sp.session_id, sp.user_id;
+$$;
+
+COMMENT ON FUNCTION app_fcn.release_expired_participations(integer) IS
+'Cancels a batch of unpaid registrations whose payment window expired, skipping rows locked by concurrent transactions, and returns the released (session_id, user_id) pairs.';
 
 
 create or replace function app_fcn.cancel_participation(
@@ -217,3 +331,109 @@ $$;
 COMMENT ON FUNCTION app_fcn.revoke_all_active_session(uuid)
 IS
 'Revoke all active session participations for the given user. Used to cancel pending or active registrations during checkout failures, user-initiated cancellations, or safety rollback paths. Only affects active participations and preserves historical records.';
+
+
+CREATE OR REPLACE FUNCTION app_fcn.get_registration_preflight(
+    p_user_id uuid,
+    p_session_id uuid
+)
+RETURNS TABLE (
+    user_disabled boolean,
+    session_owner boolean,
+    session_cancelled boolean,
+    active_participation boolean,
+    session_full boolean,
+    registration_open boolean,
+    id uuid,
+    coach_id uuid,
+    title text,
+    price_cents int,
+    currency text,
+    status text,
+    starts_at timestamptz,
+    ends_at timestamptz,
+    cancelled_at timestamptz,
+    created_at timestamptz,
+    updated_at timestamptz,
+    credit_cents int
+)
+LANGUAGE plpgsql
+STABLE
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+/*
+ * app_fcn.get_registration_preflight
+ *
+ * Evaluates every registration precondition for a user and a session
+ * in a single call, together with the session row and the user's
+ * credit balance in the session currency.
+ *
+ * This replaces the sequence of predicate calls previously issued by
+ * the registration flow (one round trip each) with one round trip.
+ * Always returns exactly one row; session columns and credit_cents are
+ * NULL when the session does not exist, which is how callers tell it
+ * is missing.
+ *
+ * Authorization:
+ *   - A user may run the preflight for themselves
+ *   - An admin may run it for any user
+ *
+ * Notes:
+ *   - Read-only; decisions are left to the service layer
+ *   - Predicates are the same ones used by the write-side functions,
+ *     which re-check them; capacity is re-checked by the seat trigger
+ *   - registration_open is false (not NULL) for missing or cancelled
+ *     sessions
+ */
+BEGIN
+    IF NOT (app_fcn.is_self(p_user_id) OR app_fcn.is_admin()) THEN
+        RAISE EXCEPTION 'permission denied'
+            USING ERRCODE = 'AP401';
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        EXISTS (
+            SELECT 1
+            FROM app.users u
+            WHERE u.id = p_user_id
+                AND u.disabled_at IS NOT NULL
+        ),
+        app_fcn.is_session_owner(p_user_id, p_session_id),
+        s.cancelled_at IS NOT NULL,
+        app_fcn.has_active_participation(p_user_id, p_session_id),
+        app_fcn.is_session_full(p_session_id),
+        COALESCE(app_fcn.is_registration_open(p_session_id), false),
+        s.id,
+        s.coach_id,
+        s.title::text,
+        s.price_cents,
+        s.currency,
+        s.status::text,
+        s.starts_at,
+        s.ends_at,
+        s.cancelled_at,
+        s.created_at,
+        s.updated_at,
+        CASE
+            WHEN s.id IS NULL THEN NULL
+            ELSE app_fcn.fetch_credit_internal(p_user_id, s.currency)
+        END
+    FROM (SELECT p_session_id AS session_id) AS target
+    LEFT JOIN app.sessions s ON s.id = target.session_id;
+END;
+$$;
+
+COMMENT ON FUNCTION app_fcn.get_registration_preflight(uuid, uuid) IS
+'Returns all session registration preconditions (disabled user, owner,
+cancellation, active participation, capacity, registration window), the
+session row, NULL for a missing session, and the user credit balance in
+one row.
+
+Authorization:
+- Users may run their own preflight
+- Admins may run any user preflight
+
+Errors:
+- AP401: permission denied';
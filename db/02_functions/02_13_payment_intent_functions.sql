@@ -1,8 +1,13 @@
+DROP FUNCTION IF EXISTS app_fcn.create_payment_intent(
+    uuid, uuid, text, text, text, integer, integer, text
+);
+
 CREATE OR REPLACE FUNCTION app_fcn.create_payment_intent(
     p_user_id uuid,
     p_session_id uuid,
     p_provider text,
     p_provider_intent_id text,
+    p_provider_checkout_id text,
     p_status text,
     p_amount_cents integer,
     p_credit_applied_cents integer,
@@ -66,6 +71,7 @@ BEGIN
     SET
         provider = p_provider,
         provider_intent_id = p_provider_intent_id,
+        provider_checkout_id = p_provider_checkout_id,
         status = p_status,
         amount_cents = p_amount_cents,
         credit_applied_cents = p_credit_applied_cents,
@@ -80,6 +86,7 @@ BEGIN
 	        session_id,
 	        provider,
 	        provider_intent_id,
+	        provider_checkout_id,
 	        status,
 	        amount_cents,
 	        credit_applied_cents,
@@ -91,6 +98,7 @@ BEGIN
 	        p_session_id,
 	        p_provider,
 	        p_provider_intent_id,
+	        p_provider_checkout_id,
 	        p_status,
 	        p_amount_cents,
 	        p_credit_applied_cents,
@@ -108,6 +116,7 @@ COMMENT ON FUNCTION app_fcn.create_payment_intent(
     text,
     text,
     text,
+    text,
     integer,
     integer,
     text
@@ -472,3 +481,48 @@ IS
 Concurrency-safe via pg_advisory_xact_lock scoped to (user_id, session_id).
 Raises AP404 if the intent does not exist.
 Does not create rows; only updates provider_intent_id.';
+
+
+CREATE OR REPLACE FUNCTION app_fcn.cancel_payment_intents(
+    p_session_ids uuid[],
+    p_user_ids uuid[]
+)
+RETURNS TABLE (
+    provider_checkout_id text
+)
+LANGUAGE sql
+VOLATILE
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+    /*
+     * app_fcn.cancel_payment_intents
+     *
+     * Cancels the pending payment intents of the given participations,
+     * passed as two parallel arrays of session and user ids.
+     *
+     * Behavior:
+     *   - Intents in a terminal status (succeeded, failed, canceled) or
+     *     already processing a payment are left untouched
+     *
+     * Returns:
+     *   - One row per cancelled intent with its checkout session id
+     *     (NULL when none was recorded), so the caller can expire the
+     *     checkout on the provider side
+     *
+     * Usage:
+     *   - Expired participation sweeper
+     */
+    UPDATE app.payment_intents pi
+    SET status = 'canceled'
+    FROM unnest(p_session_ids, p_user_ids)
+        AS released(session_id, user_id)
+    WHERE pi.session_id = released.session_id
+        AND pi.user_id = released.user_id
+        AND pi.status NOT IN ('succeeded', 'failed', 'canceled', 'processing')
+    RETURNING pi.provider_checkout_id;
+$$;
+
+COMMENT ON FUNCTION app_fcn.cancel_payment_intents(uuid[], uuid[])
+IS
+'Cancels the pending payment intents of released participations and returns their checkout session ids. Terminal and processing intents are left untouched.';
@@ -0,0 +1,28 @@
+-- ------------------------------------------------------------------
+-- Row Level Security: app.payment_revenue_monthly
+--
+-- Visibility model:
+-- - Coaches see their own revenue
+-- - Admins see all revenue
+-- - Writes happen only through the payment trigger
+-- ------------------------------------------------------------------
+
+-- Enable and enforce RLS
+ALTER TABLE app.payment_revenue_monthly ENABLE ROW LEVEL SECURITY;
+ALTER TABLE app.payment_revenue_monthly FORCE ROW LEVEL SECURITY;
+
+-- ------------------------------------------------------------------
+-- Policy: payment_revenue_monthly_select
+--
+-- Controls who can SELECT revenue buckets
+-- ------------------------------------------------------------------
+CREATE POLICY payment_revenue_monthly_select
+ON app.payment_revenue_monthly
+FOR SELECT
+USING (
+    app_fcn.is_self(coach_id)
+    OR app_fcn.is_admin()
+);
+
+COMMENT ON POLICY payment_revenue_monthly_select ON app.payment_revenue_monthly IS
+'Coaches can see their own revenue and admins can see all revenue.';
@@ -0,0 +1,42 @@
+-- ------------------------------------------------------------------
+-- Permissions: app.payment_revenue_monthly
+--
+-- Purpose:
+-- - Allow admins to report revenue and fees without scanning payments
+--
+-- Design notes:
+-- - Revenue buckets are derived data, written only by the payment
+--   trigger
+-- - Inserts, updates and deletes are forbidden to runtime roles
+-- - Row visibility is enforced exclusively via RLS
+-- ------------------------------------------------------------------
+
+-- ------------------------------------------------------------------
+-- Privilege cleanup
+-- ------------------------------------------------------------------
+REVOKE ALL ON TABLE app.payment_revenue_monthly FROM app_user;
+REVOKE ALL ON TABLE app.payment_revenue_monthly FROM app_system;
+
+-- ------------------------------------------------------------------
+-- app_user: read-only (RLS-scoped)
+-- ------------------------------------------------------------------
+GRANT SELECT
+ON TABLE app.payment_revenue_monthly
+TO app_user;
+
+-- ------------------------------------------------------------------
+-- app_admin: owner
+--
+-- Notes:
+-- - Keeps its privileges so the SECURITY DEFINER payment trigger can
+--   maintain the buckets
+-- ------------------------------------------------------------------
+
+-- ------------------------------------------------------------------
+-- Documentation
+-- ------------------------------------------------------------------
+
+COMMENT ON TABLE app.payment_revenue_monthly IS
+'Payment totals per coach, UTC calendar month and currency.
+SELECT is granted to app_user; rows are written only by the payment trigger.
+All row-level visibility is enforced by RLS.';
@@ -32,3 +32,18 @@ WHERE disabled_at IS NOT NULL;
 
 COMMENT ON INDEX app.idx_users_disabled_at IS
 'Optimizes queries targeting disabled users only.';
+
+-- ---------------------------------------------------------------
+-- Keyset pagination
+--
+-- Used by:
+-- - admin user listing (cursor pagination)
+--
+-- id breaks ties between users created at the same instant
+-- ---------------------------------------------------------------
+
+CREATE INDEX idx_users_created_at_id
+ON app.users (created_at DESC, id DESC);
+
+COMMENT ON INDEX app.idx_users_created_at_id IS
+'Supports keyset pagination of the admin user listing.';
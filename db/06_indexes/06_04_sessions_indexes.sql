@@ -46,3 +46,26 @@ ON app.sessions (coach_id, starts_at);
 
 COMMENT ON INDEX app.idx_sessions_coach_starts_at IS
 'Optimizes coach dashboard queries combining coach_id and start time.';
+
+-- ---------------------------------------------------------------
+-- Keyset pagination
+--
+-- Used by:
+-- - public and admin session listings
+-- - coach session listings (cursor pagination)
+--
+-- Matches the (created_at DESC, id DESC) listing order so a cursor
+-- page is a bounded index range scan
+-- ---------------------------------------------------------------
+
+CREATE INDEX idx_sessions_created_at_id
+ON app.sessions (created_at DESC, id DESC);
+
+COMMENT ON INDEX app.idx_sessions_created_at_id IS
+'Supports keyset pagination of session listings ordered by creation time.';
+
+CREATE INDEX idx_sessions_coach_created_at_id
+ON app.sessions (coach_id, created_at DESC, id DESC);
+
+COMMENT ON INDEX app.idx_sessions_coach_created_at_id IS
+'Supports keyset pagination of sessions owned by a coach.';
@@ -19,17 +19,35 @@ COMMENT ON INDEX app.idx_refresh_tokens_user_id IS
 -- Active tokens lookup
 --
 -- Used by:
--- - Cleanup of expired/revoked tokens
+-- - app_fcn.get_active_refresh_token (login / refresh)
 -- - Session management
 --
--- Partial index for performance (only active tokens)
+-- Partial covering index: only active tokens, so its size follows
+-- the number of live sessions rather than the rotation history, and
+-- the lookup is answered from the index alone
 -- ---------------------------------------------------------------
 CREATE INDEX idx_refresh_tokens_active
-ON app.refresh_tokens (expires_at)
+ON app.refresh_tokens (token_hash)
+INCLUDE (user_id, created_at, expires_at)
 WHERE revoked_at IS NULL;
 
 COMMENT ON INDEX app.idx_refresh_tokens_active IS
-'Optimizes queries filtering only active (non-revoked) refresh tokens.';
+'Covers active (non-revoked) refresh token lookups by hash.';
+
+-- ---------------------------------------------------------------
+-- Dead tokens by age
+--
+-- Used by:
+-- - app_fcn.purge_refresh_tokens (compaction job)
+--
+-- A token is dead from its revocation, or its expiry when it was
+-- never revoked
+-- ---------------------------------------------------------------
+CREATE INDEX idx_refresh_tokens_dead_since
+ON app.refresh_tokens ((COALESCE(revoked_at, expires_at)));
+
+COMMENT ON INDEX app.idx_refresh_tokens_dead_since IS
+'Lets the compaction job delete the oldest dead refresh tokens in bounded batches.';
 
 -- ---------------------------------------------------------------
 -- Token replacement chain inspection
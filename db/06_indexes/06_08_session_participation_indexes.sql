@@ -34,6 +34,23 @@ WHERE cancelled_at IS NULL;
 COMMENT ON INDEX app.idx_sp_active_session_id IS
 'Optimizes lookups of active participants by session_id, used in RLS and joins.';
 
+-- ---------------------------------------------------------------
+-- Own session listing
+--
+-- Used by:
+-- - "my sessions" listing (session_read.get_own_sessions)
+--
+-- Drives the listing from the user's active participations; the
+-- included paid_at lets the visibility check run on the index alone
+-- ---------------------------------------------------------------
+CREATE INDEX idx_sp_active_user_session
+ON app.session_participation(user_id, session_id)
+INCLUDE (paid_at)
+WHERE cancelled_at IS NULL;
+
+COMMENT ON INDEX app.idx_sp_active_user_session IS
+'Supports the own session listing: active participations of a user with their session and payment state, readable by an index-only scan.';
+
 -- ---------------------------------------------------------------
 -- Fast general lookup on user_id
 --
@@ -94,3 +111,20 @@ ON app.session_participation(registered_at);
 
 COMMENT ON INDEX app.idx_sp_registered_at IS
 'Speeds up queries filtering participations by registration date for analytics and reporting.';
+
+
+-- ---------------------------------------------------------------
+-- Unpaid holds by payment deadline
+--
+-- Used by:
+-- - app_fcn.release_expired_participations (expired hold sweeper)
+--
+-- Partial index: only pending, unpaid registrations
+-- ---------------------------------------------------------------
+CREATE INDEX idx_sp_unpaid_expires_at
+ON app.session_participation(expires_at)
+WHERE cancelled_at IS NULL
+    AND paid_at IS NULL;
+
+COMMENT ON INDEX app.idx_sp_unpaid_expires_at IS
+'Lets the expired hold sweeper find lapsed unpaid registrations in deadline order without scanning settled rows.';
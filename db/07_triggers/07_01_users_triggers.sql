@@ -183,3 +183,53 @@ EXECUTE FUNCTION app.tg_set_updated_at();
 
 COMMENT ON TRIGGER trg_90_users_set_updated_at ON app.users IS
 'Automatically maintains updated_at timestamp on UPDATE.';
+
+-- ------------------------------------------------------------------
+-- Function: app.tg_notify_user_status
+--
+-- Purpose:
+-- - Publishes the id of a user whose status (disabled, roles) changed
+--   on the app_user_status channel
+-- - Lets every backend process drop its cached user status
+--
+-- Notes:
+-- - NOTIFY is delivered on commit only, rolled back changes are silent
+-- ------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION app.tg_notify_user_status()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_user_id uuid;
+BEGIN
+    IF TG_TABLE_NAME = 'users' THEN
+        v_user_id := NEW.id;
+    ELSIF TG_OP = 'DELETE' THEN
+        v_user_id := OLD.user_id;
+    ELSE
+        v_user_id := NEW.user_id;
+    END IF;
+
+    PERFORM pg_notify('app_user_status', v_user_id::text);
+
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION app.tg_notify_user_status IS
+'Notifies app_user_status listeners that a user status changed.';
+
+-- ------------------------------------------------------------------
+-- Trigger: trg_95_users_notify_status
+--
+-- After the change:
+-- - Only fires when disabled_at actually changed
+-- ------------------------------------------------------------------
+CREATE TRIGGER trg_95_users_notify_status
+AFTER UPDATE OF disabled_at ON app.users
+FOR EACH ROW
+WHEN (OLD.disabled_at IS DISTINCT FROM NEW.disabled_at)
+EXECUTE FUNCTION app.tg_notify_user_status();
+
+COMMENT ON TRIGGER trg_95_users_notify_status ON app.users IS
+'Invalidates cached user status when a user is disabled or re-enabled.';
@@ -161,3 +161,48 @@ EXECUTE FUNCTION app.tg_credit_ledger_time_guard();
 
 COMMENT ON TRIGGER trg_credit_ledger_time_guard ON app.credit_ledger IS
 'Guarantees that ledger entries are inserted in chronological order for each user.';
+
+-- ------------------------------------------------------------------
+-- Function: maintain app.credit_balances
+-- ------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION app.tg_credit_ledger_apply_balance()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, pg_temp
+AS $$
+BEGIN
+    -- The upsert row lock serializes concurrent entries per balance.
+    INSERT INTO app.credit_balances (
+        user_id,
+        currency,
+        balance_cents,
+        updated_at
+    )
+    VALUES (
+        NEW.user_id,
+        NEW.currency,
+        NEW.amount_cents,
+        NEW.created_at
+    )
+    ON CONFLICT (user_id, currency) DO UPDATE
+    SET
+        balance_cents =
+            app.credit_balances.balance_cents + EXCLUDED.balance_cents,
+        updated_at = EXCLUDED.updated_at;
+
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION app.tg_credit_ledger_apply_balance() IS
+'Applies each new ledger entry to app.credit_balances in the same transaction, keeping balance reads constant-time.';
+
+-- Trigger: maintain balances after insert
+CREATE TRIGGER trg_credit_ledger_apply_balance
+AFTER INSERT ON app.credit_ledger
+FOR EACH ROW
+EXECUTE FUNCTION app.tg_credit_ledger_apply_balance();
+
+COMMENT ON TRIGGER trg_credit_ledger_apply_balance ON app.credit_ledger IS
+'Keeps app.credit_balances in sync with the append-only ledger.';
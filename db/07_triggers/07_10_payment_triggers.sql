@@ -74,3 +74,69 @@ EXECUTE FUNCTION app.tg_payment_idempotency_guard();
 
 COMMENT ON TRIGGER trg_payment_idempotency_guard ON app.payments IS
 'Ensures each payment inserted is unique by provider and provider_payment_id to enforce idempotency.';
+
+-- ------------------------------------------------------------------
+-- Function: maintain app.payment_revenue_monthly
+-- ------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION app.tg_payment_apply_revenue()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, pg_temp
+AS $$
+BEGIN
+    -- The upsert row lock serializes concurrent payments per bucket.
+    INSERT INTO app.payment_revenue_monthly (
+        coach_id,
+        month,
+        currency,
+        payment_count,
+        gross_amount_cents,
+        provider_fee_cents,
+        net_amount_cents,
+        updated_at
+    )
+    SELECT
+        s.coach_id,
+        date_trunc('month', NEW.created_at AT TIME ZONE 'UTC')::date,
+        NEW.currency,
+        1,
+        NEW.gross_amount_cents,
+        NEW.provider_fee_cents,
+        NEW.net_amount_cents,
+        NEW.created_at
+    FROM app.sessions s
+    WHERE s.id = NEW.session_id
+    ON CONFLICT (coach_id, month, currency) DO UPDATE
+    SET
+        payment_count =
+            app.payment_revenue_monthly.payment_count + 1,
+        gross_amount_cents =
+            app.payment_revenue_monthly.gross_amount_cents
+            + EXCLUDED.gross_amount_cents,
+        provider_fee_cents =
+            app.payment_revenue_monthly.provider_fee_cents
+            + EXCLUDED.provider_fee_cents,
+        net_amount_cents =
+            app.payment_revenue_monthly.net_amount_cents
+            + EXCLUDED.net_amount_cents,
+        updated_at = GREATEST(
+            app.payment_revenue_monthly.updated_at,
+            EXCLUDED.updated_at
+        );
+
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION app.tg_payment_apply_revenue() IS
+'Adds each new payment to its coach, month and currency bucket in app.payment_revenue_monthly, in the same transaction.';
+
+-- Trigger: maintain revenue buckets after insert
+CREATE TRIGGER trg_payment_apply_revenue
+AFTER INSERT ON app.payments
+FOR EACH ROW
+EXECUTE FUNCTION app.tg_payment_apply_revenue();
+
+COMMENT ON TRIGGER trg_payment_apply_revenue ON app.payments IS
+'Keeps app.payment_revenue_monthly in sync with the append-only payments table.';
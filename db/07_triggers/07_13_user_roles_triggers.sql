@@ -0,0 +1,16 @@
+-- ------------------------------------------------------------------
+-- Trigger: trg_90_user_roles_notify_status
+--
+-- Purpose:
+-- - Invalidates cached user status when a role is granted or revoked
+--
+-- Notes:
+-- - Uses app.tg_notify_user_status (07_01_users_triggers.sql)
+-- ------------------------------------------------------------------
+CREATE TRIGGER trg_90_user_roles_notify_status
+AFTER INSERT OR UPDATE OR DELETE ON app.user_roles
+FOR EACH ROW
+EXECUTE FUNCTION app.tg_notify_user_status();
+
+COMMENT ON TRIGGER trg_90_user_roles_notify_status ON app.user_roles IS
+'Invalidates cached user status when the roles of a user change.';
@@ -0,0 +1,105 @@
+\c app
+
+-- ------------------------------------------------------------------
+-- Table: app.stripe_webhook_events
+--
+-- Purpose:
+-- - Durable inbox of verified Stripe webhook events
+-- - Lets the webhook endpoint acknowledge Stripe immediately and
+--   process the event later in background workers
+--
+-- Design principles:
+-- - One row per Stripe event id: redeliveries are deduplicated
+-- - Workers claim due rows with FOR UPDATE SKIP LOCKED
+-- - Failed events are retried with backoff, then parked as 'dead'
+--
+-- Notes:
+-- - Accessed exclusively through app_fcn inbox functions
+-- - Processed rows are kept so late redeliveries stay deduplicated
+-- ------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS app.stripe_webhook_events (
+    -- ------------------------------------------------------------------
+    -- Identity
+    -- ------------------------------------------------------------------
+
+    event_id TEXT NOT NULL,
+
+    -- ------------------------------------------------------------------
+    -- Event content (as verified by the webhook signature)
+    -- ------------------------------------------------------------------
+
+    event_type TEXT NOT NULL,
+    payload    JSONB NOT NULL,
+
+    -- ------------------------------------------------------------------
+    -- Processing state
+    -- ------------------------------------------------------------------
+
+    status          TEXT NOT NULL DEFAULT 'pending',
+    attempts        INTEGER NOT NULL DEFAULT 0,
+    last_error      TEXT NULL,
+    next_attempt_at timestamptz NOT NULL DEFAULT now(),
+
+    -- ------------------------------------------------------------------
+    -- Timestamps
+    -- ------------------------------------------------------------------
+
+    received_at  timestamptz NOT NULL DEFAULT now(),
+    processed_at timestamptz NULL,
+
+    -- ------------------------------------------------------------------
+    -- Constraints
+    -- ------------------------------------------------------------------
+
+    -- Stripe event ids are globally unique
+    CONSTRAINT pk_stripe_webhook_events
+        PRIMARY KEY (event_id),
+
+    CONSTRAINT chk_stripe_webhook_events_status
+        CHECK (status IN ('pending', 'processed', 'dead')),
+
+    CONSTRAINT chk_stripe_webhook_events_attempts
+        CHECK (attempts >= 0),
+
+    -- Processed events carry their completion time
+    CONSTRAINT chk_stripe_webhook_events_processed_at
+        CHECK ((status = 'processed') = (processed_at IS NOT NULL))
+);
+
+-- Created after 01_18, so ownership is normalized here.
+ALTER TABLE app.stripe_webhook_events OWNER TO app_admin;
+
+-- ------------------------------------------------------------------
+-- Comments
+-- ------------------------------------------------------------------
+
+COMMENT ON TABLE app.stripe_webhook_events IS
+'Durable inbox of verified Stripe webhook events. The webhook endpoint stores events and acknowledges them; background workers process them with retries.';
+
+COMMENT ON COLUMN app.stripe_webhook_events.event_id IS
+'Stripe event identifier (evt_...). Deduplicates redeliveries.';
+
+COMMENT ON COLUMN app.stripe_webhook_events.event_type IS
+'Stripe event type (e.g., payment_intent.succeeded).';
+
+COMMENT ON COLUMN app.stripe_webhook_events.payload IS
+'Full event body as received and verified.';
+
+COMMENT ON COLUMN app.stripe_webhook_events.status IS
+'pending until processed; dead once retries are exhausted.';
+
+COMMENT ON COLUMN app.stripe_webhook_events.attempts IS
+'Number of processing attempts made so far.';
+
+COMMENT ON COLUMN app.stripe_webhook_events.last_error IS
+'Error of the last failed attempt, if any.';
+
+COMMENT ON COLUMN app.stripe_webhook_events.next_attempt_at IS
+'Earliest time a worker may claim the event (retry backoff).';
+
+COMMENT ON COLUMN app.stripe_webhook_events.received_at IS
+'Timestamp when the webhook was received.';
+
+COMMENT ON COLUMN app.stripe_webhook_events.processed_at IS
+'Timestamp when the event was processed successfully.';
@@ -0,0 +1,115 @@
+\c app
+
+-- ------------------------------------------------------------------
+-- Table: app.payment_revenue_monthly
+--
+-- Purpose:
+-- - Revenue totals per coach, calendar month (UTC) and currency
+-- - Constant-size reads for admin revenue and fee reporting
+--
+-- Design notes:
+-- - Derived from app.payments, which stays the source of truth
+-- - Maintained in the same transaction as every payment insert by
+--   trg_payment_apply_revenue; payments are append-only, so inserts
+--   are the only change to roll up
+-- - Never written directly by runtime roles
+-- ------------------------------------------------------------------
+
+CREATE TABLE IF NOT EXISTS app.payment_revenue_monthly (
+    -- Coach hosting the paid sessions
+    coach_id UUID NOT NULL,
+
+    -- First day of the calendar month (UTC) the payments were made in
+    month DATE NOT NULL,
+
+    -- ISO 4217 currency code (e.g. EUR, USD)
+    currency CHAR(3) NOT NULL,
+
+    -- Number of payments rolled up
+    payment_count INTEGER NOT NULL,
+
+    -- Sums of the payment amounts (in cents)
+    gross_amount_cents BIGINT NOT NULL,
+    provider_fee_cents BIGINT NOT NULL,
+    net_amount_cents BIGINT NOT NULL,
+
+    -- Time of the last payment applied
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+
+    -- ------------------------------------------------------------------
+    -- Constraints
+    -- ------------------------------------------------------------------
+
+    CONSTRAINT pk_payment_revenue_monthly
+        PRIMARY KEY (coach_id, month, currency),
+
+    CONSTRAINT fk_payment_revenue_monthly_coach_id
+        FOREIGN KEY (coach_id)
+        REFERENCES app.users(id),
+
+    -- Buckets are keyed by the first day of their month
+    CONSTRAINT chk_payment_revenue_monthly_month_start
+        CHECK (month = date_trunc('month', month)::date)
+);
+
+-- Created after 01_18, so ownership is normalized here.
+ALTER TABLE app.payment_revenue_monthly OWNER TO app_admin;
+
+-- ------------------------------------------------------------------
+-- Backfill from existing payments (no-op on a fresh database)
+-- ------------------------------------------------------------------
+INSERT INTO app.payment_revenue_monthly (
+    coach_id,
+    month,
+    currency,
+    payment_count,
+    gross_amount_cents,
+    provider_fee_cents,
+    net_amount_cents,
+    updated_at
+)
+SELECT
+    s.coach_id,
+    date_trunc('month', p.created_at AT TIME ZONE 'UTC')::date,
+    p.currency,
+    COUNT(*),
+    SUM(p.gross_amount_cents),
+    SUM(p.provider_fee_cents),
+    SUM(p.net_amount_cents),
+    MAX(p.created_at)
+FROM app.payments p
+JOIN app.sessions s
+    ON s.id = p.session_id
+GROUP BY 1, 2, 3
+ON CONFLICT (coach_id, month, currency) DO NOTHING;
+
+-- ------------------------------------------------------------------
+-- Comments
+-- ------------------------------------------------------------------
+
+COMMENT ON TABLE app.payment_revenue_monthly IS
+'Payment totals per coach, UTC calendar month and currency, maintained transactionally from app.payments inserts.';
+
+COMMENT ON COLUMN app.payment_revenue_monthly.coach_id IS
+'Coach of the paid sessions. References app.users(id).';
+
+COMMENT ON COLUMN app.payment_revenue_monthly.month IS
+'First day of the UTC calendar month the payments were created in.';
+
+COMMENT ON COLUMN app.payment_revenue_monthly.currency IS
+'ISO 4217 currency code of the payments.';
+
+COMMENT ON COLUMN app.payment_revenue_monthly.payment_count IS
+'Number of payments in the bucket.';
+
+COMMENT ON COLUMN app.payment_revenue_monthly.gross_amount_cents IS
+'Sum of the gross amounts, in cents.';
+
+COMMENT ON COLUMN app.payment_revenue_monthly.provider_fee_cents IS
+'Sum of the payment provider fees, in cents.';
+
+COMMENT ON COLUMN app.payment_revenue_monthly.net_amount_cents IS
+'Sum of the net amounts, in cents.';
+
+COMMENT ON COLUMN app.payment_revenue_monthly.updated_at IS
+'Timestamp of the last payment applied to the bucket.';
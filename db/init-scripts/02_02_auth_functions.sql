@@ -391,4 +391,54 @@ as $$
 $$;
 
 COMMENT ON FUNCTION app_fcn.revoke_refresh_token(text) IS
-'Revokes a single refresh token by hash. Used internally for token rotation or explicit logout. Does not raise.';
\ No newline at end of file
+'Revokes a single refresh token by hash. Used internally for token rotation or explicit logout. Does not raise.';
+
+
+create or replace function app_fcn.purge_refresh_tokens(
+	p_grace_seconds integer,
+	p_limit integer
+)
+returns integer
+language sql
+security definer
+set search_path = app, app_fcn, pg_temp
+as $$
+	/*
+	Function:
+	- purge_refresh_tokens
+
+	Purpose:
+	- Keep app.refresh_tokens bounded by deleting dead tokens
+
+	Behavior:
+	- Deletes up to p_limit tokens revoked or expired more than
+	  p_grace_seconds ago, oldest first
+	- Rows locked by a concurrent rotation are skipped
+	- Returns the number of deleted tokens
+	- Does not raise
+
+	Security:
+	- SECURITY DEFINER
+	- Used by the refresh token compaction job
+	*/
+	WITH dead AS (
+		SELECT rt.id
+		FROM app.refresh_tokens rt
+		WHERE COALESCE(rt.revoked_at, rt.expires_at)
+			< now() - make_interval(secs => p_grace_seconds)
+		ORDER BY COALESCE(rt.revoked_at, rt.expires_at)
+		LIMIT p_limit
+		FOR UPDATE SKIP LOCKED
+	),
+	deleted AS (
+		DELETE FROM app.refresh_tokens rt
+		USING dead
+		WHERE rt.id = dead.id
+		RETURNING 1
+	)
+	SELECT count(*)::int
+	FROM deleted;
+$$;
+
+COMMENT ON FUNCTION app_fcn.purge_refresh_tokens(integer, integer) IS
+'Deletes a bounded batch of refresh tokens revoked or expired for longer than the grace window. Returns the number of deleted tokens. Does not raise.';
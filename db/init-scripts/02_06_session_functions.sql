@@ -7,7 +7,8 @@ CREATE OR replace FUNCTION app_fcn.session_create_session(
 	p_starts_at timestamptz,
 	p_ends_at timestamptz,
 	p_price_cents int,
-	p_currency text
+	p_currency text,
+	p_capacity int
 )
 returns void
 language plpgsql
@@ -39,9 +40,12 @@ as $$
 	 * - p_ends_at        : Session end timestamp (UTC).
 	 * - p_price_cents    : Session price in cents.
 	 * - p_currency       : ISO currency code (upper-case expected).
+	 * - p_capacity       : Maximum number of active participations.
 	 *
 	 * Errors:
 	 * - Raises ERRCODE 'AP401' if the caller is not authorized.
+	 * - Raises ERRCODE '23P01' (excl_sessions_no_overlap) if the time
+	 *   range overlaps another active session.
 	 *
 	 * Returns:
 	 * - void
@@ -64,10 +68,6 @@ as $$
 			RETURN;
 		END IF;
 
-		IF app_fcn.is_session_overlapping(p_starts_at, p_ends_at) THEN
-			RETURN;
-		END IF;
-	
 		INSERT INTO app.sessions(
 			id,
 			coach_id,
@@ -75,7 +75,8 @@ as $$
 			starts_at,
 			ends_at,
 			price_cents,
-			currency
+			currency,
+			capacity
 		)
 		VALUES (
 			p_session_id,
@@ -84,7 +85,8 @@ as $$
 			p_starts_at,
 			p_ends_at,
 			p_price_cents,
-			p_currency
+			p_currency,
+			p_capacity
 		);
 	END;
 $$;
@@ -96,7 +98,8 @@ COMMENT ON FUNCTION app_fcn.session_create_session(
 	timestamptz,
 	timestamptz,
 	int,
-	text
+	text,
+	int
 ) IS
 'Creates a session in an idempotent and concurrency-safe manner.
 
@@ -105,7 +108,8 @@ conditions. If the session already exists, the function returns without
 modifying state.
 
 Authorization is enforced inside the database: the caller must be a coach
-or an admin. Designed to be safely retryable and spam-resistant.';
+or an admin. Raises 23P01 if the time range overlaps another active
+session. Designed to be safely retryable and spam-resistant.';
 
 create or replace function app_fcn.session_update(
 	p_session_id uuid,
@@ -130,7 +134,8 @@ as $$
 	 *   - If the caller is not an admin or a coach, the function raises an error.
 	 *   - If the session does not exist, the function performs a no-op.
 	 *   - If the new time range overlaps with another active session (excluding
-	 *     the session being updated), a domain exception is raised.
+	 *     the session being updated), the excl_sessions_no_overlap
+	 *     constraint rejects the update.
 	 *   - If the provided values are identical to the current state, no update
 	 *     is performed (idempotent behavior).
 	 *
@@ -140,13 +145,14 @@ as $$
 	 *
 	 * Notes:
 	 *   - This function is intentionally idempotent to allow safe retries.
-	 *   - Overlapping sessions are treated as a domain violation (AP409).
+	 *   - Overlaps are detected by the exclusion constraint's GiST index
+	 *     as the row is written, so concurrent updates cannot both pass.
 	 *   - Missing sessions are treated as a no-op to preserve idempotency.
 	 *   - Uses half-open time ranges ([starts_at, ends_at)).
 	 *
 	 * Errors:
 	 *   - AP401: caller is not authorized
-	 *   - AP409: session time overlaps with another active session
+	 *   - 23P01: session time overlaps with another active session
 	 */
 	BEGIN
 		IF NOT (app_fcn.is_admin() OR app_fcn.is_coach()) THEN
@@ -158,15 +164,6 @@ as $$
 			RETURN;
 		END IF;
 
-		IF app_fcn.is_session_overlapping_except(
-			p_starts_at,
-			p_ends_at,
-			p_session_id
-		) THEN
-			RAISE EXCEPTION 'session is overlapping'
-				USING ERRCODE = 'AP409';
-		END IF;
-
 		UPDATE app.sessions
 		SET 
 			title = p_title,
@@ -187,7 +184,7 @@ COMMENT ON FUNCTION app_fcn.session_update(
 - No-op if the session does not exist.
 - Safe to call multiple times with the same arguments.
 - Raises AP401 if the caller is not an admin or coach.
-- Raises AP409 if the updated time range overlaps another active session.
+- Raises 23P01 if the updated time range overlaps another active session.
 - Enforces session scheduling invariants at the database level.';
 
 CREATE OR REPLACE FUNCTION app_fcn.get_session_for_registration(
@@ -462,12 +459,126 @@ $$;
 COMMENT ON FUNCTION app_fcn.get_complete_session(uuid) IS
 'Returns a complete session projection including coach public profile and aggregated participant list as JSON. Designed as a read-model helper for API consumption. SECURITY DEFINER; bypasses RLS and must enforce visibility explicitly if required.';
 
+create or replace function app_fcn.get_session_version(
+	p_session_id uuid
+)
+returns text
+language sql
+stable
+security definer
+set search_path = app, app_fcn, pg_temp
+as $$
+	/*
+	 * app_fcn.get_session_version
+	 * ----------------------------------------
+	 * Returns an opaque version of a session read model, or NULL when
+	 * the session does not exist.
+	 *
+	 * The version changes whenever the session row (updated_at), one
+	 * of its participations (participation_version) or the coach
+	 * profile changes. It backs HTTP ETags: a single primary key
+	 * lookup decides whether the full projection must be rebuilt.
+	 *
+	 * SECURITY DEFINER: reads the coach profile past RLS, exposes no
+	 * data besides the version.
+	 */
+	SELECT concat_ws(
+		':',
+		s.participation_version,
+		extract(epoch FROM s.updated_at),
+		extract(epoch FROM up.updated_at)
+	)
+	FROM app.sessions s
+	LEFT JOIN app.user_profiles up ON up.user_id = s.coach_id
+	WHERE s.id = p_session_id;
+$$;
+
+COMMENT ON FUNCTION app_fcn.get_session_version(uuid) IS
+'Returns an opaque version of a session read model (session row, participations, coach profile), NULL when the session does not exist. Backs HTTP ETags.';
+
+create or replace function app_fcn.get_coach_sessions_version(
+	p_coach_id uuid
+)
+returns text
+language sql
+stable
+security definer
+set search_path = app, app_fcn, pg_temp
+as $$
+	/*
+	 * app_fcn.get_coach_sessions_version
+	 * ----------------------------------------
+	 * Returns an opaque version of every session owned by a coach.
+	 *
+	 * Covers created or deleted sessions (count), session and
+	 * participation changes (updated_at, participation_version) and
+	 * the coach profile. Uses the coach_id index only.
+	 */
+	SELECT concat_ws(
+		':',
+		count(*),
+		sum(s.participation_version),
+		extract(epoch FROM max(s.updated_at)),
+		(
+			SELECT extract(epoch FROM up.updated_at)
+			FROM app.user_profiles up
+			WHERE up.user_id = p_coach_id
+		)
+	)
+	FROM app.sessions s
+	WHERE s.coach_id = p_coach_id;
+$$;
+
+COMMENT ON FUNCTION app_fcn.get_coach_sessions_version(uuid) IS
+'Returns an opaque version of all sessions owned by a coach, including their participations and the coach profile. Backs HTTP ETags.';
+
+create or replace function app_fcn.get_participant_sessions_version(
+	p_user_id uuid
+)
+returns text
+language sql
+stable
+security definer
+set search_path = app, app_fcn, pg_temp
+as $$
+	/*
+	 * app_fcn.get_participant_sessions_version
+	 * ----------------------------------------
+	 * Returns an opaque version of every session a user participates
+	 * in, cancelled participations included.
+	 *
+	 * Covers joined or removed participations (count), session and
+	 * participation changes (updated_at, participation_version) and
+	 * the coach profiles.
+	 */
+	SELECT concat_ws(
+		':',
+		count(*),
+		sum(s.participation_version),
+		extract(epoch FROM max(s.updated_at)),
+		extract(epoch FROM max(up.updated_at))
+	)
+	FROM app.session_participation sp
+	JOIN app.sessions s ON s.id = sp.session_id
+	LEFT JOIN app.user_profiles up ON up.user_id = s.coach_id
+	WHERE sp.user_id = p_user_id;
+$$;
+
+COMMENT ON FUNCTION app_fcn.get_participant_sessions_version(uuid) IS
+'Returns an opaque version of all sessions a user participates in, including their participations and coach profiles. Backs HTTP ETags.';
+
+DROP FUNCTION IF EXISTS app_fcn.get_own_coach_sessions(
+	uuid, int, int, timestamptz, timestamptz
+);
+
 create or replace function app_fcn.get_own_coach_sessions(
 	p_coach_id uuid,
 	p_limit int,
 	p_offset int,
 	p_from timestamptz,
-	p_to timestamptz
+	p_to timestamptz,
+	p_cursor_created_at timestamptz DEFAULT NULL,
+	p_cursor_id uuid DEFAULT NULL
 )
 returns table(
 	id uuid,
@@ -500,6 +611,12 @@ as $$
 	 *   - p_from: include sessions starting at or after this timestamp.
 	 *   - p_to:   include sessions ending at or before this timestamp.
 	 *
+	 * Pagination:
+	 *   - Ordered by (created_at, id) descending.
+	 *   - When p_cursor_created_at / p_cursor_id are given, only rows
+	 *     strictly after that keyset position are returned (keyset
+	 *     pagination, callers pass p_offset = 0).
+	 *
 	 * Sessions are guaranteed non-overlapping by design.
 	 */
 	begin
@@ -549,6 +666,10 @@ as $$
 				p_to IS NULL
 				or s.ends_at <= p_to
 			)
+			AND (
+				p_cursor_created_at IS NULL
+				OR (s.created_at, s.id) < (p_cursor_created_at, p_cursor_id)
+			)
         GROUP BY
             s.id,
             cp.user_id,
@@ -563,12 +684,13 @@ as $$
             s.currency,
             s.created_at,
             s.updated_at
+		ORDER BY s.created_at DESC, s.id DESC
 		OFFSET p_offset
         LIMIT p_limit;
 	end;
 $$;
 
 COMMENT ON FUNCTION app_fcn.get_own_coach_sessions(
-    uuid, int, int, timestamptz, timestamptz
+    uuid, int, int, timestamptz, timestamptz, timestamptz, uuid
 ) IS
-'Returns paginated sessions owned by a coach, optionally filtered by a fully-contained date range. Includes aggregated participants as json[]. Raises AP401 if the user is not a coach.';
+'Returns paginated sessions owned by a coach, newest first, optionally filtered by a fully-contained date range and positioned after a (created_at, id) keyset cursor. Includes aggregated participants as json[]. Raises AP401 if the user is not a coach.';
@@ -15,8 +15,8 @@ AS $$
  *
  * Returns the current credit balance (in cents) for the given user.
  *
- * The balance is derived by summing all entries in the credit ledger
- * and represents the authoritative source of truth for user credit.
+ * The balance is read from app.credit_balances, which the ledger
+ * insert trigger keeps equal to the sum of the user's entries.
  *
  * Authorization:
  *   - A user may fetch their own credit balance
@@ -33,21 +33,16 @@ BEGIN
             USING ERRCODE = 'AP401';
     END IF;
 
-    RETURN (
-        SELECT COALESCE(SUM(amount_cents), 0)
-        FROM app.credit_ledger
-        WHERE user_id = p_user_id
-		AND currency = p_currency
-    );
+    RETURN app_fcn.fetch_credit_internal(p_user_id, p_currency);
 END;
 $$;
 
 COMMENT ON FUNCTION app_fcn.fetch_credit(uuid, text) IS
 'Returns the current credit balance (in cents) for a user and currency
-by summing all entries in the credit ledger.
+in constant time from app.credit_balances.
 
-The balance is derived, authoritative, and based on an append-only
-ledger model.
+The balance is maintained transactionally from the append-only credit
+ledger, which remains the source of truth.
 
 Authorization:
 - Users may fetch their own credit balance
@@ -319,7 +314,8 @@ AS $$
 	/*
 	 * fetch_credit_internal
 	 *
-	 * Computes the current credit balance for a user and currency.
+	 * Returns the current credit balance for a user and currency from the
+	 * app.credit_balances snapshot (primary key lookup).
 	 *
 	 * This is a low-level, auth-agnostic primitive intended for internal use
 	 * by trusted database functions (e.g. ledger appenders, triggers).
@@ -328,12 +324,14 @@ AS $$
 	 * - No dependency on session GUCs
 	 * - Safe to call from triggers and background workers
 	 */
-	SELECT COALESCE(SUM(amount_cents), 0)::int
-	FROM app.credit_ledger
-	WHERE user_id = p_user_id
-	AND currency = p_currency
+	SELECT COALESCE((
+		SELECT balance_cents
+		FROM app.credit_balances
+		WHERE user_id = p_user_id
+		AND currency = p_currency
+	), 0)
 $$;
 
 
 comment on function app_fcn.fetch_credit_internal(uuid, text)
-is 'Auth-free primitive that computes a user credit balance from the ledger';
\ No newline at end of file
+is 'Auth-free primitive that reads a user credit balance from app.credit_balances';
\ No newline at end of file
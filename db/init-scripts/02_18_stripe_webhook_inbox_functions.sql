@@ -0,0 +1,253 @@
+\c app
+
+CREATE OR REPLACE FUNCTION app_fcn.enqueue_stripe_event(
+    p_event_id text,
+    p_event_type text,
+    p_payload jsonb
+)
+RETURNS boolean
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+/*
+ * app_fcn.enqueue_stripe_event
+ *
+ * Stores a verified Stripe webhook event in the inbox.
+ *
+ * Idempotency:
+ *   - Stripe redelivers events; a known event id is ignored.
+ *
+ * Returns:
+ *   - TRUE when the event was stored, FALSE when it was a duplicate.
+ */
+BEGIN
+    INSERT INTO app.stripe_webhook_events (
+        event_id,
+        event_type,
+        payload
+    )
+    VALUES (
+        p_event_id,
+        p_event_type,
+        p_payload
+    )
+    ON CONFLICT (event_id) DO NOTHING;
+
+    RETURN FOUND;
+END;
+$$;
+
+COMMENT ON FUNCTION app_fcn.enqueue_stripe_event(text, text, jsonb)
+IS
+'Stores a verified Stripe webhook event in the inbox. Returns FALSE for an already known event id.';
+
+CREATE OR REPLACE FUNCTION app_fcn.claim_stripe_event(
+    p_lease_seconds double precision
+)
+RETURNS TABLE (
+    event_id text,
+    event_type text,
+    payload text,
+    attempts integer
+)
+LANGUAGE SQL
+VOLATILE
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+    /*
+     * app_fcn.claim_stripe_event
+     *
+     * Leases the oldest due pending event to the caller.
+     *
+     * Concurrency:
+     *   - SKIP LOCKED lets concurrent workers claim distinct events
+     *     without waiting on each other.
+     *   - The event is not due again for p_lease_seconds, so the caller
+     *     commits right away and calls Stripe without holding the row.
+     *
+     * Behavior:
+     *   - Returns no row when nothing is due.
+     *   - An event whose worker died is claimed again once its lease
+     *     is over.
+     */
+    UPDATE app.stripe_webhook_events e
+    SET next_attempt_at = now() + make_interval(secs => p_lease_seconds)
+    WHERE e.event_id = (
+        SELECT c.event_id
+        FROM app.stripe_webhook_events c
+        WHERE c.status = 'pending'
+        AND c.next_attempt_at <= now()
+        ORDER BY c.next_attempt_at
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING
+        e.event_id,
+        e.event_type,
+        e.payload::text,
+        e.attempts;
+$$;
+
+COMMENT ON FUNCTION app_fcn.claim_stripe_event(double precision)
+IS
+'Leases the oldest due pending Stripe webhook event for p_lease_seconds, skipping events claimed by other workers.';
+
+CREATE OR REPLACE FUNCTION app_fcn.lock_stripe_event(
+    p_event_id text
+)
+RETURNS boolean
+LANGUAGE SQL
+VOLATILE
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+    /*
+     * app_fcn.lock_stripe_event
+     *
+     * Locks a claimed event before its effects are applied.
+     *
+     * Concurrency:
+     *   - The row stays locked until the caller commits or rolls back.
+     *   - Returns FALSE when the event is no longer pending or is being
+     *     applied by a worker that claimed it after an expired lease,
+     *     so an event is applied at most once.
+     */
+    SELECT EXISTS (
+        SELECT 1
+        FROM app.stripe_webhook_events e
+        WHERE e.event_id = p_event_id
+        AND e.status = 'pending'
+        FOR UPDATE SKIP LOCKED
+    );
+$$;
+
+COMMENT ON FUNCTION app_fcn.lock_stripe_event(text)
+IS
+'Locks a pending Stripe webhook event for the calling transaction. Returns FALSE when it was processed or is locked by another worker.';
+
+CREATE OR REPLACE FUNCTION app_fcn.complete_stripe_event(
+    p_event_id text
+)
+RETURNS void
+LANGUAGE SQL
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+    /*
+     * app_fcn.complete_stripe_event
+     *
+     * Marks a claimed event as processed.
+     */
+    UPDATE app.stripe_webhook_events
+    SET
+        status = 'processed',
+        attempts = attempts + 1,
+        last_error = NULL,
+        processed_at = now()
+    WHERE event_id = p_event_id;
+$$;
+
+COMMENT ON FUNCTION app_fcn.complete_stripe_event(text)
+IS
+'Marks a claimed Stripe webhook event as processed.';
+
+CREATE OR REPLACE FUNCTION app_fcn.fail_stripe_event(
+    p_event_id text,
+    p_error text,
+    p_retry_in_seconds double precision,
+    p_max_attempts integer
+)
+RETURNS boolean
+LANGUAGE SQL
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+    /*
+     * app_fcn.fail_stripe_event
+     *
+     * Records a failed processing attempt of a claimed event.
+     *
+     * Behavior:
+     *   - The event is retried after p_retry_in_seconds.
+     *   - Once p_max_attempts is reached it is parked as 'dead'.
+     *   - An event processed meanwhile by another worker is left as is.
+     *
+     * Returns:
+     *   - TRUE when the event is dead.
+     */
+    UPDATE app.stripe_webhook_events
+    SET
+        attempts = attempts + 1,
+        last_error = p_error,
+        status = CASE
+            WHEN attempts + 1 >= p_max_attempts THEN 'dead'
+            ELSE 'pending'
+        END,
+        next_attempt_at = now() + make_interval(secs => p_retry_in_seconds)
+    WHERE event_id = p_event_id
+    AND status = 'pending'
+    RETURNING status = 'dead';
+$$;
+
+COMMENT ON FUNCTION app_fcn.fail_stripe_event(
+    text,
+    text,
+    double precision,
+    integer
+)
+IS
+'Records a failed attempt of a Stripe webhook event and schedules its retry, or parks it as dead once attempts are exhausted.';
+
+CREATE OR REPLACE FUNCTION app_fcn.stripe_inbox_stats()
+RETURNS TABLE (
+    pending bigint,
+    due bigint,
+    dead bigint,
+    oldest_pending_seconds double precision
+)
+LANGUAGE SQL
+STABLE
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+    /*
+     * app_fcn.stripe_inbox_stats
+     *
+     * Reports the webhook inbox depth and lag.
+     *
+     * Returns:
+     *   - pending: events not yet processed (including backoff)
+     *   - due: pending events a worker may claim now
+     *   - dead: events that exhausted their retries
+     *   - oldest_pending_seconds: age of the oldest pending event,
+     *     0 when the inbox is drained
+     */
+    SELECT
+        p.pending,
+        p.due,
+        (
+            SELECT count(*)
+            FROM app.stripe_webhook_events d
+            WHERE d.status = 'dead'
+        ),
+        p.oldest_pending_seconds
+    FROM (
+        SELECT
+            count(*) AS pending,
+            count(*) FILTER (
+                WHERE e.next_attempt_at <= now()
+            ) AS due,
+            COALESCE(
+                EXTRACT(EPOCH FROM now() - min(e.received_at)),
+                0
+            )::double precision AS oldest_pending_seconds
+        FROM app.stripe_webhook_events e
+        WHERE e.status = 'pending'
+    ) p;
+$$;
+
+COMMENT ON FUNCTION app_fcn.stripe_inbox_stats()
+IS
+'Returns the Stripe webhook inbox depth (pending, due, dead) and the age of the oldest pending event.';
@@ -0,0 +1,13 @@
+\c app
+
+-- ------------------------------------------------------------------
+-- Row Level Security: app.stripe_webhook_events
+--
+-- Visibility model:
+-- - No runtime role reads or writes the inbox directly
+-- - All access goes through SECURITY DEFINER inbox functions
+-- ------------------------------------------------------------------
+
+-- Enable and enforce RLS (no policies: deny by default)
+ALTER TABLE app.stripe_webhook_events ENABLE ROW LEVEL SECURITY;
+ALTER TABLE app.stripe_webhook_events FORCE ROW LEVEL SECURITY;
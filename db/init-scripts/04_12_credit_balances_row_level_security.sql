@@ -0,0 +1,30 @@
+\c app
+
+-- ------------------------------------------------------------------
+-- Row Level Security: app.credit_balances
+--
+-- Visibility model:
+-- - Users see only their own balances
+-- - Admins see all balances
+-- - Writes happen only through the credit ledger trigger
+-- ------------------------------------------------------------------
+
+-- Enable and enforce RLS
+ALTER TABLE app.credit_balances ENABLE ROW LEVEL SECURITY;
+ALTER TABLE app.credit_balances FORCE ROW LEVEL SECURITY;
+
+-- ------------------------------------------------------------------
+-- Policy: credit_balances_select
+--
+-- Controls who can SELECT balances
+-- ------------------------------------------------------------------
+CREATE POLICY credit_balances_select
+ON app.credit_balances
+FOR SELECT
+USING (
+    app_fcn.is_self(user_id)
+    OR app_fcn.is_admin()
+);
+
+COMMENT ON POLICY credit_balances_select ON app.credit_balances IS
+'Users can see their own balances and admins can see all balances.';
@@ -0,0 +1,27 @@
+\c app
+
+-- ------------------------------------------------------------------
+-- Permissions: app.stripe_webhook_events
+--
+-- Purpose:
+-- - Keep the webhook inbox private to the backend
+--
+-- Design notes:
+-- - Events are enqueued, claimed and settled through app_fcn
+--   SECURITY DEFINER functions only
+-- - No runtime role holds table privileges
+-- ------------------------------------------------------------------
+
+-- ------------------------------------------------------------------
+-- Privilege cleanup
+-- ------------------------------------------------------------------
+REVOKE ALL ON TABLE app.stripe_webhook_events FROM app_user;
+REVOKE ALL ON TABLE app.stripe_webhook_events FROM app_system;
+
+-- ------------------------------------------------------------------
+-- Documentation
+-- ------------------------------------------------------------------
+
+COMMENT ON TABLE app.stripe_webhook_events IS
+'Durable inbox of verified Stripe webhook events.
+No runtime role holds table privileges; app_system uses the app_fcn inbox functions.';
@@ -0,0 +1,44 @@
+\c app
+
+-- ------------------------------------------------------------------
+-- Permissions: app.credit_balances
+--
+-- Purpose:
+-- - Allow users to read their own balances
+-- - Allow admins to reconcile balances against the ledger
+--
+-- Design notes:
+-- - Balances are derived data, written only by the ledger trigger
+-- - Inserts, updates and deletes are forbidden to runtime roles
+-- - Row visibility is enforced exclusively via RLS
+-- ------------------------------------------------------------------
+
+-- ------------------------------------------------------------------
+-- Privilege cleanup
+-- ------------------------------------------------------------------
+REVOKE ALL ON TABLE app.credit_balances FROM app_user;
+REVOKE ALL ON TABLE app.credit_balances FROM app_system;
+
+-- ------------------------------------------------------------------
+-- app_user: read-only (RLS-scoped)
+-- ------------------------------------------------------------------
+GRANT SELECT
+ON TABLE app.credit_balances
+TO app_user;
+
+-- ------------------------------------------------------------------
+-- app_admin: owner
+--
+-- Notes:
+-- - Keeps its privileges so the SECURITY DEFINER ledger trigger can
+--   maintain balances
+-- ------------------------------------------------------------------
+
+-- ------------------------------------------------------------------
+-- Documentation
+-- ------------------------------------------------------------------
+
+COMMENT ON TABLE app.credit_balances IS
+'Current credit balance per user and currency.
+SELECT is granted to app_user; rows are written only by the credit ledger trigger.
+All row-level visibility is enforced by RLS.';
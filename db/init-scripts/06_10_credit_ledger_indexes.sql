@@ -58,3 +58,21 @@ ON app.credit_ledger (cause, created_at DESC);
 COMMENT ON INDEX app.idx_credit_ledger_cause_created_at IS
 'Optimizes queries filtering credit ledger entries by cause and ordering by creation time.';
 
+
+-- ---------------------------------------------------------------
+-- Keyset pagination
+-- Used by:
+-- - User credit history (cursor pagination)
+-- - Admin credit listings
+-- ---------------------------------------------------------------
+CREATE INDEX idx_credit_ledger_created_at_id
+ON app.credit_ledger (created_at DESC, id DESC);
+
+COMMENT ON INDEX app.idx_credit_ledger_created_at_id IS
+'Supports keyset pagination of credit ledger listings ordered by creation time.';
+
+CREATE INDEX idx_credit_ledger_user_created_at_id
+ON app.credit_ledger (user_id, created_at DESC, id DESC);
+
+COMMENT ON INDEX app.idx_credit_ledger_user_created_at_id IS
+'Supports keyset pagination of a user credit history.';
@@ -116,3 +116,22 @@ ON app.payments (session_id, user_id);
 
 COMMENT ON INDEX app.ux_payments_coach_session IS
 'Ensures a coach is paid at most once per session. Prevents duplicate payouts and enforces payout idempotency.';
+
+-- ---------------------------------------------------------------
+-- Keyset pagination
+--
+-- Used by:
+-- - User payment history (cursor pagination)
+-- - Admin payment listings
+-- ---------------------------------------------------------------
+CREATE INDEX idx_payment_created_at_id
+ON app.payments (created_at DESC, id DESC);
+
+COMMENT ON INDEX app.idx_payment_created_at_id IS
+'Supports keyset pagination of payment listings ordered by creation time.';
+
+CREATE INDEX idx_payment_user_created_at_id
+ON app.payments (user_id, created_at DESC, id DESC);
+
+COMMENT ON INDEX app.idx_payment_user_created_at_id IS
+'Supports keyset pagination of the payments of a user.';
@@ -0,0 +1,35 @@
+\c app
+
+-- ------------------------------------------------------------------
+-- Indexes: app.stripe_webhook_events
+-- ------------------------------------------------------------------
+
+-- ---------------------------------------------------------------
+-- Due pending events
+--
+-- Used by:
+-- - app_fcn.claim_stripe_event (oldest due event first)
+-- - app_fcn.stripe_inbox_stats (depth and lag)
+--
+-- Partial: processed rows accumulate and are never claimed.
+-- ---------------------------------------------------------------
+CREATE INDEX idx_stripe_webhook_events_pending
+ON app.stripe_webhook_events (next_attempt_at)
+WHERE status = 'pending';
+
+COMMENT ON INDEX app.idx_stripe_webhook_events_pending IS
+'Finds due pending webhook events without scanning processed ones.';
+
+-- ---------------------------------------------------------------
+-- Dead events
+--
+-- Used by:
+-- - app_fcn.stripe_inbox_stats
+-- - Ops review of events that exhausted their retries
+-- ---------------------------------------------------------------
+CREATE INDEX idx_stripe_webhook_events_dead
+ON app.stripe_webhook_events (received_at)
+WHERE status = 'dead';
+
+COMMENT ON INDEX app.idx_stripe_webhook_events_dead IS
+'Lists webhook events that exhausted their retries.';
@@ -0,0 +1,20 @@
+\c app
+
+-- ------------------------------------------------------------------
+-- Indexes: app.payment_revenue_monthly
+-- ------------------------------------------------------------------
+
+-- ---------------------------------------------------------------
+-- Month range scans across coaches
+--
+-- Used by:
+-- - admin revenue report (per month and per currency totals)
+--
+-- The primary key (coach_id, month, currency) serves per-coach
+-- reports
+-- ---------------------------------------------------------------
+CREATE INDEX idx_payment_revenue_monthly_month
+ON app.payment_revenue_monthly (month, currency);
+
+COMMENT ON INDEX app.idx_payment_revenue_monthly_month IS
+'Supports revenue reports over a month range for all coaches.';
@@ -191,3 +191,92 @@ EXECUTE FUNCTION app.tg_sessions_validate_status_transition();
 
 COMMENT ON TRIGGER trg_40_sessions_validate_status_transition ON app.sessions IS
 'Validates session status changes and prevents invalid transitions.';
+
+-- ------------------------------------------------------------------
+-- Function: app.tg_notify_session_listing
+--
+-- Purpose:
+-- - Publishes the id of a session whose public listing changed on the
+--   app_session_listing channel
+-- - Lets every backend process drop its cached session listings
+--
+-- Notes:
+-- - NOTIFY is delivered on commit only, rolled back changes are silent
+-- - Seat counter updates are not listed publicly and stay silent
+-- ------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION app.tg_notify_session_listing()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_TABLE_NAME = 'user_profiles' THEN
+        PERFORM pg_notify('app_session_listing', 'coach:' || NEW.user_id);
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify('app_session_listing', OLD.id::text);
+    ELSE
+        PERFORM pg_notify('app_session_listing', NEW.id::text);
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION app.tg_notify_session_listing() IS
+'Notifies app_session_listing listeners that a publicly listed session changed.';
+
+-- ------------------------------------------------------------------
+-- Trigger: trg_95_sessions_notify_listing
+--
+-- After the change:
+-- - Fires on every created or deleted session
+-- ------------------------------------------------------------------
+CREATE TRIGGER trg_95_sessions_notify_listing
+AFTER INSERT OR DELETE ON app.sessions
+FOR EACH ROW
+EXECUTE FUNCTION app.tg_notify_session_listing();
+
+COMMENT ON TRIGGER trg_95_sessions_notify_listing ON app.sessions IS
+'Invalidates cached session listings when a session is created or deleted.';
+
+-- ------------------------------------------------------------------
+-- Trigger: trg_96_sessions_notify_listing_update
+--
+-- After the change:
+-- - Only fires when a publicly listed column actually changed
+-- ------------------------------------------------------------------
+CREATE TRIGGER trg_96_sessions_notify_listing_update
+AFTER UPDATE ON app.sessions
+FOR EACH ROW
+WHEN (
+    (
+        OLD.title, OLD.starts_at, OLD.ends_at, OLD.status,
+        OLD.cancelled_at, OLD.price_cents, OLD.currency
+    ) IS DISTINCT FROM (
+        NEW.title, NEW.starts_at, NEW.ends_at, NEW.status,
+        NEW.cancelled_at, NEW.price_cents, NEW.currency
+    )
+)
+EXECUTE FUNCTION app.tg_notify_session_listing();
+
+COMMENT ON TRIGGER trg_96_sessions_notify_listing_update ON app.sessions IS
+'Invalidates cached session listings when a listed session column changes.';
+
+-- ------------------------------------------------------------------
+-- Trigger: trg_95_user_profiles_notify_session_listing
+--
+-- After the change:
+-- - Coach names are listed with their sessions; names change rarely,
+--   so any renamed profile invalidates the listings
+-- ------------------------------------------------------------------
+CREATE TRIGGER trg_95_user_profiles_notify_session_listing
+AFTER UPDATE OF first_name, last_name ON app.user_profiles
+FOR EACH ROW
+WHEN (
+    (OLD.first_name, OLD.last_name)
+        IS DISTINCT FROM (NEW.first_name, NEW.last_name)
+)
+EXECUTE FUNCTION app.tg_notify_session_listing();
+
+COMMENT ON TRIGGER trg_95_user_profiles_notify_session_listing
+    ON app.user_profiles IS
+'Invalidates cached session listings when a profile name changes.';
@@ -1,7 +1,6 @@
 \c app
 
 
-
 -- ------------------------------------------------------------------
 -- Triggers: app.session_participation
 --
@@ -98,58 +97,175 @@ COMMENT ON TRIGGER trg_session_participation_datetime_guard ON app.session_parti
 'Prevents invalid inserts/updates on session_participation according to session start/end times, cancellation rules, and attendance immutability.';
 
 -- ------------------------------------------------------------------
--- Trigger: session_participant_limit
+-- Triggers: session seat counter
 -- ------------------------------------------------------------------
--- Enforces a hard limit of 6 participants per session.
+-- Enforces sessions.capacity through the sessions.seats_taken counter.
+--
+-- A seat is taken with a single conditional UPDATE of the session row
+-- (seats_taken < capacity), so concurrent registrations never
+-- overbook and only hold the session row lock for the increment,
+-- instead of serializing whole registrations on a session lock and
+-- counting participations.
+--
+-- Seats are released when a participation is cancelled or deleted.
 --
--- This invariant is enforced at the database level to avoid
--- race conditions under concurrent inserts.
+-- The same row updates bump sessions.participation_version, so any
+-- participation change also versions the session read models.
+-- ------------------------------------------------------------------
+
+
 -- ------------------------------------------------------------------
+-- Trigger function: take a seat
+-- ------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION app.tg_session_participation_take_seat()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+BEGIN
+    IF NEW.cancelled_at IS NOT NULL THEN
+        UPDATE app.sessions
+        SET participation_version = participation_version + 1
+        WHERE id = NEW.session_id;
+
+        RETURN NULL;
+    END IF;
+
+    UPDATE app.sessions
+    SET seats_taken = seats_taken + 1,
+        participation_version = participation_version + 1
+    WHERE id = NEW.session_id
+        AND seats_taken < capacity;
+
+    -- Full: reclaim seats held by lapsed registrations, then retry once
+    IF NOT FOUND AND app_fcn.release_lapsed_seats(NEW.session_id) > 0 THEN
+        UPDATE app.sessions
+        SET seats_taken = seats_taken + 1,
+            participation_version = participation_version + 1
+        WHERE id = NEW.session_id
+            AND seats_taken < capacity;
+    END IF;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'session full'
+            USING ERRCODE = 'AB409';
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION app.tg_session_participation_take_seat() IS
+'Takes a seat on app.sessions.seats_taken for each new active participation and bumps app.sessions.participation_version. Raises AB409 when the session is at capacity and no lapsed registration can be released.';
 
 
 -- ------------------------------------------------------------------
--- Trigger function
+-- Trigger function: release a seat
 -- ------------------------------------------------------------------
-CREATE OR REPLACE FUNCTION app.tg_session_participation_limit()
+CREATE OR REPLACE FUNCTION app.tg_session_participation_release_seat()
 RETURNS trigger
 LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
 AS $$
 DECLARE
-    participation_count integer;
+    v_released integer := 0;
 BEGIN
-    -- Serialize inserts per session to avoid race conditions
-    PERFORM pg_advisory_xact_lock(hashtext('session:' || NEW.session_id::text));
-
-    -- Count existing participants for this session
-    SELECT COUNT(*)
-    INTO participation_count
-    FROM app.session_participation
-    WHERE session_id = NEW.session_id
-		AND cancelled_at IS NULL;
-
-    -- Enforce maximum of 6 participants
-    IF participation_count >= 6 THEN
-        RAISE EXCEPTION
-            'Session % already has 6 participants',
-            NEW.session_id;
+    -- Only the transition to cancelled releases a seat; rewriting
+    -- cancelled_at of an already cancelled row must not.
+    IF TG_OP = 'DELETE' THEN
+        IF OLD.cancelled_at IS NULL THEN
+            v_released := 1;
+        END IF;
+    ELSIF OLD.cancelled_at IS NULL AND NEW.cancelled_at IS NOT NULL THEN
+        v_released := 1;
     END IF;
 
-    RETURN NEW;
+    -- Every change bumps the version, one row update either way.
+    UPDATE app.sessions
+    SET seats_taken = seats_taken - v_released,
+        participation_version = participation_version + 1
+    WHERE id = OLD.session_id;
+
+    RETURN NULL;
 END;
 $$;
 
+COMMENT ON FUNCTION app.tg_session_participation_release_seat() IS
+'Releases the seat of a participation when it is cancelled or deleted while active, and bumps app.sessions.participation_version on every participation change.';
+
 
 -- ------------------------------------------------------------------
--- Trigger binding
+-- Trigger bindings
 -- ------------------------------------------------------------------
-CREATE TRIGGER trg_session_participation_limit
-BEFORE INSERT ON app.session_participation
+-- AFTER INSERT: rows resolved by ON CONFLICT DO UPDATE take no seat.
+CREATE TRIGGER trg_session_participation_take_seat
+AFTER INSERT ON app.session_participation
+FOR EACH ROW
+EXECUTE FUNCTION app.tg_session_participation_take_seat();
+
+CREATE TRIGGER trg_session_participation_release_seat
+AFTER UPDATE ON app.session_participation
+FOR EACH ROW
+WHEN (OLD.* IS DISTINCT FROM NEW.*)
+EXECUTE FUNCTION app.tg_session_participation_release_seat();
+
+CREATE TRIGGER trg_session_participation_release_seat_on_delete
+AFTER DELETE ON app.session_participation
 FOR EACH ROW
-EXECUTE FUNCTION app.tg_session_participation_limit();
+EXECUTE FUNCTION app.tg_session_participation_release_seat();
 
 
 -- ------------------------------------------------------------------
 -- PostgreSQL documentation
 -- ------------------------------------------------------------------
-COMMENT ON FUNCTION app.tg_session_participation_limit() IS
-'Prevents more than 6 participants from being inserted into a session. Uses an advisory transaction lock on session_id to avoid race conditions.';
\ No newline at end of file
+COMMENT ON TRIGGER trg_session_participation_take_seat ON app.session_participation IS
+'Enforces app.sessions.capacity by atomically taking a seat for each inserted participation.';
+
+COMMENT ON TRIGGER trg_session_participation_release_seat ON app.session_participation IS
+'Keeps app.sessions.seats_taken in sync when participations are cancelled, and bumps app.sessions.participation_version on every effective update.';
+
+COMMENT ON TRIGGER trg_session_participation_release_seat_on_delete ON app.session_participation IS
+'Keeps app.sessions.seats_taken and participation_version in sync when participations are deleted.';
+
+
+-- ------------------------------------------------------------------
+-- Trigger function: participant renamed
+-- ------------------------------------------------------------------
+-- Participant names are part of the session read models, so renaming
+-- a profile bumps the version of every session the user takes part in.
+-- ------------------------------------------------------------------
+CREATE OR REPLACE FUNCTION app.tg_user_profiles_bump_participation_version()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = app, app_fcn, pg_temp
+AS $$
+BEGIN
+    UPDATE app.sessions s
+    SET participation_version = s.participation_version + 1
+    WHERE s.id IN (
+        SELECT sp.session_id
+        FROM app.session_participation sp
+        WHERE sp.user_id = NEW.user_id
+    );
+
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION app.tg_user_profiles_bump_participation_version() IS
+'Bumps app.sessions.participation_version of every session a renamed user participates in.';
+
+CREATE TRIGGER trg_user_profiles_bump_participation_version
+AFTER UPDATE OF first_name, last_name ON app.user_profiles
+FOR EACH ROW
+WHEN (
+    (OLD.first_name, OLD.last_name)
+        IS DISTINCT FROM (NEW.first_name, NEW.last_name)
+)
+EXECUTE FUNCTION app.tg_user_profiles_bump_participation_version();
+
+COMMENT ON TRIGGER trg_user_profiles_bump_participation_version ON app.user_profiles IS
+'Versions the session read models listing a participant when the participant is renamed.';